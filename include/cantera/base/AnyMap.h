@@ -12,6 +12,7 @@
 
 #include <unordered_map>
 #include <filesystem>
+#include <iosfwd>
 #include <any>
 
 namespace YAML
@@ -61,6 +62,7 @@ protected:
     shared_ptr<AnyMap> m_metadata;
 
     friend class InputFileError;
+    friend class AnyMap;
     friend void warn_deprecated(const string& source, const AnyBase& node,
                                 const string& message);
 };
@@ -720,6 +722,13 @@ private:
     static std::unordered_map<string,
                               pair<AnyMap, std::filesystem::file_time_type>> s_cache;
 
+    //! Serialization of AnyMap trees in the binary format used by the persistent
+    //! input cache. Locations within the input file are preserved.
+    static void writeBinary(std::ostream& out, const AnyMap& map);
+    static void writeBinary(std::ostream& out, const AnyValue& value);
+    static void readBinary(std::istream& in, AnyMap& map);
+    static void readBinary(std::istream& in, AnyValue& value);
+
     //! Information about fields that should appear first when outputting to
     //! YAML. Keys in this map are matched to `__type__` keys in AnyMap
     //! objects, and values are a list of field names.
@@ -241,6 +241,22 @@ public:
         *m_funcs_v_dp_dp_dp[name] = makeDelegate(func, when, *m_funcs_v_dp_dp_dp[name]);
     }
 
+    //! Set delegates for member functions with the signature
+    //! `void(void*, double*, double*)`
+    //! @since New in %Cantera 3.2.
+    void setDelegate(
+        const string& name,
+        const function<void(std::array<size_t, 2>, void*, double*, double*)>& func,
+        const string& when)
+    {
+        if (!m_funcs_v_vp_dp_dp.count(name)) {
+            throw NotImplementedError("Delegator::setDelegate",
+                "for function named '{}' with signature "
+                "'void(void*, double*, double*)'.", name);
+        }
+        *m_funcs_v_vp_dp_dp[name] = makeDelegate(func, when, *m_funcs_v_vp_dp_dp[name]);
+    }
+
     //! set delegates for member functions with the signature `double(void*)`
     void setDelegate(const string& name,
                      const function<int(double&, void*)>& func,
@@ -386,6 +402,17 @@ protected:
         m_funcs_v_dp_dp_dp[name] = &target;
     }
 
+    //! Install a function with the signature `void(void*, double*, double*)` as being
+    //! delegatable
+    //! @since New in %Cantera 3.2.
+    void install(const string& name,
+                 function<void(std::array<size_t, 2>, void*, double*, double*)>& target,
+                 const function<void(std::array<size_t, 2>, void*, double*, double*)>& base)
+    {
+        target = base;
+        m_funcs_v_vp_dp_dp[name] = &target;
+    }
+
     //! Install a function with the signature `double(void*)` as being delegatable
     void install(const string& name, function<double(void*)>& target,
                  const function<double(void*)>& func)
@@ -532,6 +559,8 @@ protected:
         function<void(std::array<size_t, 2>, double, double*, double*)>*> m_funcs_v_d_dp_dp;
     map<string,
         function<void(std::array<size_t, 3>, double*, double*, double*)>*> m_funcs_v_dp_dp_dp;
+    map<string,
+        function<void(std::array<size_t, 2>, void*, double*, double*)>*> m_funcs_v_vp_dp_dp;
 
     // Delegates with a return value
     map<string, function<double(void*)>> m_base_d_vp;
@@ -0,0 +1,185 @@
+//! @file Profiler.h Declarations for classes Profiler and ProfileTimer
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#ifndef CT_PROFILER_H
+#define CT_PROFILER_H
+
+#include "cantera/base/AnyMap.h"
+#include <chrono>
+#include <mutex>
+
+namespace Cantera
+{
+
+//! Collects call counts and wall-clock times for named categories.
+//!
+//! Profiling is disabled by default, in which case ProfileTimer objects do not query
+//! the clock and no statistics are recorded. If %Cantera is compiled without support
+//! for profiling (SCons option `profiling=n`), timers are compiled out and profiling
+//! cannot be enabled. Derived classes define the categories tracked for a specific
+//! type of object, for example SolverProfiler and KineticsProfiler.
+//!
+//! @since New in %Cantera 3.2.
+//! @ingroup globalUtilFuncs
+class Profiler
+{
+public:
+    Profiler() = default;
+    virtual ~Profiler() = default;
+    Profiler(const Profiler&) = delete;
+    Profiler& operator=(const Profiler&) = delete;
+
+    //! Enable or disable profiling. Previously collected statistics are retained.
+    //! Throws an exception if profiling is enabled but %Cantera was compiled without
+    //! support for profiling.
+    void setEnabled(bool enabled);
+
+    //! Returns `true` if profiling is enabled
+    bool enabled() const {
+        return m_enabled;
+    }
+
+    //! Returns `true` if %Cantera was compiled with support for profiling. If not,
+    //! ProfileTimer objects are compiled out.
+    static constexpr bool profilingSupported() {
+#if CT_PROFILING
+        return true;
+#else
+        return false;
+#endif
+    }
+
+    //! Reset all statistics to zero
+    void clear();
+
+    //! Add a category. If a category with the same name already exists, the index
+    //! of the existing category is returned.
+    //! @param name  Name of the category
+    //! @return  Index of the category
+    size_t addCategory(const string& name);
+
+    //! Number of categories
+    size_t nCategories() const {
+        return m_names.size();
+    }
+
+    //! Name of the category with index `i`
+    const string& categoryName(size_t i) const;
+
+    //! Add time spent in a category. This method is thread-safe.
+    //! @param category  Index of the category
+    //! @param elapsed  Wall-clock time [s]
+    //! @param calls  Number of calls contributing to the elapsed time
+    void add(size_t category, double elapsed, size_t calls=1);
+
+    //! Number of recorded calls for the category `name`
+    size_t calls(const string& name) const;
+
+    //! Total wall-clock time [s] recorded for the category `name`
+    double time(const string& name) const;
+
+    //! Return statistics for all categories, where each entry maps the name of a
+    //! category to a map with fields `calls` and `time`.
+    AnyMap stats() const;
+
+protected:
+    //! Index of the category `name`; throws an exception if it does not exist
+    size_t categoryIndex(const string& name) const;
+
+    bool m_enabled = false; //!< Indicates whether profiling is enabled
+    vector<string> m_names; //!< Names of the categories
+    map<string, size_t> m_index; //!< Mapping of category names to indices
+    vector<size_t> m_calls; //!< Number of calls for each category
+    vector<double> m_time; //!< Wall-clock time [s] for each category
+    std::mutex m_mutex; //!< Mutex protecting concurrent updates
+};
+
+//! Wall-clock timer accumulating time spent in a category of a Profiler.
+//!
+//! Each pair of calls to start() and stop() contributes a fixed number of calls
+//! (usually one) to the category. The accumulated time is added to the Profiler when
+//! the timer goes out of scope, which limits synchronization overhead if a category is
+//! timed repeatedly within a loop. If the profiler is `nullptr` or disabled, start()
+//! and stop() have no effect. If %Cantera is compiled without support for profiling,
+//! ProfileTimer is an empty class whose methods are optimized away.
+//!
+//! @since New in %Cantera 3.2.
+//! @ingroup globalUtilFuncs
+#if CT_PROFILING
+class ProfileTimer
+{
+public:
+    //! Constructor
+    //! @param profiler  Profiler receiving the timing information; may be `nullptr`
+    //! @param category  Index of the category being timed
+    //! @param start  If `true`, start timing immediately
+    //! @param calls  Number of calls attributed to each timed interval. Use 0 for
+    //!     steps that only contribute to the time spent in a category.
+    ProfileTimer(Profiler* profiler, size_t category, bool start=true, size_t calls=1)
+        : m_profiler((profiler && profiler->enabled()) ? profiler : nullptr)
+        , m_category(category)
+        , m_callsPerInterval(calls)
+    {
+        if (start) {
+            this->start();
+        }
+    }
+
+    ProfileTimer(const ProfileTimer&) = delete;
+    ProfileTimer& operator=(const ProfileTimer&) = delete;
+
+    ~ProfileTimer() {
+        if (m_profiler) {
+            stop();
+            if (m_intervals) {
+                m_profiler->add(m_category, m_elapsed,
+                                m_intervals * m_callsPerInterval);
+            }
+        }
+    }
+
+    //! Start timing an interval
+    void start() {
+        if (m_profiler) {
+            m_start = std::chrono::steady_clock::now();
+            m_running = true;
+        }
+    }
+
+    //! Stop timing the current interval
+    void stop() {
+        if (m_running) {
+            std::chrono::duration<double> dt = std::chrono::steady_clock::now() - m_start;
+            m_elapsed += dt.count();
+            m_intervals++;
+            m_running = false;
+        }
+    }
+
+private:
+    Profiler* m_profiler; //!< Profiler; `nullptr` if profiling is disabled
+    size_t m_category;
+    size_t m_callsPerInterval; //!< Number of calls attributed to each interval
+    std::chrono::steady_clock::time_point m_start;
+    bool m_running = false;
+    double m_elapsed = 0.0; //!< Accumulated time [s]
+    size_t m_intervals = 0; //!< Number of timed intervals
+};
+#else
+class ProfileTimer
+{
+public:
+    ProfileTimer(Profiler* profiler, size_t category, bool start=true,
+                 size_t calls=1) {}
+    ProfileTimer(const ProfileTimer&) = delete;
+    ProfileTimer& operator=(const ProfileTimer&) = delete;
+    void start() {}
+    void stop() {}
+};
+#endif
+
+}
+
+#endif
@@ -8,6 +8,7 @@
 
 #include "cantera/base/global.h"
 #include "cantera/base/AnyMap.h"
+#include <mutex>
 
 namespace Cantera
 {
@@ -76,6 +77,8 @@ public:
     }
 
     //! Resize SolutionArray objects with a single dimension (default).
+    //! Added entries are zero-initialized and do not hold valid states until they
+    //! are assigned, for example using setState() or setStates().
     void resize(int size);
 
     //! SolutionArray shape information used by high-level API's.
@@ -173,6 +176,149 @@ public:
     //! Normalize mass/mole fractions
     void normalize();
 
+    /**
+     *  Check whether a property can be evaluated for all entries using evalProperty().
+     *  @param name  Name of property
+     *  @since New in %Cantera 3.2
+     */
+    static bool hasProperty(const string& name);
+
+    //! Retrieve names of properties that can be evaluated using evalProperty().
+    //! Names correspond to C++ getters of ThermoPhase, Kinetics and Transport
+    //! objects, where a leading `get` is omitted (examples: `"cp_mass"`,
+    //! `"netProductionRates"`, `"mixDiffCoeffs"`).
+    //! @since New in %Cantera 3.2
+    static vector<string> listProperties();
+
+    /**
+     *  Number of values per SolutionArray entry for a given property; for example,
+     *  1 for scalar properties or the number of species for species properties.
+     *  @param name  Name of property
+     *  @since New in %Cantera 3.2
+     */
+    size_t propertySize(const string& name);
+
+    /**
+     *  Evaluate a property for all entries of the SolutionArray.
+     *
+     *  States are restored in turn and the property is evaluated by the associated
+     *  Solution object without any intermediate conversions, which avoids overhead
+     *  of per-entry access from high-level API's. If more than one thread is
+     *  enabled (see setNumThreads()), entries are split across worker threads, each
+     *  of which uses a cloned Solution object; the state of the associated Solution
+     *  object is not modified in this case.
+     *
+     *  @param name  Name of property; see listProperties()
+     *  @param out  Output buffer with length size() * propertySize(); values for
+     *      each entry are stored contiguously (row-major order)
+     *  @since New in %Cantera 3.2
+     */
+    void evalProperty(const string& name, double* out);
+
+    //! Evaluate a property for all entries of the SolutionArray.
+    //! @see evalProperty(const string&, double*)
+    //! @since New in %Cantera 3.2
+    vector<double> evalProperty(const string& name);
+
+    /**
+     *  Set the number of threads used by evalProperty().
+     *
+     *  Worker threads use a pool of Solution objects that are cloned from the
+     *  associated Solution object when first needed; the pool is shared with
+     *  SolutionArray objects created by share(). Reaction rate multipliers are
+     *  synchronized for each evaluation, whereas other modifications of the
+     *  associated Solution object (for example, added species or modified reactions)
+     *  require a reset of the pool by calling this method.
+     *
+     *  @param nThreads  Number of threads; if zero, all available hardware threads
+     *      are used. The default value of one disables parallel evaluation.
+     *  @since New in %Cantera 3.2
+     */
+    void setNumThreads(size_t nThreads);
+
+    /**
+     *  Use an existing pool of cloned Solution objects for worker threads.
+     *
+     *  This allows callers to retain worker Solution objects across multiple
+     *  SolutionArray objects, for example when evaluating properties for batches of
+     *  states (see Kinetics::evalBatch). The pool needs to be empty or hold clones of
+     *  the associated Solution object, and is extended as needed. Calling
+     *  setNumThreads() discards the pool.
+     *
+     *  @param workers  Pool of worker Solution objects
+     *  @since New in %Cantera 3.2
+     */
+    void setWorkers(const shared_ptr<vector<shared_ptr<Solution>>>& workers);
+
+    //! Number of threads used by evalProperty().
+    //! @see setNumThreads()
+    //! @since New in %Cantera 3.2
+    size_t numThreads() const {
+        return m_nThreads;
+    }
+
+    /**
+     *  Set the states of all entries of the SolutionArray in a single pass.
+     *
+     *  Property pairs correspond to ThermoPhase setters, where specific properties
+     *  are on a mass basis (for example, `"TP"` uses ThermoPhase::setState_TP and
+     *  `"HP"` uses ThermoPhase::setState_HP). If composition is specified as well,
+     *  the property pair is followed by `"X"` (mole fractions) or `"Y"` (mass
+     *  fractions).
+     *
+     *  Properties that are not specified (for example, the composition for mode
+     *  `"TP"`) are retained from the stored state of each entry. Entries added by
+     *  resize() that have not been assigned a state yet use the state of the
+     *  associated phase at the time of the call instead.
+     *
+     *  @param mode  Property pair defining the state, optionally followed by `"X"`
+     *      or `"Y"`; examples are `"TP"`, `"TPX"` or `"HPY"`
+     *  @param prop1  Values of the first property (length size())
+     *  @param prop2  Values of the second property (length size())
+     *  @param comp  Mole or mass fractions with length size() * nSpecies() (row-major
+     *      order); required if and only if `mode` includes `"X"` or `"Y"`
+     *  @param normalize  If `true`, mole or mass fractions are normalized; if
+     *      `false`, compositions are used as-is, which avoids an additional pass
+     *      for pre-validated input. Phases that store states using mass fractions
+     *      (for example, IdealGasPhase) cannot hold unnormalized mole fractions
+     *      directly; in this case, each entry `X_k` is converted to a mass fraction
+     *      `Y_k = X_k M_k / sum_j(X_j M_j) * sum_j(X_j)`. The mass fractions thus
+     *      have the same sum as the mole fractions, and normalizing either of them
+     *      recovers the specified composition.
+     *  @since New in %Cantera 3.2
+     */
+    void setStates(const string& mode, const double* prop1, const double* prop2,
+                   const double* comp=nullptr, bool normalize=true);
+
+    /**
+     *  Locate data of a component within the underlying storage, which allows
+     *  high-level API's to access values without copying.
+     *
+     *  Direct access is available for properties defining the native state (see
+     *  Phase::nativeState) and for auxiliary components holding double values,
+     *  provided that the active entries are contiguous. The returned pointer
+     *  remains valid while the SolutionArray (or an object sharing its data) exists,
+     *  until it is resized or the auxiliary component is replaced by data of a
+     *  different type; holding a copy of the pointer returned by sharedData()
+     *  prevents either.
+     *
+     *  @param name  Name of component
+     *  @param[out] stride  Distance between values of consecutive entries
+     *  @param[out] width  Number of values per entry
+     *  @return  Pointer to the values of the first active entry, or `nullptr` if
+     *      direct access is not available
+     *  @since New in %Cantera 3.2
+     */
+    double* componentData(const string& name, size_t& stride, size_t& width);
+
+    //! Retrieve the storage holding states of all entries; shared with sliced
+    //! objects created by share().
+    //! @see componentData()
+    //! @since New in %Cantera 3.2
+    shared_ptr<vector<double>> sharedData() {
+        return m_data;
+    }
+
     /**
      *  Add auxiliary component to SolutionArray. Initialization requires a subsequent
      *  call of setComponent().
@@ -243,9 +389,16 @@ public:
      *  @param sub  Name identifier of subgroup holding SolutionArray data
      *  @param overwrite  Force overwrite if subgroup exists; optional (default=`false`)
      *  @param compression  Compression level; optional (default=0; HDF only)
+     *  @param append  If `true`, append entries to resizable datasets of an existing
+     *      subgroup, or create a new subgroup with resizable datasets; optional
+     *      (default=`false`)
+     *  @param chunkSize  Number of rows per HDF chunk; optional (default=0, which
+     *      uses a single chunk for compressed data, and 1024 rows for resizable data)
+     *  @since  Arguments `append` and `chunkSize` are new in %Cantera 3.2
      */
     void writeEntry(const string& fname, const string& name, const string& sub,
-                    bool overwrite=false, int compression=0);
+                    bool overwrite=false, int compression=0, bool append=false,
+                    size_t chunkSize=0);
 
     /**
      *  Write SolutionArray data to AnyMap. Used by YAML serialization.
@@ -291,10 +444,18 @@ public:
      *  @param basis  Output mass (`"Y"`/`"mass"`) or mole (`"X"`/`"mole"`) fractions;
      *      if not specified (default=`""`), the native basis of the underlying
      *      ThermoPhase manager is used - see Phase::nativeState (CSV only)
+     *  @param append  If `true`, append entries to an existing data entry, which
+     *      allows for streaming of data in blocks with bounded memory; the entry is
+     *      created if it does not exist yet. Components of appended data need to
+     *      match the existing entry (HDF only; default=`false`)
+     *  @param chunkSize  Number of rows per chunk; if zero (default), a single chunk
+     *      is used for compressed data, and 1024 rows are used for data that can be
+     *      appended (HDF only)
+     *  @since  Arguments `append` and `chunkSize` are new in %Cantera 3.2
      */
     void save(const string& fname, const string& name="", const string& sub="",
               const string& desc="", bool overwrite=false, int compression=0,
-              const string& basis="");
+              const string& basis="", bool append=false, size_t chunkSize=0);
 
     /**
      *  Read header information from a HDF container file.
@@ -318,8 +479,25 @@ public:
      *  @param fname  Name of HDF container file
      *  @param name  Identifier of group holding header information
      *  @param sub  Name identifier of subgroup holding SolutionArray data
+     *  @param columns  Names of auxiliary components and species to be restored; if
+     *      empty (default), all components are restored. Temperature and pressure or
+     *      density are always restored, as they are required to define SolutionArray
+     *      entries. If species names are included, only the corresponding columns of
+     *      species data are read from the file, and fractions of all other species
+     *      are set to zero.
+     *  @param start  First entry to be restored (default=0)
+     *  @param count  Number of entries to be restored; if npos (default), all entries
+     *      starting at `start` are restored. Only selected entries are read from the
+     *      file; slicing is limited to one-dimensional data.
+     *  @param lazy  If `true`, reading of auxiliary components is deferred until they
+     *      are first accessed (default=`false`). Modification time and size of the
+     *      file are recorded, and deferred components raise an exception if the file
+     *      has changed before they are read.
+     *  @since  Arguments `columns`, `start`, `count` and `lazy` are new in %Cantera 3.2
      */
-    void readEntry(const string& fname, const string& name, const string& sub);
+    void readEntry(const string& fname, const string& name, const string& sub,
+                   const vector<string>& columns={}, size_t start=0, size_t count=npos,
+                   bool lazy=false);
 
     /**
      *  Restore SolutionArray data from AnyMap. Used by YAML serialization.
@@ -341,9 +519,19 @@ public:
      *      contains header information and a subgroup holding actual SolutionArray data
      *  @param sub  Name identifier for the subgroup holding the SolutionArray data and
      *      metadata objects. If omitted (`""`), the subgroup name defaults to "data"
+     *  @param columns  Names of auxiliary components and species to be restored; if
+     *      empty (default), all components are restored (HDF only; see readEntry())
+     *  @param start  First entry to be restored (default=0; HDF only)
+     *  @param count  Number of entries to be restored; if npos (default), all entries
+     *      starting at `start` are restored (HDF only)
+     *  @param lazy  If `true`, reading of auxiliary components is deferred until they
+     *      are first accessed (default=`false`; HDF only)
      *  @return  AnyMap containing header information
+     *  @since  Arguments `columns`, `start`, `count` and `lazy` are new in %Cantera 3.2
      */
-    AnyMap restore(const string& fname, const string& name, const string& sub="");
+    AnyMap restore(const string& fname, const string& name, const string& sub="",
+                   const vector<string>& columns={}, size_t start=0, size_t count=npos,
+                   bool lazy=false);
 
 protected:
     //! Service function used to resize SolutionArray
@@ -384,6 +572,15 @@ protected:
     //! Retrieve set containing list of properties defining state
     set<string> _stateProperties(const string& mode, bool alias=false);
 
+    //! Read deferred auxiliary components from file; if `name` is empty, all deferred
+    //! components are read.
+    void _loadDeferred(const string& name="") const;
+
+    //! Retrieve pool of cloned Solution objects used by worker threads, where the
+    //! pool is extended as needed to accommodate `nWorkers` workers. Callers need to
+    //! hold #m_workerMutex while using the pool.
+    vector<shared_ptr<Solution>>& _workers(size_t nWorkers);
+
     shared_ptr<Solution> m_sol; //!< Solution object associated with state data
     size_t m_size; //!< Number of entries in SolutionArray
     size_t m_dataSize; //!< Total size of unsliced data
@@ -394,6 +591,10 @@ protected:
 
     shared_ptr<vector<double>> m_data; //!< Work vector holding states
 
+    //! Flags marking entries that were added by resizing and have not been assigned
+    //! a state yet (see setStates()); shared with sliced objects
+    shared_ptr<vector<bool>> m_unset;
+
     //! Auxiliary (extra) components; size of first dimension has to match m_dataSize
     shared_ptr<map<string, AnyValue>> m_extra;
 
@@ -403,8 +604,20 @@ protected:
     //! corresponds to the last entry (different from Python index convention).
     shared_ptr<map<int, string>> m_order;
 
+    //! Functions reading auxiliary components from file when they are first accessed
+    //! (see readEntry()); shared with sliced objects
+    shared_ptr<map<string, function<AnyValue()>>> m_deferred;
+
     bool m_shared = false; //!< `true` if data are shared from another object
     vector<int> m_active; //!< Vector of locations referencing active entries
+
+    size_t m_nThreads = 1; //!< Number of threads used for property evaluation
+
+    //! Cloned Solution objects used by worker threads; shared with sliced objects
+    shared_ptr<vector<shared_ptr<Solution>>> m_workers;
+
+    //! Mutex serializing use of worker Solution objects; shared with sliced objects
+    shared_ptr<std::mutex> m_workerMutex;
 };
 
 //! Return mapping of component alias names to standardized component names.
@@ -49,6 +49,15 @@ public:
     //! sizes, which involves considerable overhead for metadata).
     void setCompressionLevel(int level);
 
+    //! Set number of rows per chunk (`0` for default behavior)
+    //!
+    //! If set, chunked storage is used for matrix-type data written by writeData(),
+    //! rather than a single chunk covering the entire dataset. Resizable datasets
+    //! created by appendData() always use chunked storage, where a default of 1024
+    //! rows per chunk is used if no chunk size is set.
+    //! @since New in %Cantera 3.2
+    void setChunkSize(size_t rows);
+
     //! Check whether location `id` represents a group
     bool hasGroup(const string& id) const;
 
@@ -84,7 +93,9 @@ public:
     //! Write attributes to a specified location
     //! @param id  storage location within file
     //! @param meta  AnyMap containing attributes
-    void writeAttributes(const string& id, const AnyMap& meta);
+    //! @param overwrite  if true, replace existing attributes (default=false)
+    //! @since  Argument `overwrite` is new in %Cantera 3.2
+    void writeAttributes(const string& id, const AnyMap& meta, bool overwrite=false);
 
     //! Read dataset from a specified location
     //! @param id  storage location within file
@@ -93,12 +104,21 @@ public:
     //! @param cols  number of matrix columns, if applicable; if 0, a vector is
     //!     expected, if npos, the size is detected automatically; otherwise, an exact
     //!     number of columns needs to be matched.
+    //! @param start  first row to be read (default=0)
+    //! @param count  number of rows to be read; if npos (default), all rows starting
+    //!     at `start` are read. Only the selected rows (hyperslab) are read from the
+    //!     file.
+    //! @param indices  indices of matrix columns to be read; if empty (default), all
+    //!     columns are read. Only the selected columns (union of hyperslabs) are read
+    //!     from the file, and are returned in the order specified.
     //! @returns  matrix or vector containing data; implemented for types
     //!     `vector<double>`, `vector<long int>`, `vector<string>`,
     //!     `vector<vector<double>>`, `vector<vector<long int>>` and
     //!     `vector<vector<string>>`
-    AnyValue readData(const string& id,
-                      const string& name, size_t rows, size_t cols=npos) const;
+    //! @since  Arguments `start`, `count` and `indices` are new in %Cantera 3.2
+    AnyValue readData(const string& id, const string& name, size_t rows,
+                      size_t cols=npos, size_t start=0, size_t count=npos,
+                      const vector<size_t>& indices={}) const;
 
     //! Write dataset to a specified location
     //! @param id  storage location within file
@@ -109,6 +129,35 @@ public:
     //!     `vector<vector<string>>`
     void writeData(const string& id, const string& name, const AnyValue& data);
 
+    //! Append rows to a resizable dataset at a specified location
+    //!
+    //! If the dataset does not exist, a resizable dataset with chunked storage is
+    //! created, where the first dimension is unlimited; chunk size and compression
+    //! level are set by setChunkSize() and setCompressionLevel(). Existing datasets
+    //! are extended, which requires that they were created by this method.
+    //! @param id  storage location within file
+    //! @param name  name of vector/matrix entry
+    //! @param data  vector or matrix containing rows to be appended; implemented for
+    //!     the same types as writeData()
+    //! @returns  number of rows of the dataset after appending data
+    //! @since New in %Cantera 3.2
+    size_t appendData(const string& id, const string& name, const AnyValue& data);
+
+    //! Check whether rows can be appended to a dataset at a specified location
+    //!
+    //! No data are written; the check allows for validating all datasets of a group
+    //! before any of them is modified by appendData().
+    //! @param id  storage location within file
+    //! @param name  name of vector/matrix entry
+    //! @param data  vector or matrix containing rows to be appended
+    //! @returns  current number of rows of the dataset, or zero if the dataset does
+    //!     not exist yet
+    //! @exception CanteraError  if the existing dataset is not resizable or its
+    //!     shape is inconsistent with the data to be appended
+    //! @since New in %Cantera 3.2
+    size_t checkAppend(const string& id, const string& name,
+                       const AnyValue& data) const;
+
 private:
 #if CT_USE_HDF5
     //! ensure that HDF group is readable
@@ -120,6 +169,7 @@ private:
     unique_ptr<HighFive::File> m_file; //!< HDF container file
     bool m_write; //!< HDF access mode
     int m_compressionLevel=0; //!< HDF compression level
+    size_t m_chunkSize=0; //!< HDF chunk size (number of rows)
 #endif
 };
 
@@ -0,0 +1,17 @@
+#ifndef CT_CONFIG_H
+#define CT_CONFIG_H
+#define CANTERA_VERSION "3.1.0"
+#define CANTERA_SHORT_VERSION "3.1"
+typedef double doublereal;
+typedef int integer;
+typedef int ftnlen;
+#define STRING_LEN_AT_END
+#define FTN_TRAILING_UNDERSCORE 1
+#define CT_USE_SYSTEM_EIGEN 1
+#define CT_USE_SYSTEM_FMT 1
+#define CT_USE_SYSTEM_YAMLCPP 1
+#define CT_USE_LAPACK 1
+#define LAPACK_FTN_TRAILING_UNDERSCORE 1
+#define LAPACK_FTN_STRING_LEN_AT_END 1
+#define CT_PROFILING 1
+#endif
@@ -72,6 +72,18 @@ void addDataDirectory(const string& dir);
 
 //! @copydoc Application::getDataDirectories
 string getDataDirectories(const string& sep);
+
+//! @copydoc Application::setCacheDirectory
+void setCacheDirectory(const string& dir);
+
+//! @copydoc Application::cacheDirectory
+string cacheDirectory();
+
+//! @copydoc Application::readCacheEntry
+bool readCacheEntry(const string& category, const string& key, string& data);
+
+//! @copydoc Application::writeCacheEntry
+void writeCacheEntry(const string& category, const string& key, const string& data);
 //! @}
 
 //! @copydoc Application::loadExtension
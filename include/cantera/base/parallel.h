@@ -0,0 +1,57 @@
+/**
+ * @file parallel.h
+ *    Utilities for distributing independent work items across threads
+ *    (see @ref Cantera::parallelFor).
+ */
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#ifndef CT_PARALLEL_H
+#define CT_PARALLEL_H
+
+#include "ct_defs.h"
+
+namespace Cantera
+{
+
+class Solution;
+
+//! @addtogroup globalUtilFuncs
+//! @{
+
+//! Number of concurrent threads supported by the hardware (at least 1).
+//! @since New in %Cantera 3.2
+size_t hardwareThreads();
+
+/**
+ *  Apply a function to contiguous blocks of the index range `[0, n)` using up to
+ *  `nThreads` threads.
+ *
+ *  The range is split into at most `nThreads` blocks of near-equal size, where block
+ *  `i` is always processed by worker `i`. The function receives the worker index as
+ *  well as the beginning and end of the block, which allows callers to use resources
+ *  owned by individual workers (for example, cloned Solution objects) without
+ *  synchronization. Worker `0` runs on the calling thread; if only a single worker is
+ *  needed, no threads are created. Exceptions thrown by any of the workers are
+ *  re-thrown on the calling thread after all workers have finished.
+ *
+ *  @param n  Number of work items
+ *  @param nThreads  Maximum number of threads; if zero, hardwareThreads() is used
+ *  @param func  Function with signature `func(worker, begin, end)`
+ *  @since New in %Cantera 3.2
+ */
+void parallelFor(size_t n, size_t nThreads,
+                 const function<void(size_t, size_t, size_t)>& func);
+
+//! Check whether reaction rates of a Solution are delegated to external code, for
+//! example rates implemented in Python, which cannot be evaluated on concurrent
+//! threads.
+//! @since New in %Cantera 3.2
+bool hasDelegatedRates(Solution& sol);
+
+//! @}
+
+}
+
+#endif
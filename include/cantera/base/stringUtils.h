@@ -10,6 +10,8 @@
 #define CT_STRINGUTILS_H
 
 #include "ct_defs.h"
+#include <cstring>
+#include <limits>
 
 namespace Cantera
 {
@@ -144,6 +146,61 @@ string toLowerCopy(const string& input);
  */
 bool caseInsensitiveEquals(const string &input, const string &test);
 
+//! Compute the SHA-256 digest of a string.
+/*!
+ *  @param data  Input data, which may contain arbitrary bytes
+ *  @returns the digest as a string of 64 lower-case hexadecimal digits
+ *  @since New in %Cantera 3.2.
+ */
+string sha256(const string& data);
+
+//! Convert a number to its binary representation with little-endian byte order.
+/*!
+ *  Used to write binary data that can be read on any platform. Floating point
+ *  values are stored using their IEEE 754 representation.
+ *  @see fromLittleEndian()
+ *  @since New in %Cantera 3.2.
+ */
+template <class T>
+string toLittleEndian(T value)
+{
+    static_assert(std::is_arithmetic_v<T> && sizeof(T) <= 8);
+    static_assert(!std::is_floating_point_v<T> || std::numeric_limits<T>::is_iec559);
+    using Bits = std::conditional_t<sizeof(T) == 1, uint8_t,
+                 std::conditional_t<sizeof(T) == 2, uint16_t,
+                 std::conditional_t<sizeof(T) == 4, uint32_t, uint64_t>>>;
+    Bits bits;
+    std::memcpy(&bits, &value, sizeof(T));
+    string out(sizeof(T), '\0');
+    for (size_t i = 0; i < sizeof(T); i++) {
+        out[i] = static_cast<char>((bits >> (8 * i)) & 0xff);
+    }
+    return out;
+}
+
+//! Convert the binary representation of a number with little-endian byte order,
+//! as created by toLittleEndian(), to a number.
+/*!
+ *  @param bytes  Pointer to the first of `sizeof(T)` bytes
+ *  @since New in %Cantera 3.2.
+ */
+template <class T>
+T fromLittleEndian(const char* bytes)
+{
+    static_assert(std::is_arithmetic_v<T> && sizeof(T) <= 8);
+    static_assert(!std::is_floating_point_v<T> || std::numeric_limits<T>::is_iec559);
+    using Bits = std::conditional_t<sizeof(T) == 1, uint8_t,
+                 std::conditional_t<sizeof(T) == 2, uint16_t,
+                 std::conditional_t<sizeof(T) == 4, uint32_t, uint64_t>>>;
+    Bits bits = 0;
+    for (size_t i = 0; i < sizeof(T); i++) {
+        bits |= static_cast<Bits>(static_cast<unsigned char>(bytes[i])) << (8 * i);
+    }
+    T value;
+    std::memcpy(&value, &bits, sizeof(T));
+    return value;
+}
+
 //! @}
 
 }
@@ -34,6 +34,8 @@ public:
     bool addReaction(shared_ptr<Reaction> r, bool resize=true) override;
     void addThirdBody(shared_ptr<Reaction> r);
     void modifyReaction(size_t i, shared_ptr<Reaction> rNew) override;
+    void setParameters(const AnyMap& phaseNode) override;
+    AnyMap parameters() const override;
     void resizeSpecies() override;
     void resizeReactions() override;
     void setMultiplier(size_t i, double f) override;
@@ -79,6 +81,12 @@ public:
     Eigen::SparseMatrix<double> netRatesOfProgress_ddCi() override;
     //! @}
 
+    //! @name Tabulation of rate constants
+    //! @{
+    void getRateTabulation(AnyMap& settings) const override;
+    void setRateTabulation(const AnyMap& settings) override;
+    //! @}
+
     //! @name Rate calculation intermediate methods
     //! @{
 
@@ -122,6 +130,12 @@ protected:
     //! @param drop  pointer to output buffer
     void process_ddP(const vector<double>& in, double* drop);
 
+    //! Forward rate constants used as reference values by numerical derivatives.
+    //! If rate constants are tabulated, rate constants are evaluated directly, as
+    //! the derivatives are otherwise dominated by interpolation errors.
+    //! @since New in %Cantera 3.2.
+    const double* directRateConstants();
+
     //! Process concentration (molar density) derivative
     //! @param stoich  stoichiometry manager
     //! @param in  rate expression used for the derivative calculation
@@ -146,6 +160,105 @@ protected:
 
     //! @}
 
+    //! Values tabulated on a grid that is uniform in inverse temperature and, if
+    //! pressure-dependent, in the logarithm of pressure. Values that vary by orders
+    //! of magnitude across the pressure range are tabulated as logarithms.
+    //! @since New in %Cantera 3.2.
+    struct RateTable {
+        //! Indices of tabulated reactions, or of entries of an output buffer
+        vector<size_t> reactions;
+        size_t nT = 0; //!< Number of temperature grid points
+        size_t nP = 1; //!< Number of pressure grid points
+        bool logarithmic = false; //!< `true` if logarithms of values are tabulated
+        //! Tabulated values, where the value for reaction `reactions[j]` at grid
+        //! point `(iT, iP)` is stored at index `(iP * nT + iT) * reactions.size() + j`
+        vector<double> values;
+    };
+
+    //! Rate constants of pressure-dependent Arrhenius (P-log) reactions, tabulated
+    //! as functions of temperature at the pressures of their rate expressions.
+    //! At other pressures, rate constants are interpolated linearly in the logarithm
+    //! of pressure, as done by PlogRate.
+    //! @since New in %Cantera 3.2.
+    struct PlogTable {
+        vector<size_t> reactions; //!< Indices of tabulated reactions
+        //! Index of the first column of #table for each reaction, with an additional
+        //! entry marking the end of the columns of the last reaction
+        vector<size_t> start;
+        vector<double> logP; //!< Logarithm of the pressure of each column
+        //! Rate constants, with one column for each pressure of each reaction
+        RateTable table;
+    };
+
+    //! Tables created for a given mechanism and tabulation settings. Once created,
+    //! tables are not modified and are shared with clones of this object.
+    //! @since New in %Cantera 3.2.
+    struct RateTables {
+        vector<RateTable> rates; //!< Tables of forward rate constants
+        //! Index of the table within #rates for each rate evaluator; `npos` if the
+        //! evaluator is not tabulated using #rates
+        vector<size_t> index;
+        //! Index of the rate evaluator for P-log reactions; `npos` if these
+        //! reactions are not tabulated
+        size_t plogHandler = npos;
+        PlogTable plog; //!< Table of P-log rate constants
+        //! Table of inverse equilibrium constants of reversible reactions
+        RateTable rkcn;
+    };
+
+    //! Create tables for all rate evaluators and equilibrium constants that
+    //! can be tabulated
+    //! @since New in %Cantera 3.2.
+    void buildRateTables();
+
+    //! Tabulate rate constants of P-log reactions at the pressures of their rate
+    //! expressions.
+    //! @param reactions  Indices of P-log reactions
+    //! @param[out] plog  Table of rate constants
+    //! @return `false` if the error bound cannot be met within the maximum
+    //!     grid size
+    //! @since New in %Cantera 3.2.
+    bool buildPlogTable(const vector<size_t>& reactions, PlogTable& plog);
+
+    //! Tabulate values on a grid that is refined until the relative interpolation
+    //! error estimated at intermediate grid points is below #m_tab_rtol.
+    //! @param table  Table with reaction indices and scaling set; grid and values
+    //!     are filled in
+    //! @param pdep  `true` if values depend on pressure
+    //! @param eval  Function evaluating values at a given temperature and pressure
+    //!     into a buffer indexed by the entries of `table.reactions`
+    //! @return `false` if the error bound cannot be met within the maximum
+    //!     grid size
+    //! @since New in %Cantera 3.2.
+    bool tabulate(RateTable& table, bool pdep,
+                  const std::function<void(double, double, double*)>& eval);
+
+    //! Interpolate tabulated values using piecewise cubic polynomials in inverse
+    //! temperature and, if pressure-dependent, logarithm of pressure.
+    //! @param table  Tabulated values
+    //! @param T  Temperature [K]
+    //! @param logP  Natural logarithm of pressure; ignored if the table does not
+    //!     depend on pressure
+    //! @param[out] out  Interpolated values for all reactions, indexed by reaction
+    //! @since New in %Cantera 3.2.
+    void interpolate(const RateTable& table, double T, double logP, double* out) const;
+
+    //! Interpolate tabulated rate constants of P-log reactions.
+    //! @param table  Tabulated values
+    //! @param T  Temperature [K]
+    //! @param logP  Natural logarithm of pressure
+    //! @param[out] out  Interpolated rate constants, indexed by reaction
+    //! @since New in %Cantera 3.2.
+    void interpolate(const PlogTable& table, double T, double logP, double* out) const;
+
+    //! Update standard chemical potentials #m_grt and standard Gibbs free energy
+    //! changes of reversible reactions, if these are out of date. These are not
+    //! calculated by updateROP() if equilibrium constants are tabulated.
+    //! @since New in %Cantera 3.2.
+    void updateDeltaGibbs0();
+
+    void shareWithClone(Kinetics& clone) const override;
+
     //! Difference between the global reactants order and the global products
     //! order. Of type "double" to account for the fact that we can have real-
     //! valued stoichiometries.
@@ -153,6 +266,9 @@ protected:
 
     ThirdBodyCalc m_multi_concm; //!< used with MultiRate evaluator
 
+    //! Index of the profiler category for each rate evaluator in #m_rateHandlers
+    vector<size_t> m_rateCategories;
+
     //! Third body concentrations
     vector<double> m_concm;
 
@@ -177,6 +293,20 @@ protected:
     vector<double> m_sbuf0;
     vector<double> m_state;
     vector<double> m_grt; //!< Standard chemical potentials for each species
+
+    //! Rate tabulation settings
+    double m_tab_Tmin = 0.0;
+    double m_tab_Tmax = 0.0;
+    double m_tab_Pmin = 0.0;
+    double m_tab_Pmax = 0.0;
+    double m_tab_rtol = 1e-4;
+
+    bool m_tab_valid = false; //!< Indicates whether tables are up to date
+    //! Tables of rate constants and equilibrium constants
+    shared_ptr<const RateTables> m_tables;
+
+    //! Indicates whether #m_grt and #m_delta_gibbs0 are up to date
+    bool m_deltaGibbs0_ok = false;
 };
 
 }
@@ -14,6 +14,7 @@
 #include "StoichManager.h"
 #include "cantera/base/ValueCache.h"
 #include "MultiRate.h"
+#include "KineticsProfiler.h"
 
 namespace Cantera
 {
@@ -142,6 +143,11 @@ public:
     //! @param phases Phases used to specify the state for the newly cloned Kinetics
     //!     object. These can be created from the phases used by this object using the
     //!     ThermoPhase::clone() method.
+    //!
+    //! The clone holds its own copies of all Reaction objects and rate evaluators,
+    //! so modifications of reactions in either object do not affect the other one.
+    //! The stoichiometric data of the reactions is shared with the clone, and is
+    //! only copied if reactions are added to either object.
     //! @since New in %Cantera 3.2.
     shared_ptr<Kinetics> clone(const vector<shared_ptr<ThermoPhase>>& phases) const;
 
@@ -1139,8 +1145,10 @@ public:
 
     /**
      * Stoichiometric coefficient matrix for reactants.
+     *
+     * @since Changed in %Cantera 3.2 to return a reference.
      */
-    Eigen::SparseMatrix<double> reactantStoichCoeffs() const {
+    const Eigen::SparseMatrix<double>& reactantStoichCoeffs() const {
         return m_reactantStoich.stoichCoeffs();
     }
 
@@ -1154,15 +1162,19 @@ public:
 
     /**
      * Stoichiometric coefficient matrix for products.
+     *
+     * @since Changed in %Cantera 3.2 to return a reference.
      */
-    Eigen::SparseMatrix<double> productStoichCoeffs() const {
+    const Eigen::SparseMatrix<double>& productStoichCoeffs() const {
         return m_productStoich.stoichCoeffs();
     }
 
     /**
      * Stoichiometric coefficient matrix for products of reversible reactions.
+     *
+     * @since Changed in %Cantera 3.2 to return a reference.
      */
-    Eigen::SparseMatrix<double> revProductStoichCoeffs() const {
+    const Eigen::SparseMatrix<double>& revProductStoichCoeffs() const {
         return m_revProductStoich.stoichCoeffs();
     }
 
@@ -1273,6 +1285,91 @@ public:
      */
     virtual void init() {}
 
+    /**
+     * Retrieve settings for the tabulation of rate constants.
+     *
+     * @param settings  AnyMap containing the tabulation settings; empty if
+     *     tabulation is disabled.
+     * @see setRateTabulation()
+     * @since New in %Cantera 3.2.
+     */
+    virtual void getRateTabulation(AnyMap& settings) const
+    {
+        throw NotImplementedError("Kinetics::getRateTabulation",
+            "Not implemented for kinetics type '{}'.", kineticsType());
+    }
+
+    /**
+     * Enable, modify or disable the tabulation of rate constants.
+     *
+     * If enabled, rate constants that depend only on temperature (and, optionally,
+     * pressure) are evaluated once on a grid spanning the specified range and are
+     * subsequently obtained by interpolation. Outside of the tabulated range, rate
+     * constants are evaluated directly. Tables are created the first time rates are
+     * evaluated after the settings or the reaction mechanism are modified.
+     *
+     * For BulkKinetics, the following keyword/value pairs are supported:
+     *  - `T-range` (list of two doubles): minimum and maximum temperature of the
+     *    tabulated range. Required to enable tabulation.
+     *  - `P-range` (list of two doubles): minimum and maximum pressure of the
+     *    tabulated range. If omitted, Chebyshev rate constants are not tabulated.
+     *    P-log rate constants are tabulated at the pressures of their rate
+     *    expressions and do not require a pressure range.
+     *  - `rtol` (double): relative error bound of interpolated values. The default
+     *    value is 1e-4.
+     *
+     * Passing an empty map disables tabulation.
+     *
+     * @param settings  AnyMap containing the tabulation settings.
+     * @since New in %Cantera 3.2.
+     */
+    virtual void setRateTabulation(const AnyMap& settings)
+    {
+        throw NotImplementedError("Kinetics::setRateTabulation",
+            "Not implemented for kinetics type '{}'.", kineticsType());
+    }
+
+    /**
+     *  Evaluate a property for a batch of thermodynamic states.
+     *
+     *  States are set and the property is evaluated for each state within a single
+     *  call, which avoids the overhead of per-state access from high-level API's.
+     *  The Kinetics object needs to be associated with a Solution object (see
+     *  root()); the state of the associated ThermoPhase object is restored
+     *  afterwards. For parallel evaluation, worker threads use a pool of cloned
+     *  Solution objects that is retained across calls and is discarded whenever
+     *  cached values are invalidated (see cacheNumber()).
+     *
+     *  @param property  Name of the property, for example `"netProductionRates"`
+     *      or `"fwdRateConstants"`; see SolutionArray::evalProperty
+     *  @param nStates  Number of states
+     *  @param T  Temperatures [K] (length `nStates`)
+     *  @param P  Pressures [Pa] (length `nStates`)
+     *  @param Y  Mass fractions (length `nStates` * number of species in the
+     *      associated phase; row-major order), which are normalized for each state
+     *  @param out  Output buffer with length `nStates` times the size of the
+     *      property (see SolutionArray::propertySize); values for each state are
+     *      stored contiguously
+     *  @param nThreads  Number of threads; if zero, all available hardware threads
+     *      are used. Parallel evaluation is not supported for mechanisms that
+     *      include user-defined reaction rates.
+     *  @since New in %Cantera 3.2
+     */
+    void evalBatch(const string& property, size_t nStates, const double* T,
+                   const double* P, const double* Y, double* out, size_t nThreads=1);
+
+    //! Get the profiler collecting call counts and wall-clock times for the steps
+    //! involved in evaluating rates of progress and species production rates.
+    //! Profiling is disabled by default; use KineticsProfiler::setEnabled() to
+    //! enable it. For BulkKinetics, statistics are collected for each reaction rate
+    //! evaluator as well as for the calculation of equilibrium constants,
+    //! third-body concentrations and the application of stoichiometric
+    //! coefficients.
+    //! @since New in %Cantera 3.2.
+    KineticsProfiler& profiler() {
+        return m_profiler;
+    }
+
     //! Set kinetics-related parameters from an AnyMap phase description.
     //! @since New in %Cantera 3.2.
     virtual void setParameters(const AnyMap& phaseNode);
@@ -1280,7 +1377,7 @@ public:
     //! Return the parameters for a phase definition which are needed to
     //! reconstruct an identical object using the newKinetics function. This
     //! excludes the reaction definitions, which are handled separately.
-    AnyMap parameters() const;
+    virtual AnyMap parameters() const;
 
     /**
      * Resize arrays with sizes that depend on the total number of species.
@@ -1377,10 +1474,20 @@ public:
         m_perturb[i] = f;
     }
 
+    //! Invalidate any cached values, which is also done whenever reactions or
+    //! settings affecting rate calculations are modified.
     virtual void invalidateCache() {
         m_cache.clear();
+        m_cacheNum++;
     };
 
+    //! Number of times cached values were invalidated. Objects derived from this
+    //! Kinetics object, for example clones, may use this to detect modifications.
+    //! @since New in %Cantera 3.2
+    int cacheNumber() const {
+        return m_cacheNum;
+    }
+
     //! @}
     //! Check for unmarked duplicate reactions and unmatched marked duplicates
     //!
@@ -1429,9 +1536,19 @@ public:
     }
 
 protected:
+    //! Share data that depends only on the reaction mechanism and settings of this
+    //! object with a clone created by clone(), which avoids recomputing the data.
+    //! The base class method does nothing.
+    //! @param clone  Kinetics object created by clone()
+    //! @since New in %Cantera 3.2.
+    virtual void shareWithClone(Kinetics& clone) const {}
+
     //! Cache for saved calculations within each Kinetics object.
     ValueCache m_cache;
 
+    //! Counter incremented by invalidateCache()
+    int m_cacheNum = 0;
+
     // Update internal rate-of-progress variables #m_ropf and #m_ropr.
     virtual void updateROP() {
         throw NotImplementedError("Kinetics::updateROP");
@@ -1454,6 +1571,16 @@ protected:
     vector<unique_ptr<MultiRateBase>> m_rateHandlers;
     map<string, size_t> m_rateTypes; //!< Mapping of rate handlers
 
+    //! Profiler for rate evaluation steps. See profiler()
+    KineticsProfiler m_profiler;
+
+    //! Cloned Solution objects used by worker threads in evalBatch()
+    shared_ptr<vector<shared_ptr<Solution>>> m_batchWorkers;
+
+    //! cacheNumber() at the time #m_batchWorkers were created; used to discard
+    //! workers that do not reflect modified reactions or settings
+    int m_batchWorkersCacheNum = -1;
+
     //! @name Stoichiometry management
     //!
     //! These objects and functions handle turning reaction extents into species
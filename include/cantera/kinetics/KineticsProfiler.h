@@ -0,0 +1,43 @@
+//! @file KineticsProfiler.h Declarations for class KineticsProfiler
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#ifndef CT_KINETICSPROFILER_H
+#define CT_KINETICSPROFILER_H
+
+#include "cantera/base/Profiler.h"
+
+namespace Cantera
+{
+
+//! Collects call counts and wall-clock times for the steps involved in evaluating
+//! rates of progress and species production rates.
+//!
+//! Each Kinetics object registers one Profiler category for each reaction rate
+//! evaluator (MultiRate object), named after the rate type handled by the evaluator,
+//! for example `Arrhenius`, `Troe`, `pressure-dependent-Arrhenius`, `Chebyshev`, or
+//! the name of a user-defined rate type. In addition, the categories
+//! `equilibrium-constants`, `third-bodies` and `stoichiometry` are always present.
+//! Steps are timed using ProfileTimer objects.
+//!
+//! @since New in %Cantera 3.2.
+//! @ingroup kineticsmgr
+class KineticsProfiler : public Profiler
+{
+public:
+    KineticsProfiler();
+
+    //! Index of the category for the calculation of equilibrium constants
+    static constexpr size_t equilibriumConstants = 0;
+    //! Index of the category for the evaluation and application of third-body
+    //! concentrations (ThirdBodyCalc)
+    static constexpr size_t thirdBodies = 1;
+    //! Index of the category for the application of stoichiometric coefficients
+    //! (StoichManagerN) to rates of progress and species production rates
+    static constexpr size_t stoichiometry = 2;
+};
+
+}
+
+#endif
@@ -25,6 +25,7 @@ class MultiRate final : public MultiRateBase
     CT_DEFINE_HAS_MEMBER(has_ddT, ddTScaledFromStruct)
     CT_DEFINE_HAS_MEMBER(has_ddP, perturbPressure)
     CT_DEFINE_HAS_MEMBER(has_ddM, perturbThirdBodies)
+    CT_DEFINE_HAS_MEMBER(has_evalMultiple, evalMultipleFromStruct)
 
 public:
     string type() override {
@@ -67,6 +68,11 @@ public:
     }
 
     void getRateConstants(double* kf) override {
+        if constexpr (has_evalMultiple<RateType>::value) {
+            if (RateType::evalMultipleFromStruct(m_rxn_rates, m_shared, kf)) {
+                return;
+            }
+        }
         for (auto& [iRxn, rate] : m_rxn_rates) {
             kf[iRxn] = rate.evalFromStruct(m_shared);
         }
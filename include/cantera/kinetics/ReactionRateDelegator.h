@@ -46,6 +46,21 @@ public:
         m_wrappedData = wrapper;
     }
 
+    void invalidateCache() override {
+        ReactionData::invalidateCache();
+        batchParameters.clear();
+    }
+
+    //! Parameters of all reactions used for batch evaluation, stored in reaction
+    //! order with ReactionRateDelegator::nBatchParameters() entries per reaction.
+    //! Cleared by invalidateCache().
+    //! @since New in %Cantera 3.2.
+    vector<double> batchParameters;
+
+    //! Buffer for rate constants obtained by batch evaluation
+    //! @since New in %Cantera 3.2.
+    vector<double> batchRates;
+
 protected:
     //! The reaction rate type
     string m_rateType;
@@ -90,6 +105,37 @@ public:
         return m_evalFromStruct(shared_data.getWrapper()->get());
     }
 
+    //! Set the number of parameters per reaction used for batch evaluation. If
+    //! batch evaluation is enabled, MultiRate evaluators obtain rate constants of
+    //! all reactions of this type from a single call to the delegated `evalBatch`
+    //! method instead of calling `evalFromStruct` for each reaction.
+    //! @param n  Number of parameters, or `npos` to disable batch evaluation
+    //! @since New in %Cantera 3.2.
+    void setBatchParameterCount(size_t n) {
+        m_nBatchParameters = n;
+    }
+
+    //! Number of parameters per reaction used for batch evaluation; `npos` if batch
+    //! evaluation is disabled.
+    //! @since New in %Cantera 3.2.
+    size_t nBatchParameters() const {
+        return m_nBatchParameters;
+    }
+
+    //! Evaluate the rate constants of multiple reactions using the delegated
+    //! `evalBatch` method. Parameters of the individual rates are obtained from the
+    //! delegated `getBatchParameters` method and are cached in `shared_data` until
+    //! its cache is invalidated.
+    //! @param rates  Pairs of reaction index and rate object, as stored by MultiRate
+    //! @param shared_data  data shared by all reactions of a given type
+    //! @param[out] kf  Forward rate constants, indexed by reaction
+    //! @return  `false` if batch evaluation is not enabled, in which case `kf` is not
+    //!     modified
+    //! @since New in %Cantera 3.2.
+    static bool evalMultipleFromStruct(
+        vector<pair<size_t, ReactionRateDelegator>>& rates,
+        ReactionDataDelegator& shared_data, double* kf);
+
     void setParameters(const AnyMap& node, const UnitStack& units) override {
         m_setParameters(node, units);
     }
@@ -108,6 +154,16 @@ private:
     //! ReactionData wrapper object
     function<double(void*)> m_evalFromStruct;
 
+    //! Number of parameters per reaction used for batch evaluation
+    size_t m_nBatchParameters = npos;
+
+    //! Delegated `getBatchParameters` method writing the parameters of this rate
+    function<void(std::array<size_t, 1>, double*)> m_getBatchParameters;
+
+    //! Delegated `evalBatch` method taking a pointer to the ReactionData wrapper
+    //! object, the parameters of all reactions, and the output array of rate constants
+    function<void(std::array<size_t, 2>, void*, double*, double*)> m_evalBatch;
+
     function<void(const string&, void*)> m_validate;
     function<void(const AnyMap&, const UnitStack&)> m_setParameters;
     function<void(AnyMap&)> m_getParameters;
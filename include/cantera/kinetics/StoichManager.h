@@ -591,30 +591,28 @@ public:
     /**
      * Constructor for the StoichManagerN class.
      */
-    StoichManagerN() : m_ready(true) {
-        m_stoichCoeffs.setZero();
-        m_stoichCoeffs.resize(0, 0);
-    }
+    StoichManagerN() : m_ready(true), m_coeffs(make_shared<Coefficients>()) {}
 
     //! Resize the sparse coefficient matrix
     void resizeCoeffs(size_t nSpc, size_t nRxn)
     {
-        size_t nCoeffs = m_coeffList.size();
+        Coefficients& c = mutableCoeffs();
+        size_t nCoeffs = c.coeffList.size();
 
         // Stoichiometric coefficient matrix
-        m_stoichCoeffs.resize(nSpc, nRxn);
-        m_stoichCoeffs.reserve(nCoeffs);
-        m_stoichCoeffs.setFromTriplets(m_coeffList.begin(), m_coeffList.end());
+        c.stoichCoeffs.resize(nSpc, nRxn);
+        c.stoichCoeffs.reserve(nCoeffs);
+        c.stoichCoeffs.setFromTriplets(c.coeffList.begin(), c.coeffList.end());
 
         // Set up outer/inner indices for mapped derivative output
-        Eigen::SparseMatrix<double> tmp = m_stoichCoeffs.transpose();
-        m_outerIndices.resize(nSpc + 1); // number of columns + 1
+        Eigen::SparseMatrix<double> tmp = c.stoichCoeffs.transpose();
+        c.outerIndices.resize(nSpc + 1); // number of columns + 1
         for (int i = 0; i < tmp.outerSize() + 1; i++) {
-            m_outerIndices[i] = tmp.outerIndexPtr()[i];
+            c.outerIndices[i] = tmp.outerIndexPtr()[i];
         }
-        m_innerIndices.resize(nCoeffs);
+        c.innerIndices.resize(nCoeffs);
         for (size_t n = 0; n < nCoeffs; n++) {
-            m_innerIndices[n] = tmp.innerIndexPtr()[n];
+            c.innerIndices[n] = tmp.innerIndexPtr()[n];
         }
         m_values.resize(nCoeffs, 0.);
 
@@ -628,10 +626,10 @@ public:
             }
         }
         // update reaction setup
-        _resizeCoeffs(m_c1_list.begin(), m_c1_list.end(), indices);
-        _resizeCoeffs(m_c2_list.begin(), m_c2_list.end(), indices);
-        _resizeCoeffs(m_c3_list.begin(), m_c3_list.end(), indices);
-        _resizeCoeffs(m_cn_list.begin(), m_cn_list.end(), indices);
+        _resizeCoeffs(c.c1_list.begin(), c.c1_list.end(), indices);
+        _resizeCoeffs(c.c2_list.begin(), c.c2_list.end(), indices);
+        _resizeCoeffs(c.c3_list.begin(), c.c3_list.end(), indices);
+        _resizeCoeffs(c.cn_list.begin(), c.cn_list.end(), indices);
 
         m_ready = true;
     }
@@ -680,16 +678,17 @@ public:
             throw CanteraError(
                 "StoichManagerN::add()", "size of stoich and species arrays differ");
         }
+        Coefficients& c = mutableCoeffs();
         bool frac = false;
         for (size_t n = 0; n < stoich.size(); n++) {
-            m_coeffList.emplace_back(
+            c.coeffList.emplace_back(
                 static_cast<int>(k[n]), static_cast<int>(rxn), stoich[n]);
             if (fmod(stoich[n], 1.0) || stoich[n] != order[n]) {
                 frac = true;
             }
         }
         if (frac || k.size() > 3) {
-            m_cn_list.emplace_back(rxn, k, order, stoich);
+            c.cn_list.emplace_back(rxn, k, order, stoich);
         } else {
             // Try to express the reaction with unity stoichiometric
             // coefficients (by repeating species when necessary) so that the
@@ -704,54 +703,59 @@ public:
 
             switch (kRep.size()) {
             case 1:
-                m_c1_list.emplace_back(rxn, kRep[0]);
+                c.c1_list.emplace_back(rxn, kRep[0]);
                 break;
             case 2:
-                m_c2_list.emplace_back(rxn, kRep[0], kRep[1]);
+                c.c2_list.emplace_back(rxn, kRep[0], kRep[1]);
                 break;
             case 3:
-                m_c3_list.emplace_back(rxn, kRep[0], kRep[1], kRep[2]);
+                c.c3_list.emplace_back(rxn, kRep[0], kRep[1], kRep[2]);
                 break;
             default:
-                m_cn_list.emplace_back(rxn, k, order, stoich);
+                c.cn_list.emplace_back(rxn, k, order, stoich);
             }
         }
         m_ready = false;
     }
 
     void multiply(const double* input, double* output) const {
-        _multiply(m_c1_list.begin(), m_c1_list.end(), input, output);
-        _multiply(m_c2_list.begin(), m_c2_list.end(), input, output);
-        _multiply(m_c3_list.begin(), m_c3_list.end(), input, output);
-        _multiply(m_cn_list.begin(), m_cn_list.end(), input, output);
+        const Coefficients& c = *m_coeffs;
+        _multiply(c.c1_list.begin(), c.c1_list.end(), input, output);
+        _multiply(c.c2_list.begin(), c.c2_list.end(), input, output);
+        _multiply(c.c3_list.begin(), c.c3_list.end(), input, output);
+        _multiply(c.cn_list.begin(), c.cn_list.end(), input, output);
     }
 
     void incrementSpecies(const double* input, double* output) const {
-        _incrementSpecies(m_c1_list.begin(), m_c1_list.end(), input, output);
-        _incrementSpecies(m_c2_list.begin(), m_c2_list.end(), input, output);
-        _incrementSpecies(m_c3_list.begin(), m_c3_list.end(), input, output);
-        _incrementSpecies(m_cn_list.begin(), m_cn_list.end(), input, output);
+        const Coefficients& c = *m_coeffs;
+        _incrementSpecies(c.c1_list.begin(), c.c1_list.end(), input, output);
+        _incrementSpecies(c.c2_list.begin(), c.c2_list.end(), input, output);
+        _incrementSpecies(c.c3_list.begin(), c.c3_list.end(), input, output);
+        _incrementSpecies(c.cn_list.begin(), c.cn_list.end(), input, output);
     }
 
     void decrementSpecies(const double* input, double* output) const {
-        _decrementSpecies(m_c1_list.begin(), m_c1_list.end(), input, output);
-        _decrementSpecies(m_c2_list.begin(), m_c2_list.end(), input, output);
-        _decrementSpecies(m_c3_list.begin(), m_c3_list.end(), input, output);
-        _decrementSpecies(m_cn_list.begin(), m_cn_list.end(), input, output);
+        const Coefficients& c = *m_coeffs;
+        _decrementSpecies(c.c1_list.begin(), c.c1_list.end(), input, output);
+        _decrementSpecies(c.c2_list.begin(), c.c2_list.end(), input, output);
+        _decrementSpecies(c.c3_list.begin(), c.c3_list.end(), input, output);
+        _decrementSpecies(c.cn_list.begin(), c.cn_list.end(), input, output);
     }
 
     void incrementReactions(const double* input, double* output) const {
-        _incrementReactions(m_c1_list.begin(), m_c1_list.end(), input, output);
-        _incrementReactions(m_c2_list.begin(), m_c2_list.end(), input, output);
-        _incrementReactions(m_c3_list.begin(), m_c3_list.end(), input, output);
-        _incrementReactions(m_cn_list.begin(), m_cn_list.end(), input, output);
+        const Coefficients& c = *m_coeffs;
+        _incrementReactions(c.c1_list.begin(), c.c1_list.end(), input, output);
+        _incrementReactions(c.c2_list.begin(), c.c2_list.end(), input, output);
+        _incrementReactions(c.c3_list.begin(), c.c3_list.end(), input, output);
+        _incrementReactions(c.cn_list.begin(), c.cn_list.end(), input, output);
     }
 
     void decrementReactions(const double* input, double* output) const {
-        _decrementReactions(m_c1_list.begin(), m_c1_list.end(), input, output);
-        _decrementReactions(m_c2_list.begin(), m_c2_list.end(), input, output);
-        _decrementReactions(m_c3_list.begin(), m_c3_list.end(), input, output);
-        _decrementReactions(m_cn_list.begin(), m_cn_list.end(), input, output);
+        const Coefficients& c = *m_coeffs;
+        _decrementReactions(c.c1_list.begin(), c.c1_list.end(), input, output);
+        _decrementReactions(c.c2_list.begin(), c.c2_list.end(), input, output);
+        _decrementReactions(c.c3_list.begin(), c.c3_list.end(), input, output);
+        _decrementReactions(c.cn_list.begin(), c.cn_list.end(), input, output);
     }
 
     //! Return matrix containing stoichiometric coefficients
@@ -764,7 +768,7 @@ public:
             throw CanteraError("StoichManagerN::stoichCoeffs", "The object "
                 "is not fully configured; make sure to call resizeCoeffs().");
         }
-        return m_stoichCoeffs;
+        return m_coeffs->stoichCoeffs;
     }
 
     //! Calculate derivatives with respect to species concentrations.
@@ -779,42 +783,63 @@ public:
      */
     Eigen::SparseMatrix<double> derivatives(const double* conc, const double* rates)
     {
+        const Coefficients& c = *m_coeffs;
         // calculate derivative entries using known sparse storage order
         std::fill(m_values.begin(), m_values.end(), 0.);
-        _derivatives(m_c1_list.begin(), m_c1_list.end(), conc, rates, m_values);
-        _derivatives(m_c2_list.begin(), m_c2_list.end(), conc, rates, m_values);
-        _derivatives(m_c3_list.begin(), m_c3_list.end(), conc, rates, m_values);
-        _derivatives(m_cn_list.begin(), m_cn_list.end(), conc, rates, m_values);
+        _derivatives(c.c1_list.begin(), c.c1_list.end(), conc, rates, m_values);
+        _derivatives(c.c2_list.begin(), c.c2_list.end(), conc, rates, m_values);
+        _derivatives(c.c3_list.begin(), c.c3_list.end(), conc, rates, m_values);
+        _derivatives(c.cn_list.begin(), c.cn_list.end(), conc, rates, m_values);
 
-        return Eigen::Map<Eigen::SparseMatrix<double>>(
-            m_stoichCoeffs.cols(), m_stoichCoeffs.rows(), m_values.size(),
-            m_outerIndices.data(), m_innerIndices.data(), m_values.data());
+        return Eigen::Map<const Eigen::SparseMatrix<double>>(
+            c.stoichCoeffs.cols(), c.stoichCoeffs.rows(), m_values.size(),
+            c.outerIndices.data(), c.innerIndices.data(), m_values.data());
     }
 
     //! Scale input by reaction order and factor
     void scale(const double* in, double* out, double factor) const
     {
-        _scale(m_c1_list.begin(), m_c1_list.end(), in, out, factor);
-        _scale(m_c2_list.begin(), m_c2_list.end(), in, out, factor);
-        _scale(m_c3_list.begin(), m_c3_list.end(), in, out, factor);
-        _scale(m_cn_list.begin(), m_cn_list.end(), in, out, factor);
+        const Coefficients& c = *m_coeffs;
+        _scale(c.c1_list.begin(), c.c1_list.end(), in, out, factor);
+        _scale(c.c2_list.begin(), c.c2_list.end(), in, out, factor);
+        _scale(c.c3_list.begin(), c.c3_list.end(), in, out, factor);
+        _scale(c.cn_list.begin(), c.cn_list.end(), in, out, factor);
     }
 
 private:
-    bool m_ready; //!< Boolean flag indicating whether object is fully configured
+    //! Stoichiometric data for all reactions handled by this object. Copies of a
+    //! StoichManagerN object share this data until one of them is modified.
+    struct Coefficients
+    {
+        vector<C1> c1_list;
+        vector<C2> c2_list;
+        vector<C3> c3_list;
+        vector<C_AnyN> cn_list;
+
+        //! Sparse matrices for stoichiometric coefficients
+        SparseTriplets coeffList;
+        Eigen::SparseMatrix<double> stoichCoeffs;
+
+        //! Storage indices used to build derivatives
+        vector<int> outerIndices;
+        vector<int> innerIndices;
+    };
+
+    //! Get the stoichiometric data for modification, making a private copy
+    //! first if the data is shared with other StoichManagerN objects
+    Coefficients& mutableCoeffs() {
+        if (m_coeffs.use_count() != 1) {
+            m_coeffs = make_shared<Coefficients>(*m_coeffs);
+        }
+        // The data is owned exclusively by this object and was created non-const
+        return const_cast<Coefficients&>(*m_coeffs);
+    }
 
-    vector<C1> m_c1_list;
-    vector<C2> m_c2_list;
-    vector<C3> m_c3_list;
-    vector<C_AnyN> m_cn_list;
+    bool m_ready; //!< Boolean flag indicating whether object is fully configured
 
-    //! Sparse matrices for stoichiometric coefficients
-    SparseTriplets m_coeffList;
-    Eigen::SparseMatrix<double> m_stoichCoeffs;
+    shared_ptr<const Coefficients> m_coeffs; //!< Shared stoichiometric data
 
-    //! Storage indicies used to build derivatives
-    vector<int> m_outerIndices;
-    vector<int> m_innerIndices;
+    //! Work array for derivatives
     vector<double> m_values;
 };
 
@@ -91,6 +91,12 @@ protected:
     //! during integrator initialization or reinitialization.
     void applyOptions();
 
+    //! Create (if needed) and initialize the SystemJacobian used either as a
+    //! preconditioner or, for the `"SPARSE"` linear solver type, to form and
+    //! factorize the Newton iteration matrix.
+    //! @since New in %Cantera 3.2.
+    void initializeSystemJacobian();
+
 private:
     void sensInit(double t0, FuncEval& func);
 
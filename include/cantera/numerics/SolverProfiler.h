@@ -0,0 +1,88 @@
+//! @file SolverProfiler.h Declarations for class SolverProfiler
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#ifndef CT_SOLVERPROFILER_H
+#define CT_SOLVERPROFILER_H
+
+#include "cantera/base/Profiler.h"
+
+namespace Cantera
+{
+
+//! Phases of a solver that are tracked by SolverProfiler.
+//! @since New in %Cantera 3.2.
+enum class SolverPhase {
+    residual, //!< Evaluation of the residual or right-hand side function
+    jacobian, //!< Evaluation of the Jacobian matrix
+    factorization, //!< Factorization of the (transient or preconditioner) matrix
+    linearSolve, //!< Solution of linear systems using a factorized matrix
+    thermo, //!< Update of thermodynamic properties
+    kinetics, //!< Update of species production rates
+    transport, //!< Update of transport properties
+    refinement, //!< Grid refinement
+    timeStepping, //!< Pseudo-transient time stepping used as fallback of Newton solves
+    count_ //!< Number of phases; not a valid phase
+};
+
+//! Collects call counts and wall-clock times for different phases of a solver.
+//!
+//! Each SolverPhase is represented by a Profiler category named after the phase (see
+//! phaseName()). Phases may be nested, for example residual evaluations carried out
+//! while evaluating a finite difference Jacobian are also counted as residual
+//! evaluations. For phases evaluated concurrently by multiple threads, times are
+//! summed over all threads.
+//!
+//! @since New in %Cantera 3.2.
+//! @ingroup numerics
+class SolverProfiler : public Profiler
+{
+public:
+    SolverProfiler();
+
+    using Profiler::add;
+    using Profiler::calls;
+    using Profiler::time;
+
+    //! Add time spent in a phase. This method is thread-safe.
+    //! @param phase  Solver phase
+    //! @param elapsed  Wall-clock time [s]
+    //! @param calls  Number of calls contributing to the elapsed time
+    void add(SolverPhase phase, double elapsed, size_t calls=1) {
+        add(static_cast<size_t>(phase), elapsed, calls);
+    }
+
+    //! Number of recorded calls of a phase
+    size_t calls(SolverPhase phase) const {
+        return m_calls[static_cast<size_t>(phase)];
+    }
+
+    //! Total wall-clock time [s] recorded for a phase
+    double time(SolverPhase phase) const {
+        return m_time[static_cast<size_t>(phase)];
+    }
+
+    //! Name of a solver phase used for the keys returned by stats()
+    static string phaseName(SolverPhase phase);
+};
+
+//! ProfileTimer accumulating time spent in a solver phase. Each pair of calls to
+//! start() and stop() contributes one call to the phase.
+//!
+//! @since New in %Cantera 3.2.
+//! @ingroup numerics
+class PhaseTimer : public ProfileTimer
+{
+public:
+    //! Constructor
+    //! @param profiler  Profiler receiving the timing information; may be `nullptr`
+    //! @param phase  Solver phase being timed
+    //! @param start  If `true`, start timing immediately
+    PhaseTimer(SolverProfiler* profiler, SolverPhase phase, bool start=true)
+        : ProfileTimer(profiler, static_cast<size_t>(phase), start) {}
+};
+
+}
+
+#endif
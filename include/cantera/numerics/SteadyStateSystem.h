@@ -8,6 +8,7 @@
 
 #include "cantera/base/ct_defs.h"
 #include "SystemJacobian.h"
+#include "SolverProfiler.h"
 
 namespace Cantera
 {
@@ -120,6 +121,15 @@ public:
     //! linear systems as part of each Newton iteration.
     shared_ptr<SystemJacobian> linearSolver() const { return m_jac; }
 
+    //! Get the profiler collecting call counts and wall-clock times for the phases of
+    //! the solver, which include residual and Jacobian evaluations, factorizations,
+    //! linear solves and time stepping. Profiling is disabled by default; use
+    //! SolverProfiler::setEnabled() to enable it.
+    //! @since New in %Cantera 3.2.
+    SolverProfiler& profiler() {
+        return m_profiler;
+    }
+
     //! Reciprocal of the time step.
     double rdt() const {
         return m_rdt;
@@ -325,6 +335,8 @@ protected:
     double m_jacobianRelPerturb = 1e-5;
     //! Absolute perturbation of each component in finite difference Jacobian
     double m_jacobianAbsPerturb = 1e-10;
+
+    SolverProfiler m_profiler; //!< Profiler for solver phases. See profiler()
 };
 
 }
@@ -320,6 +320,47 @@ public:
         throw NotImplementedError("Domain1D::eval");
     }
 
+    //! Evaluate derivatives of local source terms at a grid point.
+    /*!
+     *  Domains may provide analytic derivatives of source terms that only depend on
+     *  the solution at the same grid point, for example chemical production rates.
+     *  If derivatives are provided, the corresponding source terms need to be held
+     *  constant while the residual is evaluated for the finite difference Jacobian
+     *  (that is, if eval() is called with `j != npos`), so that the finite
+     *  difference approximation only captures the remaining terms.
+     *
+     *  @param[in] x  Local state vector
+     *  @param[in] j  Local grid point
+     *  @param[out] jac  Derivatives of residual components with respect to solution
+     *      components at point `j`, stored as a column-major square matrix with
+     *      nComponents() rows
+     *  @returns  `true` if derivatives are provided; the default implementation
+     *      returns `false`.
+     *  @since New in %Cantera 3.2.
+     */
+    virtual bool evalSourceJacobian(double* x, size_t j, double* jac) {
+        return false;
+    }
+
+    /**
+     *  Add the contributions of this domain to the products of an adjoint vector
+     *  @f$ \lambda @f$ and the derivatives of the residuals with respect to the
+     *  logarithms of the rate constants @f$ k_i @f$ of all reactions,
+     *  @f$ \lambda^T \partial f / \partial \ln k_i @f$.
+     *
+     *  @param[in] kin  Kinetics object whose reactions are considered. Domains that
+     *      do not use this object do not contribute.
+     *  @param[in] x  Local state vector
+     *  @param[in] lambda  Local part of the adjoint vector
+     *  @param[in,out] products  Array of length `kin.nReactions()` the contributions
+     *      are added to
+     *  @since New in %Cantera 3.2.
+     */
+    virtual void addReactionAdjointProducts(const Kinetics& kin, const double* x,
+                                            const double* lambda, double* products)
+    {
+    }
+
     /**
      * Returns the index of the solution vector, which corresponds to component
      * n at grid point j.
@@ -271,6 +271,29 @@ public:
         return m_do_radiation;
     }
 
+    //! Set whether derivatives of chemical source terms are evaluated analytically
+    //! when evaluating the Jacobian.
+    //!
+    //! If enabled, derivatives of species production rates with respect to
+    //! temperature and mass fractions are assembled from kinetics derivatives (see
+    //! Kinetics::netProductionRates_ddX), while remaining terms are obtained by finite
+    //! differences with production rates held constant. This avoids re-evaluating
+    //! reaction rates for every perturbation of the solution. Derivatives are subject
+    //! to the derivative settings of the Kinetics object (see
+    //! Kinetics::setDerivativeSettings) and are only used if the Jacobian is evaluated
+    //! column by column (see OneDim::setJacobianColoring). Disabled by default.
+    //!
+    //! @since New in %Cantera 3.2.
+    void enableAnalyticChemistryJacobian(bool analytic);
+
+    //! Returns `true` if derivatives of chemical source terms are evaluated
+    //! analytically when evaluating the Jacobian.
+    //! @see enableAnalyticChemistryJacobian
+    //! @since New in %Cantera 3.2.
+    bool analyticChemistryJacobianEnabled() const {
+        return m_analyticChemistryJac;
+    }
+
     //! Return radiative heat loss at grid point j
     double radiativeHeatLoss(size_t j) const {
         return m_qdotRadiation[j];
@@ -373,6 +396,34 @@ public:
     //! between j and j + 1.
     void setGasAtMidpoint(const double* x, size_t j);
 
+    /**
+     *  Set the number of threads used to evaluate thermodynamic, kinetic and
+     *  transport properties at the grid points.
+     *
+     *  Grid points are split into blocks that are evaluated concurrently, where each
+     *  worker thread uses a Solution object cloned from the one associated with this
+     *  domain. This applies to residual evaluations as well as finite difference
+     *  Jacobians that evaluate the residual for all points at once (see
+     *  OneDim::setJacobianColoring), whereas property updates for only a few points
+     *  are not split. Reaction rate multipliers are synchronized for each evaluation,
+     *  whereas other modifications of the associated Solution object (for example,
+     *  modified reactions) require a reset of the cloned objects by calling this
+     *  method. Parallel evaluation is not available for mechanisms that include
+     *  reaction rates implemented in Python or other external languages.
+     *
+     *  @param nThreads  Number of threads; if zero, all available hardware threads
+     *      are used. The default value of one disables parallel evaluation.
+     *  @since New in %Cantera 3.2.
+     */
+    void setNumThreads(size_t nThreads);
+
+    //! Number of threads used to evaluate properties at the grid points.
+    //! @see setNumThreads()
+    //! @since New in %Cantera 3.2.
+    size_t numThreads() const {
+        return m_nThreads;
+    }
+
     //! Get the density [kg/m³] at point `j`
     double density(size_t j) const {
         return m_rho[j];
@@ -427,6 +478,14 @@ public:
     void eval(size_t jGlobal, double* xGlobal, double* rsdGlobal,
               integer* diagGlobal, double rdt) override;
 
+    //! Evaluate derivatives of the species and energy residuals with respect to
+    //! temperature and mass fractions due to chemical source terms, if enabled.
+    //! @see enableAnalyticChemistryJacobian
+    bool evalSourceJacobian(double* x, size_t j, double* jac) override;
+
+    void addReactionAdjointProducts(const Kinetics& kin, const double* x,
+                                    const double* lambda, double* products) override;
+
     //! Index of the species on the left boundary with the largest mass fraction
     size_t leftExcessSpecies() const {
         return m_kExcessLeft;
@@ -458,18 +517,9 @@ protected:
      * * #m_wtm (mean molecular weight)
      * * #m_cp (specific heat capacity)
      * * #m_hk (species specific enthalpies)
-     * * #m_wdot (species production rates)
+     * * #m_wdot (species production rates), unless `updateRates` is `false`
      */
-    void updateThermo(const double* x, size_t j0, size_t j1) {
-        for (size_t j = j0; j <= j1; j++) {
-            setGas(x,j);
-            m_rho[j] = m_thermo->density();
-            m_wtm[j] = m_thermo->meanMolecularWeight();
-            m_cp[j] = m_thermo->cp_mass();
-            m_thermo->getPartialMolarEnthalpies(&m_hk(0, j));
-            m_kin->getNetProductionRates(&m_wdot(0, j));
-        }
-    }
+    void updateThermo(const double* x, size_t j0, size_t j1, bool updateRates=true);
 
     /**
      * Update the transport properties at grid points in the range from `j0`
@@ -488,6 +538,30 @@ protected:
     //! to be updated are defined.
     virtual void updateProperties(size_t jg, double* x, size_t jmin, size_t jmax);
 
+    //! Set the state of `thermo` to be consistent with the solution at point `j`.
+    //! @since New in %Cantera 3.2.
+    void setGas(ThermoPhase& thermo, const double* x, size_t j) const;
+
+    //! Set the state of `thermo` to be consistent with the solution at the midpoint
+    //! between `j` and `j + 1`, using `ybar` (length #m_nsp) as work array.
+    //! @since New in %Cantera 3.2.
+    void setGasAtMidpoint(ThermoPhase& thermo, const double* x, size_t j,
+                          double* ybar) const;
+
+    /**
+     *  Evaluate properties for blocks of grid points, which are distributed across
+     *  worker threads if enabled (see setNumThreads()).
+     *
+     *  @param j0  First grid point
+     *  @param j1  One past the last grid point
+     *  @param func  Function with signature `func(thermo, kin, trans, begin, end)`,
+     *      which evaluates properties for points `begin <= j < end` using the
+     *      provided objects. Different blocks must only write to separate locations.
+     *  @since New in %Cantera 3.2.
+     */
+    void forEachPointBlock(size_t j0, size_t j1,
+        const function<void(ThermoPhase&, Kinetics&, Transport&, size_t, size_t)>& func);
+
     /**
      * Computes the radiative heat loss vector over points jmin to jmax and stores
      * the data in the qdotRadiation variable.
@@ -908,6 +982,11 @@ protected:
     //! Array of size #m_nsp by #m_points for saving species production rates
     Array2D m_wdot;
 
+    //! Work arrays of size #m_nsp used for analytic derivatives of species production
+    //! rates
+    //! @see evalSourceJacobian
+    vector<double> m_dwdot_dT, m_dwdot_dC, m_dwdot_dX, m_hkWork, m_work;
+
     size_t m_nsp; //!< Number of species in the mechanism
 
     //! Phase object used for calculating thermodynamic properties
@@ -919,6 +998,16 @@ protected:
     //! Transport object used for calculating transport properties
     Transport* m_trans = nullptr;
 
+    //! Number of threads used to evaluate properties (0: hardware concurrency)
+    size_t m_nThreads = 1;
+
+    //! Cloned Solution objects used by worker threads other than the calling thread
+    vector<shared_ptr<Solution>> m_workers;
+
+    //! Kinetics::cacheNumber() at the time #m_workers were created; used to discard
+    //! workers after reactions or kinetics settings are modified
+    int m_workersCacheNum = 0;
+
     //! Emissivity of the surface to the left of the domain. Used for calculating
     //! radiative heat loss.
     double m_epsilon_left = 0.0;
@@ -955,6 +1044,11 @@ protected:
     //! @see enableRadiation, radiationEnabled, computeRadiation
     bool m_do_radiation = false;
 
+    //! Determines whether derivatives of species production rates are evaluated
+    //! analytically when evaluating the Jacobian.
+    //! @see enableAnalyticChemistryJacobian, evalSourceJacobian
+    bool m_analyticChemistryJac = false;
+
     //! Determines whether the viscosity term in the momentum equation is calculated
     //! @see setViscosityFlag, setFreeFlow, setAxisymmetricFlow, setUnstrainedFlow,
     //!      updateTransport, shear
@@ -43,6 +43,13 @@ public:
         return m_mat.value(i, j);
     }
 
+    //! Element of the steady-state Jacobian, which excludes transient terms added
+    //! to the diagonal by updateTransient().
+    //! @since New in %Cantera 3.2.
+    double steadyValue(size_t i, size_t j) const {
+        return (i == j) ? m_ssdiag[i] : m_mat.value(i, j);
+    }
+
     void solve(const double* const b, double* const x) {
         m_mat.solve(b, x);
     }
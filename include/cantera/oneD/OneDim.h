@@ -162,6 +162,56 @@ public:
 
     void evalJacobian(double* x0) override;
 
+    //! Set whether the finite difference Jacobian is evaluated by perturbing groups
+    //! of columns simultaneously.
+    //!
+    //! Residuals at each grid point only depend on the solution at the same point and
+    //! its immediate neighbors. Columns corresponding to points that are at least three
+    //! points apart therefore do not share any nonzero rows, which allows for
+    //! perturbing the same component at every third point at once. This reduces the
+    //! number of residual evaluations required to construct the Jacobian from one per
+    //! column to three per component, at the expense of evaluating the residual at
+    //! all grid points for each perturbation. As a consequence, transport properties
+    //! are updated for perturbed states, which is not the case for the column-wise
+    //! evaluation, and analytic derivatives of source terms provided by
+    //! Domain1D::evalSourceJacobian are not used. Disabled by default.
+    //!
+    //! @since New in %Cantera 3.2.
+    void setJacobianColoring(bool coloring) {
+        m_jacobianColoring = coloring;
+    }
+
+    //! Returns `true` if the finite difference Jacobian is evaluated by perturbing
+    //! groups of columns simultaneously.
+    //! @see setJacobianColoring
+    //! @since New in %Cantera 3.2.
+    bool jacobianColoring() const {
+        return m_jacobianColoring;
+    }
+
+    //! Set whether columns of the Jacobian are reused after grid refinement.
+    //!
+    //! Residuals at each grid point only depend on the solution at the same point and
+    //! its immediate neighbors. If enabled, Sim1D::refine() therefore retains the
+    //! columns of the banded Jacobian (MultiJac) for points where neither the point
+    //! nor its neighbors are affected by inserted or removed points. The next Jacobian
+    //! evaluation copies these columns and only computes columns for new points and
+    //! points adjacent to them, while the grouped evaluation enabled by
+    //! setJacobianColoring() is skipped. Columns are not retained for other linear
+    //! solvers. Disabled by default.
+    //!
+    //! @since New in %Cantera 3.2.
+    void setReuseJacobianAfterRefine(bool reuse) {
+        m_reuseJacAfterRefine = reuse;
+    }
+
+    //! Returns `true` if columns of the Jacobian are reused after grid refinement.
+    //! @see setReuseJacobianAfterRefine
+    //! @since New in %Cantera 3.2.
+    bool reuseJacobianAfterRefine() const {
+        return m_reuseJacAfterRefine;
+    }
+
     //! Return a pointer to the domain global point *i* belongs to.
     /*!
      * The domains are scanned right-to-left, and the first one with starting
@@ -242,6 +292,12 @@ public:
     }
 
 protected:
+    //! Evaluate the finite difference Jacobian by perturbing the same component at
+    //! every third grid point simultaneously. Requires the steady-state residual of the
+    //! unperturbed state to be stored in #m_work1.
+    //! @see setJacobianColoring
+    void evalColoredJacobian(double* x0);
+
     //! All domains comprising the system
     vector<shared_ptr<Domain1D>> m_dom;
 
@@ -269,6 +325,26 @@ protected:
     //! Total number of points.
     size_t m_pts = 0;
 
+    //! Indicates whether the Jacobian is evaluated using grouped columns
+    bool m_jacobianColoring = false;
+
+    //! Work array holding analytic derivatives of local source terms at a single
+    //! grid point. @see Domain1D::evalSourceJacobian
+    vector<double> m_sourceJac;
+
+    //! Indicates whether Jacobian columns are reused after grid refinement
+    bool m_reuseJacAfterRefine = false;
+
+    //! Offsets of Jacobian columns retained during grid refinement within
+    //! #m_savedJac for each grid point, or `npos` if the columns for a point need to
+    //! be evaluated. Columns of the same point are stored contiguously, where each
+    //! column holds the rows of the point and its immediate neighbors. Empty if no
+    //! columns are retained. @see setReuseJacobianAfterRefine
+    vector<size_t> m_savedJacOffset;
+
+    //! Values of Jacobian columns retained during grid refinement
+    vector<double> m_savedJac;
+
 private:
     //! @name Statistics
     //! Solver stats are collected after successfully solving on a particular grid.
@@ -328,6 +328,26 @@ public:
      */
     void solveAdjoint(const double* b, double* lambda);
 
+    /**
+     * Compute the products of the adjoint vector and the derivatives of the
+     * residuals with respect to the logarithms of the rate constants of all
+     * reactions, @f$ \lambda^T \partial f / \partial \ln k_i @f$.
+     *
+     * The derivatives are evaluated analytically from the rates of progress at each
+     * grid point, which avoids re-evaluating the residual for each reaction. With
+     * @f$ \lambda @f$ obtained from solveAdjoint(), the sensitivities of an
+     * objective function that does not explicitly depend on the rate constants are
+     * the negatives of these products. Scaling all rate constants of a reaction
+     * is equivalent to scaling its rate multiplier (see Kinetics::setMultiplier).
+     *
+     * @param[in] kin  Kinetics object defining the reactions
+     * @param[in] lambda  Adjoint vector of length size()
+     * @param[out] products  Array of length `kin.nReactions()`
+     * @since New in %Cantera 3.2.
+     */
+    void getReactionAdjointProducts(const Kinetics& kin, const double* lambda,
+                                    double* products);
+
     void resize() override;
 
     //! Set a function that will be called after each successful steady-state
@@ -349,6 +369,17 @@ protected:
     //! User-supplied function called after a successful steady-state solve.
     Func1* m_steady_callback;
 
+    //! Retain columns of the current Jacobian that remain valid after grid
+    //! refinement. @see OneDim::setReuseJacobianAfterRefine
+    //! @param oldPoint  Global index of each point of the refined grid within the
+    //!     current grid, or `npos` for inserted points
+    //! @param[out] offsets  Offsets of retained columns for each point of the refined
+    //!     grid, or `npos` if the columns need to be evaluated
+    //! @param[out] values  Values of retained columns
+    //! @since New in %Cantera 3.2.
+    void saveJacobianColumns(const vector<size_t>& oldPoint, vector<size_t>& offsets,
+                             vector<double>& values);
+
 private:
     //! Calls method _finalize in each domain.
     void finalize();
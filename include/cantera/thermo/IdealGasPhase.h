@@ -500,6 +500,8 @@ public:
     void getEntropy_R_ref(double* er) const override;
     void getIntEnergy_RT_ref(double* urt) const override;
     void getCp_R_ref(double* cprt) const override;
+    void getReferenceProperties(size_t n, const double* T, double* cp_R,
+                                double* h_RT, double* s_R) const override;
     void getStandardVolumes_ref(double* vol) const override;
 
     //! @}
@@ -96,6 +96,26 @@ public:
      */
     virtual void update(double T, double* cp_R, double* h_RT, double* s_R) const;
 
+    //! Compute the reference-state properties for all species at multiple
+    //! temperatures.
+    /*!
+     * Species are evaluated in groups sharing the same parameterization, where
+     * temperature polynomials are calculated once for each group. Temperatures are
+     * processed in increasing order, such that each species is evaluated for
+     * contiguous ranges of temperatures within each of its temperature regions.
+     *
+     * @param n       Number of temperatures
+     * @param T       Temperatures [K]. Length: n.
+     * @param cp_R    Dimensionless heat capacities, where the value for species `k`
+     *                at temperature `T[i]` is stored at index `i * nSpecies + k`.
+     *                Length: n * nSpecies.
+     * @param h_RT    Dimensionless enthalpies. Layout as for `cp_R`.
+     * @param s_R     Dimensionless entropies. Layout as for `cp_R`.
+     * @since New in %Cantera 3.2.
+     */
+    virtual void updateMultiple(size_t n, const double* T, double* cp_R, double* h_RT,
+                                double* s_R) const;
+
     //! Minimum temperature.
     /*!
      * If no argument is supplied, this method returns the minimum temperature
@@ -87,6 +87,9 @@ public:
 
     void updatePropertiesTemp(const double temp, double* cp_R, double* h_RT,
                               double* s_R) const override;
+    void updatePropertiesMultiple(size_t n, const double* T, const double* tt,
+                                  double* cp_R, double* h_RT,
+                                  double* s_R) const override;
 
     size_t nCoeffs() const override;
 
@@ -310,6 +310,19 @@ public:
         }
     }
 
+    void updatePropertiesMultiple(size_t n, const double* T, const double* tt,
+                                  double* cp_R, double* h_RT,
+                                  double* s_R) const override {
+        // Temperatures are sorted, so all points in the low region come first
+        size_t nLow = std::upper_bound(T, T + n, m_midT) - T;
+        for (size_t i = 0; i < nLow; i++) {
+            msp_low.updateProperties(tt + 7 * i, cp_R + i, h_RT + i, s_R + i);
+        }
+        for (size_t i = nLow; i < n; i++) {
+            msp_high.updateProperties(tt + 7 * i, cp_R + i, h_RT + i, s_R + i);
+        }
+    }
+
     size_t nCoeffs() const override { return 15; }
 
     void reportParameters(size_t& n, int& type, double& tlow, double& thigh,
@@ -204,6 +204,27 @@ public:
                                       double* h_RT,
                                       double* s_R) const;
 
+    //! Compute the reference-state properties of one species at multiple
+    //! temperatures.
+    /*!
+     * The temperatures are sorted in increasing order, which allows
+     * parameterizations with multiple temperature regions to evaluate each region
+     * for a contiguous range of temperatures.
+     *
+     * @param n       Number of temperatures
+     * @param T       Temperatures [K] in increasing order. Length: n.
+     * @param tt      Temperature polynomials calculated by updateTemperaturePoly(),
+     *                where the polynomial for temperature `T[i]` starts at
+     *                `tt + i * temperaturePolySize()`
+     * @param cp_R    Dimensionless heat capacities. Length: n.
+     * @param h_RT    Dimensionless enthalpies. Length: n.
+     * @param s_R     Dimensionless entropies. Length: n.
+     * @since New in %Cantera 3.2.
+     */
+    virtual void updatePropertiesMultiple(size_t n, const double* T, const double* tt,
+                                          double* cp_R, double* h_RT,
+                                          double* s_R) const;
+
     //! This utility function returns the number of coefficients
     //! for a given type of species parameterization
     virtual size_t nCoeffs() const;
@@ -1058,6 +1058,28 @@ public:
                                   "Not implemented for phase type '{}'", type());
     }
 
+    //! Get the nondimensional heat capacities, enthalpies and entropies of the
+    //! species reference states at multiple temperatures. The state of the phase
+    //! is not modified.
+    /*!
+     * @param n      Number of temperatures
+     * @param T      Temperatures [K]. Length: n.
+     * @param cp_R   Output array of nondimensional reference state heat capacities
+     *               at constant pressure, where the value for species `k` at
+     *               temperature `T[i]` is stored at index `i * nSpecies() + k`.
+     *               Length: n * nSpecies().
+     * @param h_RT   Output array of nondimensional reference state enthalpies.
+     *               Layout as for `cp_R`.
+     * @param s_R    Output array of nondimensional reference state entropies.
+     *               Layout as for `cp_R`.
+     * @since New in %Cantera 3.2.
+     */
+    virtual void getReferenceProperties(size_t n, const double* T, double* cp_R,
+                                        double* h_RT, double* s_R) const {
+        throw NotImplementedError("ThermoPhase::getReferenceProperties",
+                                  "Not implemented for phase type '{}'", type());
+    }
+
     //! Get the molar volumes of the species reference states at the current
     //! *T* and *P_ref* of the solution.
     /*!
@@ -147,6 +147,19 @@ public:
 
     void invalidateCache() override;
 
+    //! Clear the in-process cache of polynomial fits.
+    /*!
+     * Polynomial fits generated by setupCollisionIntegral() are cached and reused
+     * by transport managers of the same model with identical species transport
+     * data, thermodynamic data and temperature range, for example when a Solution
+     * is cloned. The in-process cache holds the most recently used fits for up to
+     * 32 distinct sets of inputs. If a cache directory is set using setCacheDirectory(), the fits
+     * are also stored there so they can be reused by other processes.
+     *
+     * @since New in %Cantera 3.2.
+     */
+    static void clearFitCache();
+
 protected:
     GasTransport();
 
@@ -182,8 +195,18 @@ protected:
 
     //! Setup range for polynomial fits to collision integrals of
     //! Monchick & Mason @cite monchick1961
+    //!
+    //! @since Changed in %Cantera 3.2 to reuse cached fits if available.
+    //! @see clearFitCache()
     void setupCollisionIntegral();
 
+    //! Get a key identifying all inputs to the polynomial fits generated by
+    //! setupCollisionIntegral(). Transport managers with identical keys share
+    //! polynomial fits through the cache of fits. Derived classes that use
+    //! additional inputs when generating fits should extend this key.
+    //! @since New in %Cantera 3.2.
+    virtual string fitCacheKey();
+
     //! Read the transport database
     /*!
      * Read transport property data from a file for a list of species. Given the
@@ -67,6 +67,11 @@ public:
     double electricalConductivity() override;
 
 protected:
+    //! Extends the key with the parameters of the n64 model and the O2/O2-
+    //! collision integral.
+    //! @since New in %Cantera 3.2.
+    string fitCacheKey() override;
+
     //! setup parameters for n64 model
     void setupN64();
 
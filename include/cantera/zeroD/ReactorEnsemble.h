@@ -0,0 +1,205 @@
+//! @file ReactorEnsemble.h
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#ifndef CT_REACTORENSEMBLE_H
+#define CT_REACTORENSEMBLE_H
+
+#include "cantera/base/ct_defs.h"
+
+namespace Cantera
+{
+
+class Solution;
+class Reactor;
+class ReactorNet;
+
+//! A class for integrating many independent, single-reactor networks.
+/*!
+ *  Each member of the ensemble consists of a single reactor of the same type that is
+ *  integrated in time from its own initial state, which makes this class suitable for
+ *  generating tables of ignition delay times. Members are distributed across a pool of
+ *  worker threads (see parallelFor()), where each worker owns a cloned Solution object
+ *  as well as a Reactor and ReactorNet that are reused for all members assigned to
+ *  it.
+ *
+ *  Ignition is detected using the root-finding capabilities of the integrator (see
+ *  Reactor::setAdvanceLimit) as the time at which the temperature of a member first
+ *  exceeds its initial temperature by a specified amount.
+ *
+ *  @since New in %Cantera 3.2.
+ *  @ingroup zerodGroup
+ */
+class ReactorEnsemble
+{
+public:
+    //! Create an ensemble of reactors.
+    //! @param phase  Solution object defining the thermodynamic and kinetic models.
+    //!     The object is cloned for each worker thread and not modified.
+    //! @param model  Type of the reactor used for all members; see newReactor().
+    ReactorEnsemble(shared_ptr<Solution> phase,
+                    const string& model="IdealGasConstPressureReactor");
+    ReactorEnsemble(const ReactorEnsemble&) = delete;
+    ReactorEnsemble& operator=(const ReactorEnsemble&) = delete;
+    ~ReactorEnsemble();
+
+    //! Type of the reactor used for all members.
+    const string& reactorType() const {
+        return m_model;
+    }
+
+    //! Set the relative and absolute tolerances for the integrator.
+    void setTolerances(double rtol, double atol);
+
+    //! Relative integration tolerance.
+    double rtol() const {
+        return m_rtol;
+    }
+
+    //! Absolute integration tolerance.
+    double atol() const {
+        return m_atol;
+    }
+
+    //! Set the maximum number of internal integration steps the integrator will take
+    //! before reaching the next output point. A value of zero uses the default of the
+    //! integrator.
+    void setMaxSteps(int nmax);
+
+    //! Maximum number of internal integration steps; zero indicates the default.
+    int maxSteps() const {
+        return m_maxSteps;
+    }
+
+    //! Set the maximum integrator step. The default of 0.0 means infinity.
+    void setMaxTimeStep(double maxstep);
+
+    //! Maximum integrator step.
+    double maxTimeStep() const {
+        return m_maxTimeStep;
+    }
+
+    //! Set the number of threads used for integrating the ensemble. A value of zero
+    //! uses the number of threads supported by the hardware.
+    void setNumThreads(size_t nThreads);
+
+    //! Number of threads used for integrating the ensemble.
+    size_t numThreads() const {
+        return m_nThreads;
+    }
+
+    //! Set the temperature rise [K] relative to the initial temperature that
+    //! defines ignition. A non-positive value disables ignition detection. Detection
+    //! requires a reactor type that uses temperature as a state variable, for example
+    //! IdealGasConstPressureReactor.
+    void setIgnitionRise(double deltaT) {
+        m_ignitionRise = deltaT;
+    }
+
+    //! Temperature rise [K] that defines ignition.
+    double ignitionRise() const {
+        return m_ignitionRise;
+    }
+
+    //! Set whether integration of a member stops once ignition is detected. If
+    //! `true`, samples after the ignition time are set to NaN.
+    void setStopAtIgnition(bool stop) {
+        m_stopAtIgnition = stop;
+    }
+
+    //! Whether integration of a member stops once ignition is detected.
+    bool stopAtIgnition() const {
+        return m_stopAtIgnition;
+    }
+
+    //! Set the times [s] at which the states of all members are sampled. Times need
+    //! to be non-negative and increasing.
+    void setSampleTimes(span<const double> times);
+
+    //! Times [s] at which the states of all members are sampled.
+    const vector<double>& sampleTimes() const {
+        return m_sampleTimes;
+    }
+
+    //! Integrate all members of the ensemble.
+    //!
+    //! Results of previous calls are discarded. Failures of individual members do not
+    //! interrupt the integration of other members; instead, the ignition time and
+    //! samples of failed members are set to NaN and the error message is available
+    //! from errors().
+    //!
+    //! @param tEnd  End time [s] of the integration; needs to be at least as large as
+    //!     the last sample time
+    //! @param T  Initial temperatures [K] of all members
+    //! @param P  Initial pressures [Pa] of all members
+    //! @param X  Initial mole fractions of all members, where mole fractions of member
+    //!     `i` are stored in the block starting at `i * nSpecies`
+    void integrate(double tEnd, span<const double> T, span<const double> P,
+                   span<const double> X);
+
+    //! Number of members integrated by the last call to integrate().
+    size_t size() const {
+        return m_ignitionTimes.size();
+    }
+
+    //! Ignition times [s] of all members. Members that do not ignite before the end
+    //! time are assigned NaN.
+    const vector<double>& ignitionTimes() const {
+        return m_ignitionTimes;
+    }
+
+    //! Number of values stored for each sample, which consist of temperature,
+    //! pressure and the mass fractions of all species.
+    size_t sampleWidth() const;
+
+    //! Sampled states of all members. The sample taken at time `j` for member `i` is
+    //! stored in the block starting at `(i * nSamples + j) * sampleWidth()`, and holds
+    //! the temperature [K], pressure [Pa] and mass fractions of all species.
+    const vector<double>& samples() const {
+        return m_samples;
+    }
+
+    //! Error messages of all members; empty for members integrated successfully.
+    const vector<string>& errors() const {
+        return m_errors;
+    }
+
+protected:
+    //! Resources owned by a single worker thread
+    struct Worker {
+        shared_ptr<Solution> sol;
+        shared_ptr<Reactor> reactor;
+        shared_ptr<ReactorNet> net;
+    };
+
+    //! Ensure that at least `nWorkers` workers are available and configured with the
+    //! current integrator settings.
+    void prepareWorkers(size_t nWorkers);
+
+    //! Integrate member `i` using the resources of a worker.
+    void integrateMember(Worker& worker, size_t i, double tEnd,
+                         span<const double> T, span<const double> P,
+                         span<const double> X);
+
+    shared_ptr<Solution> m_sol; //!< Template Solution object
+    string m_model; //!< Reactor type
+    vector<Worker> m_workers; //!< Worker resources
+
+    double m_rtol = 1.0e-9; //!< Relative integration tolerance
+    double m_atol = 1.0e-15; //!< Absolute integration tolerance
+    int m_maxSteps = 0; //!< Maximum number of integrator steps (0: default)
+    double m_maxTimeStep = 0.0; //!< Maximum integrator step (0: unlimited)
+    size_t m_nThreads = 1; //!< Number of threads (0: hardware concurrency)
+    double m_ignitionRise = 400.0; //!< Temperature rise defining ignition
+    bool m_stopAtIgnition = true; //!< Stop integration of members once ignited
+
+    vector<double> m_sampleTimes; //!< Sample times
+    vector<double> m_ignitionTimes; //!< Ignition times of all members
+    vector<double> m_samples; //!< Sampled states of all members
+    vector<string> m_errors; //!< Error messages of all members
+};
+
+}
+
+#endif
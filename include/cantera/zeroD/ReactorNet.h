@@ -9,6 +9,7 @@
 #include "Reactor.h"
 #include "cantera/numerics/FuncEval.h"
 #include "cantera/numerics/SteadyStateSystem.h"
+#include "cantera/numerics/SolverProfiler.h"
 
 namespace Cantera
 {
@@ -44,7 +45,12 @@ public:
 
     //! Set the type of linear solver used in the integration.
     //! @param linSolverType type of linear solver. Default type: "DENSE"
-    //! Other options include: "DIAG", "DENSE", "GMRES", "BAND"
+    //! Other options include: "DIAG", "DENSE", "GMRES", "BAND" and "SPARSE". The
+    //! "SPARSE" solver uses Newton iterations where the sparse Jacobian assembled
+    //! from the reactors is factorized directly by the SystemJacobian set with
+    //! setPreconditioner(), which defaults to "eigen-sparse-direct". Like
+    //! preconditioning, it is only supported for *MoleReactor types.
+    //! @since The "SPARSE" option is new in %Cantera 3.2.
     void setLinearSolverType(const string& linSolverType="DENSE");
 
     //! Set preconditioner used by the linear solver
@@ -174,6 +180,13 @@ public:
 
     //! Get the Jacobian used by the steady-state solver.
     //!
+    //! The Jacobian is evaluated using finite differences. Residuals of each reactor
+    //! only depend on the states of reactors connected to it by flow devices, walls,
+    //! or surfaces, so state variables of reactors that do not affect any common
+    //! residuals are perturbed simultaneously. The number of residual evaluations
+    //! required is therefore determined by the size of the largest groups of coupled
+    //! reactors rather than the size of the network.
+    //!
     //! @param rdt  Reciprocal of the pseudo-timestep [1/s]. Default of 0.0 returns the
     //!     steady-state Jacobian.
     //! @since New in %Cantera 3.2.
@@ -186,6 +199,30 @@ public:
         return *m_reactors[n];
     }
 
+    //! Set the number of threads used to evaluate the governing equations.
+    //!
+    //! If more than one thread is used, only the net production rates of the
+    //! bulk-phase kinetics of all reactors (Kinetics::getNetProductionRates) are
+    //! precomputed concurrently. The remaining terms, including surface kinetics and
+    //! the coupling between reactors by flow devices and walls, are then evaluated
+    //! serially on the calling thread in the same order as for serial evaluation, so
+    //! results do not depend on the number of threads. This is
+    //! beneficial for networks consisting of many reactors with large reaction
+    //! mechanisms, and applies to both advance() and solveSteady().
+    //!
+    //! @param nThreads  Number of threads. A value of zero uses the number of threads
+    //!     supported by the hardware. The default of one disables parallel
+    //!     evaluation.
+    //! @since New in %Cantera 3.2.
+    void setNumThreads(size_t nThreads);
+
+    //! Number of threads used to evaluate the governing equations.
+    //! @see setNumThreads
+    //! @since New in %Cantera 3.2.
+    size_t numThreads() const {
+        return m_nThreads;
+    }
+
     //! Returns `true` if verbose logging output is enabled.
     bool verbose() const {
         return m_verbose;
@@ -359,6 +396,17 @@ public:
     //! Get solver stats from integrator
     AnyMap solverStats() const;
 
+    //! Get the profiler collecting call counts and wall-clock times for the phases of
+    //! the solver, which include evaluations of the right-hand side (`residual`),
+    //! updates of the reactor states (`thermo`), and the setup (`jacobian` and
+    //! `factorization`) and application (`linear_solve`) of preconditioners or
+    //! sparse direct linear solvers. Profiling is disabled by default; use
+    //! SolverProfiler::setEnabled() to enable it.
+    //! @since New in %Cantera 3.2.
+    SolverProfiler& profiler() {
+        return m_profiler;
+    }
+
     //! Set derivative settings of all reactors
     //! @param settings the settings map propagated to all reactors and kinetics objects
     virtual void setDerivativeSettings(AnyMap& settings);
@@ -388,6 +436,11 @@ protected:
     //! and deliberately not exposed in external interfaces.
     virtual void getEstimate(double time, int k, double* yest);
 
+    //! Evaluate the chemical production rates of all reactors concurrently if more
+    //! than one thread is used. Results are retained by the Kinetics objects, which
+    //! avoids their re-evaluation during the sequential evaluation of the reactors.
+    void evalKineticsParallel();
+
     //! Returns the order used for last solution step of the ODE integrator
     //! The function is intended for internal use by ReactorNet::advance
     //! and deliberately not exposed in external interfaces.
@@ -401,6 +454,7 @@ protected:
     set<WallBase*> m_walls;
     map<string, int> m_counts;  //!< Map used for default name generation
     unique_ptr<Integrator> m_integ;
+    SolverProfiler m_profiler; //!< Profiler for solver phases. See profiler()
 
     //! The independent variable in the system. May be either time or space depending
     //! on the type of reactors in the network.
@@ -426,6 +480,9 @@ protected:
 
     bool m_verbose = false;
 
+    //! Number of threads used to evaluate the governing equations. See setNumThreads
+    size_t m_nThreads = 1;
+
     //! Indicates whether time or space is the independent variable
     bool m_timeIsIndependent = true;
 
@@ -470,10 +527,23 @@ public:
                         int loglevel, int attempt_counter) override;
 
 private:
+    //! Determine which reactors are coupled through flow devices, walls, and
+    //! surfaces, and group reactors whose states can be perturbed simultaneously
+    //! when evaluating the Jacobian.
+    void initJacobianColoring();
+
     ReactorNet* m_net = nullptr;
 
     //! Initial value of each state variable
     vector<double> m_initialState;
+
+    //! Indices of the reactors whose residuals depend on the state of each reactor
+    vector<vector<size_t>> m_coupled;
+
+    //! Groups of reactors that do not affect any common residuals. The state
+    //! variables of all reactors in a group are perturbed at the same time by
+    //! evalJacobian().
+    vector<vector<size_t>> m_colors;
 };
 
 
@@ -93,6 +93,12 @@ public:
 
     void setPrimary(shared_ptr<ConnectorNode> primary) override;
 
+    //! Get the primary flow device, or `nullptr` if it has not been set.
+    //! @since New in %Cantera 3.2.
+    FlowDevice* primary() const {
+        return m_primary;
+    }
+
     void setTimeFunction(shared_ptr<Func1> f) override {
         throw NotImplementedError("PressureController::setTimeFunction");
     }
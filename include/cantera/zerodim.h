@@ -11,6 +11,7 @@
 
 // reactor network
 #include "cantera/zeroD/ReactorNet.h"
+#include "cantera/zeroD/ReactorEnsemble.h"
 
 // reactors
 #include "cantera/zeroD/Reservoir.h"
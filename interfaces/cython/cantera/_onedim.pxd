@@ -82,6 +82,10 @@ cdef extern from "cantera/oneD/Flow1D.h":
         void setPressure(double)
         void enableRadiation(cbool)
         cbool radiationEnabled()
+        void enableAnalyticChemistryJacobian(cbool) except +translate_exception
+        cbool analyticChemistryJacobianEnabled()
+        void setNumThreads(size_t)
+        size_t numThreads()
         double radiativeHeatLoss(size_t)
         double pressure()
         void setFixedTempProfile(vector[double]&, vector[double]&)
@@ -125,6 +129,7 @@ cdef extern from "cantera/oneD/Sim1D.h":
         int maxTimeStepCount()
         void setLinearSolver(shared_ptr[CxxSystemJacobian]) except +translate_exception
         shared_ptr[CxxSystemJacobian] linearSolver()
+        CxxSolverProfiler& profiler()
         void getInitialSoln() except +translate_exception
         void solve(int, cbool) except +translate_exception
         void refine(int) except +translate_exception
@@ -146,6 +151,7 @@ cdef extern from "cantera/oneD/Sim1D.h":
         void eval(double ) except +translate_exception
         size_t size()
         void solveAdjoint(const double*, double*) except +translate_exception
+        void getReactionAdjointProducts(CxxKinetics&, const double*, double*) except +translate_exception
         void getResidual(double, double*) except +translate_exception
         void setJacAge(int, int)
         void setTimeStepFactor(double)
@@ -164,6 +170,10 @@ cdef extern from "cantera/oneD/Sim1D.h":
         void setRightControlPoint(double) except +translate_exception
 
         void setJacobianPerturbation(double, double, double)
+        void setJacobianColoring(cbool)
+        cbool jacobianColoring()
+        void setReuseJacobianAfterRefine(cbool)
+        cbool reuseJacobianAfterRefine()
 
 
 cdef extern from "cantera/thermo/IdealGasPhase.h":
@@ -251,6 +251,14 @@ class FlowBase(Domain1D):
     @radiation_enabled.setter
     def radiation_enabled(self, enable: bool) -> None: ...
     @property
+    def analytic_chemistry_jacobian(self) -> bool: ...
+    @analytic_chemistry_jacobian.setter
+    def analytic_chemistry_jacobian(self, analytic: bool) -> None: ...
+    @property
+    def num_threads(self) -> int: ...
+    @num_threads.setter
+    def num_threads(self, n: int) -> None: ...
+    @property
     def radiative_heat_loss(self) -> Array: ...
     def set_free_flow(self) -> None: ...
     def set_axisymmetric_flow(self) -> None: ...
@@ -301,6 +309,21 @@ class Sim1D:
         self, relative: float, absolute: float, threshold: float
     ) -> None: ...
     @property
+    def jacobian_coloring(self) -> bool: ...
+    @jacobian_coloring.setter
+    def jacobian_coloring(self, coloring: bool) -> None: ...
+    @property
+    def reuse_jacobian_after_refine(self) -> bool: ...
+    @reuse_jacobian_after_refine.setter
+    def reuse_jacobian_after_refine(self, reuse: bool) -> None: ...
+    @property
+    def profiling(self) -> bool: ...
+    @profiling.setter
+    def profiling(self, enabled: bool) -> None: ...
+    @property
+    def profiler_stats(self) -> dict[str, dict[str, float]]: ...
+    def clear_profiler_stats(self) -> None: ...
+    @property
     def linear_solver(self) -> SystemJacobian: ...
     @linear_solver.setter
     def linear_solver(self, precon: SystemJacobian) -> None: ...
@@ -366,6 +389,9 @@ class Sim1D:
         g: Callable[[Sim1D], float] | None = None,
         dp: float = 1e-5,
     ) -> None: ...
+    def solve_adjoint_multipliers(
+        self, kinetics: _SolutionBase, dgdx: Array
+    ) -> Array: ...
     @property
     def grid_size_stats(self) -> list[int]: ...
     @property
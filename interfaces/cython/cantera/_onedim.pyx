@@ -815,6 +815,42 @@ cdef class FlowBase(Domain1D):
         def __set__(self, do_radiation):
             self.flow.enableRadiation(<cbool>do_radiation)
 
+    property analytic_chemistry_jacobian:
+        """
+        Determines whether derivatives of chemical source terms are evaluated
+        analytically from kinetics derivatives when evaluating the Jacobian, while
+        remaining terms are evaluated using finite differences. This avoids
+        re-evaluating reaction rates for each perturbation of the solution. Only used
+        if the Jacobian is evaluated column by column (see `Sim1D.jacobian_coloring`).
+        Default ``False``.
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            return self.flow.analyticChemistryJacobianEnabled()
+        def __set__(self, analytic):
+            self.flow.enableAnalyticChemistryJacobian(<cbool>analytic)
+
+    property num_threads:
+        """
+        Number of threads used to evaluate thermodynamic, kinetic and transport
+        properties at the grid points, where each thread uses a cloned `Solution`
+        object. This applies to residual evaluations as well as Jacobians evaluated
+        with `Sim1D.jacobian_coloring`. A value of zero uses all available hardware
+        threads; the default value of one disables parallel evaluation. Setting this
+        property resets cloned `Solution` objects, which is required after the
+        associated `Solution` object is modified (except for changes of reaction rate
+        multipliers). Not available for mechanisms with user-defined reaction rates.
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            return self.flow.numThreads()
+        def __set__(self, n):
+            if n < 0:
+                raise ValueError("Number of threads must be non-negative.")
+            self.flow.setNumThreads(n)
+
     property radiative_heat_loss:
         """
         Return radiative heat loss (only non-zero if radiation is enabled).
@@ -1114,6 +1150,77 @@ cdef class Sim1D:
         """
         self.sim.setJacobianPerturbation(relative, absolute, threshold)
 
+    property jacobian_coloring:
+        """
+        Get/Set whether the finite difference Jacobian is evaluated by perturbing the
+        same solution component at every third grid point simultaneously. As
+        residuals only depend on neighboring grid points, this reduces the number of
+        residual evaluations per Jacobian from one per solution component at each grid
+        point to three per solution component, which is beneficial for large grids.
+        Default ``False``.
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            return self.sim.jacobianColoring()
+        def __set__(self, cbool coloring):
+            self.sim.setJacobianColoring(coloring)
+
+    property reuse_jacobian_after_refine:
+        """
+        Get/Set whether columns of the Jacobian are reused after grid refinement. If
+        enabled, the Jacobian evaluated on the new grid copies the columns of grid
+        points where neither the point nor its neighbors are affected by refinement,
+        and only evaluates columns of new points and points adjacent to them. Only
+        supported for the default banded linear solver. Default ``False``.
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            return self.sim.reuseJacobianAfterRefine()
+        def __set__(self, cbool reuse):
+            self.sim.setReuseJacobianAfterRefine(reuse)
+
+    property profiling:
+        """
+        Get/Set whether call counts and wall-clock times are collected for the
+        phases of the solver. See `profiler_stats`. Default ``False``. Enabling
+        profiling raises an exception if Cantera was compiled with the SCons option
+        ``profiling=n``.
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            return self.sim.profiler().enabled()
+        def __set__(self, cbool enabled):
+            self.sim.profiler().setEnabled(enabled)
+
+    @property
+    def profiler_stats(self):
+        """
+        Call counts and wall-clock times [s] collected while `profiling` is enabled.
+        Returns a dictionary that maps the name of each phase to a dictionary with
+        fields ``calls`` and ``time``. Phases are ``residual``, ``jacobian``,
+        ``factorization``, ``linear_solve``, ``thermo``, ``kinetics``, ``transport``,
+        ``refinement`` and ``time_stepping``. Phases may be nested; for example,
+        residual evaluations used for finite difference Jacobians are also counted as
+        residual evaluations. For the ``thermo``, ``kinetics`` and ``transport``
+        phases, each call corresponds to a property update at a single grid point, and
+        times are summed over all threads (see `FlowBase.num_threads`).
+
+        .. versionadded:: 3.2
+        """
+        cdef CxxAnyMap stats = self.sim.profiler().stats()
+        return anymap_to_py(stats)
+
+    def clear_profiler_stats(self):
+        """
+        Reset the statistics returned by `profiler_stats`.
+
+        .. versionadded:: 3.2
+        """
+        self.sim.profiler().clear()
+
     @property
     def linear_solver(self):
         """
@@ -1614,6 +1721,13 @@ cdef class Sim1D:
             be omitted.
         :param dp:
             A relative value by which to perturb each parameter
+
+        .. note::
+
+            Parameters are evaluated serially, with two residual evaluations per
+            parameter, since ``perturb`` and ``g`` may modify objects shared by all
+            domains. For sensitivities with respect to reaction rate constants, use
+            `solve_adjoint_multipliers`, which does not require residual evaluations.
         """
         n_vars = self.sim.size()
         cdef np.ndarray[np.double_t, ndim=1] L = np.empty(n_vars)
@@ -1623,7 +1737,7 @@ cdef class Sim1D:
         self.sim.solveAdjoint(&gg[0], &L[0])
 
         cdef np.ndarray[np.double_t, ndim=1] dgdp = np.empty(n_params)
-        cdef np.ndarray[np.double_t, ndim=2] dfdp = np.empty((n_vars, n_params))
+        cdef np.ndarray[np.double_t, ndim=1] Ldfdp = np.empty(n_params)
         cdef np.ndarray[np.double_t, ndim=1] fplus = np.empty(n_vars)
         cdef np.ndarray[np.double_t, ndim=1] fminus = np.empty(n_vars)
         gplus = gminus = 0
@@ -1641,9 +1755,53 @@ cdef class Sim1D:
 
             perturb(self, i, 0)
             dgdp[i] = (gplus - gminus)/(2*dp)
-            dfdp[:,i] = (fplus - fminus) / (2*dp)
+            # only the product with the adjoint vector is needed, which avoids storing
+            # the full matrix of derivatives of the residual
+            Ldfdp[i] = np.dot(L, fplus - fminus) / (2*dp)
+
+        return dgdp - Ldfdp
+
+    def solve_adjoint_multipliers(self, _SolutionBase kinetics, dgdx):
+        r"""
+        Find the sensitivities of an objective function to the rate constants of all
+        reactions using an adjoint method.
+
+        For an objective function :math:`g(x)` where :math:`x` is the state vector
+        of the system, this computes the vector of sensitivities
+        :math:`dg/d\ln k_i` with respect to the rate constants :math:`k_i` of each
+        reaction, which are equal to the derivatives with respect to unit reaction
+        rate multipliers. This gives the same result as `solve_adjoint` with a
+        ``perturb`` function that sets reaction rate multipliers. However, the
+        derivatives of the residual are evaluated analytically from the rates of
+        progress at each grid point instead of re-evaluating the residual for each
+        reaction. This assumes that the system of equations has already been solved
+        to find :math:`x` and that :math:`g` does not depend explicitly on the rate
+        constants.
+
+        :param kinetics:
+            The `Solution` object whose reactions are considered, typically the
+            ``gas`` object of the flow domain.
+        :param dgdx:
+            The vector of partial derivatives of the function :math:`g(x)`
+            with respect to the system state :math:`x`.
 
-        return dgdp - np.dot(L, dfdp)
+        .. versionadded:: 3.2
+        """
+        if kinetics.kinetics == NULL:
+            raise CanteraError(f"Object '{kinetics.name}' has no kinetics model.")
+        n_vars = self.sim.size()
+        n_reactions = kinetics.kinetics.nReactions()
+        cdef np.ndarray[np.double_t, ndim=1] L = np.empty(n_vars)
+        cdef np.ndarray[np.double_t, ndim=1] gg = \
+                np.ascontiguousarray(dgdx, dtype=np.double)
+        cdef np.ndarray[np.double_t, ndim=1] products = np.zeros(n_reactions)
+        if not n_reactions:
+            return products
+
+        self.sim.solveAdjoint(&gg[0], &L[0])
+        self.sim.getReactionAdjointProducts(deref(kinetics.kinetics), &L[0],
+                                            &products[0])
+        return -products
 
     property grid_size_stats:
         """Return total grid size in each call to solve()"""
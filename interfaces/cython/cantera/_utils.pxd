@@ -74,6 +74,8 @@ cdef extern from "cantera/base/stringUtils.h" namespace "Cantera":
 cdef extern from "cantera/base/global.h" namespace "Cantera":
     cdef void CxxAddDataDirectory "Cantera::addDataDirectory" (string)
     cdef string CxxGetDataDirectories "Cantera::getDataDirectories" (string)
+    cdef void CxxSetCacheDirectory "Cantera::setCacheDirectory" (string) except +translate_exception
+    cdef string CxxCacheDirectory "Cantera::cacheDirectory" ()
     cdef void CxxAppdelete "Cantera::appdelete" ()
     cdef void Cxx_make_deprecation_warnings_fatal "Cantera::make_deprecation_warnings_fatal" ()
     cdef void Cxx_suppress_deprecation_warnings "Cantera::suppress_deprecation_warnings" ()
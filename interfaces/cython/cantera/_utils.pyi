@@ -9,6 +9,8 @@ from .units import Units, UnitStack, UnitSystem, _UnitDict
 
 def add_data_directory(directory: Path | str) -> None: ...
 def get_data_directories() -> list[str]: ...
+def set_cache_directory(directory: Path | str | None) -> None: ...
+def get_cache_directory() -> str | None: ...
 
 __sundials_version__: str
 __version__: str
@@ -51,6 +51,34 @@ def get_data_directories():
     """ Get a list of the directories Cantera searches for data files. """
     return pystr(CxxGetDataDirectories(stringify(os.pathsep))).split(os.pathsep)
 
+def set_cache_directory(directory):
+    """
+    Set the directory used for the persistent cache of parsed input files.
+
+    If set, the contents of YAML input files are stored in a compact binary format
+    in this directory, keyed by a SHA-256 digest of the file contents and the
+    Cantera version. Loading a file with identical contents, including from a
+    different process, then uses the cached representation instead of parsing the
+    YAML file. Species and reactions are still created from the cached input,
+    including unit conversion and validation. Transport property fits are stored in
+    the same directory. The directory is created if it does not exist. Setting the
+    directory to `None` or an empty string disables the cache, which is the
+    default.
+
+    .. versionadded:: 3.2
+    """
+    CxxSetCacheDirectory(stringify(str(directory) if directory else ""))
+
+def get_cache_directory():
+    """
+    Get the directory used for the persistent cache of parsed input files, or
+    `None` if the cache is disabled.
+
+    .. versionadded:: 3.2
+    """
+    directory = pystr(CxxCacheDirectory())
+    return directory or None
+
 __sundials_version__ = pystr(get_sundials_version())
 
 __version__ = pystr(CxxVersion())
@@ -457,6 +457,28 @@ class SolutionArray(SolutionArrayBase):
         >>> for i,j in np.ndindex(mu.shape):
         ...     # do something with mu[i,j]
 
+    Components defining the native state (for example, ``T``, ``density_mass`` and
+    ``Y`` for ideal gases) and extra components holding floating point values are
+    returned as read-only views of the underlying data without copying. Views reflect
+    subsequent updates made through `SolutionArray` setters and keep the underlying
+    data alive (via their ``base`` attribute), and a `SolutionArray` cannot be
+    resized while views of its data exist; use ``copy()`` to obtain independent
+    arrays::
+
+        >>> T0 = states.T.copy() # snapshot that is not affected by later updates
+
+    Writeable views, where assigned values are stored directly in the
+    `SolutionArray`, have to be requested explicitly using `view`::
+
+        >>> T = states.view('T', writeable=True)
+        >>> T[0] = 500. # updates the temperature of the first state
+
+    Other properties, as well as components accessed for a subset of species or for
+    non-contiguous slices, are returned as copies.
+
+    .. versionchanged:: 3.2
+        Native state and extra components are returned as views.
+
     Information about a subset of species may also be accessed, using
     parentheses to specify the species::
 
@@ -591,6 +613,66 @@ class SolutionArray(SolutionArrayBase):
 
     _purefluid_scalar = ['Q']
 
+    # Properties that are part of the native state and thus are accessed without
+    # copying (see `view`), where values map property names to names of native state
+    # components
+    _views = {'T': 'T', 'P': 'P', 'density_mass': 'D', 'Y': 'Y'}
+
+    # Properties evaluated for all states by the C++ core, where values map property
+    # names to names used by `SolutionArrayBase._eval_property`
+    _native = {
+        # From ThermoPhase
+        'T': 'temperature', 'P': 'pressure', 'density_mass': 'density',
+        'density_mole': 'molarDensity', 'mean_molecular_weight': 'meanMolecularWeight',
+        'enthalpy_mass': 'enthalpy_mass', 'enthalpy_mole': 'enthalpy_mole',
+        'int_energy_mass': 'intEnergy_mass', 'int_energy_mole': 'intEnergy_mole',
+        'entropy_mass': 'entropy_mass', 'entropy_mole': 'entropy_mole',
+        'gibbs_mass': 'gibbs_mass', 'gibbs_mole': 'gibbs_mole',
+        'cp_mass': 'cp_mass', 'cp_mole': 'cp_mole',
+        'cv_mass': 'cv_mass', 'cv_mole': 'cv_mole',
+        'isothermal_compressibility': 'isothermalCompressibility',
+        'thermal_expansion_coeff': 'thermalExpansionCoeff',
+        'sound_speed': 'soundSpeed', 'electric_potential': 'electricPotential',
+        'X': 'moleFractions', 'Y': 'massFractions', 'concentrations': 'concentrations',
+        'partial_molar_enthalpies': 'partialMolarEnthalpies',
+        'partial_molar_entropies': 'partialMolarEntropies',
+        'partial_molar_int_energies': 'partialMolarIntEnergies',
+        'partial_molar_cp': 'partialMolarCp',
+        'partial_molar_volumes': 'partialMolarVolumes',
+        'chemical_potentials': 'chemPotentials',
+        'electrochemical_potentials': 'electrochemPotentials',
+        'standard_enthalpies_RT': 'enthalpy_RT', 'standard_entropies_R': 'entropy_R',
+        'standard_int_energies_RT': 'intEnergy_RT', 'standard_gibbs_RT': 'gibbs_RT',
+        'standard_cp_R': 'cp_R', 'activities': 'activities',
+        'activity_coefficients': 'activityCoefficients',
+        # From Kinetics
+        'heat_release_rate': 'heatReleaseRate',
+        'creation_rates': 'creationRates', 'destruction_rates': 'destructionRates',
+        'net_production_rates': 'netProductionRates',
+        'forward_rates_of_progress': 'fwdRatesOfProgress',
+        'reverse_rates_of_progress': 'revRatesOfProgress',
+        'net_rates_of_progress': 'netRatesOfProgress',
+        'equilibrium_constants': 'equilibriumConstants',
+        'forward_rate_constants': 'fwdRateConstants',
+        'reverse_rate_constants': 'revRateConstants',
+        'delta_enthalpy': 'deltaEnthalpy', 'delta_gibbs': 'deltaGibbs',
+        'delta_entropy': 'deltaEntropy', 'delta_standard_enthalpy': 'deltaSSEnthalpy',
+        'delta_standard_gibbs': 'deltaSSGibbs',
+        'delta_standard_entropy': 'deltaSSEntropy',
+        'third_body_concentrations': 'thirdBodyConcentrations',
+        # From Transport
+        'viscosity': 'viscosity', 'thermal_conductivity': 'thermalConductivity',
+        'electrical_conductivity': 'electricalConductivity',
+        'mix_diff_coeffs': 'mixDiffCoeffs', 'mix_diff_coeffs_mass': 'mixDiffCoeffsMass',
+        'mix_diff_coeffs_mole': 'mixDiffCoeffsMole',
+        'thermal_diff_coeffs': 'thermalDiffCoeffs', 'mobilities': 'mobilities',
+        'species_viscosities': 'speciesViscosities',
+    }
+
+    # Property pairs that are set for all states by the C++ core
+    _native_states = {'TD', 'TP', 'DP', 'HP', 'UV', 'SP', 'SV',
+                      'ST', 'TV', 'PV', 'UP', 'VH', 'TH', 'SH'}
+
     def __init__(self, phase, shape=(0,), states=None, extra=None, meta=None,
                  init=True):
         self._phase = phase
@@ -681,6 +763,10 @@ class SolutionArray(SolutionArrayBase):
             self._has_component(name.replace("_", "-"))):
             name = name.replace("_", "-")
         if self._has_component(name):
+            out = self._state_view(name)
+            if out is not None:
+                # read-only view of data held by the C++ core (no copy)
+                return out
             out = self._get_component(name)
             out.setflags(write=False)
             return out.reshape(self.shape + out.shape[1:])
@@ -708,6 +794,8 @@ class SolutionArray(SolutionArrayBase):
                     f"Incompatible shapes for extra column '{name}': cannot assign "
                     f"value with shape {new.shape} to SolutionArray with shape "
                     f"{self.shape}")
+            # flatten leading dimensions, as entries are stored by location
+            new = new.reshape((self.size,) + new.shape[len(self.shape):])
             self._set_component(name, new)
         else:
             super().__setattr__(name, value)
@@ -857,6 +945,65 @@ class SolutionArray(SolutionArrayBase):
             v = self._get_component(k)
             self._set_component(k, v[indices])
 
+    def view(self, name, writeable=False):
+        """
+        Retrieve a view of the data of component ``name`` without copying.
+
+        Views are available for properties defining the native state (for example,
+        ``T`` and ``Y`` for ideal gases) and for extra components holding floating
+        point values, and are also returned when these properties are accessed as
+        attributes. Views reflect subsequent updates made through `SolutionArray`
+        setters, and a `SolutionArray` cannot be resized while views of its data
+        exist.
+
+        :param name: Name of the property or extra component.
+        :param writeable:
+            If `True`, values assigned to elements of the view are written directly
+            to the `SolutionArray`. Values are neither validated nor normalized, so
+            assigned states have to be consistent (for example, mass fractions have
+            to sum to one). Default is `False`, which returns a read-only view.
+
+        .. versionadded:: 3.2
+        """
+        if self._phase.selected_species:
+            raise ValueError("Views are not available for a subset of species.")
+        if self._view_component(name) is None:
+            raise ValueError(f"Views are not available for component '{name}'.")
+        data = self._state_view(name, writeable)
+        if data is None:
+            raise ValueError(
+                f"Unable to create view for component '{name}': direct access is "
+                "not available for non-contiguous or empty data.")
+        return data
+
+    def _view_component(self, name):
+        """
+        Name of the native state or extra component accessed by a view of ``name``,
+        or `None` if views are not supported.
+        """
+        component = self._views.get(name, name)
+        if (not self._has_extra(component) and
+            self._has_extra(component.replace("_", "-"))):
+            component = component.replace("_", "-")
+        if name not in self._views and not self._has_extra(component):
+            return None
+        return component
+
+    def _state_view(self, name, writeable=False):
+        """
+        Retrieve a view of native state or extra component ``name`` reshaped to the
+        shape of the `SolutionArray`, or `None` if direct access is not available.
+        """
+        component = self._view_component(name)
+        if component is None or self._phase.selected_species:
+            return None
+        data = self._get_view(component, writeable)
+        if data is None:
+            return None
+        if name in self._views and name not in self._scalar:
+            return data.reshape(self.shape + data.shape[1:])
+        return data[:, 0].reshape(self.shape)
+
     def equilibrate(self, *args, **kwargs):
         """ See `ThermoPhase.equilibrate` """
         for loc in range(self.size):
@@ -1027,7 +1174,9 @@ class SolutionArray(SolutionArrayBase):
             self.resize(np.prod(self.shape))
 
         # restore data
-        if normalize or mode.endswith("Q"):
+        if self._has_native_states(mode, *state_data):
+            self._set_states(mode, *state_data, normalize=normalize)
+        elif normalize or mode.endswith("Q"):
             for loc, i in enumerate(self._indices):
                 setattr(self._phase, mode, [st[i, ...] for st in state_data])
                 self._update_state(loc)
@@ -1241,7 +1390,7 @@ class SolutionArray(SolutionArrayBase):
         self.restore_data(data_dict, normalize)
 
     def save(self, fname, name=None, sub=None, description=None, *,
-             overwrite=False, compression=0, basis=None):
+             overwrite=False, compression=0, basis=None, append=False, chunk_size=0):
         """
         Save current `SolutionArray` contents to a data file.
 
@@ -1281,12 +1430,28 @@ class SolutionArray(SolutionArrayBase):
             Output mass (``Y``/``mass``) or mole (``X``/``mole``) fractions;
             if not specified (`None`), the native basis of the underlying `ThermoPhase`
             manager is used.
+        :param append:
+            If `True`, append entries to an existing data entry, which is created if
+            it does not exist yet; data entries are stored using resizable datasets
+            with chunked storage. This allows for writing of data in blocks, where
+            the `SolutionArray` can be cleared after each block is saved (for example,
+            by setting ``shape`` to ``(0,)``). Components
+            need to match the existing entry; optional (default=`False`; HDF only)
+        :param chunk_size:
+            Number of rows per chunk; if 0, a single chunk is used for compressed
+            data, and resizable datasets use 1024 rows per chunk; optional
+            (default=0; HDF only)
 
         .. versionadded:: 3.0
+
+        .. versionchanged:: 3.2
+            Added the ``append`` and ``chunk_size`` arguments.
         """
-        self._cxx_save(fname, name, sub, description, overwrite, compression, basis)
+        self._cxx_save(fname, name, sub, description, overwrite, compression, basis,
+                       append, chunk_size)
 
-    def restore(self, fname, name=None, sub=None):
+    def restore(self, fname, name=None, sub=None, *, columns=None, rows=None,
+                lazy=False):
         """
         Restore `SolutionArray` data and header information from a container file.
 
@@ -1301,17 +1466,57 @@ class SolutionArray(SolutionArrayBase):
         :param sub:
             Name identifier for the subgroup holding the `SolutionArray` data and
             metadata objects. If `None`, the subgroup name defaults to ``data``
+        :param columns:
+            Names of auxiliary (extra) components and species to be restored; if
+            `None`, all components are restored. Temperature and pressure or density
+            are always restored. If species names are included, only the
+            corresponding species columns are read from the file, and fractions of
+            all other species are set to zero. Optional (HDF only)
+        :param rows:
+            A `slice` selecting a contiguous range of entries to be restored; only
+            the selected entries are read from the file. Optional (HDF only;
+            one-dimensional data only)
+        :param lazy:
+            If `True`, reading of auxiliary components is deferred until they are
+            accessed for the first time (default=`False`; HDF only). Accessing a
+            deferred component raises an error if the file was modified after it
+            was restored.
         :return:
             Dictionary holding `SolutionArray` meta data.
 
         .. versionadded:: 3.0
+
+        .. versionchanged:: 3.2
+            Added the ``columns``, ``rows`` and ``lazy`` arguments.
         """
-        meta = self._cxx_restore(fname, name, sub)
+        start, count = 0, None
+        if rows is not None:
+            if not isinstance(rows, slice) or rows.step not in (None, 1):
+                raise ValueError("Argument 'rows' requires a contiguous slice.")
+            start = rows.start or 0
+            if start < 0 or (rows.stop is not None and rows.stop < start):
+                raise ValueError("Argument 'rows' requires non-negative bounds.")
+            if rows.stop is not None:
+                count = rows.stop - start
+        meta = self._cxx_restore(fname, name, sub, columns, start, count, lazy)
 
         # ensure self._indices and self._output_dummy are set
         self.shape = self._api_shape()
         return meta
 
+    def _has_native_states(self, mode, *values):
+        """
+        Check whether states defined by ``mode`` and ``values`` can be set for all
+        locations by the C++ core, which uses specific properties on a mass basis.
+        """
+        if mode[:2] not in self._native_states or mode[2:] not in ('', 'X', 'Y'):
+            return False
+        if self.basis != 'mass' and set(mode) & set('DUVHS'):
+            return False
+        if self._phase.selected_species:
+            return False
+        return all(np.asarray(v).dtype.kind in 'fiu' for v in values)
+
     def _to_picklable(self):
         with _NamedTemporaryFile(suffix=".yaml", delete=False) as t_file:
             # Context manager ensures that temporary file is properly created
@@ -1369,6 +1574,9 @@ def _state2_prop(name, doc_source):
         if len(AB) != 2:
             raise ValueError("Expected 2 elements, got {}".format(len(AB)))
         A, B, _ = np.broadcast_arrays(AB[0], AB[1], self._output_dummy)
+        if self._has_native_states(name, A, B):
+            self._set_states(name, A, B)
+            return
         for loc, index in enumerate(self._indices):
             self._set_loc(loc)
             setattr(self._phase, name, (A[index], B[index]))
@@ -1397,7 +1605,15 @@ def _state3_prop(name, doc_source, scalar=False):
             raise ValueError("Expected 3 elements, got {}".format(len(ABC)))
         A, B, _ = np.broadcast_arrays(ABC[0], ABC[1], self._output_dummy)
         XY = ABC[2] # composition
-        if len(np.shape(XY)) < 2:
+        if self._has_native_states(name, A, B):
+            C = np.empty(self.shape + (self._phase.n_species,))
+            if len(np.shape(XY)) < 2:
+                # convert string, dict or single array to full composition
+                setattr(self._phase, name[2], XY)
+                XY = getattr(self._phase, name[2])
+            C[:] = XY
+            self._set_states(name, A, B, C)
+        elif len(np.shape(XY)) < 2:
             # composition is a single array (or string or dict)
             for loc, index in enumerate(self._indices):
                 self._set_loc(loc)
@@ -1469,13 +1685,32 @@ def _make_functions():
 
     # Factory for creating read-only properties
     def make_prop(name, get_container, doc_source, block_interface=False):
+        # name of the property within the C++ core, if it can be evaluated natively
+        native = SolutionArray._native.get(name)
+        if native is not None and not SolutionArrayBase._has_property(native):
+            native = None
+
         def getter(self):
             if block_interface and isinstance(self._phase, Interface):
                 # used to block Interface methods that require synchronized updates of
                 # linked phases
                 raise NotImplementedError(
                     "Method not implemented for SolutionArray containing Interface.")
+            if name in self._views:
+                # read-only view of state data held by the C++ core (no copy)
+                data = self._state_view(name)
+                if data is not None:
+                    return data
             v = get_container(self)
+            selected = self._phase.selected_species
+            if native and not (selected and name == 'heat_release_rate'):
+                # evaluate all states within C++ core; the heat release rate is
+                # excluded for selected species as it is summed over the selection
+                data = self._eval_property(native)
+                if selected and (name in self._n_species or
+                                 name in self._n_total_species):
+                    data = data[:, selected]
+                return data.reshape(v.shape)
             for loc, index in enumerate(self._indices):
                 self._set_loc(loc)
                 v[index] = getattr(self._phase, name)
@@ -765,6 +765,7 @@ class SolutionArray(SolutionArrayBase, Generic[_P]):
         **kwargs: Unpack[StateDefinition],
     ) -> None: ...
     def sort(self, col: str, reverse: bool = False) -> None: ...
+    def view(self, name: str, writeable: bool = False) -> Array: ...
     def equilibrate(
         self,
         XY: PropertyPair | None = None,
@@ -819,9 +820,18 @@ class SolutionArray(SolutionArrayBase, Generic[_P]):
         overwrite: bool = False,
         compression: CompressionLevel = 0,
         basis: Basis | None = None,
+        append: bool = False,
+        chunk_size: int = 0,
     ) -> None: ...
     def restore(
-        self, fname: str | Path, name: str | None = None, sub: str | None = None
+        self,
+        fname: str | Path,
+        name: str | None = None,
+        sub: str | None = None,
+        *,
+        columns: Sequence[str] | None = None,
+        rows: slice | None = None,
+        lazy: bool = False,
     ) -> None: ...
     @override
     def __reduce__(self) -> Never: ...
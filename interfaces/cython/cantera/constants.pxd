@@ -17,3 +17,4 @@ cdef extern from "cantera/base/ct_defs.h" namespace "Cantera":
     cdef double CxxLightSpeed "Cantera::lightSpeed"
     cdef double CxxPermeability_0 "Cantera::permeability_0"
     cdef double CxxEpsilon_0 "Cantera::epsilon_0"
+    cdef size_t CxxNpos "Cantera::npos"
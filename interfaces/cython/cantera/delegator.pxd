@@ -49,6 +49,7 @@ cdef extern from "cantera/base/Delegator.h" namespace "Cantera":
         void setDelegate(string&, function[void(size_array1, double, double*)], string&) except +translate_exception
         void setDelegate(string&, function[void(size_array2, double, double*, double*)], string&) except +translate_exception
         void setDelegate(string&, function[void(size_array3, double*, double*, double*)], string&) except +translate_exception
+        void setDelegate(string&, function[void(size_array2, void*, double*, double*)], string&) except +translate_exception
         void setDelegate(string&, function[int(double&, void*)], string&) except +translate_exception
         void setDelegate(string&, function[int(string&, size_t)], string&) except +translate_exception
         void setDelegate(string&, function[int(size_t&, string&)], string&) except +translate_exception
@@ -73,6 +74,8 @@ cdef extern from "cantera/cython/funcWrapper.h":
         PyObject*, void(PyFuncInfo&, size_array2, double, double*, double*))
     cdef function[void(size_array3, double*, double*, double*)] pyOverride(
         PyObject*, void(PyFuncInfo&, size_array3, double*, double*, double*))
+    cdef function[void(size_array2, void*, double*, double*)] pyOverride(
+        PyObject*, void(PyFuncInfo&, size_array2, void*, double*, double*))
     cdef function[int(double&, void*)] pyOverride(PyObject*, int(PyFuncInfo&, double&, void*))
     cdef function[int(string&, size_t)] pyOverride(PyObject*, int(PyFuncInfo&, string&, size_t))
     cdef function[int(size_t&, const string&)] pyOverride(
@@ -186,6 +186,19 @@ cdef void callback_v_dp_dp_dp(PyFuncInfo& funcInfo,
         funcInfo.setExceptionType(<PyObject*>exc_type)
         funcInfo.setExceptionValue(<PyObject*>exc_value)
 
+# Wrapper for functions of type void(void*, double*, double*)
+cdef void callback_v_vp_dp_dp(PyFuncInfo& funcInfo, size_array2 sizes, void* obj,
+                              double* arg1, double* arg2) noexcept:
+    cdef double[:] view1 = <double[:sizes[0]]>arg1 if sizes[0] else None
+    cdef double[:] view2 = <double[:sizes[1]]>arg2 if sizes[1] else None
+
+    try:
+        (<object>funcInfo.func())(<object>obj, view1, view2)
+    except BaseException as e:
+        exc_type, exc_value = _sys.exc_info()[:2]
+        funcInfo.setExceptionType(<PyObject*>exc_type)
+        funcInfo.setExceptionValue(<PyObject*>exc_value)
+
 # Wrapper for functions of type double(void*)
 cdef int callback_d_vp(PyFuncInfo& funcInfo, double& out, void* obj) noexcept:
     try:
@@ -368,6 +381,9 @@ cdef int assign_delegates(obj, CxxDelegator* delegator) except -1:
         elif callback == 'void(double,double*,double*)':
             delegator.setDelegate(cxx_name,
                 pyOverride(<PyObject*>method, callback_v_d_dp_dp), cxx_when)
+        elif callback == 'void(void*,double*,double*)':
+            delegator.setDelegate(cxx_name,
+                pyOverride(<PyObject*>method, callback_v_vp_dp_dp), cxx_when)
         else:
             raise ValueError("Don't know how to set delegates for functions "
                 f"with signature '{callback}'")
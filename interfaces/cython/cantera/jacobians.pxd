@@ -41,6 +41,13 @@ cdef extern from "cantera/numerics/SystemJacobianFactory.h" namespace "Cantera":
     cdef shared_ptr[CxxSystemJacobian] newSystemJacobian(string) except\
          +translate_exception
 
+cdef extern from "cantera/numerics/SolverProfiler.h" namespace "Cantera":
+    cdef cppclass CxxSolverProfiler "Cantera::SolverProfiler":
+        void setEnabled(cbool) except +translate_exception
+        cbool enabled()
+        void clear()
+        CxxAnyMap stats()
+
 cdef class SystemJacobian:
     @staticmethod
     cdef wrap(shared_ptr[CxxSystemJacobian])
@@ -7,7 +7,7 @@ from ._types import Array
 
 class SystemJacobian:
     _type: str
-    linear_solver_type: Literal["GMRES", "direct"]
+    linear_solver_type: Literal["GMRES", "direct", "SPARSE"]
 
     def __init__(self, *args: Any, init: bool = True, **kwargs: Any) -> None: ...
     @property
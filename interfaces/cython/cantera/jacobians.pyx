@@ -92,9 +92,18 @@ cdef class EigenSparseDirectJacobian(EigenSparseJacobian):
     """
     A system matrix solver that uses Eigen's sparse direct (LU) algorithm. Wraps C++
     class :ct:`EigenSparseDirectJacobian`.
+
+    When assigned as the `ReactorNet.preconditioner`, the reactor network is
+    integrated using the ``"SPARSE"`` linear solver, where this object factorizes
+    the Newton iteration matrix directly.
+
+    .. versionchanged:: 3.2
+
+        Selects the ``"SPARSE"`` linear solver of `ReactorNet`.
     """
 
     _type = "eigen-sparse-direct"
+    linear_solver_type = "SPARSE"
 
 
 cdef class AdaptivePreconditioner(EigenSparseJacobian):
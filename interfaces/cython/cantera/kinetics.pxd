@@ -16,6 +16,13 @@ cdef extern from "cantera/numerics/eigen_sparse.h" namespace "Eigen":
         size_t outerSize()
 
 
+cdef extern from "cantera/kinetics/KineticsProfiler.h" namespace "Cantera":
+    cdef cppclass CxxKineticsProfiler "Cantera::KineticsProfiler":
+        void setEnabled(cbool) except +translate_exception
+        cbool enabled()
+        void clear()
+        CxxAnyMap stats()
+
 cdef extern from "cantera/kinetics/Kinetics.h" namespace "Cantera":
     cdef cppclass CxxReaction "Cantera::Reaction"
     cdef cppclass CxxKinetics "Cantera::Kinetics":
@@ -49,6 +56,11 @@ cdef extern from "cantera/kinetics/Kinetics.h" namespace "Cantera":
 
         void getDerivativeSettings(CxxAnyMap&) except +translate_exception
         void setDerivativeSettings(CxxAnyMap&) except +translate_exception
+        void getRateTabulation(CxxAnyMap&) except +translate_exception
+        void setRateTabulation(CxxAnyMap&) except +translate_exception
+        void evalBatch(string&, size_t, double*, double*, double*, double*,
+                       size_t) except +translate_exception nogil
+        CxxKineticsProfiler& profiler()
 
         # Kinetics sparse matrices
         CxxSparseMatrix reactantStoichCoeffs() except +translate_exception
@@ -5,7 +5,7 @@ from collections.abc import Sequence
 from pathlib import Path
 from typing import TypeAlias, TypedDict
 
-from ._types import Array
+from ._types import Array, ArrayLike
 from .reaction import CustomRate, Reaction
 from .solutionbase import _SolutionBase
 from .thermo import ThermoPhase
@@ -26,6 +26,15 @@ _DerivativeSettings = TypedDict(
     },
     total=False,
 )
+_RateTabulation = TypedDict(
+    "_RateTabulation",
+    {
+        "T-range": Sequence[float],
+        "P-range": Sequence[float],
+        "rtol": float,
+    },
+    total=False,
+)
 
 class Kinetics(_SolutionBase):
     _custom_rates: list[CustomRate]
@@ -79,6 +88,17 @@ class Kinetics(_SolutionBase):
     @derivative_settings.setter
     def derivative_settings(self, settings: _DerivativeSettings) -> None: ...
     @property
+    def rate_tabulation(self) -> _RateTabulation: ...
+    @rate_tabulation.setter
+    def rate_tabulation(self, settings: _RateTabulation) -> None: ...
+    @property
+    def profiling(self) -> bool: ...
+    @profiling.setter
+    def profiling(self, enabled: bool) -> None: ...
+    @property
+    def profiler_stats(self) -> dict[str, dict[str, float]]: ...
+    def clear_profiler_stats(self) -> None: ...
+    @property
     def forward_rate_constants_ddT(self) -> Array: ...
     @property
     def forward_rate_constants_ddP(self) -> Array: ...
@@ -162,6 +182,15 @@ class Kinetics(_SolutionBase):
     def heat_release_rate(self) -> float: ...
     @property
     def heat_production_rates(self) -> Array: ...
+    def evaluate_batch(
+        self,
+        quantity: str,
+        T: ArrayLike,
+        P: ArrayLike,
+        Y: ArrayLike,
+        *,
+        num_threads: int = 1,
+    ) -> Array: ...
 
 class InterfaceKinetics(Kinetics):
     def advance_coverages(
@@ -7,6 +7,7 @@ cimport numpy as np
 import numpy as np
 
 from .reaction cimport *
+from .thermo cimport CxxThermoPhase
 from ._utils cimport *
 from . import _utils
 
@@ -405,6 +406,86 @@ cdef class Kinetics(_SolutionBase):
         def __set__(self, settings):
             self.kinetics.setDerivativeSettings(py_to_anymap(settings))
 
+    property rate_tabulation:
+        """
+        Property setting the tabulation of rate constants. If enabled, forward rate
+        constants that depend only on temperature (and optionally pressure) as well as
+        equilibrium constants of ideal gas phases are evaluated once on a grid and are
+        subsequently interpolated. Outside of the tabulated range, rate constants are
+        evaluated directly.
+
+        For :ct:`BulkKinetics`, the following keyword/value pairs are supported:
+
+        -  ``T-range`` (list of two floats) ... minimum and maximum temperature
+           [K] of the tabulated range. Required to enable tabulation.
+
+        -  ``P-range`` (list of two floats) ... minimum and maximum pressure [Pa]
+           of the tabulated range. If omitted, Chebyshev rate constants are not
+           tabulated. P-log rate constants are tabulated at the pressures of their
+           rate expressions and do not require a pressure range.
+
+        -  ``rtol`` (float) ... relative error bound of interpolated values. The
+           default value is 1e-4.
+
+        For example::
+
+            >>> gas.rate_tabulation = {"T-range": [300, 2500]}
+
+        The same settings can be specified using the ``rate-tabulation`` field of the
+        phase definition in a YAML input file. Passing an empty dictionary disables
+        tabulation.
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            cdef CxxAnyMap settings
+            self.kinetics.getRateTabulation(settings)
+            return anymap_to_py(settings)
+        def __set__(self, settings):
+            self.kinetics.setRateTabulation(py_to_anymap(settings))
+
+    property profiling:
+        """
+        Get/Set whether call counts and wall-clock times are collected for the steps
+        involved in evaluating rates of progress and production rates. See
+        `profiler_stats`. Default ``False``.
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            return self.kinetics.profiler().enabled()
+        def __set__(self, cbool enabled):
+            self.kinetics.profiler().setEnabled(enabled)
+
+    property profiler_stats:
+        """
+        Call counts and wall-clock times [s] collected while `profiling` is enabled.
+        Returns a dictionary that maps the name of each category to a dictionary with
+        fields ``calls`` and ``time``. For :ct:`BulkKinetics`, there is one category
+        for each reaction rate type, for example ``Arrhenius``, ``Troe``,
+        ``pressure-dependent-Arrhenius``, ``Chebyshev`` or the name of an
+        `ExtensibleRate` type, as well as the categories ``equilibrium-constants``,
+        ``third-bodies`` and ``stoichiometry``. The statistics can be shown as a
+        table using::
+
+            >>> gas.profiling = True
+            >>> wdot = gas.net_production_rates
+            >>> pandas.DataFrame(gas.profiler_stats).T
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            cdef CxxAnyMap stats = self.kinetics.profiler().stats()
+            return anymap_to_py(stats)
+
+    def clear_profiler_stats(self):
+        """
+        Reset the statistics returned by `profiler_stats`.
+
+        .. versionadded:: 3.2
+        """
+        self.kinetics.profiler().clear()
+
     property forward_rate_constants_ddT:
         """
         Calculate derivatives for forward rate constants with respect to temperature
@@ -911,6 +992,99 @@ cdef class Kinetics(_SolutionBase):
         def __get__(self):
             return - self.net_rates_of_progress * self.delta_enthalpy
 
+    def evaluate_batch(self, quantity, T, P, Y, *, num_threads=1):
+        """
+        Evaluate a kinetic property for many thermodynamic states in a single call.
+        States are set and properties are evaluated within the C++ core, without
+        per-state overhead in Python. The state of this object is not modified.
+
+        :param quantity:
+            Name of the property, which is one of ``creation_rates``,
+            ``destruction_rates``, ``net_production_rates``,
+            ``forward_rates_of_progress``, ``reverse_rates_of_progress``,
+            ``net_rates_of_progress``, ``equilibrium_constants``,
+            ``forward_rate_constants``, ``reverse_rate_constants``,
+            ``delta_enthalpy``, ``delta_gibbs``, ``delta_entropy``,
+            ``delta_standard_enthalpy``, ``delta_standard_gibbs``,
+            ``delta_standard_entropy``, ``third_body_concentrations`` or
+            ``heat_release_rate``.
+        :param T:
+            Array of temperatures [K] with length *N*.
+        :param P:
+            Array of pressures [Pa] with length *N*.
+        :param Y:
+            Array of mass fractions with shape (*N*, `n_species`). Mass fractions
+            are normalized for each state.
+        :param num_threads:
+            Number of threads, where each thread uses a cloned `Solution` object. A
+            value of zero uses all available hardware threads. Parallel evaluation is
+            not supported for mechanisms with user-defined reaction rates.
+        :return:
+            Array with shape (*N*, `n_total_species`) for species properties,
+            (*N*, `n_reactions`) for reaction properties, or (*N*,) for the heat
+            release rate. Species properties are limited to `selected_species` if
+            set.
+
+        >>> T = np.linspace(1000, 2000, 101)
+        >>> P = np.full_like(T, ct.one_atm)
+        >>> Y = np.tile(gas.Y, (len(T), 1))
+        >>> wdot = gas.evaluate_batch("net_production_rates", T, P, Y)
+
+        .. versionadded:: 3.2
+        """
+        # use the property names of SolutionArray, which evaluates the same
+        # properties for all of its entries
+        from .composite import SolutionArray
+        native = SolutionArray._native.get(quantity)
+        if native is None or not hasattr(Kinetics, quantity):
+            raise ValueError(f"Unsupported quantity {quantity!r}.")
+        if num_threads < 0:
+            raise ValueError("Number of threads must be non-negative.")
+        cdef np.ndarray[np.double_t, ndim=1] data_T = \
+            np.ascontiguousarray(T, dtype=np.double).ravel()
+        cdef np.ndarray[np.double_t, ndim=1] data_P = \
+            np.ascontiguousarray(P, dtype=np.double).ravel()
+        cdef size_t size = len(data_T)
+        if len(data_P) != size:
+            raise ValueError(f"Expected {size} pressures, but received "
+                             f"{len(data_P)}.")
+        cdef size_t n_species = self.thermo.nSpecies()
+        cdef np.ndarray[np.double_t, ndim=2] data_Y = \
+            np.ascontiguousarray(Y, dtype=np.double).reshape(size, -1)
+        if data_Y.shape[1] != n_species:
+            raise ValueError(f"Expected mass fractions with {n_species} species, "
+                             f"but received {data_Y.shape[1]}.")
+
+        species = quantity in SolutionArray._n_total_species
+        scalar = False
+        if species:
+            width = self.kinetics.nTotalSpecies()
+        elif quantity in SolutionArray._n_reactions:
+            width = self.kinetics.nReactions()
+        else:
+            scalar = True
+            width = 1
+        cdef np.ndarray[np.double_t, ndim=2] data = np.empty((size, width))
+        cdef string name = stringify(native)
+        cdef size_t n_threads = num_threads
+        cdef double* out
+        if size:
+            out = &data[0, 0]
+            if n_threads == 1:
+                self.kinetics.evalBatch(name, size, &data_T[0], &data_P[0],
+                                        &data_Y[0, 0], out, n_threads)
+            else:
+                # worker threads do not call back into Python
+                with nogil:
+                    self.kinetics.evalBatch(name, size, &data_T[0], &data_P[0],
+                                            &data_Y[0, 0], out, n_threads)
+
+        if scalar:
+            return data[:, 0]
+        if species and self._selected_species.size:
+            return data[:, self._selected_species]
+        return data
+
 
 cdef class InterfaceKinetics(Kinetics):
     """
@@ -1,7 +1,13 @@
 # This file is part of Cantera. See License.txt in the top-level directory or
 # at https://cantera.org/license.txt for license and copyright information.
 
+from concurrent.futures import (
+    FIRST_COMPLETED as _FIRST_COMPLETED, ProcessPoolExecutor as _ProcessPoolExecutor,
+    wait as _wait,
+)
+from itertools import product as _product
 from math import erf as _erf
+from os import cpu_count as _cpu_count
 from pathlib import Path as _Path
 import warnings
 import numpy as np
@@ -131,12 +137,12 @@ class FlameBase(Sim1D):
             # adjust temperatures
             grid = arr.grid
             xi = (grid - grid[0]) / (grid[-1] - grid[0])
-            T = arr.T
+            T = arr.T.copy()
             T += (left.T - T[0]) * (1 - xi) + (right.T - T[-1]) * xi
             arr.TP = T, self.P
 
             # adjust velocities
-            u = arr.velocity
+            u = arr.velocity.copy()
 
             self.gas.TPY = left.T, self.P, left.Y
             arr[:i].velocity = u[:i] * left.mdot / self.gas.density / u[0]
@@ -745,10 +751,7 @@ class FreeFlame(FlameBase):
 
         Su0 = g(self)
 
-        def perturb(sim, i, dp):
-            sim.gas.set_multiplier(1+dp, i)
-
-        return self.solve_adjoint(perturb, self.gas.n_reactions, dgdx) / Su0
+        return self.solve_adjoint_multipliers(self.gas, dgdx) / Su0
 
 
 class BurnerFlame(FlameBase):
@@ -1479,3 +1482,283 @@ class CounterflowTwinPremixedFlame(FlameBase):
         self.flame.set_profile("velocity", [0.0, 1.0], [uu, 0])
         self.flame.set_profile("spreadRate", [0.0, 1.0], [0.0, a])
         self.flame.set_profile("Lambda", [0.0, 1.0], [L, L])
+
+
+def _sweep_cases(parameters):
+    """ Expand parameter grid specified as dictionary or sequence of dictionaries """
+    if isinstance(parameters, dict):
+        names = list(parameters)
+        return [dict(zip(names, values))
+                for values in _product(*(parameters[name] for name in names))]
+    cases = [dict(case) for case in parameters]
+    if any(case.keys() != cases[0].keys() for case in cases):
+        raise ValueError("All cases need to specify the same parameters.")
+    return cases
+
+
+def _sweep_distances(cases):
+    """
+    Return function evaluating distances between one case and all cases, where
+    numeric parameters are scaled by their range and other parameters contribute a
+    unit distance if values differ.
+    """
+    names = list(cases[0]) if cases else []
+    numeric = []
+    other = []
+    for name in names:
+        values = [case[name] for case in cases]
+        if all(isinstance(v, (int, float, np.number)) for v in values):
+            values = np.array(values, dtype=float)
+            span = values.max() - values.min()
+            numeric.append((values - values.min()) / span if span else 0. * values)
+        else:
+            other.append(np.array([repr(v) for v in values]))
+
+    def distances(i):
+        out = np.zeros(len(cases))
+        for values in numeric:
+            out += (values - values[i])**2
+        for values in other:
+            out += values != values[i]
+        return np.sqrt(out)
+
+    return distances
+
+
+def _flame_data(flame):
+    """ Collect solution of the flow domain as a dictionary of arrays """
+    arr = flame.to_array()
+    data = {"T": arr.T.copy(), "Y": arr.Y.copy(), "P": flame.P}
+    for name in arr.extra:
+        data[name] = np.array(getattr(arr, name))
+    if isinstance(flame, FreeFlame):
+        data["fixed"] = flame.fixed_temperature_location
+    return data
+
+
+def _flame_guess(flame, data):
+    """
+    Create `SolutionArray` used as initial guess from collected data, which retains
+    the refined grid of the source solution. For freely propagating flames, grid and
+    profiles are shifted such that the fixed temperature of the default initial guess
+    is located at the fixed temperature location of the source solution; this
+    temperature is returned as the second value (`None` for other flames). For other
+    flames, the grid is scaled to the domain of ``flame``.
+    """
+    z = flame.grid
+    grid = data["grid"]
+    fixed = None
+    if isinstance(flame, FreeFlame):
+        flame.set_initial_guess()
+        fixed = flame.fixed_temperature
+        T = data["T"]
+        below = np.flatnonzero(T < fixed)
+        if not below.size or below[-1] + 1 == len(T):
+            raise ValueError("Fixed temperature is not within the range of the "
+                             "initial guess.")
+        i = below[-1]
+        crossing = grid[i] + (fixed - T[i]) * (grid[i+1] - grid[i]) / (T[i+1] - T[i])
+        shift = data["fixed"] - crossing
+        # drop points shifted upstream of the inlet and retain the refined grid
+        new = grid + shift
+        new = np.concatenate(([z[0]], new[new > z[0]]))
+        pos = new - shift
+    else:
+        pos = grid
+        new = z[0] + (grid - grid[0]) * (z[-1] - z[0]) / (grid[-1] - grid[0])
+
+    def interp(values):
+        if values.ndim == 1:
+            return np.interp(pos, grid, values)
+        return np.column_stack([np.interp(pos, grid, v) for v in values.T])
+
+    extra = {key: interp(value) for key, value in data.items()
+             if key not in ("T", "P", "Y", "grid", "fixed")}
+    extra["grid"] = new
+    arr = SolutionArray(flame.gas, len(new), extra=extra)
+    # use pressure of the current case rather than the pressure of the source case
+    arr.TPY = interp(data["T"]), flame.P, interp(data["Y"])
+    return arr, fixed
+
+
+def _solve_case(factory, case, guess, options):
+    """
+    Solve a single case of a parameter sweep; if a solution based on the initial
+    guess ``guess`` fails, the default initial guess is used instead.
+    """
+    flame = factory(**case)
+    if guess is not None:
+        try:
+            arr, fixed = _flame_guess(flame, guess)
+            flame.set_initial_guess(data=arr)
+            if fixed is not None:
+                flame.fixed_temperature = fixed
+            flame.solve(**options)
+            return _flame_data(flame)
+        except (CanteraError, ValueError, IndexError):
+            flame = factory(**case)
+    flame.solve(**options)
+    return _flame_data(flame)
+
+
+def run_sweep(factory, parameters, *, processes=None, warm_start=True, output=None,
+              name="sweep", **options):
+    """
+    Solve flames for a grid of parameters using a pool of worker processes.
+
+    Cases are distributed across worker processes as they become available. If
+    ``warm_start`` is enabled, each case is initialized using the converged
+    solution of its nearest solved neighbor, where distances between cases are
+    based on parameter values scaled by their range (non-numeric parameters
+    contribute a unit distance if values differ). Initially, cases that are far
+    apart from each other are solved using the default initial guess, so that all
+    worker processes are busy. If a warm start fails, the case is solved again
+    using the default initial guess.
+
+    Warm starts retain the refined grid of the neighboring solution, so that grid
+    refinement starts from the resolution of the neighboring case; freely
+    propagating flames use the fixed temperature of the default initial guess, which
+    is placed at the fixed temperature location of the neighboring solution, while
+    the grid of other flames is scaled to the domain created by ``factory``.
+    Warm-started cases thus converge to the solution obtained using the default
+    initial guess to within the resolution set by the refinement criteria. ::
+
+        >>> def make_flame(phi, T, P):
+        ...     gas = ct.Solution("gri30.yaml")
+        ...     gas.set_equivalence_ratio(phi, "CH4", "O2:1.0, N2:3.76")
+        ...     gas.TP = T, P
+        ...     flame = ct.FreeFlame(gas, width=0.03)
+        ...     flame.set_refine_criteria(ratio=3, slope=0.06, curve=0.12)
+        ...     return flame
+        >>> grid = {"phi": np.linspace(0.6, 1.4, 9), "T": [300, 400],
+        ...         "P": [ct.one_atm, 5 * ct.one_atm]}
+        >>> results = ct.run_sweep(make_flame, grid, auto=True)
+        >>> for i, case in enumerate(results.meta["parameters"]["phi"]):
+        ...     flame = results[results.case == i] # solution for case i
+
+    :param factory:
+        Callable creating an unsolved flame object (for example, `FreeFlame` or
+        `CounterflowDiffusionFlame`) for a given case, where parameters are passed
+        as keyword arguments. The callable is invoked within worker processes and
+        thus needs to be picklable (for example, a function defined at the top
+        level of a module).
+    :param parameters:
+        Dictionary mapping parameter names to sequences of values, where cases
+        consist of all combinations of parameter values; alternatively, a sequence
+        of dictionaries specifying individual cases.
+    :param processes:
+        Number of worker processes; if `None`, the number of available processors
+        is used. If 1, cases are solved sequentially within the current process.
+    :param warm_start:
+        If `True` (default), cases are initialized using the solution of the
+        nearest solved neighbor.
+    :param output:
+        Name of a YAML or HDF container file used to store results (optional).
+        HDF output requires Cantera compiled with HDF support.
+    :param name:
+        Identifier of the location within the output file.
+    :param options:
+        Keyword arguments passed to `FlameBase.solve` (default: ``loglevel=0``).
+    :return:
+        `SolutionArray` holding solutions of all converged cases for the flow
+        domain, which are stacked along the first dimension. The extra component
+        ``case`` holds the index of the corresponding case, while meta data
+        ``parameters`` hold parameter values of all cases. If cases did not converge,
+        their indices are listed by meta data ``failed``.
+
+    .. versionadded:: 3.2
+    """
+    cases = _sweep_cases(parameters)
+    if not cases:
+        raise ValueError("Parameter sweep requires at least one case.")
+    options.setdefault("loglevel", 0)
+    n_cases = len(cases)
+    distances = _sweep_distances(cases)
+    results = [None] * n_cases
+    errors = {}
+
+    # distance of pending cases to nearest solved case and corresponding source
+    pending = np.ones(n_cases, dtype=bool)
+    nearest = np.full(n_cases, np.inf)
+    source = np.full(n_cases, -1)
+    # distance of pending cases to nearest case solved using default initial guess
+    seeded = np.full(n_cases, np.inf)
+
+    def next_case():
+        """ Select next case and corresponding initial guess """
+        if warm_start and (source[pending] >= 0).any():
+            i = np.flatnonzero(pending)[np.argmin(nearest[pending])]
+            pending[i] = False
+            return i, results[source[i]]
+        if warm_start and np.isfinite(seeded).any():
+            # case that is farthest apart from cases already started
+            i = np.flatnonzero(pending)[np.argmax(seeded[pending])]
+        else:
+            i = np.flatnonzero(pending)[0]
+        pending[i] = False
+        np.minimum(seeded, distances(i), out=seeded)
+        return i, None
+
+    def complete(i, data=None, error=None):
+        """ Store result for case ``i`` """
+        if error is not None:
+            errors[i] = error
+            return
+        results[i] = data
+        dist = distances(i)
+        closer = dist < nearest
+        nearest[closer] = dist[closer]
+        source[closer] = i
+
+    if processes is None:
+        processes = _cpu_count() or 1
+    if processes == 1:
+        while pending.any():
+            i, guess = next_case()
+            try:
+                complete(i, _solve_case(factory, cases[i], guess, options))
+            except CanteraError as err:
+                complete(i, error=err)
+    else:
+        with _ProcessPoolExecutor(max_workers=processes) as executor:
+            running = {}
+            while pending.any() or running:
+                while pending.any() and len(running) < processes:
+                    i, guess = next_case()
+                    future = executor.submit(
+                        _solve_case, factory, cases[i], guess, options)
+                    running[future] = i
+                done, _ = _wait(running, return_when=_FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    try:
+                        complete(i, future.result())
+                    except CanteraError as err:
+                        complete(i, error=err)
+
+    for i, err in errors.items():
+        warnings.warn(f"Case {i} of parameter sweep failed:\n{err}")
+
+    # collect solutions in a single SolutionArray
+    solved = [i for i in range(n_cases) if results[i] is not None]
+    if not solved:
+        raise CanteraError("Parameter sweep did not converge for any case.")
+    gas = factory(**cases[solved[0]]).gas
+    extra = {"case": np.concatenate(
+        [np.full(len(results[i]["T"]), i) for i in solved])}
+    for key in results[solved[0]]:
+        if key not in ("T", "P", "Y", "fixed"):
+            extra[key] = np.concatenate([results[i][key] for i in solved])
+    out = SolutionArray(gas, len(extra["case"]), extra=extra)
+    out.TPY = (np.concatenate([results[i]["T"] for i in solved]),
+               np.concatenate([np.full(len(results[i]["T"]), results[i]["P"])
+                               for i in solved]),
+               np.concatenate([results[i]["Y"] for i in solved]))
+    meta = {"parameters": {
+        key: np.array([case[key] for case in cases]).tolist() for key in cases[0]}}
+    if errors:
+        meta["failed"] = sorted(int(i) for i in errors)
+    out.meta = meta
+    if output is not None:
+        out.save(output, name=name, overwrite=True)
+    return out
@@ -1,7 +1,7 @@
 # This file is part of Cantera. See License.txt in the top-level directory or
 # at https://cantera.org/license.txt for license and copyright information.
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
 from typing import Any, Literal
 
@@ -434,3 +434,14 @@ class CounterflowTwinPremixedFlame(FlameBase):
         data: SolutionArray[Solution] | DataFrame | str | Path | None = None,
         group: str | None = None,
     ) -> None: ...
+
+def run_sweep(
+    factory: Callable[..., FlameBase],
+    parameters: dict[str, Sequence[Any]] | Sequence[dict[str, Any]],
+    *,
+    processes: int | None = None,
+    warm_start: bool = True,
+    output: str | Path | None = None,
+    name: str = "sweep",
+    **options: Any,
+) -> SolutionArray[Solution]: ...
@@ -187,6 +187,7 @@ cdef extern from "cantera/kinetics/ReactionRateDelegator.h" namespace "Cantera":
     cdef cppclass CxxReactionRateDelegator "Cantera::ReactionRateDelegator" (CxxDelegator, CxxReactionRate):
         CxxReactionRateDelegator()
         void setType(string&)
+        void setBatchParameterCount(size_t)
 
 
 cdef extern from "cantera/kinetics/InterfaceRate.h" namespace "Cantera":
@@ -262,7 +262,12 @@ class ExtensibleRate(ReactionRate):
     delegatable_methods: dict[str, tuple[str, str, str]]
     def set_parameters(self, params: AnyMap, rate_coeff_units: UnitStack) -> None: ...
     def get_parameters(self, params: AnyMap) -> None: ...
+    batch_parameters: Sequence[str] | None
     def eval(self, data: ExtensibleRateData) -> float: ...
+    @classmethod
+    def eval_batch(
+        cls, data: ExtensibleRateData, params: Array, out: Array
+    ) -> None: ...
     def validate(self, equation: str, soln: Solution) -> None: ...
 
 class ExtensibleRateData:
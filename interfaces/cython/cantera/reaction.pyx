@@ -855,6 +855,10 @@ cdef class ExtensibleRate(ReactionRate):
     `get_parameters`, `eval`, and (optionally) `validate` methods, which will be called
     as delegates from the C++ :ct:`ReactionRate` class.
 
+    Optionally, classes can also implement `eval_batch` and set `batch_parameters`, in
+    which case the rate constants of all reactions of this type are evaluated using a
+    single call to `eval_batch` instead of one call to `eval` per reaction.
+
     .. warning::
 
         The delegatable methods defined here are an experimental part of the
@@ -865,11 +869,19 @@ cdef class ExtensibleRate(ReactionRate):
 
     _reaction_rate_type = "extensible"
 
+    #: Names of the attributes holding the parameters of each rate that are passed to
+    #: `eval_batch`. If `None` (default), batch evaluation is disabled.
+    #:
+    #: .. versionadded:: 3.2
+    batch_parameters = None
+
     delegatable_methods = {
         "eval": ("evalFromStruct", "double(void*)", "replace"),
         "set_parameters": ("setParameters", "void(AnyMap&, UnitStack&)", "after"),
         "get_parameters": ("getParameters", "void(AnyMap&)", "replace"),
-        "validate": ("validate", "void(string, void*)", "replace")
+        "validate": ("validate", "void(string, void*)", "replace"),
+        "_get_batch_parameters": ("getBatchParameters", "void(double*)", "replace"),
+        "_eval_batch": ("evalBatch", "void(void*, double*, double*)", "replace")
     }
 
     def __cinit__(self, *args, init=True, **kwargs):
@@ -915,6 +927,39 @@ cdef class ExtensibleRate(ReactionRate):
         """
         raise NotImplementedError(f"{self.__class__.__name__}.eval")
 
+    @classmethod
+    def eval_batch(cls, data: ExtensibleRateData, params: np.ndarray,
+                   out: np.ndarray) -> None:
+        """
+        Responsible for calculating the forward rate constants of all reactions of this
+        type based on the current state of the phase, stored in an instance of a class
+        derived from `ExtensibleRateData`. This method is used instead of `eval` if
+        `batch_parameters` is set, and is called once per evaluation of the rate
+        constants with ``params``, a 2D array where each row contains the values of
+        the attributes listed in `batch_parameters` for one reaction. The rate
+        constants are written to the 1D array ``out``.
+
+        The values of ``params`` are collected when reactions are added to or modified
+        in a `Kinetics` object. The `eval` method is still used for the evaluation of
+        derivatives.
+
+        .. versionadded:: 3.2
+        """
+        raise NotImplementedError(f"{cls.__name__}.eval_batch")
+
+    def _get_batch_parameters(self, params):
+        if params is not None:
+            np.asarray(params)[:] = [getattr(self, name)
+                                     for name in self.batch_parameters]
+
+    def _eval_batch(self, data, params, out):
+        out = np.asarray(out)
+        if params is None:
+            params = np.empty((len(out), 0))
+        else:
+            params = np.asarray(params).reshape(len(out), -1)
+        self.eval_batch(data, params, out)
+
     def validate(self, equation: str, soln: "Solution") -> None:
         """
         Responsible for validating that the rate expression is configured with valid
@@ -946,6 +991,9 @@ cdef class ExtensibleRate(ReactionRate):
         assign_delegates(self, dynamic_cast[CxxDelegatorPtr](self.rate))
         (<CxxReactionRateDelegator*>self.rate).setType(
             stringify(self._reaction_rate_type))
+        if self.batch_parameters is not None:
+            (<CxxReactionRateDelegator*>self.rate).setBatchParameterCount(
+                len(self.batch_parameters))
 
 
 cdef class ExtensibleRateData:
@@ -188,6 +188,8 @@ cdef extern from "cantera/zerodim.h" namespace "Cantera":
         int maxSteps()
         cbool verbose()
         void setVerbose(cbool)
+        void setNumThreads(size_t) except +translate_exception
+        size_t numThreads()
         size_t neq()
         void getState(double*)
         void getDerivative(int, double *) except +translate_exception
@@ -207,6 +209,33 @@ cdef extern from "cantera/zerodim.h" namespace "Cantera":
         void setPreconditioner(shared_ptr[CxxSystemJacobian] preconditioner)
         void setDerivativeSettings(CxxAnyMap&)
         CxxAnyMap solverStats() except +translate_exception
+        CxxSolverProfiler& profiler()
+
+cdef extern from "cantera/zeroD/ReactorEnsemble.h" namespace "Cantera":
+    cdef cppclass CxxReactorEnsemble "Cantera::ReactorEnsemble":
+        CxxReactorEnsemble(shared_ptr[CxxSolution], string&) except +translate_exception
+        string reactorType()
+        void setTolerances(double, double)
+        double rtol()
+        double atol()
+        void setMaxSteps(int) except +translate_exception
+        int maxSteps()
+        void setMaxTimeStep(double) except +translate_exception
+        double maxTimeStep()
+        void setNumThreads(size_t)
+        size_t numThreads()
+        void setIgnitionRise(double)
+        double ignitionRise()
+        void setStopAtIgnition(cbool)
+        cbool stopAtIgnition()
+        void setSampleTimes(span[double]) except +translate_exception
+        vector[double]& sampleTimes()
+        void integrate(double, span[double], span[double], span[double]) except +translate_exception nogil
+        size_t size()
+        vector[double]& ignitionTimes()
+        size_t sampleWidth()
+        vector[double]& samples()
+        vector[string]& errors()
 
 cdef extern from "cantera/zeroD/ReactorDelegator.h" namespace "Cantera":
     cdef cppclass CxxReactorAccessor "Cantera::ReactorAccessor":
@@ -337,3 +366,8 @@ cdef class ReactorNet:
     cdef shared_ptr[CxxReactorNet] _net
     cdef CxxReactorNet* net
     cdef list _reactors
+
+cdef class ReactorEnsemble:
+    cdef shared_ptr[CxxReactorEnsemble] _ensemble
+    cdef CxxReactorEnsemble* ensemble
+    cdef object _contents
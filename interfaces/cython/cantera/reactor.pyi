@@ -12,7 +12,7 @@ from typing import (
 from graphviz import Digraph
 from typing_extensions import Never, override
 
-from ._types import Array, ArrayLike, LogLevel
+from ._types import Array, ArrayLike, CompositionLike, LogLevel
 from .composite import Solution
 from .func1 import _Func1Like
 from .jacobians import SystemJacobian
@@ -462,6 +462,10 @@ class ReactorNet:
     def verbose(self) -> bool: ...
     @verbose.setter
     def verbose(self, v: bool) -> None: ...
+    @property
+    def num_threads(self) -> int: ...
+    @num_threads.setter
+    def num_threads(self, n: int) -> None: ...
     def global_component_index(self, name: str, reactor: int) -> int: ...
     def component_name(self, i: int) -> str: ...
     def sensitivity(self, component: int | str, p: int, r: int = 0) -> float: ...
@@ -509,14 +513,21 @@ class ReactorNet:
     @preconditioner.setter
     def preconditioner(self, precon: SystemJacobian) -> None: ...
     @property
-    def linear_solver_type(self) -> Literal["DENSE", "GMRES", "BAND", "DIAG"]: ...
+    def linear_solver_type(self) -> Literal["DENSE", "GMRES", "BAND", "DIAG", "SPARSE"]: ...
     @linear_solver_type.setter
     def linear_solver_type(
-        self, linear_solver_type: Literal["DENSE", "GMRES", "BAND", "DIAG"]
+        self, linear_solver_type: Literal["DENSE", "GMRES", "BAND", "DIAG", "SPARSE"]
     ) -> None: ...
     @property
     def solver_stats(self) -> dict[str, int]: ...
     @property
+    def profiling(self) -> bool: ...
+    @profiling.setter
+    def profiling(self, enabled: bool) -> None: ...
+    @property
+    def profiler_stats(self) -> dict[str, dict[str, float]]: ...
+    def clear_profiler_stats(self) -> None: ...
+    @property
     def derivative_settings(self) -> Never: ...
     @derivative_settings.setter
     def derivative_settings(self, value: _DerivativeSettings) -> None: ...
@@ -535,3 +546,59 @@ class ReactorNet:
         species: Literal["X", "Y"] | bool | Iterable[str] | None = None,
         species_units: Literal["percent", "ppm"] = "percent",
     ) -> Digraph: ...
+
+class ReactorEnsemble:
+    def __init__(
+        self,
+        contents: _SolutionBase,
+        reactor_type: str = "IdealGasConstPressureReactor",
+        *,
+        num_threads: int = 1,
+    ) -> None: ...
+    @property
+    def reactor_type(self) -> str: ...
+    @property
+    def rtol(self) -> float: ...
+    @rtol.setter
+    def rtol(self, tol: float) -> None: ...
+    @property
+    def atol(self) -> float: ...
+    @atol.setter
+    def atol(self, tol: float) -> None: ...
+    @property
+    def max_steps(self) -> int: ...
+    @max_steps.setter
+    def max_steps(self, nsteps: int) -> None: ...
+    @property
+    def max_time_step(self) -> float: ...
+    @max_time_step.setter
+    def max_time_step(self, t: float) -> None: ...
+    @property
+    def num_threads(self) -> int: ...
+    @num_threads.setter
+    def num_threads(self, n: int) -> None: ...
+    @property
+    def ignition_rise(self) -> float: ...
+    @ignition_rise.setter
+    def ignition_rise(self, dT: float) -> None: ...
+    @property
+    def stop_at_ignition(self) -> bool: ...
+    @stop_at_ignition.setter
+    def stop_at_ignition(self, stop: bool) -> None: ...
+    @property
+    def sample_times(self) -> Array: ...
+    @property
+    def ignition_times(self) -> Array: ...
+    @property
+    def samples(self) -> Array: ...
+    @property
+    def errors(self) -> dict[int, str]: ...
+    def integrate(
+        self,
+        T: ArrayLike,
+        P: ArrayLike,
+        X: CompositionLike,
+        t_end: float,
+        *,
+        sample_times: ArrayLike | None = None,
+    ) -> Array: ...
@@ -1844,6 +1844,29 @@ cdef class ReactorNet:
         def __set__(self, pybool v):
             self.net.setVerbose(v)
 
+    @property
+    def num_threads(self):
+        """
+        The number of threads used to evaluate the governing equations. If more than
+        one thread is used, only the net production rates of bulk-phase kinetics
+        (``getNetProductionRates``) are precomputed concurrently for all reactors.
+        All remaining terms, including surface kinetics of `ReactorSurface` objects
+        and the coupling between reactors by flow devices and walls, are evaluated
+        serially in the same order as for a single thread. Results therefore do not
+        depend on the number of threads. A value of zero uses the number of threads
+        supported by the hardware. Parallel evaluation is not supported for
+        mechanisms that include user-defined reaction rates. The default is 1.
+
+        .. versionadded:: 3.2
+        """
+        return self.net.numThreads()
+
+    @num_threads.setter
+    def num_threads(self, n):
+        if n < 0:
+            raise ValueError("Number of threads must be non-negative.")
+        self.net.setNumThreads(n)
+
     def global_component_index(self, name, int reactor):
         """
         Returns the index of a component named ``name`` of a reactor with index
@@ -2078,7 +2101,16 @@ cdef class ReactorNet:
             - `"GMRES"`
             - `"BAND"`
             - `"DIAG"`
+            - `"SPARSE"`
 
+            The `"SPARSE"` option uses a Newton iteration where the sparse Jacobian
+            of the reactor network is factorized directly, using the
+            `EigenSparseDirectJacobian` assigned as `preconditioner` or a default
+            one. It is only available for networks of ``*MoleReactor`` types.
+
+            .. versionadded:: 3.2
+
+                The `"SPARSE"` linear solver type.
         """
         def __set__(self, linear_solver_type):
             self.net.setLinearSolverType(stringify(linear_solver_type))
@@ -2094,6 +2126,44 @@ cdef class ReactorNet:
             stats = self.net.solverStats()
             return anymap_to_py(stats)
 
+    property profiling:
+        """
+        Get/Set whether call counts and wall-clock times are collected for the
+        phases of the solver. See `profiler_stats`. Default ``False``. Enabling
+        profiling raises an exception if Cantera was compiled with the SCons option
+        ``profiling=n``.
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            return self.net.profiler().enabled()
+        def __set__(self, cbool enabled):
+            self.net.profiler().setEnabled(enabled)
+
+    property profiler_stats:
+        """
+        Call counts and wall-clock times [s] collected while `profiling` is enabled.
+        Returns a dictionary that maps the name of each phase to a dictionary with
+        fields ``calls`` and ``time``, using the same phases as `Sim1D.profiler_stats`.
+        For reactor networks, the phases recorded are evaluations of the right-hand
+        side (``residual``), updates of the reactor states (``thermo``), and the
+        setup (``jacobian`` and ``factorization``) and application
+        (``linear_solve``) of preconditioners and sparse direct linear solvers.
+
+        .. versionadded:: 3.2
+        """
+        def __get__(self):
+            cdef CxxAnyMap stats = self.net.profiler().stats()
+            return anymap_to_py(stats)
+
+    def clear_profiler_stats(self):
+        """
+        Reset the statistics returned by `profiler_stats`.
+
+        .. versionadded:: 3.2
+        """
+        self.net.profiler().clear()
+
     property derivative_settings:
         """
         Apply derivative settings to all reactors in the network.
@@ -2160,3 +2230,216 @@ cdef class ReactorNet:
                                 heat_flow_attr, mass_flow_attr, moving_wall_edge_attr,
                                 surface_edge_attr, show_wall_velocity, print_state,
                                 species, species_units)
+
+
+cdef class ReactorEnsemble:
+    """
+    ReactorEnsemble(contents, reactor_type="IdealGasConstPressureReactor", *, num_threads=1)
+
+    Ensembles of independent reactors. Each member of the ensemble consists of a single
+    reactor of type ``reactor_type`` that is integrated in time from its own initial
+    state, which is useful for generating tables of ignition delay times. Integration
+    is performed in C++, where members are distributed across ``num_threads``
+    worker threads that each use a clone of the `Solution` object ``contents``.
+
+    Example:
+
+    >>> ensemble = ReactorEnsemble(gas, num_threads=4)
+    >>> T = np.linspace(900, 1300, 41)
+    >>> tau = ensemble.integrate(T, one_atm, "H2:2, O2:1, AR:7", 0.1)
+
+    Ignition is detected as the time at which the temperature of a member first
+    exceeds its initial temperature by `ignition_rise`, using the root-finding
+    capabilities of the integrator. Detection requires a reactor type that uses
+    temperature as a state variable, for example `IdealGasConstPressureReactor` or
+    `IdealGasReactor`.
+
+    .. versionadded:: 3.2
+    """
+    def __cinit__(self, _SolutionBase contents,
+                  reactor_type="IdealGasConstPressureReactor", *, num_threads=1):
+        self._ensemble.reset(
+            new CxxReactorEnsemble(contents._base, stringify(reactor_type)))
+        self.ensemble = self._ensemble.get()
+        self._contents = contents
+
+    def __init__(self, contents, reactor_type="IdealGasConstPressureReactor", *,
+                 num_threads=1):
+        self.num_threads = num_threads
+
+    @property
+    def reactor_type(self):
+        """The type of the reactor used for all members."""
+        return pystr(self.ensemble.reactorType())
+
+    @property
+    def rtol(self):
+        """The relative error tolerance used while integrating the reactor equations."""
+        return self.ensemble.rtol()
+
+    @rtol.setter
+    def rtol(self, double tol):
+        self.ensemble.setTolerances(tol, -1)
+
+    @property
+    def atol(self):
+        """The absolute error tolerance used while integrating the reactor equations."""
+        return self.ensemble.atol()
+
+    @atol.setter
+    def atol(self, double tol):
+        self.ensemble.setTolerances(-1, tol)
+
+    @property
+    def max_steps(self):
+        """
+        The maximum number of internal integration steps that CVODES is allowed to
+        take before reaching the next output time. A value of zero uses the default
+        of the integrator.
+        """
+        return self.ensemble.maxSteps()
+
+    @max_steps.setter
+    def max_steps(self, int nsteps):
+        self.ensemble.setMaxSteps(nsteps)
+
+    @property
+    def max_time_step(self):
+        """
+        The maximum time step [s] that the integrator is allowed to use. The default
+        value of zero means that no time step maximum is used.
+        """
+        return self.ensemble.maxTimeStep()
+
+    @max_time_step.setter
+    def max_time_step(self, double t):
+        self.ensemble.setMaxTimeStep(t)
+
+    @property
+    def num_threads(self):
+        """
+        The number of threads used for integrating the ensemble. A value of zero uses
+        the number of threads supported by the hardware. Parallel integration is not
+        supported for mechanisms that include user-defined reaction rates.
+        """
+        return self.ensemble.numThreads()
+
+    @num_threads.setter
+    def num_threads(self, n):
+        if n < 0:
+            raise ValueError("Number of threads must be non-negative.")
+        self.ensemble.setNumThreads(n)
+
+    @property
+    def ignition_rise(self):
+        """
+        The temperature rise [K] relative to the initial temperature that defines
+        ignition. A non-positive value disables ignition detection. Default: 400 K.
+        """
+        return self.ensemble.ignitionRise()
+
+    @ignition_rise.setter
+    def ignition_rise(self, double dT):
+        self.ensemble.setIgnitionRise(dT)
+
+    @property
+    def stop_at_ignition(self):
+        """
+        If `True` (default), the integration of a member stops once ignition is
+        detected, and samples taken after the ignition time are set to NaN.
+        """
+        return self.ensemble.stopAtIgnition()
+
+    @stop_at_ignition.setter
+    def stop_at_ignition(self, pybool stop):
+        self.ensemble.setStopAtIgnition(stop)
+
+    @property
+    def sample_times(self):
+        """Times [s] at which the states of all members were sampled."""
+        return np.array(self.ensemble.sampleTimes())
+
+    @property
+    def ignition_times(self):
+        """
+        Ignition times [s] of all members obtained by the last call to `integrate`;
+        NaN for members that did not ignite before the end time.
+        """
+        return np.array(self.ensemble.ignitionTimes())
+
+    @property
+    def samples(self):
+        """
+        States of all members sampled at `sample_times`, as an array with shape
+        ``(n_members, n_samples, 2 + n_species)``. The last dimension holds the
+        temperature [K], the pressure [Pa] and the mass fractions of all species.
+        """
+        shape = (self.ensemble.size(), len(self.ensemble.sampleTimes()),
+                 self.ensemble.sampleWidth())
+        return np.array(self.ensemble.samples()).reshape(shape)
+
+    @property
+    def errors(self):
+        """
+        Error messages of members that could not be integrated, as a dictionary
+        mapping member indices to messages.
+        """
+        return {i: pystr(msg) for i, msg in enumerate(self.ensemble.errors()) if msg}
+
+    def integrate(self, T, P, X, double t_end, *, sample_times=None):
+        """
+        Integrate all members of the ensemble up to ``t_end`` [s] and return their
+        ignition times [s]. Members that do not ignite are assigned NaN. Failures of
+        individual members do not interrupt the integration of other members; see
+        `errors`.
+
+        :param T:
+            Initial temperatures [K] of all members
+        :param P:
+            Initial pressures [Pa] of all members
+        :param X:
+            Initial mole fractions, either as an array with one row per member or as a
+            composition (string, dictionary or array) that is used for all members
+        :param t_end:
+            End time [s] of the integration
+        :param sample_times:
+            Increasing times [s] at which the states of all members are stored; see
+            `samples`. Times may not exceed ``t_end``.
+        """
+        contents = self._contents
+        if isinstance(X, (str, dict)):
+            state = contents.state
+            contents.TPX = None, None, X
+            X = contents.X
+            contents.state = state
+        X = np.asarray(X, dtype=np.double)
+        n_species = contents.n_species
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        if X.ndim != 2 or X.shape[1] != n_species:
+            raise ValueError(f"Mole fractions need to have shape (n, {n_species}); "
+                             f"got {X.shape}.")
+        T, P, _ = np.broadcast_arrays(
+            np.asarray(T, dtype=np.double).reshape(-1, 1),
+            np.asarray(P, dtype=np.double).reshape(-1, 1), X[:, :1])
+        cdef np.ndarray[np.double_t, ndim=1] cxx_T = np.ascontiguousarray(T[:, 0])
+        cdef np.ndarray[np.double_t, ndim=1] cxx_P = np.ascontiguousarray(P[:, 0])
+        cdef np.ndarray[np.double_t, ndim=2] cxx_X = np.ascontiguousarray(
+            np.broadcast_to(X, (len(cxx_T), n_species)))
+        cdef np.ndarray[np.double_t, ndim=1] times = np.ascontiguousarray(
+            sample_times if sample_times is not None else [], dtype=np.double)
+        self.ensemble.setSampleTimes(span[double](&times[0] if times.size else NULL,
+                                                  times.size))
+
+        cdef size_t n = len(cxx_T)
+        cdef span[double] T_span = span[double](&cxx_T[0] if n else NULL, n)
+        cdef span[double] P_span = span[double](&cxx_P[0] if n else NULL, n)
+        cdef span[double] X_span = span[double](&cxx_X[0, 0] if n else NULL,
+                                                cxx_X.size)
+        if self.ensemble.numThreads() == 1:
+            self.ensemble.integrate(t_end, T_span, P_span, X_span)
+        else:
+            # worker threads do not call back into Python
+            with nogil:
+                self.ensemble.integrate(t_end, T_span, P_span, X_span)
+        return self.ignition_times
@@ -77,15 +77,24 @@ cdef extern from "cantera/base/SolutionArray.h" namespace "Cantera":
         void updateState(int) except +translate_exception
         vector[double] getState(int) except +translate_exception
         void setState(int, vector[double]&) except +translate_exception
+        size_t propertySize(string&) except +translate_exception
+        void evalProperty(string&, double*) except +translate_exception nogil
+        void setNumThreads(size_t)
+        size_t numThreads()
+        void setStates(string&, double*, double*, double*, cbool) except +translate_exception
+        double* componentData(string&, size_t&, size_t&) except +translate_exception
+        shared_ptr[vector[double]] sharedData()
         vector[string] listExtra()
         cbool hasExtra(string&)
         void addExtra(string&, cbool) except +translate_exception
         CxxAnyMap getAuxiliary(int) except +translate_exception
         void setAuxiliary(int, CxxAnyMap&) except +translate_exception
         void append(vector[double]&, CxxAnyMap&) except +translate_exception
-        void save(string&, string&, string&, string&, cbool, int, string&) except +translate_exception
-        CxxAnyMap restore(string&, string&, string&) except +translate_exception
+        void save(string&, string&, string&, string&, cbool, int, string&, cbool, size_t) except +translate_exception
+        CxxAnyMap restore(string&, string&, string&, vector[string]&, size_t, size_t, cbool) except +translate_exception
 
+    cdef cbool CxxSolutionArray_hasProperty "Cantera::SolutionArray::hasProperty" (
+        string&)
     cdef shared_ptr[CxxSolutionArray] CxxNewSolutionArray "Cantera::SolutionArray::create" (
         shared_ptr[CxxSolution], int, CxxAnyMap&) except +translate_exception
 
@@ -116,3 +125,11 @@ cdef class _SolutionBase:
 cdef class SolutionArrayBase:
     cdef shared_ptr[CxxSolutionArray] _base
     cdef CxxSolutionArray* base
+
+cdef class _SharedBuffer:
+    cdef shared_ptr[vector[double]] _anchor
+    cdef shared_ptr[CxxSolutionArray] _owner
+    cdef double* _data
+    cdef cbool _writeable
+    cdef Py_ssize_t _shape[1]
+    cdef Py_ssize_t _strides[1]
@@ -149,17 +149,33 @@ class SolutionArrayBase:
     @meta.setter
     def meta(self, meta: dict[str, Any]) -> None: ...
     @property
+    def num_threads(self) -> int: ...
+    @num_threads.setter
+    def num_threads(self, n: int) -> None: ...
+    @property
     def extra(self) -> list[str]: ...
     @property
     def component_names(self) -> list[str]: ...
     def resize(self, size: int | tuple[int, ...]) -> None: ...
     def _has_component(self, name: str) -> bool: ...
     def _get_component(self, name: str) -> Array: ...
+    def _get_view(self, name: str, writeable: bool = False) -> Array | None: ...
     def _set_component(self, name: str, data: Array) -> None: ...
     def _set_loc(self, loc: int) -> None: ...
     def _update_state(self, loc: int) -> None: ...
     def _get_state(self, loc: int) -> Array: ...
     def _set_state(self, loc: int, data: Array) -> None: ...
+    @staticmethod
+    def _has_property(name: str) -> bool: ...
+    def _eval_property(self, name: str) -> Array: ...
+    def _set_states(
+        self,
+        mode: str,
+        prop1: ArrayLike,
+        prop2: ArrayLike,
+        comp: ArrayLike | None = None,
+        normalize: bool = True,
+    ) -> None: ...
     def _has_extra(self, name: str) -> bool: ...
     def _add_extra(self, name: str, back: bool = True) -> None: ...
     def get_auxiliary(self, loc: int) -> dict[str, Any]: ...
@@ -174,5 +190,16 @@ class SolutionArrayBase:
         overwrite: bool,
         compression: CompressionLevel,
         basis: Basis,
+        append: bool = False,
+        chunk_size: int = 0,
     ) -> None: ...
-    def _cxx_restore(self, filename: str, name: str, sub: str) -> dict[str, str]: ...
+    def _cxx_restore(
+        self,
+        filename: str,
+        name: str,
+        sub: str,
+        columns: Sequence[str] | None = None,
+        start: int = 0,
+        count: int | None = None,
+        lazy: bool = False,
+    ) -> dict[str, str]: ...
@@ -14,6 +14,8 @@ from .reaction cimport *
 from ._utils cimport *
 from .delegator cimport pyOverride, callback_v, CxxPythonHandle
 from .yamlwriter cimport YamlWriter
+from .constants cimport CxxNpos
+from cpython.buffer cimport PyBUF_WRITABLE, PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES
 
 ctypedef CxxSurfPhase* CxxSurfPhasePtr
 
@@ -599,6 +601,26 @@ cdef class SolutionArrayBase:
         else:
             raise TypeError("Metadata needs to be a dictionary.")
 
+    @property
+    def num_threads(self):
+        """
+        Number of threads used to evaluate properties for all `SolutionArrayBase`
+        locations, where each thread uses a cloned `Solution` object. A value of
+        zero uses all available hardware threads; the default value of one disables
+        parallel evaluation. Setting this property resets cloned `Solution` objects,
+        which is required after the associated `Solution` object is modified (except
+        for changes of reaction rate multipliers).
+
+        .. versionadded:: 3.2
+        """
+        return self.base.numThreads()
+
+    @num_threads.setter
+    def num_threads(self, n):
+        if n < 0:
+            raise ValueError("Number of threads must be non-negative.")
+        self.base.setNumThreads(n)
+
     @property
     def extra(self):
         """ Retrieve ordered list of auxiliary `SolutionArrayBase` components """
@@ -665,6 +687,86 @@ cdef class SolutionArrayBase:
             cxx_data.push_back(item)
         self.base.setState(loc, cxx_data)
 
+    @staticmethod
+    def _has_property(name):
+        """ Check whether property can be evaluated by `SolutionArrayBase` core """
+        return CxxSolutionArray_hasProperty(stringify(name))
+
+    def _eval_property(self, name):
+        """
+        Evaluate property for all `SolutionArrayBase` locations; returns a
+        two-dimensional array where rows correspond to locations.
+        """
+        cdef string cxx_name = stringify(name)
+        cdef size_t width = self.base.propertySize(cxx_name)
+        cdef np.ndarray[np.double_t, ndim=2] data = np.empty((self.size, width))
+        cdef double* out
+        if not data.size:
+            return data
+        out = &data[0, 0]
+        if self.base.numThreads() == 1:
+            self.base.evalProperty(cxx_name, out)
+        else:
+            # worker threads do not call back into Python
+            with nogil:
+                self.base.evalProperty(cxx_name, out)
+        return data
+
+    def _set_states(self, mode, prop1, prop2, comp=None, normalize=True):
+        """
+        Set states for all `SolutionArrayBase` locations in a single pass, where
+        ``mode`` specifies a property pair optionally followed by ``X`` or ``Y``
+        (for example, ``TP`` or ``HPY``), and specific properties are on a mass
+        basis. Compositions ``comp`` are given as a two-dimensional array, where
+        rows correspond to locations.
+        """
+        cdef np.ndarray[np.double_t, ndim=1] data1 = \
+            np.ascontiguousarray(prop1, dtype=np.double).ravel()
+        cdef np.ndarray[np.double_t, ndim=1] data2 = \
+            np.ascontiguousarray(prop2, dtype=np.double).ravel()
+        cdef np.ndarray[np.double_t, ndim=2] data3
+        cdef double* comp_ptr = NULL
+        size = self.size
+        if len(data1) != size or len(data2) != size:
+            raise ValueError(f"Expected arrays with {size} entries, but received "
+                             f"arrays with {len(data1)} and {len(data2)} entries.")
+        if not size:
+            return
+        if comp is not None:
+            n_species = self.base.propertySize(b"moleFractions")
+            data3 = np.ascontiguousarray(comp, dtype=np.double).reshape(size, -1)
+            if data3.shape[1] != n_species:
+                raise ValueError(f"Expected compositions with {n_species} species, "
+                                 f"but received {data3.shape[1]}.")
+            comp_ptr = &data3[0, 0]
+        self.base.setStates(stringify(mode), &data1[0], &data2[0], comp_ptr,
+                            normalize)
+
+    def _get_view(self, name, writeable=False):
+        """
+        Retrieve a view of the data of component ``name`` without copying, or `None`
+        if direct access is not available. Rows of the returned two-dimensional array
+        correspond to locations. The view is read-only unless ``writeable`` is `True`,
+        in which case values written to the view are stored directly in the
+        `SolutionArrayBase`. While a view exists, the `SolutionArrayBase` cannot be
+        resized.
+        """
+        cdef size_t stride = 0
+        cdef size_t width = 0
+        cdef double* data = self.base.componentData(stringify(name), stride, width)
+        if data == NULL:
+            return None
+        size = self.size
+        buffer = _SharedBuffer()
+        buffer._anchor = self.base.sharedData()
+        buffer._owner = self._base
+        buffer._data = data
+        buffer._shape[0] = (size - 1) * stride + width
+        buffer._writeable = writeable
+        # the buffer is the base of the returned array and keeps the data alive
+        return np.ndarray(shape=(size, width), dtype=np.double, buffer=buffer,
+                          strides=(stride * sizeof(double), sizeof(double)))
+
     def _has_extra(self, name):
         """ Check whether `SolutionArrayBase` has extra component """
         return self.base.hasExtra(stringify(name))
@@ -689,15 +791,62 @@ cdef class SolutionArrayBase:
         self.base.append(cxx_state, py_to_anymap(extra))
 
     def _cxx_save(self, filename, name, sub, description,
-                  overwrite, compression, basis):
+                  overwrite, compression, basis, append=False, chunk_size=0):
         """ Interface `SolutionArray.save` with C++ core """
         self.base.save(
             stringify(str(filename)), stringify(name), stringify(sub),
-            stringify(description), overwrite, compression, stringify(basis))
+            stringify(description), overwrite, compression, stringify(basis),
+            append, chunk_size)
 
-    def _cxx_restore(self, filename, name, sub):
+    def _cxx_restore(self, filename, name, sub, columns=None, start=0, count=None,
+                     lazy=False):
         """ Interface `SolutionArray.restore` with C++ core """
         cdef CxxAnyMap header
+        cdef vector[string] cxx_columns
+        cdef size_t cxx_count = CxxNpos if count is None else count
+        for col in columns or ():
+            cxx_columns.push_back(stringify(col))
         header = self.base.restore(
-            stringify(str(filename)), stringify(name), stringify(sub))
+            stringify(str(filename)), stringify(name), stringify(sub), cxx_columns,
+            start, cxx_count, lazy)
         return anymap_to_py(header)
+
+
+cdef class _SharedBuffer:
+    """
+    Buffer exposing data held by a `SolutionArrayBase`, which keeps the underlying
+    storage (including extra components) alive and prevents resizing while in use.
+    The buffer is read-only unless it was created for a writeable view.
+    """
+    def __cinit__(self):
+        self._data = NULL
+        self._shape[0] = 0
+        self._strides[0] = sizeof(double)
+        self._writeable = False
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        if flags & PyBUF_WRITABLE and not self._writeable:
+            raise BufferError("Buffer is read-only.")
+        buffer.buf = self._data
+        if flags & PyBUF_FORMAT:
+            buffer.format = "d"
+        else:
+            buffer.format = NULL
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(double)
+        buffer.len = self._shape[0] * sizeof(double)
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = not self._writeable
+        if flags & PyBUF_ND:
+            buffer.shape = self._shape
+        else:
+            buffer.shape = NULL
+        if (flags & PyBUF_STRIDES) == PyBUF_STRIDES:
+            buffer.strides = self._strides
+        else:
+            buffer.strides = NULL
+        buffer.suboffsets = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
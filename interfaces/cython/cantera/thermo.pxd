@@ -52,6 +52,7 @@ cdef extern from "cantera/thermo/ThermoPhase.h" namespace "Cantera":
         double minTemp() except +translate_exception
         double maxTemp() except +translate_exception
         double refPressure() except +translate_exception
+        void getReferenceProperties(size_t, double*, double*, double*, double*) except +translate_exception
         void equilibrate(string, string, double, int, int, int, int) except +translate_exception
         size_t stateSize()
         void saveState(size_t, double*) except +translate_exception
@@ -441,6 +441,7 @@ class ThermoPhase(_SolutionBase):
     def standard_gibbs_RT(self) -> Array: ...
     @property
     def standard_cp_R(self) -> Array: ...
+    def reference_state_properties(self, T: ArrayLike) -> tuple[Array, Array, Array]: ...
     @property
     def activities(self) -> Array: ...
     @property
@@ -1685,6 +1685,35 @@ cdef class ThermoPhase(_SolutionBase):
         def __get__(self):
             return self._getArray1(thermo_getCp_R)
 
+    def reference_state_properties(self, T):
+        """
+        Evaluate nondimensional species reference-state properties for an array of
+        temperatures. Properties are evaluated at the reference pressure, and the
+        state of the phase is not modified.
+
+        :param T:
+            Array of temperatures [K]
+        :return:
+            Tuple of arrays containing the heat capacities at constant pressure
+            ``cp/R``, enthalpies ``h/RT``, and entropies ``s/R``, each with shape
+            ``(len(T), n_species)``.
+
+        .. versionadded:: 3.2
+        """
+        cdef np.ndarray[np.double_t, ndim=1] temperatures = np.ascontiguousarray(
+            np.atleast_1d(T), dtype=np.double).ravel()
+        cdef size_t n = temperatures.size
+        cdef np.ndarray[np.double_t, ndim=2] cp = np.empty((n, self.n_species))
+        cdef np.ndarray[np.double_t, ndim=2] h = np.empty((n, self.n_species))
+        cdef np.ndarray[np.double_t, ndim=2] s = np.empty((n, self.n_species))
+        if n and self.n_species:
+            self.thermo.getReferenceProperties(n, &temperatures[0], &cp[0, 0],
+                                               &h[0, 0], &s[0, 0])
+        if self._selected_species.size:
+            return (cp[:, self._selected_species], h[:, self._selected_species],
+                    s[:, self._selected_species])
+        return cp, h, s
+
     property activities:
         """
         Array of nondimensional activities. Returns either molar or molal
@@ -12,6 +12,7 @@
 #include <boost/algorithm/string.hpp>
 #include <fstream>
 #include <mutex>
+#include <sstream>
 #include <unordered_set>
 
 namespace ba = boost::algorithm;
@@ -1813,6 +1814,125 @@ bool AnyMap::addOrderingRules(const string& objectType,
     return true;
 }
 
+namespace { // helper functions for the persistent input cache
+
+//! Cache category used for parsed YAML files. The suffix is the version of the
+//! binary format, which should be incremented whenever the format or the
+//! representation of parsed YAML files changes.
+const string cacheCategory = "yaml-v2";
+
+//! Type tags used in the binary format of the input cache
+enum class CacheTag : uint8_t {
+    Empty, Double, Integer, Bool, String, Map,
+    DoubleVector, IntegerVector, BoolVector, StringVector, MapVector, ValueVector,
+    DoubleMatrix, IntegerMatrix, BoolMatrix, StringMatrix
+};
+
+//! Write a number or type tag using little-endian byte order, which makes cache
+//! files portable between platforms
+template <class T>
+void writeRaw(std::ostream& out, const T& value)
+{
+    if constexpr (std::is_enum_v<T>) {
+        out << toLittleEndian(static_cast<std::underlying_type_t<T>>(value));
+    } else {
+        out << toLittleEndian(value);
+    }
+}
+
+template <class T>
+T readRaw(std::istream& in)
+{
+    char bytes[sizeof(T)];
+    if (!in.read(bytes, sizeof(T))) {
+        throw CanteraError("AnyMap::readBinary", "Unexpected end of cache file.");
+    }
+    if constexpr (std::is_enum_v<T>) {
+        return static_cast<T>(fromLittleEndian<std::underlying_type_t<T>>(bytes));
+    } else {
+        return fromLittleEndian<T>(bytes);
+    }
+}
+
+void writeString(std::ostream& out, const string& value)
+{
+    writeRaw<uint64_t>(out, value.size());
+    out.write(value.data(), value.size());
+}
+
+string readString(std::istream& in)
+{
+    string value(readRaw<uint64_t>(in), '\0');
+    if (!in.read(value.data(), value.size())) {
+        throw CanteraError("AnyMap::readBinary", "Unexpected end of cache file.");
+    }
+    return value;
+}
+
+template <class T>
+void writeItem(std::ostream& out, const T& value)
+{
+    if constexpr (std::is_same_v<T, string>) {
+        writeString(out, value);
+    } else if constexpr (std::is_same_v<T, bool>) {
+        writeRaw<uint8_t>(out, value);
+    } else {
+        writeRaw<T>(out, value);
+    }
+}
+
+template <class T>
+T readItem(std::istream& in)
+{
+    if constexpr (std::is_same_v<T, string>) {
+        return readString(in);
+    } else if constexpr (std::is_same_v<T, bool>) {
+        return readRaw<uint8_t>(in) != 0;
+    } else {
+        return readRaw<T>(in);
+    }
+}
+
+template <class T>
+void writeVector(std::ostream& out, const vector<T>& values)
+{
+    writeRaw<uint64_t>(out, values.size());
+    for (const auto& value : values) {
+        writeItem<T>(out, value);
+    }
+}
+
+template <class T>
+vector<T> readVector(std::istream& in)
+{
+    vector<T> values(readRaw<uint64_t>(in));
+    for (size_t i = 0; i < values.size(); i++) {
+        values[i] = readItem<T>(in);
+    }
+    return values;
+}
+
+template <class T>
+void writeMatrix(std::ostream& out, const vector<vector<T>>& values)
+{
+    writeRaw<uint64_t>(out, values.size());
+    for (const auto& row : values) {
+        writeVector<T>(out, row);
+    }
+}
+
+template <class T>
+vector<vector<T>> readMatrix(std::istream& in)
+{
+    vector<vector<T>> values(readRaw<uint64_t>(in));
+    for (auto& row : values) {
+        row = readVector<T>(in);
+    }
+    return values;
+}
+
+} // end anonymous namespace
+
 void AnyMap::clearCachedFile(const string& filename)
 {
     string fullName = findInputFile(filename);
@@ -1838,6 +1958,179 @@ AnyMap AnyMap::fromYamlString(const string& yaml) {
     return amap;
 }
 
+void AnyMap::writeBinary(std::ostream& out, const AnyMap& map)
+{
+    writeRaw<int32_t>(out, map.m_line);
+    writeRaw<int32_t>(out, map.m_column);
+    writeRaw<uint64_t>(out, map.m_data.size());
+    for (const auto& [key, value] : map.m_data) {
+        writeString(out, key);
+        writeBinary(out, value);
+    }
+}
+
+void AnyMap::writeBinary(std::ostream& out, const AnyValue& value)
+{
+    writeRaw<int32_t>(out, value.m_line);
+    writeRaw<int32_t>(out, value.m_column);
+    const auto& type = value.type();
+    if (value.empty()) {
+        writeRaw(out, CacheTag::Empty);
+    } else if (type == typeid(double)) {
+        writeRaw(out, CacheTag::Double);
+        writeItem(out, value.as<double>());
+    } else if (type == typeid(long int)) {
+        writeRaw(out, CacheTag::Integer);
+        writeItem<int64_t>(out, value.as<long int>());
+    } else if (type == typeid(bool)) {
+        writeRaw(out, CacheTag::Bool);
+        writeItem(out, value.as<bool>());
+    } else if (type == typeid(string)) {
+        writeRaw(out, CacheTag::String);
+        writeItem(out, value.as<string>());
+    } else if (type == typeid(AnyMap)) {
+        writeRaw(out, CacheTag::Map);
+        writeBinary(out, value.as<AnyMap>());
+    } else if (type == typeid(vector<double>)) {
+        writeRaw(out, CacheTag::DoubleVector);
+        writeVector(out, value.as<vector<double>>());
+    } else if (type == typeid(vector<long int>)) {
+        writeRaw(out, CacheTag::IntegerVector);
+        const auto& items = value.as<vector<long int>>();
+        writeVector(out, vector<int64_t>(items.begin(), items.end()));
+    } else if (type == typeid(vector<bool>)) {
+        writeRaw(out, CacheTag::BoolVector);
+        writeVector(out, value.as<vector<bool>>());
+    } else if (type == typeid(vector<string>)) {
+        writeRaw(out, CacheTag::StringVector);
+        writeVector(out, value.as<vector<string>>());
+    } else if (type == typeid(vector<AnyMap>)) {
+        writeRaw(out, CacheTag::MapVector);
+        const auto& items = value.as<vector<AnyMap>>();
+        writeRaw<uint64_t>(out, items.size());
+        for (const auto& item : items) {
+            writeBinary(out, item);
+        }
+    } else if (type == typeid(vector<AnyValue>)) {
+        writeRaw(out, CacheTag::ValueVector);
+        const auto& items = value.as<vector<AnyValue>>();
+        writeRaw<uint64_t>(out, items.size());
+        for (const auto& item : items) {
+            writeBinary(out, item);
+        }
+    } else if (type == typeid(vector<vector<double>>)) {
+        writeRaw(out, CacheTag::DoubleMatrix);
+        writeMatrix(out, value.as<vector<vector<double>>>());
+    } else if (type == typeid(vector<vector<long int>>)) {
+        writeRaw(out, CacheTag::IntegerMatrix);
+        vector<vector<int64_t>> items;
+        for (const auto& row : value.as<vector<vector<long int>>>()) {
+            items.emplace_back(row.begin(), row.end());
+        }
+        writeMatrix(out, items);
+    } else if (type == typeid(vector<vector<bool>>)) {
+        writeRaw(out, CacheTag::BoolMatrix);
+        writeMatrix(out, value.as<vector<vector<bool>>>());
+    } else if (type == typeid(vector<vector<string>>)) {
+        writeRaw(out, CacheTag::StringMatrix);
+        writeMatrix(out, value.as<vector<vector<string>>>());
+    } else {
+        throw CanteraError("AnyMap::writeBinary",
+            "Unable to serialize value of type '{}'", value.type_str());
+    }
+}
+
+void AnyMap::readBinary(std::istream& in, AnyMap& map)
+{
+    int line = readRaw<int32_t>(in);
+    int column = readRaw<int32_t>(in);
+    map.setLoc(line, column);
+    size_t n = readRaw<uint64_t>(in);
+    for (size_t i = 0; i < n; i++) {
+        string key = readString(in);
+        readBinary(in, map.createForYaml(key, line, column));
+    }
+}
+
+void AnyMap::readBinary(std::istream& in, AnyValue& value)
+{
+    int line = readRaw<int32_t>(in);
+    int column = readRaw<int32_t>(in);
+    auto tag = readRaw<CacheTag>(in);
+    switch (tag) {
+    case CacheTag::Empty:
+        break;
+    case CacheTag::Double:
+        value = readItem<double>(in);
+        break;
+    case CacheTag::Integer:
+        value = static_cast<long int>(readItem<int64_t>(in));
+        break;
+    case CacheTag::Bool:
+        value = readItem<bool>(in);
+        break;
+    case CacheTag::String:
+        value = readItem<string>(in);
+        break;
+    case CacheTag::Map: {
+        AnyMap item;
+        readBinary(in, item);
+        value = std::move(item);
+        break;
+    }
+    case CacheTag::DoubleVector:
+        value = readVector<double>(in);
+        break;
+    case CacheTag::IntegerVector: {
+        auto items = readVector<int64_t>(in);
+        value = vector<long int>(items.begin(), items.end());
+        break;
+    }
+    case CacheTag::BoolVector:
+        value = readVector<bool>(in);
+        break;
+    case CacheTag::StringVector:
+        value = readVector<string>(in);
+        break;
+    case CacheTag::MapVector: {
+        vector<AnyMap> items(readRaw<uint64_t>(in));
+        for (auto& item : items) {
+            readBinary(in, item);
+        }
+        value = std::move(items);
+        break;
+    }
+    case CacheTag::ValueVector: {
+        vector<AnyValue> items(readRaw<uint64_t>(in));
+        for (auto& item : items) {
+            readBinary(in, item);
+        }
+        value = std::move(items);
+        break;
+    }
+    case CacheTag::DoubleMatrix:
+        value = readMatrix<double>(in);
+        break;
+    case CacheTag::IntegerMatrix: {
+        vector<vector<long int>> items;
+        for (const auto& row : readMatrix<int64_t>(in)) {
+            items.emplace_back(row.begin(), row.end());
+        }
+        value = std::move(items);
+        break;
+    }
+    case CacheTag::BoolMatrix:
+        value = readMatrix<bool>(in);
+        break;
+    case CacheTag::StringMatrix:
+        value = readMatrix<string>(in);
+        break;
+    default:
+        throw CanteraError("AnyMap::readBinary", "Invalid value type in cache file.");
+    }
+    value.setLoc(line, column);
+}
+
 AnyMap AnyMap::fromYamlFile(const string& name, const string& parent_name)
 {
     string fullName;
@@ -1872,8 +2165,40 @@ AnyMap AnyMap::fromYamlFile(const string& name, const string& parent_name)
     auto& [cache_item, cache_time] = s_cache[fullName];
     cache_time = mtime;
     try {
-        YAML::Node node = YAML::LoadFile(fullName);
-        cache_item = node.as<AnyMap>();
+        string cacheDir = cacheDirectory();
+        if (cacheDir.empty()) {
+            YAML::Node node = YAML::LoadFile(fullName);
+            cache_item = node.as<AnyMap>();
+        } else {
+            // Use the persistent cache, where files are identified by their contents
+            std::ifstream file(fullName, std::ios::binary);
+            string contents{std::istreambuf_iterator<char>(file),
+                            std::istreambuf_iterator<char>()};
+            string data;
+            bool cached = false;
+            if (readCacheEntry(cacheCategory, contents, data)) {
+                try {
+                    std::istringstream in(data);
+                    AnyMap parsed;
+                    readBinary(in, parsed);
+                    cache_item = std::move(parsed);
+                    cached = true;
+                } catch (std::exception&) {
+                    // Treat a corrupt cache entry as a cache miss
+                }
+            }
+            if (!cached) {
+                YAML::Node node = YAML::Load(contents);
+                cache_item = node.as<AnyMap>();
+                try {
+                    std::ostringstream out;
+                    writeBinary(out, cache_item);
+                    writeCacheEntry(cacheCategory, contents, out.str());
+                } catch (CanteraError&) {
+                    // Values of types not created by the YAML parser can't be cached
+                }
+            }
+        }
         cache_item.setMetadata("filename", AnyValue(fullName));
         cache_item.applyUnits();
     } catch (YAML::Exception& err) {
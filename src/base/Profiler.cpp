@@ -0,0 +1,91 @@
+//! @file Profiler.cpp
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#include "cantera/base/Profiler.h"
+
+namespace Cantera
+{
+
+void Profiler::setEnabled(bool enabled)
+{
+    if (enabled && !profilingSupported()) {
+        throw CanteraError("Profiler::setEnabled", "Profiling is not available "
+            "since Cantera was compiled with 'profiling=n'.");
+    }
+    m_enabled = enabled;
+}
+
+void Profiler::clear()
+{
+    std::lock_guard<std::mutex> lock(m_mutex);
+    std::fill(m_calls.begin(), m_calls.end(), 0);
+    std::fill(m_time.begin(), m_time.end(), 0.0);
+}
+
+size_t Profiler::addCategory(const string& name)
+{
+    std::lock_guard<std::mutex> lock(m_mutex);
+    auto iter = m_index.find(name);
+    if (iter != m_index.end()) {
+        return iter->second;
+    }
+    m_index[name] = m_names.size();
+    m_names.push_back(name);
+    m_calls.push_back(0);
+    m_time.push_back(0.0);
+    return m_names.size() - 1;
+}
+
+const string& Profiler::categoryName(size_t i) const
+{
+    if (i >= m_names.size()) {
+        throw IndexError("Profiler::categoryName", "categories", i, m_names.size());
+    }
+    return m_names[i];
+}
+
+void Profiler::add(size_t category, double elapsed, size_t calls)
+{
+    if (category >= m_names.size()) {
+        throw IndexError("Profiler::add", "categories", category, m_names.size());
+    }
+    std::lock_guard<std::mutex> lock(m_mutex);
+    m_calls[category] += calls;
+    m_time[category] += elapsed;
+}
+
+size_t Profiler::categoryIndex(const string& name) const
+{
+    auto iter = m_index.find(name);
+    if (iter == m_index.end()) {
+        throw CanteraError("Profiler::categoryIndex",
+                           "Unknown category '{}'.", name);
+    }
+    return iter->second;
+}
+
+size_t Profiler::calls(const string& name) const
+{
+    return m_calls[categoryIndex(name)];
+}
+
+double Profiler::time(const string& name) const
+{
+    return m_time[categoryIndex(name)];
+}
+
+AnyMap Profiler::stats() const
+{
+    AnyMap stats;
+    for (size_t i = 0; i < m_names.size(); i++) {
+        AnyMap category;
+        category["calls"] = static_cast<long int>(m_calls[i]);
+        category["time"] = m_time[i];
+        stats[m_names[i]] = std::move(category);
+    }
+    return stats;
+}
+
+}
@@ -7,14 +7,18 @@
 // at https://cantera.org/license.txt for license and copyright information.
 
 #include "cantera/base/SolutionArray.h"
+#include "cantera/base/parallel.h"
 #include "cantera/base/Solution.h"
 #include "cantera/base/Storage.h"
 #include "cantera/base/stringUtils.h"
 #include "cantera/thermo/ThermoPhase.h"
 #include "cantera/thermo/SurfPhase.h"
+#include "cantera/kinetics/Kinetics.h"
+#include "cantera/transport/Transport.h"
 #include "cantera/base/utilities.h"
 #include <boost/algorithm/string.hpp>
 #include <boost/range/adaptor/reversed.hpp>
+#include <filesystem>
 #include <fstream>
 #include <sstream>
 
@@ -56,6 +60,191 @@ const map<string, string> reverseAliasMap = {
     {"oxidizer-velocity", "Uo"},
 };
 
+//! Evaluator for a property computed from the current state of a Solution object
+struct PropertyEvaluator
+{
+    //! Number of values per SolutionArray entry
+    function<size_t(Solution&)> size;
+    //! Evaluate property for current state; values are written to buffer
+    function<void(Solution&, double*)> eval;
+};
+
+size_t scalarSize(Solution& sol)
+{
+    return 1;
+}
+
+size_t nSpecies(Solution& sol)
+{
+    return sol.thermo()->nSpecies();
+}
+
+size_t nTotalSpecies(Solution& sol)
+{
+    return sol.kinetics()->nTotalSpecies();
+}
+
+size_t nReactions(Solution& sol)
+{
+    return sol.kinetics()->nReactions();
+}
+
+PropertyEvaluator thermoScalar(double (ThermoPhase::*getter)() const)
+{
+    return {scalarSize, [getter](Solution& sol, double* out) {
+        *out = (sol.thermo().get()->*getter)();
+    }};
+}
+
+PropertyEvaluator thermoSpecies(void (ThermoPhase::*getter)(double*) const)
+{
+    return {nSpecies, [getter](Solution& sol, double* out) {
+        (sol.thermo().get()->*getter)(out);
+    }};
+}
+
+PropertyEvaluator kineticsSpecies(void (Kinetics::*getter)(double*))
+{
+    return {nTotalSpecies, [getter](Solution& sol, double* out) {
+        (sol.kinetics().get()->*getter)(out);
+    }};
+}
+
+PropertyEvaluator kineticsReactions(void (Kinetics::*getter)(double*))
+{
+    return {nReactions, [getter](Solution& sol, double* out) {
+        (sol.kinetics().get()->*getter)(out);
+    }};
+}
+
+PropertyEvaluator transportScalar(double (Transport::*getter)())
+{
+    return {scalarSize, [getter](Solution& sol, double* out) {
+        *out = (sol.transport().get()->*getter)();
+    }};
+}
+
+PropertyEvaluator transportSpecies(void (Transport::*getter)(double*))
+{
+    return {nSpecies, [getter](Solution& sol, double* out) {
+        (sol.transport().get()->*getter)(out);
+    }};
+}
+
+//! Properties available for evaluation by SolutionArray::evalProperty; names
+//! correspond to C++ getters, where a leading 'get' is omitted.
+const map<string, PropertyEvaluator>& propertyEvaluators()
+{
+    static const map<string, PropertyEvaluator> evaluators = {
+        // scalar thermodynamic properties
+        {"temperature", thermoScalar(&ThermoPhase::temperature)},
+        {"pressure", thermoScalar(&ThermoPhase::pressure)},
+        {"density", thermoScalar(&ThermoPhase::density)},
+        {"molarDensity", thermoScalar(&ThermoPhase::molarDensity)},
+        {"meanMolecularWeight", thermoScalar(&ThermoPhase::meanMolecularWeight)},
+        {"enthalpy_mass", thermoScalar(&ThermoPhase::enthalpy_mass)},
+        {"enthalpy_mole", thermoScalar(&ThermoPhase::enthalpy_mole)},
+        {"intEnergy_mass", thermoScalar(&ThermoPhase::intEnergy_mass)},
+        {"intEnergy_mole", thermoScalar(&ThermoPhase::intEnergy_mole)},
+        {"entropy_mass", thermoScalar(&ThermoPhase::entropy_mass)},
+        {"entropy_mole", thermoScalar(&ThermoPhase::entropy_mole)},
+        {"gibbs_mass", thermoScalar(&ThermoPhase::gibbs_mass)},
+        {"gibbs_mole", thermoScalar(&ThermoPhase::gibbs_mole)},
+        {"cp_mass", thermoScalar(&ThermoPhase::cp_mass)},
+        {"cp_mole", thermoScalar(&ThermoPhase::cp_mole)},
+        {"cv_mass", thermoScalar(&ThermoPhase::cv_mass)},
+        {"cv_mole", thermoScalar(&ThermoPhase::cv_mole)},
+        {"isothermalCompressibility",
+            thermoScalar(&ThermoPhase::isothermalCompressibility)},
+        {"thermalExpansionCoeff", thermoScalar(&ThermoPhase::thermalExpansionCoeff)},
+        {"soundSpeed", thermoScalar(&ThermoPhase::soundSpeed)},
+        {"electricPotential", thermoScalar(&ThermoPhase::electricPotential)},
+        // species properties
+        {"moleFractions", thermoSpecies(&ThermoPhase::getMoleFractions)},
+        {"massFractions", thermoSpecies(&ThermoPhase::getMassFractions)},
+        {"concentrations", thermoSpecies(&ThermoPhase::getConcentrations)},
+        {"partialMolarEnthalpies", thermoSpecies(&ThermoPhase::getPartialMolarEnthalpies)},
+        {"partialMolarEntropies", thermoSpecies(&ThermoPhase::getPartialMolarEntropies)},
+        {"partialMolarIntEnergies",
+            thermoSpecies(&ThermoPhase::getPartialMolarIntEnergies)},
+        {"partialMolarCp", thermoSpecies(&ThermoPhase::getPartialMolarCp)},
+        {"partialMolarVolumes", thermoSpecies(&ThermoPhase::getPartialMolarVolumes)},
+        {"chemPotentials", thermoSpecies(&ThermoPhase::getChemPotentials)},
+        {"electrochemPotentials", thermoSpecies(&ThermoPhase::getElectrochemPotentials)},
+        {"enthalpy_RT", thermoSpecies(&ThermoPhase::getEnthalpy_RT)},
+        {"entropy_R", thermoSpecies(&ThermoPhase::getEntropy_R)},
+        {"intEnergy_RT", thermoSpecies(&ThermoPhase::getIntEnergy_RT)},
+        {"gibbs_RT", thermoSpecies(&ThermoPhase::getGibbs_RT)},
+        {"cp_R", thermoSpecies(&ThermoPhase::getCp_R)},
+        {"activities", thermoSpecies(&ThermoPhase::getActivities)},
+        {"activityCoefficients", thermoSpecies(&ThermoPhase::getActivityCoefficients)},
+        // kinetic properties
+        {"creationRates", kineticsSpecies(&Kinetics::getCreationRates)},
+        {"destructionRates", kineticsSpecies(&Kinetics::getDestructionRates)},
+        {"netProductionRates", kineticsSpecies(&Kinetics::getNetProductionRates)},
+        {"fwdRatesOfProgress", kineticsReactions(&Kinetics::getFwdRatesOfProgress)},
+        {"revRatesOfProgress", kineticsReactions(&Kinetics::getRevRatesOfProgress)},
+        {"netRatesOfProgress", kineticsReactions(&Kinetics::getNetRatesOfProgress)},
+        {"equilibriumConstants", kineticsReactions(&Kinetics::getEquilibriumConstants)},
+        {"fwdRateConstants", kineticsReactions(&Kinetics::getFwdRateConstants)},
+        {"revRateConstants", {nReactions, [](Solution& sol, double* out) {
+            sol.kinetics()->getRevRateConstants(out);
+        }}},
+        {"deltaEnthalpy", kineticsReactions(&Kinetics::getDeltaEnthalpy)},
+        {"deltaGibbs", kineticsReactions(&Kinetics::getDeltaGibbs)},
+        {"deltaEntropy", kineticsReactions(&Kinetics::getDeltaEntropy)},
+        {"deltaSSEnthalpy", kineticsReactions(&Kinetics::getDeltaSSEnthalpy)},
+        {"deltaSSGibbs", kineticsReactions(&Kinetics::getDeltaSSGibbs)},
+        {"deltaSSEntropy", kineticsReactions(&Kinetics::getDeltaSSEntropy)},
+        {"thirdBodyConcentrations",
+            kineticsReactions(&Kinetics::getThirdBodyConcentrations)},
+        {"heatReleaseRate", {scalarSize, [](Solution& sol, double* out) {
+            auto kin = sol.kinetics();
+            vector<double> hk(kin->nTotalSpecies());
+            vector<double> wdot(kin->nTotalSpecies());
+            kin->thermo().getPartialMolarEnthalpies(hk.data());
+            kin->getNetProductionRates(wdot.data());
+            *out = 0.;
+            for (size_t k = 0; k < kin->thermo().nSpecies(); k++) {
+                *out -= hk[k] * wdot[k];
+            }
+        }}},
+        // transport properties
+        {"viscosity", transportScalar(&Transport::viscosity)},
+        {"thermalConductivity", transportScalar(&Transport::thermalConductivity)},
+        {"electricalConductivity", transportScalar(&Transport::electricalConductivity)},
+        {"mixDiffCoeffs", transportSpecies(&Transport::getMixDiffCoeffs)},
+        {"mixDiffCoeffsMass", transportSpecies(&Transport::getMixDiffCoeffsMass)},
+        {"mixDiffCoeffsMole", transportSpecies(&Transport::getMixDiffCoeffsMole)},
+        {"thermalDiffCoeffs", transportSpecies(&Transport::getThermalDiffCoeffs)},
+        {"mobilities", transportSpecies(&Transport::getMobilities)},
+        {"speciesViscosities", transportSpecies(&Transport::getSpeciesViscosities)},
+    };
+    return evaluators;
+}
+
+//! Setters for property pairs supported by SolutionArray::setStates
+const map<string, function<void(ThermoPhase&, double, double)>>& stateSetters()
+{
+    static const map<string, function<void(ThermoPhase&, double, double)>> setters{
+        {"TD", [](ThermoPhase& tp, double T, double D) { tp.setState_TD(T, D); }},
+        {"TP", [](ThermoPhase& tp, double T, double P) { tp.setState_TP(T, P); }},
+        {"DP", [](ThermoPhase& tp, double D, double P) { tp.setState_DP(D, P); }},
+        {"HP", [](ThermoPhase& tp, double H, double P) { tp.setState_HP(H, P); }},
+        {"UV", [](ThermoPhase& tp, double U, double V) { tp.setState_UV(U, V); }},
+        {"SP", [](ThermoPhase& tp, double S, double P) { tp.setState_SP(S, P); }},
+        {"SV", [](ThermoPhase& tp, double S, double V) { tp.setState_SV(S, V); }},
+        {"ST", [](ThermoPhase& tp, double S, double T) { tp.setState_ST(S, T); }},
+        {"TV", [](ThermoPhase& tp, double T, double V) { tp.setState_TV(T, V); }},
+        {"PV", [](ThermoPhase& tp, double P, double V) { tp.setState_PV(P, V); }},
+        {"UP", [](ThermoPhase& tp, double U, double P) { tp.setState_UP(U, P); }},
+        {"VH", [](ThermoPhase& tp, double V, double H) { tp.setState_VH(V, H); }},
+        {"TH", [](ThermoPhase& tp, double T, double H) { tp.setState_TH(T, H); }},
+        {"SH", [](ThermoPhase& tp, double S, double H) { tp.setState_SH(S, H); }},
+    };
+    return setters;
+}
+
 } // end unnamed namespace
 
 const map<string, string>& _componentAliasMap()
@@ -77,8 +266,11 @@ SolutionArray::SolutionArray(const shared_ptr<Solution>& sol,
     m_stride = m_sol->thermo()->stateSize();
     m_sol->thermo()->addSpeciesLock();
     m_data = make_shared<vector<double>>(m_dataSize * m_stride, 0.);
+    m_unset = make_shared<vector<bool>>(m_dataSize, false);
     m_extra = make_shared<map<string, AnyValue>>();
     m_order = make_shared<map<int, string>>();
+    m_deferred = make_shared<map<string, function<AnyValue()>>>();
+    m_workerMutex = make_shared<std::mutex>();
     for (size_t i = 0; i < m_dataSize; ++i) {
         m_active.push_back(static_cast<int>(i));
     }
@@ -94,9 +286,14 @@ SolutionArray::SolutionArray(const SolutionArray& other,
     , m_dataSize(other.m_data->size())
     , m_stride(other.m_stride)
     , m_data(other.m_data)
+    , m_unset(other.m_unset)
     , m_extra(other.m_extra)
     , m_order(other.m_order)
+    , m_deferred(other.m_deferred)
     , m_shared(true)
+    , m_nThreads(other.m_nThreads)
+    , m_workers(other.m_workers)
+    , m_workerMutex(other.m_workerMutex)
 {
     m_sol->thermo()->addSpeciesLock();
     if (!other.m_shared) {
@@ -165,11 +362,13 @@ void setScalar(AnyValue& extra, const AnyValue& data, const vector<int>& slice);
 
 void SolutionArray::reset()
 {
+    _loadDeferred();
     size_t nState = m_sol->thermo()->stateSize();
     vector<double> state(nState);
     m_sol->thermo()->saveState(state); // thermo contains current state
     for (size_t k = 0; k < m_size; ++k) {
         std::copy(state.begin(), state.end(), m_data->data() + m_active[k] * m_stride);
+        (*m_unset)[m_active[k]] = false;
     }
     for (auto& [key, extra] : *m_extra) {
         if (extra.is<void>()) {
@@ -232,9 +431,11 @@ void SolutionArray::setApiShape(const vector<long int>& shape)
 
 void SolutionArray::_resize(size_t size)
 {
+    _loadDeferred();
     m_size = size;
     m_dataSize = size;
     m_data->resize(m_dataSize * m_stride, 0.);
+    m_unset->resize(m_dataSize, true);
     for (auto& [key, data] : *m_extra) {
         _resizeExtra(key);
     }
@@ -656,7 +857,7 @@ vector<string> SolutionArray::listExtra(bool all) const
     int pos = 0;
     while (m_order->count(pos)) {
         const auto& name = m_order->at(pos);
-        if (all || !m_extra->at(name).is<void>()) {
+        if (all || !m_extra->at(name).is<void>() || m_deferred->count(name)) {
             names.push_back(name);
         }
         pos++;
@@ -666,7 +867,7 @@ vector<string> SolutionArray::listExtra(bool all) const
     pos = -1;
     while (m_order->count(pos)) {
         const auto& name = m_order->at(pos);
-        if (all || !m_extra->at(name).is<void>()) {
+        if (all || !m_extra->at(name).is<void>() || m_deferred->count(name)) {
             names.push_back(name);
         }
         pos--;
@@ -709,6 +910,7 @@ AnyValue SolutionArray::getComponent(const string& name) const
     AnyValue out;
     if (m_extra->count(_name)) {
         // extra component
+        _loadDeferred(_name);
         const auto& extra = m_extra->at(_name);
         if (extra.is<void>()) {
             return AnyValue();
@@ -770,6 +972,7 @@ void SolutionArray::setComponent(const string& name, const AnyValue& data)
             "Unknown component '{}'.", name);
     }
     if (m_extra->count(name)) {
+        _loadDeferred(name);
         _setExtra(name, data);
         return;
     }
@@ -795,6 +998,7 @@ void SolutionArray::setComponent(const string& name, const AnyValue& data)
     }
     for (size_t k = 0; k < m_size; ++k) {
         (*m_data)[m_active[k] * m_stride + ix] = vec[k];
+        (*m_unset)[m_active[k]] = false;
     }
 }
 
@@ -827,6 +1031,7 @@ void SolutionArray::updateState(int loc)
     setLoc(loc, false);
     size_t nState = m_sol->thermo()->stateSize();
     m_sol->thermo()->saveState(nState, m_data->data() + m_loc * m_stride);
+    (*m_unset)[m_loc] = false;
 }
 
 vector<double> SolutionArray::getState(int loc)
@@ -849,6 +1054,7 @@ void SolutionArray::setState(int loc, const vector<double>& state)
     setLoc(loc, false);
     m_sol->thermo()->restoreState(state);
     m_sol->thermo()->saveState(nState, m_data->data() + m_loc * m_stride);
+    (*m_unset)[m_loc] = false;
 }
 
 void SolutionArray::normalize() {
@@ -881,8 +1087,212 @@ void SolutionArray::normalize() {
     }
 }
 
+bool SolutionArray::hasProperty(const string& name)
+{
+    return propertyEvaluators().count(name);
+}
+
+vector<string> SolutionArray::listProperties()
+{
+    vector<string> names;
+    for (const auto& [name, evaluator] : propertyEvaluators()) {
+        names.push_back(name);
+    }
+    return names;
+}
+
+size_t SolutionArray::propertySize(const string& name)
+{
+    if (!hasProperty(name)) {
+        throw CanteraError("SolutionArray::propertySize",
+            "Unknown property '{}'.", name);
+    }
+    return propertyEvaluators().at(name).size(*m_sol);
+}
+
+void SolutionArray::evalProperty(const string& name, double* out)
+{
+    if (!hasProperty(name)) {
+        throw CanteraError("SolutionArray::evalProperty",
+            "Unknown property '{}'.", name);
+    }
+    const auto& evaluator = propertyEvaluators().at(name);
+    size_t width = evaluator.size(*m_sol);
+    if (m_nThreads != 1 && hasDelegatedRates(*m_sol)) {
+        throw CanteraError("SolutionArray::evalProperty", "Parallel evaluation is "
+            "not supported for mechanisms that include user-defined reaction rates.");
+    }
+    size_t nThreads = std::min(m_nThreads ? m_nThreads : hardwareThreads(), m_size);
+    if (nThreads <= 1) {
+        for (size_t k = 0; k < m_size; ++k) {
+            setLoc(static_cast<int>(k));
+            evaluator.eval(*m_sol, out + k * width);
+        }
+        return;
+    }
+
+    // workers may be shared with other objects used on different threads
+    std::lock_guard<std::mutex> lock(*m_workerMutex);
+    auto& workers = _workers(nThreads);
+    size_t nState = m_sol->thermo()->stateSize();
+    parallelFor(m_size, nThreads, [&](size_t worker, size_t begin, size_t end) {
+        auto& sol = *workers[worker];
+        for (size_t k = begin; k < end; ++k) {
+            sol.thermo()->restoreState(nState, m_data->data() + m_active[k] * m_stride);
+            evaluator.eval(sol, out + k * width);
+        }
+    });
+}
+
+vector<double> SolutionArray::evalProperty(const string& name)
+{
+    vector<double> out(m_size * propertySize(name));
+    evalProperty(name, out.data());
+    return out;
+}
+
+void SolutionArray::setNumThreads(size_t nThreads)
+{
+    std::lock_guard<std::mutex> lock(*m_workerMutex);
+    m_nThreads = nThreads;
+    m_workers.reset();
+}
+
+void SolutionArray::setWorkers(const shared_ptr<vector<shared_ptr<Solution>>>& workers)
+{
+    std::lock_guard<std::mutex> lock(*m_workerMutex);
+    m_workers = workers;
+}
+
+vector<shared_ptr<Solution>>& SolutionArray::_workers(size_t nWorkers)
+{
+    if (!m_workers) {
+        m_workers = make_shared<vector<shared_ptr<Solution>>>();
+    }
+    auto kin = m_sol->kinetics();
+    bool withKinetics = kin && kin->kineticsType() != "none";
+    bool withTransport = m_sol->transport() &&
+        m_sol->transport()->transportModel() != "none";
+    while (m_workers->size() < nWorkers) {
+        m_workers->push_back(m_sol->clone({}, withKinetics, withTransport));
+    }
+    if (withKinetics) {
+        // rate multipliers are not retained by cloned Kinetics objects
+        for (auto& worker : *m_workers) {
+            for (size_t i = 0; i < kin->nReactions(); i++) {
+                worker->kinetics()->setMultiplier(i, kin->multiplier(i));
+            }
+        }
+    }
+    return *m_workers;
+}
+
+void SolutionArray::setStates(const string& mode, const double* prop1,
+                              const double* prop2, const double* comp, bool normalize)
+{
+    const auto& setters = stateSetters();
+    string pair = mode.substr(0, 2);
+    string spec = mode.size() > 2 ? mode.substr(2) : "";
+    if (mode.size() > 3 || !setters.count(pair) ||
+        (!spec.empty() && spec != "X" && spec != "Y"))
+    {
+        throw CanteraError("SolutionArray::setStates",
+            "Unsupported mode '{}'.", mode);
+    }
+    if (spec.empty() != (comp == nullptr)) {
+        throw CanteraError("SolutionArray::setStates",
+            "Composition is required if and only if mode ('{}') specifies mole or "
+            "mass fractions.", mode);
+    }
+    const auto& setter = setters.at(pair);
+    auto phase = m_sol->thermo();
+    size_t nSpecies = phase->nSpecies();
+    // states that store mass fractions do not retain the scaling of unnormalized
+    // mole fractions, which are thus converted to mass fractions with the same sum;
+    // this also ensures that restored states match the specified property pair
+    bool convertX = !normalize && phase->nativeState().count("Y");
+    vector<double> work(nSpecies);
+    // entries added by resizing that do not hold a state yet use the current state
+    // of the phase for properties that are not specified
+    vector<double> current(phase->stateSize());
+    phase->saveState(current);
+    for (size_t k = 0; k < m_size; ++k) {
+        if ((*m_unset)[m_active[k]]) {
+            setLoc(static_cast<int>(k), false);
+            phase->restoreState(current);
+        } else {
+            setLoc(static_cast<int>(k));
+        }
+        if (spec == "X") {
+            const double* X = comp + k * nSpecies;
+            if (normalize) {
+                phase->setMoleFractions(X);
+            } else if (!convertX) {
+                phase->setMoleFractions_NoNorm(X);
+            } else {
+                double sumX = 0., sumY = 0.;
+                for (size_t i = 0; i < nSpecies; i++) {
+                    work[i] = X[i] * phase->molecularWeight(i);
+                    sumX += X[i];
+                    sumY += work[i];
+                }
+                if (sumY > 0.) {
+                    scale(work.begin(), work.end(), work.begin(), sumX / sumY);
+                }
+                phase->setMassFractions_NoNorm(work.data());
+            }
+        } else if (spec == "Y") {
+            if (normalize) {
+                phase->setMassFractions(comp + k * nSpecies);
+            } else {
+                phase->setMassFractions_NoNorm(comp + k * nSpecies);
+            }
+        }
+        setter(*phase, prop1[k], prop2[k]);
+        updateState(static_cast<int>(k));
+    }
+}
+
+double* SolutionArray::componentData(const string& name, size_t& stride, size_t& width)
+{
+    if (m_size == 0) {
+        return nullptr;
+    }
+    for (size_t k = 1; k < m_size; ++k) {
+        if (m_active[k] != m_active[0] + static_cast<int>(k)) {
+            // active entries are not contiguous
+            return nullptr;
+        }
+    }
+    string _name = name;
+    if (!hasComponent(name, false) && reverseAliasMap.count(name)) {
+        _name = reverseAliasMap.at(name);
+    }
+    size_t first = static_cast<size_t>(m_active[0]);
+    if (m_extra->count(_name)) {
+        _loadDeferred(_name);
+        auto& extra = (*m_extra)[_name];
+        if (!extra.isVector<double>()) {
+            return nullptr;
+        }
+        stride = 1;
+        width = 1;
+        return extra.asVector<double>().data() + first;
+    }
+
+    auto phase = m_sol->thermo();
+    const auto nativeState = phase->nativeState();
+    if (!nativeState.count(_name)) {
+        return nullptr;
+    }
+    stride = m_stride;
+    width = (_name == "X" || _name == "Y") ? phase->nSpecies() : 1;
+    return m_data->data() + first * m_stride + nativeState.at(_name);
+}
+
 AnyMap SolutionArray::getAuxiliary(int loc)
 {
+    _loadDeferred();
     setLoc(loc);
     AnyMap out;
     for (const auto& [key, extra] : *m_extra) {
@@ -911,6 +1321,7 @@ AnyMap SolutionArray::getAuxiliary(int loc)
 
 void SolutionArray::setAuxiliary(int loc, const AnyMap& data)
 {
+    _loadDeferred();
     setLoc(loc, false);
     for (const auto& [name, value] : data) {
         if (!m_extra->count(name)) {
@@ -1157,7 +1568,8 @@ void SolutionArray::writeEntry(const string& fname, bool overwrite, const string
 }
 
 void SolutionArray::writeEntry(const string& fname, const string& name,
-                               const string& sub, bool overwrite, int compression)
+                               const string& sub, bool overwrite, int compression,
+                               bool append, size_t chunkSize)
 {
     if (name == "") {
         throw CanteraError("SolutionArray::writeEntry",
@@ -1167,70 +1579,115 @@ void SolutionArray::writeEntry(const string& fname, const string& name,
         throw NotImplementedError("SolutionArray::writeEntry",
             "Unable to save sliced data.");
     }
+    if (append && apiNdim() != 1) {
+        throw NotImplementedError("SolutionArray::writeEntry",
+            "Unable to append multi-dimensional arrays.");
+    }
+    _loadDeferred();
     Storage file(fname, true);
     if (compression) {
         file.setCompressionLevel(compression);
     }
+    if (chunkSize) {
+        file.setChunkSize(chunkSize);
+    }
     string path = name;
     if (sub != "") {
         path += "/" + sub;
     } else {
         path += "/data";
     }
+    size_t stored = 0;
     if (file.checkGroup(path, true)) {
-        if (!overwrite) {
+        if (append) {
+            AnyMap attrs = file.readAttributes(path, false);
+            if (!attrs.hasKey("size") || !attrs.hasKey("components")
+                || attrs["components"].asVector<string>() != componentNames())
+            {
+                throw CanteraError("SolutionArray::writeEntry",
+                    "Unable to append data to group '{}' as stored components "
+                    "are inconsistent.", path);
+            }
+            stored = attrs["size"].asInt();
+        } else if (!overwrite) {
             throw CanteraError("SolutionArray::writeEntry",
                 "Group name '{}' exists; use 'overwrite' argument to overwrite.", name);
+        } else {
+            file.deleteGroup(path);
+            file.checkGroup(path, true);
         }
-        file.deleteGroup(path);
-        file.checkGroup(path, true);
     }
-    file.writeAttributes(path, m_meta);
-    AnyMap more;
-    if (apiNdim() == 1) {
-        more["size"] = int(m_dataSize);
-    } else {
-        more["api-shape"] = m_apiShape;
+
+    // collect datasets before anything is written
+    vector<pair<string, AnyValue>> datasets;
+    if (m_dataSize) {
+        const auto& nativeState = m_sol->thermo()->nativeState();
+        size_t nSpecies = m_sol->thermo()->nSpecies();
+        for (auto& [key, offset] : nativeState) {
+            if (key == "X" || key == "Y") {
+                vector<vector<double>> prop;
+                for (size_t i = 0; i < m_size; i++) {
+                    size_t first = offset + i * m_stride;
+                    prop.emplace_back(m_data->begin() + first,
+                                      m_data->begin() + first + nSpecies);
+                }
+                datasets.emplace_back(key, AnyValue());
+                datasets.back().second = prop;
+            } else {
+                datasets.emplace_back(key, getComponent(key));
+            }
+        }
+        for (const auto& [key, value] : *m_extra) {
+            if (isSimpleVector(value)) {
+                datasets.emplace_back(key, value);
+            } else if (value.is<void>()) {
+                // skip unintialized component
+            } else {
+                throw NotImplementedError("SolutionArray::writeEntry",
+                    "Unable to save component '{}' with data type {}.",
+                    key, value.type_str());
+            }
+        }
     }
-    if (!m_meta.hasKey("transport-model") && m_sol->transport()) {
-        more["transport-model"] = m_sol->transportModel();
+
+    if (append) {
+        // ensure that all datasets can be extended before any of them is modified
+        for (const auto& [key, data] : datasets) {
+            size_t rows = file.checkAppend(path, key, data);
+            if (rows != stored) {
+                throw CanteraError("SolutionArray::writeEntry",
+                    "Unable to append data to group '{}' as DataSet '{}' holds {} "
+                    "rows while the group size is {}.", path, key, rows, stored);
+            }
+        }
     }
-    more["components"] = componentNames();
-    file.writeAttributes(path, more);
-    if (!m_dataSize) {
-        return;
+    if (!stored) {
+        file.writeAttributes(path, m_meta, append);
+        AnyMap more;
+        if (!m_meta.hasKey("transport-model") && m_sol->transport()) {
+            more["transport-model"] = m_sol->transportModel();
+        }
+        more["components"] = componentNames();
+        file.writeAttributes(path, more, append);
     }
 
-    const auto& nativeState = m_sol->thermo()->nativeState();
-    size_t nSpecies = m_sol->thermo()->nSpecies();
-    for (auto& [key, offset] : nativeState) {
-        if (key == "X" || key == "Y") {
-            vector<vector<double>> prop;
-            for (size_t i = 0; i < m_size; i++) {
-                size_t first = offset + i * m_stride;
-                prop.emplace_back(m_data->begin() + first,
-                                  m_data->begin() + first + nSpecies);
-            }
-            AnyValue data;
-            data = prop;
-            file.writeData(path, key, data);
+    // write new datasets, or extend resizable datasets
+    for (const auto& [key, data] : datasets) {
+        if (append) {
+            file.appendData(path, key, data);
         } else {
-            auto data = getComponent(key);
             file.writeData(path, key, data);
         }
     }
 
-    for (const auto& [key, value] : *m_extra) {
-        if (isSimpleVector(value)) {
-            file.writeData(path, key, value);
-        } else if (value.is<void>()) {
-            // skip unintialized component
-        } else {
-            throw NotImplementedError("SolutionArray::writeEntry",
-                "Unable to save component '{}' with data type {}.",
-                key, value.type_str());
-        }
+    // update size last, so that the group remains consistent if writing fails
+    AnyMap more;
+    if (apiNdim() == 1) {
+        more["size"] = int(stored + m_dataSize);
+    } else {
+        more["api-shape"] = m_apiShape;
     }
+    file.writeAttributes(path, more, true);
 }
 
 void SolutionArray::writeEntry(AnyMap& root, const string& name, const string& sub,
@@ -1244,6 +1701,7 @@ void SolutionArray::writeEntry(AnyMap& root, const string& name, const string& s
         throw NotImplementedError("SolutionArray::writeEntry",
             "Unable to save sliced data.");
     }
+    _loadDeferred();
     string path = name;
     if (sub != "") {
         path += "/" + sub;
@@ -1345,7 +1803,7 @@ void SolutionArray::append(const vector<double>& state, const AnyMap& extra)
 
 void SolutionArray::save(const string& fname, const string& name, const string& sub,
                          const string& desc, bool overwrite, int compression,
-                         const string& basis)
+                         const string& basis, bool append, size_t chunkSize)
 {
     if (m_size < m_dataSize) {
         throw NotImplementedError("SolutionArray::save",
@@ -1366,10 +1824,21 @@ void SolutionArray::save(const string& fname, const string& name, const string&
             "Argument 'basis' is not used for HDF or YAML output.", basis);
     }
     if (extension == "h5" || extension == "hdf"  || extension == "hdf5") {
-        writeHeader(fname, name, desc, overwrite);
-        writeEntry(fname, name, sub, true, compression);
+        bool exists = false;
+        if (append) {
+            Storage file(fname, true);
+            exists = file.hasGroup(name);
+        }
+        if (!exists) {
+            writeHeader(fname, name, desc, overwrite);
+        }
+        writeEntry(fname, name, sub, true, compression, append, chunkSize);
         return;
     }
+    if (append) {
+        throw NotImplementedError("SolutionArray::save",
+            "Appending data is only supported for HDF output.");
+    }
     if (extension == "yaml" || extension == "yml") {
         // Check for an existing file and load it if present
         AnyMap data;
@@ -1433,7 +1902,9 @@ AnyMap SolutionArray::readHeader(const AnyMap& root, const string& name)
 }
 
 AnyMap SolutionArray::restore(const string& fname,
-                              const string& name, const string& sub)
+                              const string& name, const string& sub,
+                              const vector<string>& columns, size_t start,
+                              size_t count, bool lazy)
 {
     size_t dot = fname.find_last_of(".");
     string extension = (dot != npos) ? toLowerCopy(fname.substr(dot + 1)) : "";
@@ -1444,9 +1915,13 @@ AnyMap SolutionArray::restore(const string& fname,
             "'read_csv' instead.");
     }
     if (extension == "h5" || extension == "hdf"  || extension == "hdf5") {
-        readEntry(fname, name, sub);
+        readEntry(fname, name, sub, columns, start, count, lazy);
         header = readHeader(fname, name);
     } else if (extension == "yaml" || extension == "yml") {
+        if (columns.size() || start != 0 || count != npos || lazy) {
+            throw NotImplementedError("SolutionArray::restore",
+                "Partial loading is only supported for HDF input.");
+        }
         const AnyMap& root = AnyMap::fromYamlFile(fname);
         readEntry(root, name, sub);
         header = readHeader(root, name);
@@ -1458,6 +1933,22 @@ AnyMap SolutionArray::restore(const string& fname,
     return header;
 }
 
+void SolutionArray::_loadDeferred(const string& name) const
+{
+    if (m_deferred->empty()) {
+        return;
+    }
+    if (name.empty()) {
+        for (const auto& [key, loader] : *m_deferred) {
+            (*m_extra)[key] = loader();
+        }
+        m_deferred->clear();
+    } else if (m_deferred->count(name)) {
+        (*m_extra)[name] = m_deferred->at(name)();
+        m_deferred->erase(name);
+    }
+}
+
 void SolutionArray::_initExtra(const string& name, const AnyValue& value)
 {
     if (!m_extra->count(name)) {
@@ -1543,6 +2034,13 @@ void SolutionArray::_setExtra(const string& name, const AnyValue& data)
     }
 
     auto& extra = m_extra->at(name);
+    if (extra.isVector<double>() && m_data.use_count() > 1
+        && !data.is<double>() && !data.isVector<double>())
+    {
+        // values may be accessed directly (see componentData)
+        throw CanteraError("SolutionArray::_setExtra",
+            "Unable to replace '{}' as data are shared by multiple objects.", name);
+    }
     if (data.is<void>() && m_size == m_dataSize) {
         // reset placeholder
         extra = AnyValue();
@@ -1690,7 +2188,8 @@ string getName(const set<string>& names, const string& name)
 }
 
 void SolutionArray::readEntry(const string& fname, const string& name,
-                              const string& sub)
+                              const string& sub, const vector<string>& columns,
+                              size_t start, size_t count, bool lazy)
 {
     Storage file(fname, false);
     if (name == "") {
@@ -1708,21 +2207,87 @@ void SolutionArray::readEntry(const string& fname, const string& name,
         throw CanteraError("SolutionArray::readEntry",
             "Group name specifying data entry is empty.");
     }
+    if (m_data.use_count() > 1) {
+        throw CanteraError("SolutionArray::readEntry",
+            "Unable to restore data as data are shared by multiple objects.");
+    }
     m_extra->clear();
+    m_deferred->clear();
     auto [size, names] = file.contents(path);
     m_meta = file.readAttributes(path, true);
+    size_t stored = size; // number of entries held by file
+    vector<long int> shape;
     if (m_meta.hasKey("size")) {
         // one-dimensional array
-        resize(m_meta["size"].as<long int>());
+        stored = m_meta["size"].as<long int>();
         m_meta.erase("size");
     } else if (m_meta.hasKey("api-shape")) {
         // API uses multiple dimensions to interpret C++ SolutionArray
-        setApiShape(m_meta["api-shape"].asVector<long int>());
+        shape = m_meta["api-shape"].asVector<long int>();
+        stored = 1;
+        for (auto dim : shape) {
+            stored *= dim;
+        }
         m_meta.erase("api-shape");
+    }
+    if (count == npos) {
+        count = stored - std::min(start, stored);
+    }
+    if (start + count > stored) {
+        throw IndexError("SolutionArray::readEntry", path, start + count - 1, stored);
+    }
+    if (start == 0 && count == stored && shape.size()) {
+        setApiShape(shape);
+    } else if (shape.size() > 1) {
+        throw NotImplementedError("SolutionArray::readEntry",
+            "Partial restore of multi-dimensional data is not supported.");
     } else {
-        // legacy format; size needs to be detected
-        resize(static_cast<int>(size));
+        resize(static_cast<int>(count));
+    }
+    for (const auto& col : columns) {
+        if (!names.count(col) && !(aliasMap.count(col) && names.count(aliasMap.at(col)))
+            && !hasComponent(col, false))
+        {
+            throw CanteraError("SolutionArray::readEntry",
+                "Component '{}' not found in group '{}'.", col, path);
+        }
     }
+    auto isSelected = [&columns](const string& key, const string& alias) {
+        if (columns.empty()) {
+            return true;
+        }
+        return std::find(columns.begin(), columns.end(), key) != columns.end() ||
+            std::find(columns.begin(), columns.end(), alias) != columns.end();
+    };
+    auto readSlice = [&](const string& key, size_t cols) {
+        return file.readData(path, key, stored, cols, start, count);
+    };
+
+    // species selected by name are read as a hyperslab of the species columns;
+    // fractions of other species are set to zero
+    size_t nSpecies = m_sol->thermo()->nSpecies();
+    vector<size_t> species;
+    for (const auto& col : columns) {
+        size_t k = m_sol->thermo()->speciesIndex(col, false);
+        if (k != npos) {
+            species.push_back(k);
+        }
+    }
+    auto readSpecies = [&](const string& key) {
+        AnyValue data;
+        data = file.readData(path, key, stored, nSpecies, start, count, species);
+        auto prop = std::move(data.asVector<vector<double>>());
+        if (species.empty()) {
+            return prop;
+        }
+        vector<vector<double>> full(prop.size(), vector<double>(nSpecies, 0.));
+        for (size_t i = 0; i < prop.size(); i++) {
+            for (size_t j = 0; j < species.size(); j++) {
+                full[i][species[j]] = prop[i][j];
+            }
+        }
+        return full;
+    };
 
     if (m_size == 0) {
         return;
@@ -1744,34 +2309,30 @@ void SolutionArray::readEntry(const string& fname, const string& name,
     }
 
     // restore state data
-    size_t nSpecies = m_sol->thermo()->nSpecies();
     size_t nState = m_sol->thermo()->stateSize();
     const auto& nativeStates = m_sol->thermo()->nativeState();
     if (mode == "native") {
         // native state can be written directly into data storage
         for (const auto& [name, offset] : nativeStates) {
             if (name == "X" || name == "Y") {
-                AnyValue data;
-                data = file.readData(path, name, m_size, nSpecies);
-                auto prop = data.asVector<vector<double>>();
+                auto prop = readSpecies(name);
                 for (size_t i = 0; i < m_dataSize; i++) {
                     std::copy(prop[i].begin(), prop[i].end(),
                               m_data->data() + offset + i * m_stride);
                 }
             } else {
                 AnyValue data;
-                data = file.readData(path, getName(names, name), m_dataSize, 0);
+                data = readSlice(getName(names, name), 0);
                 setComponent(name, data);
             }
         }
     } else if (mode == "TPX") {
         AnyValue data;
-        data = file.readData(path, getName(names, "T"), m_dataSize, 0);
+        data = readSlice(getName(names, "T"), 0);
         vector<double> T = std::move(data.asVector<double>());
-        data = file.readData(path, getName(names, "P"), m_dataSize, 0);
+        data = readSlice(getName(names, "P"), 0);
         vector<double> P = std::move(data.asVector<double>());
-        data = file.readData(path, "X", m_dataSize, nSpecies);
-        vector<vector<double>> X = std::move(data.asVector<vector<double>>());
+        vector<vector<double>> X = readSpecies("X");
         for (size_t i = 0; i < m_dataSize; i++) {
             m_sol->thermo()->setMoleFractions_NoNorm(X[i].data());
             m_sol->thermo()->setState_TP(T[i], P[i]);
@@ -1779,12 +2340,11 @@ void SolutionArray::readEntry(const string& fname, const string& name,
         }
     } else if (mode == "TDX") {
         AnyValue data;
-        data = file.readData(path, getName(names, "T"), m_dataSize, 0);
+        data = readSlice(getName(names, "T"), 0);
         vector<double> T = std::move(data.asVector<double>());
-        data = file.readData(path, getName(names, "D"), m_dataSize, 0);
+        data = readSlice(getName(names, "D"), 0);
         vector<double> D = std::move(data.asVector<double>());
-        data = file.readData(path, "X", m_dataSize, nSpecies);
-        vector<vector<double>> X = std::move(data.asVector<vector<double>>());
+        vector<vector<double>> X = readSpecies("X");
         for (size_t i = 0; i < m_dataSize; i++) {
             m_sol->thermo()->setMoleFractions_NoNorm(X[i].data());
             m_sol->thermo()->setState_TD(T[i], D[i]);
@@ -1792,12 +2352,11 @@ void SolutionArray::readEntry(const string& fname, const string& name,
         }
     } else if (mode == "TPY") {
         AnyValue data;
-        data = file.readData(path, getName(names, "T"), m_dataSize, 0);
+        data = readSlice(getName(names, "T"), 0);
         vector<double> T = std::move(data.asVector<double>());
-        data = file.readData(path, getName(names, "P"), m_dataSize, 0);
+        data = readSlice(getName(names, "P"), 0);
         vector<double> P = std::move(data.asVector<double>());
-        data = file.readData(path, "Y", m_dataSize, nSpecies);
-        vector<vector<double>> Y = std::move(data.asVector<vector<double>>());
+        vector<vector<double>> Y = readSpecies("Y");
         for (size_t i = 0; i < m_dataSize; i++) {
             m_sol->thermo()->setMassFractions_NoNorm(Y[i].data());
             m_sol->thermo()->setState_TP(T[i], P[i]);
@@ -1806,10 +2365,9 @@ void SolutionArray::readEntry(const string& fname, const string& name,
     } else if (mode == "legacySurf") {
         // erroneous TDX mode (should be TPX or TPY) - Sim1D (Cantera 2.5)
         AnyValue data;
-        data = file.readData(path, getName(names, "T"), m_dataSize, 0);
+        data = readSlice(getName(names, "T"), 0);
         vector<double> T = std::move(data.asVector<double>());
-        data = file.readData(path, "X", m_dataSize, nSpecies);
-        vector<vector<double>> X = std::move(data.asVector<vector<double>>());
+        vector<vector<double>> X = readSpecies("X");
         for (size_t i = 0; i < m_dataSize; i++) {
             m_sol->thermo()->setMoleFractions_NoNorm(X[i].data());
             m_sol->thermo()->setTemperature(T[i]);
@@ -1826,8 +2384,19 @@ void SolutionArray::readEntry(const string& fname, const string& name,
             "Import of '{}' data is not supported.", mode);
     }
 
+    m_unset->assign(m_dataSize, false);
+
     // restore remaining data
     if (m_meta.hasKey("components")) {
+        // file signature used to detect modifications before deferred data are read
+        string fullName;
+        std::filesystem::file_time_type mtime;
+        uintmax_t fsize = 0;
+        if (lazy) {
+            fullName = std::filesystem::absolute(fname).string();
+            mtime = std::filesystem::last_write_time(fullName);
+            fsize = std::filesystem::file_size(fullName);
+        }
         const auto& components = m_meta["components"].asVector<string>();
         bool back = false;
         for (const auto& name : components) {
@@ -1838,10 +2407,28 @@ void SolutionArray::readEntry(const string& fname, const string& name,
                 if (reverseAliasMap.count(name)) {
                     _name = reverseAliasMap.at(name);
                 }
+                if (!isSelected(name, _name)) {
+                    continue;
+                }
                 addExtra(_name, back);
-                AnyValue data;
-                data = file.readData(path, name, m_dataSize);
-                setComponent(_name, data);
+                if (lazy) {
+                    (*m_deferred)[_name] =
+                        [fname=fullName, path, name, stored, start, count, mtime, fsize]() {
+                            if (std::filesystem::last_write_time(fname) != mtime ||
+                                std::filesystem::file_size(fname) != fsize)
+                            {
+                                throw CanteraError("SolutionArray::readEntry",
+                                    "Unable to load deferred component '{}' as file "
+                                    "'{}' was modified after it was restored.",
+                                    name, fname);
+                            }
+                            Storage storage(fname, false);
+                            return storage.readData(
+                                path, name, stored, npos, start, count);
+                        };
+                } else {
+                    setComponent(_name, readSlice(name, npos));
+                }
             }
         }
         m_meta.erase("components");
@@ -1854,10 +2441,11 @@ void SolutionArray::readEntry(const string& fname, const string& name,
                 if (reverseAliasMap.count(name)) {
                     _name = reverseAliasMap.at(name);
                 }
+                if (!isSelected(name, _name)) {
+                    continue;
+                }
                 addExtra(_name);
-                AnyValue data;
-                data = file.readData(path, name, m_dataSize);
-                setComponent(_name, data);
+                setComponent(_name, readSlice(name, npos));
             }
         }
     }
@@ -1900,7 +2488,12 @@ void SolutionArray::readEntry(const AnyMap& root, const string& name, const stri
         }
         resize(static_cast<int>(size));
     }
+    if (m_data.use_count() > 1) {
+        throw CanteraError("SolutionArray::readEntry",
+            "Unable to restore data as data are shared by multiple objects.");
+    }
     m_extra->clear();
+    m_deferred->clear();
 
     // restore data
     set<string> exclude = {"size", "api-shape", "points", "X", "Y"};
@@ -2073,7 +2666,13 @@ void setSingle(AnyValue& extra, const AnyValue& data, const vector<int>& slice)
 {
     size_t size = slice.size();
     if (extra.vectorSize() == size && data.vectorSize() == size) {
-        extra = data; // no slicing necessary; type can change
+        if (extra.isVector<T>()) {
+            // no slicing necessary; retain storage location of existing data
+            const auto& vData = data.asVector<T>();
+            std::copy(vData.begin(), vData.end(), extra.asVector<T>().begin());
+        } else {
+            extra = data; // no slicing necessary; type can change
+        }
         return;
     }
     if (extra.matrixShape().first == size && data.vectorSize() == size) {
@@ -53,6 +53,11 @@ void Storage::setCompressionLevel(int level)
     m_compressionLevel = level;
 }
 
+void Storage::setChunkSize(size_t rows)
+{
+    m_chunkSize = rows;
+}
+
 bool Storage::hasGroup(const string& id) const
 {
     if (!m_file->exist(id)) {
@@ -273,12 +278,15 @@ AnyMap Storage::readAttributes(const string& id, bool recursive) const
     }
 }
 
-void writeH5Attributes(h5::Group sub, const AnyMap& meta)
+void writeH5Attributes(h5::Group sub, const AnyMap& meta, bool overwrite)
 {
     for (auto& [name, item] : meta) {
         if (sub.hasAttribute(name)) {
-            throw NotImplementedError("writeH5Attributes",
-                "Unable to overwrite existing Attribute '{}'", name);
+            if (!overwrite) {
+                throw NotImplementedError("writeH5Attributes",
+                    "Unable to overwrite existing Attribute '{}'", name);
+            }
+            sub.deleteAttribute(name);
         }
         if (item.is<long int>()) {
             int value = item.asInt();
@@ -330,8 +338,11 @@ void writeH5Attributes(h5::Group sub, const AnyMap& meta)
         } else if (item.is<AnyMap>()) {
             // step into recursion
             auto value = item.as<AnyMap>();
-            auto grp = sub.createGroup(name);
-            writeH5Attributes(grp, value);
+            if (overwrite && sub.exist(name)) {
+                writeH5Attributes(sub.getGroup(name), value, overwrite);
+            } else {
+                writeH5Attributes(sub.createGroup(name), value, overwrite);
+            }
         } else {
             throw NotImplementedError("writeH5Attributes",
                 "Unable to write attribute '{}' with type '{}'",
@@ -340,12 +351,12 @@ void writeH5Attributes(h5::Group sub, const AnyMap& meta)
     }
 }
 
-void Storage::writeAttributes(const string& id, const AnyMap& meta)
+void Storage::writeAttributes(const string& id, const AnyMap& meta, bool overwrite)
 {
     try {
         checkGroupWrite(id, false);
         h5::Group sub = m_file->getGroup(id);
-        writeH5Attributes(sub, meta);
+        writeH5Attributes(sub, meta, overwrite);
     } catch (const Cantera::NotImplementedError& err) {
         throw NotImplementedError("Storage::writeAttribute",
             "{} in group '{}'.", err.getMessage(), id);
@@ -359,8 +370,27 @@ void Storage::writeAttributes(const string& id, const AnyMap& meta)
     }
 }
 
-AnyValue Storage::readData(const string& id,
-                           const string& name, size_t rows, size_t cols) const
+template <class T>
+void orderColumns(vector<vector<T>>& data, const vector<size_t>& sorted,
+                  const vector<size_t>& indices)
+{
+    if (sorted == indices) {
+        return;
+    }
+    // restore requested order of columns
+    for (auto& row : data) {
+        vector<T> selected(indices.size());
+        for (size_t j = 0; j < indices.size(); j++) {
+            auto pos = std::lower_bound(sorted.begin(), sorted.end(), indices[j]);
+            selected[j] = row[pos - sorted.begin()];
+        }
+        row = std::move(selected);
+    }
+}
+
+AnyValue Storage::readData(const string& id, const string& name, size_t rows,
+                           size_t cols, size_t start, size_t count,
+                           const vector<size_t>& indices) const
 {
     try {
         checkGroupRead(id);
@@ -400,17 +430,61 @@ AnyValue Storage::readData(const string& id,
             "Shape of DataSet '{}' is inconsistent; expected {} columns "
             "but received {}.", name, cols, shape[1]);
     }
+    if (count == npos) {
+        count = rows - std::min(start, rows);
+    }
+    if (start + count > rows) {
+        throw IndexError("Storage::readData", name, start + count - 1, rows);
+    }
+    if (indices.size() && ndim != 2) {
+        throw CanteraError("Storage::readData",
+            "Selection of columns requires two-dimensional DataSet, but '{}' has {} "
+            "dimension(s).", name, ndim);
+    }
+    // HDF returns selected columns in ascending order
+    vector<size_t> sorted(indices);
+    std::sort(sorted.begin(), sorted.end());
+    sorted.erase(std::unique(sorted.begin(), sorted.end()), sorted.end());
+    for (auto ix : sorted) {
+        if (ix >= shape[1]) {
+            throw IndexError("Storage::readData", name, ix, shape[1]);
+        }
+    }
+    auto read = [&](auto& data) {
+        if (sorted.size()) {
+            // read union of hyperslabs holding selected rows and columns
+            h5::HyperSlab slab;
+            for (auto ix : sorted) {
+                slab |= h5::RegularHyperSlab({start, ix}, {count, 1});
+            }
+            dataset.select(slab, h5::DataSpace({count, sorted.size()})).read(data);
+            return;
+        }
+        if (start == 0 && count == rows) {
+            dataset.read(data);
+            return;
+        }
+        // read hyperslab holding selected rows
+        vector<size_t> offset{start};
+        vector<size_t> extent{count};
+        if (ndim == 2) {
+            offset.push_back(0);
+            extent.push_back(shape[1]);
+        }
+        dataset.select(offset, extent).read(data);
+    };
     AnyValue out;
     const auto datatype = dataset.getDataType().getClass();
     if (datatype == h5::DataTypeClass::Float) {
         try {
             if (ndim == 1) {
                 vector<double> data;
-                dataset.read(data);
+                read(data);
                 out = data;
             } else { // ndim == 2
                 vector<vector<double>> data;
-                dataset.read(data);
+                read(data);
+                orderColumns(data, sorted, indices);
                 out = data;
             }
         } catch (const std::exception& err) {
@@ -422,11 +496,12 @@ AnyValue Storage::readData(const string& id,
         try {
             if (ndim == 1) {
                 vector<long int> data;
-                dataset.read(data);
+                read(data);
                 out = data;
             } else { // ndim == 2
                 vector<vector<long int>> data;
-                dataset.read(data);
+                read(data);
+                orderColumns(data, sorted, indices);
                 out = data;
             }
         } catch (const std::exception& err) {
@@ -438,11 +513,12 @@ AnyValue Storage::readData(const string& id,
         try {
             if (ndim == 1) {
                 vector<string> data;
-                dataset.read(data);
+                read(data);
                 out = data;
             } else { // ndim == 2
                 vector<vector<string>> data;
-                dataset.read(data);
+                read(data);
+                orderColumns(data, sorted, indices);
                 out = data;
             }
         } catch (const std::exception& err) {
@@ -506,13 +582,18 @@ void Storage::writeData(const string& id, const string& name, const AnyValue& da
             "Cannot write DataSet '{}' in group '{}' as input data with type\n"
             "'{}'\nis not supported.", name, id, data.type_str());
     }
-    if (m_compressionLevel) {
-        // Set chunk size to single chunk and apply compression level; for caveats, see
+    if (m_compressionLevel || m_chunkSize) {
+        // Unless a chunk size is specified, use a single chunk and apply compression
+        // level; for caveats, see
         // https://stackoverflow.com/questions/32994766/compressed-files-bigger-in-h5py
-        h5::DataSpace space(dims, dims); //{h5::DataSpace::UNLIMITED, dims[1]});
+        h5::DataSpace space(dims, dims);
         h5::DataSetCreateProps props;
-        props.add(h5::Chunking(vector<hsize_t>{dims[0], dims[1]}));
-        props.add(h5::Deflate(m_compressionLevel));
+        hsize_t chunkRows = m_chunkSize ? std::min(m_chunkSize, dims[0]) : dims[0];
+        props.add(h5::Chunking(vector<hsize_t>{
+            std::max<hsize_t>(chunkRows, 1), std::max<hsize_t>(dims[1], 1)}));
+        if (m_compressionLevel) {
+            props.add(h5::Deflate(m_compressionLevel));
+        }
         if (data.isVector<vector<long int>>()) {
             h5::DataSet dataset = sub.createDataSet<long int>(name, space, props);
             dataset.write(data.asVector<vector<long int>>());
@@ -546,6 +627,129 @@ void Storage::writeData(const string& id, const string& name, const AnyValue& da
     }
 }
 
+vector<size_t> appendCount(const string& id, const string& name,
+                           const AnyValue& data)
+{
+    size_t size = data.vectorSize();
+    auto [rows, cols] = data.matrixShape();
+    if (size != npos && !data.isVector<bool>()) {
+        return {size};
+    } else if (rows != npos && cols != npos) {
+        return {rows, cols};
+    }
+    throw NotImplementedError("Storage::appendData",
+        "Cannot append to DataSet '{}' in group '{}' as input data with type\n"
+        "'{}'\nis not supported.", name, id, data.type_str());
+}
+
+size_t Storage::checkAppend(const string& id, const string& name,
+                            const AnyValue& data) const
+{
+    vector<size_t> count = appendCount(id, name, data);
+    try {
+        if (!m_file->exist(id) || !m_file->getGroup(id).exist(name)) {
+            return 0;
+        }
+        h5::DataSet dataset = m_file->getGroup(id).getDataSet(name);
+        h5::DataSpace space = dataset.getSpace();
+        auto dims = space.getDimensions();
+        if (dims.size() != count.size() || (dims.size() == 2 && dims[1] != count[1])) {
+            throw CanteraError("Storage::checkAppend",
+                "Shape of DataSet '{}' in group '{}' is inconsistent with data to be "
+                "appended.", name, id);
+        }
+        if (space.getMaxDimensions()[0] != h5::DataSpace::UNLIMITED) {
+            throw CanteraError("Storage::checkAppend",
+                "DataSet '{}' in group '{}' is not resizable.", name, id);
+        }
+        return dims[0];
+    } catch (const CanteraError&) {
+        throw;
+    } catch (const std::exception& err) {
+        // convert HighFive exception
+        throw CanteraError("Storage::checkAppend",
+            "Encountered exception for DataSet '{}' in group '{}':\n{}",
+            name, id, err.what());
+    }
+}
+
+size_t Storage::appendData(const string& id, const string& name, const AnyValue& data)
+{
+    try {
+        checkGroupWrite(id, false);
+    } catch (const CanteraError& err) {
+        // rethrow with public method attribution
+        throw CanteraError("Storage::appendData", "{}", err.getMessage());
+    } catch (const std::exception& err) {
+        // convert HighFive exception
+        throw CanteraError("Storage::appendData",
+            "Encountered exception for group '{}':\n{}", id, err.what());
+    }
+    h5::Group sub = m_file->getGroup(id);
+    vector<size_t> count = appendCount(id, name, data);
+    size_t stored = checkAppend(id, name, data);
+
+    try {
+        if (!sub.exist(name)) {
+            // create resizable dataset with unlimited number of rows
+            vector<size_t> dims = count;
+            vector<size_t> maxDims = count;
+            dims[0] = 0;
+            maxDims[0] = h5::DataSpace::UNLIMITED;
+            h5::DataSpace space(dims, maxDims);
+            vector<hsize_t> chunk(count.begin(), count.end());
+            chunk[0] = m_chunkSize ? m_chunkSize : 1024;
+            if (chunk.size() == 2) {
+                chunk[1] = std::max<hsize_t>(chunk[1], 1);
+            }
+            h5::DataSetCreateProps props;
+            props.add(h5::Chunking(chunk));
+            if (m_compressionLevel) {
+                props.add(h5::Deflate(m_compressionLevel));
+            }
+            if (data.isVector<long int>() || data.isVector<vector<long int>>()) {
+                sub.createDataSet<long int>(name, space, props);
+            } else if (data.isVector<double>() || data.isVector<vector<double>>()) {
+                sub.createDataSet<double>(name, space, props);
+            } else {
+                sub.createDataSet<string>(name, space, props);
+            }
+        }
+        if (!count[0]) {
+            return stored;
+        }
+
+        h5::DataSet dataset = sub.getDataSet(name);
+        vector<size_t> dims = count;
+        dims[0] = stored + count[0];
+        vector<size_t> offset(dims.size(), 0);
+        offset[0] = stored;
+        dataset.resize(dims);
+        auto selection = dataset.select(offset, count);
+        if (data.isVector<long int>()) {
+            selection.write(data.asVector<long int>());
+        } else if (data.isVector<double>()) {
+            selection.write(data.asVector<double>());
+        } else if (data.isVector<string>()) {
+            selection.write(data.asVector<string>());
+        } else if (data.isVector<vector<long int>>()) {
+            selection.write(data.asVector<vector<long int>>());
+        } else if (data.isVector<vector<double>>()) {
+            selection.write(data.asVector<vector<double>>());
+        } else {
+            selection.write(data.asVector<vector<string>>());
+        }
+        return dims[0];
+    } catch (const CanteraError&) {
+        throw;
+    } catch (const std::exception& err) {
+        // convert HighFive exception
+        throw CanteraError("Storage::appendData",
+            "Encountered exception for DataSet '{}' in group '{}':\n{}",
+            name, id, err.what());
+    }
+}
+
 #else
 
 Storage::Storage(string fname, bool write)
@@ -600,14 +804,21 @@ AnyMap Storage::readAttributes(const string& id, bool recursive) const
                        "Saving to HDF requires HighFive installation.");
 }
 
-void Storage::writeAttributes(const string& id, const AnyMap& meta)
+void Storage::setChunkSize(size_t rows)
+{
+    throw CanteraError("Storage::setChunkSize",
+                       "Saving to HDF requires HighFive installation.");
+}
+
+void Storage::writeAttributes(const string& id, const AnyMap& meta, bool overwrite)
 {
     throw CanteraError("Storage::writeAttributes",
                        "Saving to HDF requires HighFive installation.");
 }
 
-AnyValue Storage::readData(const string& id,
-                           const string& name, size_t rows, size_t cols) const
+AnyValue Storage::readData(const string& id, const string& name, size_t rows,
+                           size_t cols, size_t start, size_t count,
+                           const vector<size_t>& indices) const
 {
     throw CanteraError("Storage::readData",
                        "Saving to HDF requires HighFive installation.");
@@ -620,6 +831,20 @@ void Storage::writeData(const string& id,
                        "Saving to HDF requires HighFive installation.");
 }
 
+size_t Storage::appendData(const string& id,
+                           const string& name, const AnyValue& data)
+{
+    throw CanteraError("Storage::appendData",
+                       "Saving to HDF requires HighFive installation.");
+}
+
+size_t Storage::checkAppend(const string& id,
+                            const string& name, const AnyValue& data) const
+{
+    throw CanteraError("Storage::checkAppend",
+                       "Saving to HDF requires HighFive installation.");
+}
+
 #endif
 
 }
@@ -12,9 +12,11 @@
 #include <boost/dll/import.hpp>
 #include <boost/algorithm/string.hpp>
 
+#include <filesystem>
 #include <fstream>
 #include <sstream>
 #include <mutex>
+#include <random>
 
 namespace ba = boost::algorithm;
 
@@ -305,6 +307,99 @@ void Application::addDataDirectory(const string& dir)
     inputDirs.insert(inputDirs.begin(), d);
 }
 
+void Application::setCacheDirectory(const string& dir)
+{
+    std::unique_lock<std::mutex> dirLock(dir_mutex);
+    if (dir.empty()) {
+        m_cacheDir.clear();
+        return;
+    }
+    std::error_code ec;
+    std::filesystem::create_directories(dir, ec);
+    if (ec) {
+        throw CanteraError("Application::setCacheDirectory",
+            "Unable to create cache directory '{}':\n{}", dir, ec.message());
+    }
+    m_cacheDir = std::filesystem::absolute(dir).string();
+}
+
+string Application::cacheDirectory()
+{
+    std::unique_lock<std::mutex> dirLock(dir_mutex);
+    return m_cacheDir;
+}
+
+namespace {
+
+//! Identifier written at the start of each cache file
+const string cacheMagic = "CTCACHE\n";
+
+//! SHA-256 digest identifying a cache entry. Entries written by different versions
+//! of %Cantera have different digests.
+string cacheDigest(const string& category, const string& key)
+{
+    return sha256(fmt::format("{}\n{}\n", CANTERA_VERSION, category) + key);
+}
+
+//! Header of the cache file holding the entry with the given digest
+string cacheHeader(const string& digest)
+{
+    return fmt::format("{}{}\n{}\n", cacheMagic, CANTERA_VERSION, digest);
+}
+
+} // end anonymous namespace
+
+bool Application::readCacheEntry(const string& category, const string& key,
+                                 string& data)
+{
+    string dir = cacheDirectory();
+    if (dir.empty()) {
+        return false;
+    }
+    string digest = cacheDigest(category, key);
+    string fileName = fmt::format("{}/{}-{}.ctcache", dir, category, digest);
+    std::ifstream file(fileName, std::ios::binary);
+    if (!file) {
+        return false;
+    }
+    string header = cacheHeader(digest);
+    string fileHeader(header.size(), '\0');
+    if (!file.read(fileHeader.data(), fileHeader.size()) || fileHeader != header) {
+        return false;
+    }
+    data.assign(std::istreambuf_iterator<char>(file),
+                std::istreambuf_iterator<char>());
+    return true;
+}
+
+void Application::writeCacheEntry(const string& category, const string& key,
+                                  const string& data)
+{
+    string dir = cacheDirectory();
+    if (dir.empty()) {
+        return;
+    }
+    string digest = cacheDigest(category, key);
+    string fileName = fmt::format("{}/{}-{}.ctcache", dir, category, digest);
+    // Write to a temporary file and rename it so that concurrent processes never
+    // read a partially written cache file
+    string tmpName = fmt::format("{}.{}.tmp", fileName, std::random_device()());
+    std::error_code ec;
+    {
+        std::ofstream file(tmpName, std::ios::binary);
+        file << cacheHeader(digest) << data;
+        if (!file) {
+            file.close();
+            std::filesystem::remove(tmpName, ec);
+            return;
+        }
+    }
+    std::filesystem::rename(tmpName, fileName, ec);
+    if (ec) {
+        std::filesystem::remove(tmpName, ec);
+    }
+}
+
 string Application::findInputFile(const string& name)
 {
     std::unique_lock<std::mutex> dirLock(dir_mutex);
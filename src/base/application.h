@@ -239,6 +239,60 @@ public:
         return boost::algorithm::join(inputDirs, sep);
     }
 
+    //! Set the directory used for the persistent cache of parsed input files.
+    /*!
+     * If set, the contents of YAML input files read by AnyMap::fromYamlFile() are
+     * stored in a compact binary format in this directory, keyed by a SHA-256
+     * digest of the file contents and the %Cantera version. Subsequent attempts to
+     * read a file with identical contents, including from other processes, load
+     * the cached representation instead of parsing the YAML file. The directory is
+     * created if it does not exist. Transport property fits are stored in the same
+     * directory; see GasTransport::clearFitCache().
+     *
+     * The cache stores parsed input files, not the objects created from them:
+     * Species and Reaction objects are still created from the cached input on each
+     * load, including conversion of units and validation.
+     *
+     * @param dir  Name of the cache directory. An empty string disables the cache,
+     *     which is the default.
+     *
+     * @ingroup inputGroup
+     * @since New in %Cantera 3.2.
+     */
+    void setCacheDirectory(const string& dir);
+
+    //! Get the directory used for the persistent cache of parsed input files. An
+    //! empty string indicates that the cache is disabled.
+    //!
+    //! @ingroup inputGroup
+    //! @since New in %Cantera 3.2.
+    string cacheDirectory();
+
+    //! Read an entry from the persistent cache.
+    /*!
+     * @param category  Type of data stored in the entry, used as part of the name of
+     *     the cache file
+     * @param key  Data identifying the entry, for example the contents of an input
+     *     file. Entries are identified by a SHA-256 digest of the key, the category
+     *     and the %Cantera version.
+     * @param[out] data  Contents of the entry
+     * @return  `true` if a valid entry written by this version of %Cantera was
+     *     found; `false` if the cache is disabled or no such entry exists.
+     *
+     * @ingroup inputGroup
+     * @since New in %Cantera 3.2.
+     */
+    bool readCacheEntry(const string& category, const string& key, string& data);
+
+    //! Write an entry to the persistent cache. Does nothing if the cache is
+    //! disabled. Failures to write the entry are ignored.
+    //! @see readCacheEntry()
+    //!
+    //! @ingroup inputGroup
+    //! @since New in %Cantera 3.2.
+    void writeCacheEntry(const string& category, const string& key,
+                         const string& data);
+
     //! Load an extension implementing user-defined models
     //! @param extType Specifies the interface / language of the extension, for example
     //!     "python"
@@ -407,6 +461,9 @@ protected:
     //! Current vector of input directories to search for input files
     vector<string> inputDirs;
 
+    //! Directory used for the persistent cache of parsed input files
+    string m_cacheDir;
+
     //! Versions of Python to consider when attempting to load user extensions
     vector<string> m_pythonSearchVersions = {"3.14", "3.13", "3.12"};
 
@@ -166,6 +166,26 @@ string getDataDirectories(const string& sep)
     return app()->getDataDirectories(sep);
 }
 
+void setCacheDirectory(const string& dir)
+{
+    app()->setCacheDirectory(dir);
+}
+
+string cacheDirectory()
+{
+    return app()->cacheDirectory();
+}
+
+bool readCacheEntry(const string& category, const string& key, string& data)
+{
+    return app()->readCacheEntry(category, key, data);
+}
+
+void writeCacheEntry(const string& category, const string& key, const string& data)
+{
+    app()->writeCacheEntry(category, key, data);
+}
+
 string findInputFile(const string& name)
 {
     return app()->findInputFile(name);
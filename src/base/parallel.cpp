@@ -0,0 +1,81 @@
+/**
+ * @file parallel.cpp
+ *    Utilities for distributing independent work items across threads.
+ */
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#include "cantera/base/parallel.h"
+#include "cantera/base/Solution.h"
+#include "cantera/kinetics/Kinetics.h"
+#include "cantera/kinetics/Reaction.h"
+#include "cantera/kinetics/ReactionRateDelegator.h"
+#include <exception>
+#include <thread>
+
+namespace Cantera
+{
+
+size_t hardwareThreads()
+{
+    return std::max<size_t>(std::thread::hardware_concurrency(), 1);
+}
+
+void parallelFor(size_t n, size_t nThreads,
+                 const function<void(size_t, size_t, size_t)>& func)
+{
+    if (nThreads == 0) {
+        nThreads = hardwareThreads();
+    }
+    size_t nWorkers = std::min(n, nThreads);
+    if (nWorkers <= 1) {
+        if (n) {
+            func(0, 0, n);
+        }
+        return;
+    }
+
+    vector<std::exception_ptr> errors(nWorkers);
+    auto work = [&](size_t worker) {
+        // distribute remainder of items across leading workers
+        size_t begin = worker * (n / nWorkers) + std::min(worker, n % nWorkers);
+        size_t end = begin + n / nWorkers + (worker < n % nWorkers ? 1 : 0);
+        try {
+            func(worker, begin, end);
+        } catch (...) {
+            errors[worker] = std::current_exception();
+        }
+    };
+
+    vector<std::thread> threads;
+    threads.reserve(nWorkers - 1);
+    for (size_t worker = 1; worker < nWorkers; worker++) {
+        threads.emplace_back(work, worker);
+    }
+    work(0);
+    for (auto& thread : threads) {
+        thread.join();
+    }
+    for (const auto& err : errors) {
+        if (err) {
+            std::rethrow_exception(err);
+        }
+    }
+}
+
+bool hasDelegatedRates(Solution& sol)
+{
+    auto kin = sol.kinetics();
+    if (!kin) {
+        return false;
+    }
+    for (size_t i = 0; i < kin->nReactions(); i++) {
+        if (dynamic_cast<ReactionRateDelegator*>(kin->reaction(i)->rate().get())) {
+            return true;
+        }
+    }
+    return false;
+}
+
+}
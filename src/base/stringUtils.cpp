@@ -224,4 +224,73 @@ bool caseInsensitiveEquals(const string &input, const string &test) {
     return ba::iequals(input, test);
 }
 
+string sha256(const string& data)
+{
+    static const uint32_t k[64] = {
+        0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1,
+        0x923f82a4, 0xab1c5ed5, 0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3,
+        0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174, 0xe49b69c1, 0xefbe4786,
+        0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+        0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147,
+        0x06ca6351, 0x14292967, 0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13,
+        0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85, 0xa2bfe8a1, 0xa81a664b,
+        0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+        0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a,
+        0x5b9cca4f, 0x682e6ff3, 0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208,
+        0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+    };
+    uint32_t h[8] = {
+        0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a,
+        0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+    };
+    auto rotr = [](uint32_t x, int n) { return (x >> n) | (x << (32 - n)); };
+
+    // Pad the message to a multiple of 64 bytes, ending with its length in bits
+    string msg = data;
+    msg.push_back(static_cast<char>(0x80));
+    while (msg.size() % 64 != 56) {
+        msg.push_back('\0');
+    }
+    uint64_t nBits = static_cast<uint64_t>(data.size()) * 8;
+    for (int i = 7; i >= 0; i--) {
+        msg.push_back(static_cast<char>((nBits >> (8 * i)) & 0xff));
+    }
+
+    uint32_t w[64];
+    for (size_t block = 0; block < msg.size(); block += 64) {
+        for (size_t i = 0; i < 16; i++) {
+            const auto* b = reinterpret_cast<const unsigned char*>(&msg[block + 4 * i]);
+            w[i] = (uint32_t(b[0]) << 24) | (uint32_t(b[1]) << 16)
+                | (uint32_t(b[2]) << 8) | uint32_t(b[3]);
+        }
+        for (size_t i = 16; i < 64; i++) {
+            uint32_t s0 = rotr(w[i-15], 7) ^ rotr(w[i-15], 18) ^ (w[i-15] >> 3);
+            uint32_t s1 = rotr(w[i-2], 17) ^ rotr(w[i-2], 19) ^ (w[i-2] >> 10);
+            w[i] = w[i-16] + s0 + w[i-7] + s1;
+        }
+        uint32_t a[8];
+        std::copy(h, h + 8, a);
+        for (size_t i = 0; i < 64; i++) {
+            uint32_t S1 = rotr(a[4], 6) ^ rotr(a[4], 11) ^ rotr(a[4], 25);
+            uint32_t ch = (a[4] & a[5]) ^ (~a[4] & a[6]);
+            uint32_t t1 = a[7] + S1 + ch + k[i] + w[i];
+            uint32_t S0 = rotr(a[0], 2) ^ rotr(a[0], 13) ^ rotr(a[0], 22);
+            uint32_t maj = (a[0] & a[1]) ^ (a[0] & a[2]) ^ (a[1] & a[2]);
+            uint32_t t2 = S0 + maj;
+            std::copy_backward(a, a + 7, a + 8);
+            a[4] += t1;
+            a[0] = t1 + t2;
+        }
+        for (size_t i = 0; i < 8; i++) {
+            h[i] += a[i];
+        }
+    }
+
+    string digest;
+    for (size_t i = 0; i < 8; i++) {
+        digest += fmt::format("{:08x}", h[i]);
+    }
+    return digest;
+}
+
 }
@@ -3,11 +3,33 @@
 
 #include "cantera/kinetics/BulkKinetics.h"
 #include "cantera/kinetics/Reaction.h"
+#include "cantera/kinetics/PlogRate.h"
 #include "cantera/thermo/ThermoPhase.h"
 
 namespace Cantera
 {
 
+namespace {
+
+//! Determine weights for cubic Lagrange interpolation on a uniform grid.
+//! @param x  Location in units of the grid spacing, where `0 <= x <= n - 1`
+//! @param n  Number of grid points; at least 4
+//! @param[out] start  Index of the first of four grid points used
+//! @param[out] w  Weights of the four grid points
+void cubicWeights(double x, size_t n, size_t& start, double* w)
+{
+    x = std::clamp(x, 0.0, n - 1.0);
+    size_t i = std::min(static_cast<size_t>(x), n - 2);
+    start = (i == 0) ? 0 : std::min(i - 1, n - 4);
+    double t = x - start;
+    w[0] = -(t - 1.0) * (t - 2.0) * (t - 3.0) / 6.0;
+    w[1] = t * (t - 2.0) * (t - 3.0) / 2.0;
+    w[2] = -t * (t - 1.0) * (t - 3.0) / 2.0;
+    w[3] = t * (t - 1.0) * (t - 2.0) / 6.0;
+}
+
+}
+
 BulkKinetics::BulkKinetics() {
     setDerivativeSettings(AnyMap()); // use default settings
 }
@@ -44,6 +66,7 @@ bool BulkKinetics::addReaction(shared_ptr<Reaction> r, bool resize)
         m_rateTypes[rtype] = m_rateHandlers.size();
         m_rateHandlers.push_back(rate->newMultiRate());
         m_rateHandlers.back()->resize(m_kk, nReactions(), nPhases());
+        m_rateCategories.push_back(m_profiler.addCategory(rtype));
     }
 
     // Set index of rate to number of reaction within kinetics
@@ -59,6 +82,7 @@ bool BulkKinetics::addReaction(shared_ptr<Reaction> r, bool resize)
     }
 
     m_concm.push_back(NAN);
+    m_tab_valid = false;
     return true;
 }
 
@@ -104,12 +128,33 @@ void BulkKinetics::modifyReaction(size_t i, shared_ptr<Reaction> rNew)
     rate->setRateIndex(i);
     rate->setContext(*rNew, *this);
     m_rateHandlers[index]->replace(i, *rate);
+    m_tab_valid = false;
     invalidateCache();
 }
 
+void BulkKinetics::setParameters(const AnyMap& phaseNode)
+{
+    Kinetics::setParameters(phaseNode);
+    if (phaseNode.hasKey("rate-tabulation")) {
+        setRateTabulation(phaseNode["rate-tabulation"].as<AnyMap>());
+    }
+}
+
+AnyMap BulkKinetics::parameters() const
+{
+    AnyMap out = Kinetics::parameters();
+    AnyMap tabulation;
+    getRateTabulation(tabulation);
+    if (!tabulation.empty()) {
+        out["rate-tabulation"] = std::move(tabulation);
+    }
+    return out;
+}
+
 void BulkKinetics::resizeSpecies()
 {
     Kinetics::resizeSpecies();
+    m_tab_valid = false;
     m_act_conc.resize(m_kk);
     m_phys_conc.resize(m_kk);
     m_grt.resize(m_kk);
@@ -146,6 +191,7 @@ void BulkKinetics::invalidateCache()
 {
     Kinetics::invalidateCache();
     m_ROP_ok = false;
+    m_deltaGibbs0_ok = false;
 }
 
 void BulkKinetics::getFwdRateConstants(double* kfwd)
@@ -161,6 +207,7 @@ void BulkKinetics::getEquilibriumConstants(double* kc)
 {
     updateROP();
 
+    updateDeltaGibbs0();
     vector<double>& delta_gibbs0 = m_rbuf0;
     fill(delta_gibbs0.begin(), delta_gibbs0.end(), 0.0);
 
@@ -273,6 +320,386 @@ void BulkKinetics::setDerivativeSettings(const AnyMap& settings)
     }
 }
 
+void BulkKinetics::getRateTabulation(AnyMap& settings) const
+{
+    if (m_tab_Tmax == 0.0) {
+        return; // tabulation is disabled
+    }
+    settings["T-range"] = vector<double>{m_tab_Tmin, m_tab_Tmax};
+    if (m_tab_Pmax != 0.0) {
+        settings["P-range"] = vector<double>{m_tab_Pmin, m_tab_Pmax};
+    }
+    settings["rtol"] = m_tab_rtol;
+}
+
+void BulkKinetics::setRateTabulation(const AnyMap& settings)
+{
+    double Tmin = 0.0, Tmax = 0.0, Pmin = 0.0, Pmax = 0.0;
+    double rtol = settings.getDouble("rtol", 1e-4);
+    if (!settings.empty()) {
+        auto T = settings.convertVector("T-range", "K", 2);
+        Tmin = T[0];
+        Tmax = T[1];
+        if (Tmin <= 0.0 || Tmax <= Tmin) {
+            throw CanteraError("BulkKinetics::setRateTabulation",
+                "Invalid temperature range [{}, {}].", Tmin, Tmax);
+        }
+        if (settings.hasKey("P-range")) {
+            auto P = settings.convertVector("P-range", "Pa", 2);
+            Pmin = P[0];
+            Pmax = P[1];
+            if (Pmin <= 0.0 || Pmax <= Pmin) {
+                throw CanteraError("BulkKinetics::setRateTabulation",
+                    "Invalid pressure range [{}, {}].", Pmin, Pmax);
+            }
+        }
+        if (rtol <= 0.0) {
+            throw CanteraError("BulkKinetics::setRateTabulation",
+                "Relative tolerance must be positive; got {}.", rtol);
+        }
+    }
+    m_tab_Tmin = Tmin;
+    m_tab_Tmax = Tmax;
+    m_tab_Pmin = Pmin;
+    m_tab_Pmax = Pmax;
+    m_tab_rtol = rtol;
+    m_tab_valid = false;
+    m_tables.reset();
+
+    // force re-evaluation of all rate constants
+    for (auto& rates : m_rateHandlers) {
+        rates->resize(nTotalSpecies(), nReactions(), nPhases());
+    }
+    invalidateCache();
+}
+
+void BulkKinetics::buildRateTables()
+{
+    auto tables = make_shared<RateTables>();
+    tables->index.assign(m_rateHandlers.size(), npos);
+
+    // For ideal gases, standard state properties and reaction enthalpies depend
+    // on temperature only
+    bool idealGas = thermo().type() == "ideal-gas";
+    vector<double> state;
+    thermo().saveState(state);
+
+    vector<vector<size_t>> handlerReactions(m_rateHandlers.size());
+    for (size_t i = 0; i < nReactions(); i++) {
+        auto rate = reaction(i)->rate();
+        string rtype = rate->subType();
+        if (rtype == "") {
+            rtype = rate->type();
+        }
+        handlerReactions[m_rateTypes.at(rtype)].push_back(i);
+    }
+
+    for (size_t h = 0; h < m_rateHandlers.size(); h++) {
+        auto& rates = m_rateHandlers[h];
+        string rtype = rates->type();
+        if (rtype == "pressure-dependent-Arrhenius") {
+            if (buildPlogTable(handlerReactions[h], tables->plog)) {
+                tables->plogHandler = h;
+            }
+            continue;
+        }
+        bool pdep = rtype == "Chebyshev";
+        if (rtype != "Arrhenius" && !(rtype == "Blowers-Masel" && idealGas)
+            && !(pdep && m_tab_Pmax != 0.0))
+        {
+            // Rate depends on composition or on a pressure range that is not
+            // tabulated
+            continue;
+        }
+        RateTable table;
+        table.reactions = handlerReactions[h];
+        table.logarithmic = pdep;
+        auto eval = [this, &rates](double T, double P, double* kf) {
+            thermo().setState_TP(T, P);
+            rates->update(thermo(), *this);
+            rates->getRateConstants(kf);
+        };
+        if (tabulate(table, pdep, eval)) {
+            tables->index[h] = tables->rates.size();
+            tables->rates.push_back(std::move(table));
+        }
+        // discard data cached for the last grid point
+        rates->resize(nTotalSpecies(), nReactions(), nPhases());
+    }
+
+    if (idealGas && !m_revindex.empty()) {
+        tables->rkcn.reactions = m_revindex;
+        auto eval = [this](double T, double P, double* rkcn) {
+            thermo().setState_TP(T, P);
+            vector<double>& grt = m_sbuf0;
+            vector<double>& delta_gibbs0 = m_rbuf2;
+            thermo().getStandardChemPotentials(grt.data());
+            fill(delta_gibbs0.begin(), delta_gibbs0.end(), 0.0);
+            getRevReactionDelta(grt.data(), delta_gibbs0.data());
+            double rrt = 1.0 / thermo().RT();
+            double logStandConc = log(thermo().standardConcentration());
+            for (size_t irxn : m_revindex) {
+                rkcn[irxn] = std::min(
+                    exp(delta_gibbs0[irxn] * rrt - m_dn[irxn] * logStandConc),
+                    BigNumber);
+            }
+        };
+        if (!tabulate(tables->rkcn, false, eval)) {
+            tables->rkcn = RateTable();
+        }
+    }
+
+    thermo().restoreState(state);
+    m_tables = std::move(tables);
+    invalidateCache();
+    m_tab_valid = true;
+}
+
+bool BulkKinetics::buildPlogTable(const vector<size_t>& reactions, PlogTable& plog)
+{
+    // Group the rate expressions of each reaction by pressure. Each group forms a
+    // column of the table, where the rate constant is the sum of the rate
+    // expressions of the group.
+    vector<vector<ArrheniusRate>> columns;
+    plog.reactions = reactions;
+    plog.start.clear();
+    plog.logP.clear();
+    for (size_t i : reactions) {
+        plog.start.push_back(columns.size());
+        auto& rate = dynamic_cast<PlogRate&>(*reaction(i)->rate());
+        for (const auto& [pressure, arrhenius] : rate.getRates()) {
+            double logP = log(pressure);
+            if (columns.size() > plog.start.back() && plog.logP.back() == logP) {
+                // another rate expression at the same pressure
+                columns.back().push_back(arrhenius);
+            } else {
+                plog.logP.push_back(logP);
+                columns.push_back({arrhenius});
+            }
+        }
+    }
+    plog.start.push_back(columns.size());
+
+    plog.table = RateTable();
+    plog.table.logarithmic = true;
+    for (size_t j = 0; j < columns.size(); j++) {
+        plog.table.reactions.push_back(j);
+    }
+    auto eval = [&columns](double T, double P, double* k) {
+        double logT = log(T);
+        double recipT = 1.0 / T;
+        for (size_t j = 0; j < columns.size(); j++) {
+            k[j] = 0.0;
+            for (const auto& arrhenius : columns[j]) {
+                k[j] += arrhenius.evalRate(logT, recipT);
+            }
+        }
+    };
+    return tabulate(plog.table, false, eval);
+}
+
+bool BulkKinetics::tabulate(RateTable& table, bool pdep,
+                            const std::function<void(double, double, double*)>& eval)
+{
+    const size_t maxPointsT = 4097;
+    const size_t maxPointsP = 65;
+    size_t nR = table.reactions.size();
+    double uMin = 1.0 / m_tab_Tmax;
+    double uMax = 1.0 / m_tab_Tmin;
+    double logPmin = pdep ? log(m_tab_Pmin) : 0.0;
+    double logPmax = pdep ? log(m_tab_Pmax) : 0.0;
+    double P = thermo().pressure();
+    size_t nBuf = nReactions();
+    for (size_t j : table.reactions) {
+        nBuf = std::max(nBuf, j + 1);
+    }
+    vector<double> buf(nBuf);
+
+    size_t nT = 9;
+    size_t nP = pdep ? 5 : 1;
+    while (nT <= maxPointsT && nP <= maxPointsP) {
+        // Evaluate values on a grid with twice the resolution of the table
+        size_t mT = 2 * nT - 1;
+        size_t mP = pdep ? 2 * nP - 1 : 1;
+        vector<double> temperatures(mT), logPressures(mP, logPmin);
+        for (size_t i = 0; i < mT; i++) {
+            temperatures[i] = 1.0 / (uMin + (uMax - uMin) * i / (mT - 1));
+        }
+        for (size_t k = 1; k < mP; k++) {
+            logPressures[k] = logPmin + (logPmax - logPmin) * k / (mP - 1);
+        }
+        vector<double> fine(mT * mP * nR);
+        for (size_t k = 0; k < mP; k++) {
+            for (size_t i = 0; i < mT; i++) {
+                eval(temperatures[i], pdep ? exp(logPressures[k]) : P, buf.data());
+                double* row = &fine[(k * mT + i) * nR];
+                for (size_t j = 0; j < nR; j++) {
+                    row[j] = buf[table.reactions[j]];
+                }
+                if (table.logarithmic) {
+                    for (size_t j = 0; j < nR; j++) {
+                        row[j] = log(std::max(row[j], SmallNumber));
+                    }
+                }
+            }
+        }
+
+        // The table consists of every other point of the fine grid
+        table.nT = nT;
+        table.nP = nP;
+        table.values.resize(nT * nP * nR);
+        for (size_t k = 0; k < nP; k++) {
+            for (size_t i = 0; i < nT; i++) {
+                std::copy_n(&fine[(2 * k * mT + 2 * i) * nR], nR,
+                       &table.values[(k * nT + i) * nR]);
+            }
+        }
+
+        // Estimate the interpolation error at the remaining points of the fine
+        // grid. Values limited to BigNumber are not checked.
+        bool convergedT = true;
+        bool convergedP = true;
+        for (size_t k = 0; k < mP; k++) {
+            for (size_t i = 0; i < mT; i++) {
+                if (i % 2 == k % 2) {
+                    // skip table points and points that are intermediate in both
+                    // directions
+                    continue;
+                }
+                interpolate(table, temperatures[i], logPressures[k], buf.data());
+                const double* row = &fine[(k * mT + i) * nR];
+                for (size_t j = 0; j < nR; j++) {
+                    double exact = table.logarithmic ? exp(row[j]) : row[j];
+                    if (std::abs(exact) < BigNumber &&
+                        std::abs(buf[table.reactions[j]] - exact)
+                            > m_tab_rtol * std::abs(exact))
+                    {
+                        convergedT &= (i % 2 == 0);
+                        convergedP &= (k % 2 == 0);
+                        break;
+                    }
+                }
+            }
+        }
+        if (convergedT && convergedP) {
+            return true;
+        }
+        nT = convergedT ? nT : mT;
+        nP = convergedP ? nP : mP;
+    }
+    table.values.clear();
+    return false;
+}
+
+void BulkKinetics::interpolate(const RateTable& table, double T, double logP,
+                               double* out) const
+{
+    size_t nR = table.reactions.size();
+    double uMin = 1.0 / m_tab_Tmax;
+    double du = (1.0 / m_tab_Tmin - uMin) / (table.nT - 1);
+    size_t iT;
+    double wT[4];
+    cubicWeights((1.0 / T - uMin) / du, table.nT, iT, wT);
+
+    size_t iP = 0;
+    size_t mP = 1;
+    double wP[4] = {1.0, 0.0, 0.0, 0.0};
+    if (table.nP > 1) {
+        double logPmin = log(m_tab_Pmin);
+        double dlogP = (log(m_tab_Pmax) - logPmin) / (table.nP - 1);
+        cubicWeights((logP - logPmin) / dlogP, table.nP, iP, wP);
+        mP = 4;
+    }
+
+    for (size_t j = 0; j < nR; j++) {
+        out[table.reactions[j]] = 0.0;
+    }
+    for (size_t k = 0; k < mP; k++) {
+        for (size_t i = 0; i < 4; i++) {
+            double w = wP[k] * wT[i];
+            const double* row = &table.values[((iP + k) * table.nT + iT + i) * nR];
+            for (size_t j = 0; j < nR; j++) {
+                out[table.reactions[j]] += w * row[j];
+            }
+        }
+    }
+    if (table.logarithmic) {
+        for (size_t j = 0; j < nR; j++) {
+            out[table.reactions[j]] = exp(out[table.reactions[j]]);
+        }
+    }
+}
+
+void BulkKinetics::interpolate(const PlogTable& plog, double T, double logP,
+                               double* out) const
+{
+    const RateTable& table = plog.table;
+    size_t nC = table.reactions.size();
+    double uMin = 1.0 / m_tab_Tmax;
+    double du = (1.0 / m_tab_Tmin - uMin) / (table.nT - 1);
+    size_t iT;
+    double wT[4];
+    cubicWeights((1.0 / T - uMin) / du, table.nT, iT, wT);
+    auto logRate = [&](size_t c) {
+        double value = 0.0;
+        for (size_t i = 0; i < 4; i++) {
+            value += wT[i] * table.values[(iT + i) * nC + c];
+        }
+        return value;
+    };
+
+    for (size_t j = 0; j < plog.reactions.size(); j++) {
+        // Outside of the pressure range of a reaction, the rate expression at the
+        // nearest pressure is used, as done by PlogRate
+        size_t first = plog.start[j];
+        size_t last = plog.start[j + 1] - 1;
+        auto begin = plog.logP.begin();
+        size_t c = std::upper_bound(begin + first, begin + last + 1, logP) - begin;
+        double logk;
+        if (c == first) {
+            logk = logRate(first);
+        } else if (c > last) {
+            logk = logRate(last);
+        } else {
+            double logk1 = logRate(c - 1);
+            double logk2 = logRate(c);
+            logk = logk1 + (logk2 - logk1) * (logP - plog.logP[c - 1])
+                / (plog.logP[c] - plog.logP[c - 1]);
+        }
+        out[plog.reactions[j]] = exp(logk);
+    }
+}
+
+void BulkKinetics::updateDeltaGibbs0()
+{
+    if (m_deltaGibbs0_ok) {
+        return;
+    }
+    thermo().getStandardChemPotentials(m_grt.data());
+    fill(m_delta_gibbs0.begin(), m_delta_gibbs0.end(), 0.0);
+
+    // compute Delta G^0 for all reversible reactions
+    getRevReactionDelta(m_grt.data(), m_delta_gibbs0.data());
+    m_deltaGibbs0_ok = true;
+}
+
+void BulkKinetics::shareWithClone(Kinetics& clone) const
+{
+    auto other = dynamic_cast<BulkKinetics*>(&clone);
+    if (!m_tab_valid || !other || other->thermo().type() != thermo().type()) {
+        return;
+    }
+    if (other->m_tab_Tmin == m_tab_Tmin && other->m_tab_Tmax == m_tab_Tmax
+        && other->m_tab_Pmin == m_tab_Pmin && other->m_tab_Pmax == m_tab_Pmax
+        && other->m_tab_rtol == m_tab_rtol)
+    {
+        // The clone has the same reactions, added in the same order, so rate
+        // evaluators have the same indices
+        other->m_tables = m_tables;
+        other->m_tab_valid = true;
+    }
+}
+
 void BulkKinetics::getFwdRateConstants_ddT(double* dkfwd)
 {
     assertDerivativesValid("BulkKinetics::getFwdRateConstants_ddT");
@@ -448,26 +875,33 @@ Eigen::SparseMatrix<double> BulkKinetics::netRatesOfProgress_ddCi()
 
 void BulkKinetics::updateROP()
 {
+    if (m_tab_Tmax != 0.0 && !m_tab_valid) {
+        buildRateTables();
+    }
     static const int cacheId = m_cache.getId();
     CachedScalar last = m_cache.getScalar(cacheId);
     double T = thermo().temperature();
     double rho = thermo().density();
     int statenum = thermo().stateMFNumber();
+    bool tabulateT = m_tab_valid && T >= m_tab_Tmin && T <= m_tab_Tmax;
 
     if (last.state1 != T || last.state2 != rho) {
         // Update properties that are independent of the composition
-        thermo().getStandardChemPotentials(m_grt.data());
-        fill(m_delta_gibbs0.begin(), m_delta_gibbs0.end(), 0.0);
-        double logStandConc = log(thermo().standardConcentration());
-
-        // compute Delta G^0 for all reversible reactions
-        getRevReactionDelta(m_grt.data(), m_delta_gibbs0.data());
-
-        double rrt = 1.0 / thermo().RT();
-        for (size_t i = 0; i < m_revindex.size(); i++) {
-            size_t irxn = m_revindex[i];
-            m_rkcn[irxn] = std::min(
-                exp(m_delta_gibbs0[irxn] * rrt - m_dn[irxn] * logStandConc), BigNumber);
+        ProfileTimer timer(&m_profiler, KineticsProfiler::equilibriumConstants);
+        m_deltaGibbs0_ok = false;
+        if (tabulateT && m_tables->rkcn.nT) {
+            // Delta G^0 is only calculated if needed by other methods
+            interpolate(m_tables->rkcn, T, 0.0, m_rkcn.data());
+        } else {
+            updateDeltaGibbs0();
+            double logStandConc = log(thermo().standardConcentration());
+            double rrt = 1.0 / thermo().RT();
+            for (size_t i = 0; i < m_revindex.size(); i++) {
+                size_t irxn = m_revindex[i];
+                m_rkcn[irxn] = std::min(
+                    exp(m_delta_gibbs0[irxn] * rrt - m_dn[irxn] * logStandConc),
+                    BigNumber);
+            }
         }
 
         for (size_t i = 0; i != m_irrev.size(); ++i) {
@@ -482,15 +916,29 @@ void BulkKinetics::updateROP()
         double ctot = thermo().molarDensity();
 
         // Third-body objects interacting with MultiRate evaluator
+        ProfileTimer timer(&m_profiler, KineticsProfiler::thirdBodies);
         m_multi_concm.update(m_phys_conc, ctot, m_concm.data());
         m_ROP_ok = false;
     }
 
+    double P = thermo().pressure();
+    bool tabulateP = tabulateT && P >= m_tab_Pmin && P <= m_tab_Pmax;
+    double logP = tabulateT ? log(P) : 0.0;
+
     // loop over MultiRate evaluators for each reaction type
-    for (auto& rates : m_rateHandlers) {
+    for (size_t h = 0; h < m_rateHandlers.size(); h++) {
+        auto& rates = m_rateHandlers[h];
+        ProfileTimer timer(&m_profiler, m_rateCategories[h]);
         bool changed = rates->update(thermo(), *this);
         if (changed) {
-            rates->getRateConstants(m_kf0.data());
+            size_t itab = tabulateT ? m_tables->index[h] : npos;
+            if (itab != npos && (m_tables->rates[itab].nP == 1 || tabulateP)) {
+                interpolate(m_tables->rates[itab], T, logP, m_kf0.data());
+            } else if (tabulateT && h == m_tables->plogHandler) {
+                interpolate(m_tables->plog, T, logP, m_kf0.data());
+            } else {
+                rates->getRateConstants(m_kf0.data());
+            }
             m_ROP_ok = false;
         }
     }
@@ -507,19 +955,30 @@ void BulkKinetics::updateROP()
     }
 
     copy(m_rfn.begin(), m_rfn.end(), m_ropf.data());
-    processThirdBodies(m_ropf.data());
+    {
+        ProfileTimer timer(&m_profiler, KineticsProfiler::thirdBodies, true, 0);
+        processThirdBodies(m_ropf.data());
+    }
     copy(m_ropf.begin(), m_ropf.end(), m_ropr.begin());
 
     // for reversible reactions, multiply ropr by concentration products
-    applyEquilibriumConstants(m_ropr.data());
+    {
+        ProfileTimer timer(&m_profiler, KineticsProfiler::equilibriumConstants,
+                           true, 0);
+        applyEquilibriumConstants(m_ropr.data());
+    }
 
-    for (auto& rates : m_rateHandlers) {
-        rates->modifyRateConstants(m_ropf.data(), m_ropr.data());
+    for (size_t h = 0; h < m_rateHandlers.size(); h++) {
+        ProfileTimer timer(&m_profiler, m_rateCategories[h], true, 0);
+        m_rateHandlers[h]->modifyRateConstants(m_ropf.data(), m_ropr.data());
     }
 
     // multiply ropf and ropr by concentration products
-    m_reactantStoich.multiply(m_act_conc.data(), m_ropf.data());
-    m_revProductStoich.multiply(m_act_conc.data(), m_ropr.data());
+    {
+        ProfileTimer timer(&m_profiler, KineticsProfiler::stoichiometry);
+        m_reactantStoich.multiply(m_act_conc.data(), m_ropf.data());
+        m_revProductStoich.multiply(m_act_conc.data(), m_ropr.data());
+    }
 
     for (size_t j = 0; j != nReactions(); ++j) {
         m_ropnet[j] = m_ropf[j] - m_ropr[j];
@@ -561,6 +1020,7 @@ void BulkKinetics::applyEquilibriumConstants(double* rop)
 
 void BulkKinetics::applyEquilibriumConstants_ddT(double* drkcn)
 {
+    updateDeltaGibbs0();
     double T = thermo().temperature();
     double P = thermo().pressure();
     double rrt = 1. / thermo().RT();
@@ -598,8 +1058,9 @@ void BulkKinetics::process_ddT(const vector<double>& in, double* drop)
 {
     // apply temperature derivative
     copy(in.begin(), in.end(), drop);
+    const double* kf = directRateConstants();
     for (auto& rates : m_rateHandlers) {
-        rates->processRateConstants_ddT(drop, m_rfn.data(), m_jac_rtol_delta);
+        rates->processRateConstants_ddT(drop, kf, m_jac_rtol_delta);
     }
 }
 
@@ -607,9 +1068,25 @@ void BulkKinetics::process_ddP(const vector<double>& in, double* drop)
 {
     // apply pressure derivative
     copy(in.begin(), in.end(), drop);
+    const double* kf = directRateConstants();
+    for (auto& rates : m_rateHandlers) {
+        rates->processRateConstants_ddP(drop, kf, m_jac_rtol_delta);
+    }
+}
+
+const double* BulkKinetics::directRateConstants()
+{
+    if (!m_tab_valid) {
+        return m_rfn.data();
+    }
+    vector<double>& kf = m_rbuf0;
     for (auto& rates : m_rateHandlers) {
-        rates->processRateConstants_ddP(drop, m_rfn.data(), m_jac_rtol_delta);
+        rates->getRateConstants(kf.data());
+    }
+    for (size_t i = 0; i < nReactions(); ++i) {
+        kf[i] *= m_perturb[i];
     }
+    return kf.data();
 }
 
 void BulkKinetics::process_ddC(StoichManagerN& stoich, const vector<double>& in,
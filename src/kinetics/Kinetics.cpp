@@ -13,6 +13,8 @@
 #include "cantera/kinetics/KineticsFactory.h"
 #include "cantera/kinetics/Reaction.h"
 #include "cantera/thermo/ThermoPhase.h"
+#include "cantera/base/Solution.h"
+#include "cantera/base/SolutionArray.h"
 #include "cantera/base/stringUtils.h"
 #include "cantera/base/utilities.h"
 #include "cantera/base/global.h"
@@ -27,16 +29,33 @@ namespace Cantera
 shared_ptr<Kinetics> Kinetics::clone(
     const vector<shared_ptr<ThermoPhase>>& phases) const
 {
-    vector<AnyMap> reactionDefs;
-    for (size_t i = 0; i < nReactions(); i++) {
-        reactionDefs.push_back(reaction(i)->parameters());
-    }
     AnyMap phaseNode = parameters();
-    phaseNode["__fix-duplicate-reactions__"] = true;
-    AnyMap rootNode;
-    rootNode["reactions"] = std::move(reactionDefs);
-    rootNode.applyUnits();
-    return newKinetics(phases, phaseNode, rootNode, phases[0]->root());
+    phaseNode["reactions"] = "none";
+    auto kin = newKinetics(phases, phaseNode, AnyMap(), phases[0]->root());
+
+    // Reactions can be modified in place, so the clone needs its own Reaction
+    // objects. These are created individually, which avoids assembling and
+    // re-checking the complete mechanism, as duplicate reactions have already
+    // been marked or fixed.
+    for (const auto& r : m_reactions) {
+        AnyMap rxnDef = r->parameters();
+        rxnDef.applyUnits();
+        shared_ptr<Reaction> rNew = newReaction(rxnDef, *kin);
+        if (!kin->addReaction(rNew, false)) {
+            throw CanteraError("Kinetics::clone",
+                "Unable to add reaction '{}' to cloned Kinetics object.",
+                r->equation());
+        }
+    }
+    kin->resizeReactions();
+    // The clone has the same reactions as this object, so the stoichiometric data
+    // is shared instead of keeping a separate copy for each clone. The data is
+    // copied when reactions are added to either object.
+    kin->m_reactantStoich = m_reactantStoich;
+    kin->m_productStoich = m_productStoich;
+    kin->m_revProductStoich = m_revProductStoich;
+    shareWithClone(*kin);
+    return kin;
 }
 
 size_t Kinetics::checkReactionIndex(size_t i) const
@@ -415,6 +434,7 @@ void Kinetics::getCreationRates(double* cdot)
     // zero out the output array
     fill(cdot, cdot + m_kk, 0.0);
 
+    ProfileTimer timer(&m_profiler, KineticsProfiler::stoichiometry);
     // the forward direction creates product species
     m_productStoich.incrementSpecies(m_ropf.data(), cdot);
 
@@ -427,6 +447,7 @@ void Kinetics::getDestructionRates(double* ddot)
     updateROP();
 
     fill(ddot, ddot + m_kk, 0.0);
+    ProfileTimer timer(&m_profiler, KineticsProfiler::stoichiometry);
     // the reverse direction destroys products in reversible reactions
     m_revProductStoich.incrementSpecies(m_ropr.data(), ddot);
     // the forward direction destroys reactants
@@ -438,6 +459,7 @@ void Kinetics::getNetProductionRates(double* net)
     updateROP();
 
     fill(net, net + m_kk, 0.0);
+    ProfileTimer timer(&m_profiler, KineticsProfiler::stoichiometry);
     // products are created for positive net rate of progress
     m_productStoich.incrementSpecies(m_ropnet.data(), net);
     // reactants are destroyed for positive net rate of progress
@@ -590,6 +612,39 @@ Eigen::SparseMatrix<double> Kinetics::netProductionRates_ddCi()
     return m_stoichMatrix * netRatesOfProgress_ddCi();
 }
 
+void Kinetics::evalBatch(const string& property, size_t nStates, const double* T,
+                         const double* P, const double* Y, double* out,
+                         size_t nThreads)
+{
+    auto sol = root();
+    if (!sol) {
+        throw CanteraError("Kinetics::evalBatch",
+            "Kinetics object is not associated with a Solution object.");
+    }
+    auto states = SolutionArray::create(sol, static_cast<int>(nStates));
+    states->setNumThreads(nThreads);
+    if (nThreads != 1) {
+        if (!m_batchWorkers || m_batchWorkersCacheNum != m_cacheNum) {
+            // cloned Kinetics objects do not reflect modified reactions or settings
+            m_batchWorkers = make_shared<vector<shared_ptr<Solution>>>();
+            m_batchWorkersCacheNum = m_cacheNum;
+        }
+        states->setWorkers(m_batchWorkers);
+    }
+
+    auto& phase = *sol->thermo();
+    vector<double> saved(phase.stateSize());
+    phase.saveState(saved);
+    try {
+        states->setStates("TPY", T, P, Y, true);
+        states->evalProperty(property, out);
+    } catch (...) {
+        phase.restoreState(saved);
+        throw;
+    }
+    phase.restoreState(saved);
+}
+
 void Kinetics::addThermo(shared_ptr<ThermoPhase> thermo)
 {
     // the phase with lowest dimensionality is assumed to be the
@@ -0,0 +1,18 @@
+//! @file KineticsProfiler.cpp
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#include "cantera/kinetics/KineticsProfiler.h"
+
+namespace Cantera
+{
+
+KineticsProfiler::KineticsProfiler()
+{
+    addCategory("equilibrium-constants");
+    addCategory("third-bodies");
+    addCategory("stoichiometry");
+}
+
+}
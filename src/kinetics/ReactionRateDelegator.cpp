@@ -56,6 +56,44 @@ ReactionRateDelegator::ReactionRateDelegator()
     install("validate", m_validate,
         [](const string& equation, void* soln) {
             throw NotImplementedError("ReactionRateDelegator::validate"); });
+    install("getBatchParameters", m_getBatchParameters,
+        [](std::array<size_t, 1> sizes, double* params) {
+            throw NotImplementedError("ReactionRateDelegator::getBatchParameters"); });
+    install("evalBatch", m_evalBatch,
+        [](std::array<size_t, 2> sizes, void* data, double* params, double* kf) {
+            throw NotImplementedError("ReactionRateDelegator::evalBatch"); });
+}
+
+bool ReactionRateDelegator::evalMultipleFromStruct(
+    vector<pair<size_t, ReactionRateDelegator>>& rates,
+    ReactionDataDelegator& shared_data, double* kf)
+{
+    if (rates.empty() || rates[0].second.m_nBatchParameters == npos) {
+        return false;
+    }
+    size_t nRates = rates.size();
+    size_t nParams = rates[0].second.m_nBatchParameters;
+    auto& params = shared_data.batchParameters;
+    if (params.size() != nRates * nParams) {
+        params.resize(nRates * nParams);
+        for (size_t i = 0; i < nRates; i++) {
+            auto& rate = rates[i].second;
+            if (rate.m_nBatchParameters != nParams) {
+                throw CanteraError("ReactionRateDelegator::evalMultipleFromStruct",
+                    "Inconsistent number of batch parameters for rates of type '{}'.",
+                    rate.m_rateType);
+            }
+            rate.m_getBatchParameters({nParams}, params.data() + i * nParams);
+        }
+    }
+    auto& out = shared_data.batchRates;
+    out.resize(nRates);
+    rates[0].second.m_evalBatch({nRates * nParams, nRates},
+        shared_data.getWrapper()->get(), params.data(), out.data());
+    for (size_t i = 0; i < nRates; i++) {
+        kf[rates[i].first] = out[i];
+    }
+    return true;
 }
 
 unique_ptr<MultiRateBase> ReactionRateDelegator::newMultiRate() const
@@ -4,6 +4,7 @@
 // at https://cantera.org/license.txt for license and copyright information.
 
 #include "cantera/numerics/CVodesIntegrator.h"
+#include "cantera/numerics/SystemJacobianFactory.h"
 #include "cantera/base/stringUtils.h"
 
 #include <iostream>
@@ -87,6 +88,57 @@ extern "C" {
         return f->preconditioner_solve_nothrow(NV_DATA_S(r),NV_DATA_S(z));
     }
 
+    //! @name Sparse direct linear solver
+    //! Callbacks of the matrix-embedded SUNLinearSolver used for the `"SPARSE"`
+    //! linear solver type. The content of the linear solver object is the CVODES
+    //! memory block, which provides the current time, predicted state and gamma.
+    //! The Newton matrix M = I - gamma * J is formed and factorized by the
+    //! SystemJacobian attached to the integrator.
+    //! @{
+
+    static SUNLinearSolver_Type sparse_direct_gettype(SUNLinearSolver LS)
+    {
+        return SUNLINEARSOLVER_MATRIX_EMBEDDED;
+    }
+
+    static int sparse_direct_setup(SUNLinearSolver LS, SUNMatrix A)
+    {
+        sunrealtype t, gamma, rl1;
+        N_Vector ypred, yn, fn, zn1;
+        void* f_data;
+        int flag = CVodeGetNonlinearSystemData(LS->content, &t, &ypred, &yn, &fn,
+                                               &gamma, &rl1, &zn1, &f_data);
+        if (flag != CV_SUCCESS) {
+            return -1;
+        }
+        FuncEval* f = (FuncEval*) f_data;
+        return f->preconditioner_setup_nothrow(t, NV_DATA_S(ypred), gamma);
+    }
+
+    static int sparse_direct_solve(SUNLinearSolver LS, SUNMatrix A, N_Vector x,
+                                   N_Vector b, sunrealtype tol)
+    {
+        sunrealtype t, gamma, rl1;
+        N_Vector ypred, yn, fn, zn1;
+        void* f_data;
+        int flag = CVodeGetNonlinearSystemData(LS->content, &t, &ypred, &yn, &fn,
+                                               &gamma, &rl1, &zn1, &f_data);
+        if (flag != CV_SUCCESS) {
+            return -1;
+        }
+        FuncEval* f = (FuncEval*) f_data;
+        return f->preconditioner_solve_nothrow(NV_DATA_S(b), NV_DATA_S(x));
+    }
+
+    static int sparse_direct_free(SUNLinearSolver LS)
+    {
+        // The content is owned by CVodesIntegrator and must not be released here
+        LS->content = nullptr;
+        SUNLinSolFreeEmpty(LS);
+        return 0;
+    }
+    //! @}
+
     /**
      * SUNDIALS callback that forwards root evaluations to the FuncEval.
      * @param[in] t Current integration time at which roots are requested
@@ -285,9 +337,7 @@ void CVodesIntegrator::initialize(double t0, FuncEval& func)
     m_func = &func;
     func.clearErrors();
     // Initialize preconditioner if applied
-    if (m_prec_side != PreconditionerSide::NO_PRECONDITION) {
-        m_preconditioner->initialize(m_neq);
-    }
+    initializeSystemJacobian();
     if (m_y) {
         N_VDestroy_Serial(m_y); // free solution vector if already allocated
     }
@@ -367,9 +417,7 @@ void CVodesIntegrator::reinitialize(double t0, FuncEval& func)
     m_func = &func;
     func.clearErrors();
     // reinitialize preconditioner if applied
-    if (m_prec_side != PreconditionerSide::NO_PRECONDITION) {
-        m_preconditioner->initialize(m_neq);
-    }
+    initializeSystemJacobian();
     int result = CVodeReInit(m_cvode_mem, m_t0, m_y);
     checkError(result, "reinitialize", "CVodeReInit");
     m_nRootFunctions = npos;
@@ -377,6 +425,16 @@ void CVodesIntegrator::reinitialize(double t0, FuncEval& func)
     applyOptions();
 }
 
+void CVodesIntegrator::initializeSystemJacobian()
+{
+    if (m_type == "SPARSE" && !m_preconditioner) {
+        m_preconditioner = newSystemJacobian("eigen-sparse-direct");
+    }
+    if (m_prec_side != PreconditionerSide::NO_PRECONDITION || m_type == "SPARSE") {
+        m_preconditioner->initialize(m_neq);
+    }
+}
+
 void CVodesIntegrator::applyOptions()
 {
     if (m_type == "DENSE") {
@@ -451,6 +509,31 @@ void CVodesIntegrator::applyOptions()
         #endif
             CVodeSetLinearSolver(m_cvode_mem, (SUNLinearSolver) m_linsol,
                                 (SUNMatrix) m_linsol_matrix);
+    } else if (m_type == "SPARSE") {
+        // The Newton iteration matrix is formed and factorized by the attached
+        // SystemJacobian, which is therefore used as a solver and not a preconditioner
+        if (m_prec_side != PreconditionerSide::NO_PRECONDITION) {
+            throw CanteraError("CVodesIntegrator::applyOptions",
+                "The sparse direct linear solver requires a system Jacobian with "
+                "preconditioner side 'none', but side '{}' was specified.",
+                m_preconditioner->preconditionerSide());
+        }
+        SUNLinSolFree((SUNLinearSolver) m_linsol);
+        SUNMatDestroy((SUNMatrix) m_linsol_matrix);
+        m_linsol_matrix = nullptr;
+        SUNLinearSolver LS = SUNLinSolNewEmpty(m_sundials_ctx.get());
+        if (LS == nullptr) {
+            throw CanteraError("CVodesIntegrator::applyOptions",
+                "Error creating Sundials sparse direct linear solver object");
+        }
+        LS->content = m_cvode_mem;
+        LS->ops->gettype = sparse_direct_gettype;
+        LS->ops->setup = sparse_direct_setup;
+        LS->ops->solve = sparse_direct_solve;
+        LS->ops->free = sparse_direct_free;
+        m_linsol = LS;
+        int flag = CVodeSetLinearSolver(m_cvode_mem, LS, nullptr);
+        checkError(flag, "applyOptions", "CVodeSetLinearSolver");
     } else {
         throw CanteraError("CVodesIntegrator::applyOptions",
                            "unsupported linear solver flag '{}'", m_type);
@@ -0,0 +1,44 @@
+//! @file SolverProfiler.cpp
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#include "cantera/numerics/SolverProfiler.h"
+
+namespace Cantera
+{
+
+SolverProfiler::SolverProfiler()
+{
+    for (size_t i = 0; i < static_cast<size_t>(SolverPhase::count_); i++) {
+        addCategory(phaseName(static_cast<SolverPhase>(i)));
+    }
+}
+
+string SolverProfiler::phaseName(SolverPhase phase)
+{
+    switch (phase) {
+    case SolverPhase::residual:
+        return "residual";
+    case SolverPhase::jacobian:
+        return "jacobian";
+    case SolverPhase::factorization:
+        return "factorization";
+    case SolverPhase::linearSolve:
+        return "linear_solve";
+    case SolverPhase::thermo:
+        return "thermo";
+    case SolverPhase::kinetics:
+        return "kinetics";
+    case SolverPhase::transport:
+        return "transport";
+    case SolverPhase::refinement:
+        return "refinement";
+    case SolverPhase::timeStepping:
+        return "time_stepping";
+    default:
+        throw CanteraError("SolverProfiler::phaseName", "Invalid solver phase.");
+    }
+}
+
+}
@@ -52,6 +52,7 @@ void SteadyStateSystem::solve(int loglevel)
         if (!m_jac_ok) {
             evalJacobian(m_state->data());
             try {
+                PhaseTimer timer(&m_profiler, SolverPhase::factorization);
                 m_jac->updateTransient(m_rdt, m_mask.data());
                 m_jac_ok = true;
             } catch (CanteraError& err) {
@@ -110,6 +111,7 @@ void SteadyStateSystem::solve(int loglevel)
 
 double SteadyStateSystem::timeStep(int nsteps, double dt, double* x, double* r, int loglevel)
 {
+    PhaseTimer timer(&m_profiler, SolverPhase::timeStepping);
     // set the Jacobian age parameter to the transient value
     newton().setOptions(m_ts_jac_age);
 
@@ -262,6 +264,7 @@ void SteadyStateSystem::initTimeInteg(double dt, double* x)
 
     // if the stepsize has changed, then update the transient part of the Jacobian
     if (fabs(rdt_old - m_rdt) > Tiny) {
+        PhaseTimer timer(&m_profiler, SolverPhase::factorization);
         m_jac->updateTransient(m_rdt, m_mask.data());
     }
 }
@@ -273,6 +276,7 @@ void SteadyStateSystem::setSteadyMode()
     }
 
     m_rdt = 0.0;
+    PhaseTimer timer(&m_profiler, SolverPhase::factorization);
     m_jac->updateTransient(m_rdt, m_mask.data());
 }
 
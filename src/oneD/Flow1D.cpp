@@ -10,6 +10,7 @@
 #include "cantera/transport/TransportFactory.h"
 #include "cantera/numerics/funcs.h"
 #include "cantera/base/global.h"
+#include "cantera/base/parallel.h"
 
 using namespace std;
 
@@ -123,6 +124,7 @@ string Flow1D::domainType() const {
 void Flow1D::_setKinetics(shared_ptr<Kinetics> kin)
 {
     m_kin = kin.get();
+    m_workers.clear();
     m_solution->setKinetics(kin);
 }
 
@@ -135,6 +137,7 @@ void Flow1D::_setTransport(shared_ptr<Transport> trans)
     if (m_trans->transportModel() == "none") {
         throw CanteraError("Flow1D::_setTransport", "Invalid Transport model 'none'.");
     }
+    m_workers.clear();
     m_do_multicomponent = (m_trans->transportModel() == "multicomponent" ||
         m_trans->transportModel() == "multicomponent-CK");
 
@@ -221,6 +224,23 @@ void Flow1D::setFluxGradientBasis(ThermoBasis fluxGradientBasis) {
     }
 }
 
+void Flow1D::enableAnalyticChemistryJacobian(bool analytic)
+{
+    if (analytic && m_kin->nReactions()) {
+        try {
+            // check whether kinetics derivatives are implemented
+            AnyMap settings;
+            m_kin->getDerivativeSettings(settings);
+        } catch (NotImplementedError&) {
+            throw CanteraError("Flow1D::enableAnalyticChemistryJacobian",
+                "Kinetics model '{}' does not provide derivatives of production rates.",
+                m_kin->kineticsType());
+        }
+    }
+    m_analyticChemistryJac = analytic;
+    needJacUpdate();
+}
+
 void Flow1D::_getInitialSoln(double* x)
 {
     for (size_t j = 0; j < m_points; j++) {
@@ -232,22 +252,89 @@ void Flow1D::_getInitialSoln(double* x)
 
 void Flow1D::setGas(const double* x, size_t j)
 {
-    m_thermo->setTemperature(T(x,j));
+    setGas(*m_thermo, x, j);
+}
+
+void Flow1D::setGas(ThermoPhase& thermo, const double* x, size_t j) const
+{
+    thermo.setTemperature(T(x,j));
     const double* yy = x + m_nv*j + c_offset_Y;
-    m_thermo->setMassFractions_NoNorm(yy);
-    m_thermo->setPressure(m_press);
+    thermo.setMassFractions_NoNorm(yy);
+    thermo.setPressure(m_press);
 }
 
 void Flow1D::setGasAtMidpoint(const double* x, size_t j)
 {
-    m_thermo->setTemperature(0.5*(T(x,j)+T(x,j+1)));
+    setGasAtMidpoint(*m_thermo, x, j, m_ybar.data());
+}
+
+void Flow1D::setGasAtMidpoint(ThermoPhase& thermo, const double* x, size_t j,
+                              double* ybar) const
+{
+    thermo.setTemperature(0.5*(T(x,j)+T(x,j+1)));
     const double* yy_j = x + m_nv*j + c_offset_Y;
     const double* yy_j_plus1 = x + m_nv*(j+1) + c_offset_Y;
     for (size_t k = 0; k < m_nsp; k++) {
-        m_ybar[k] = 0.5*(yy_j[k] + yy_j_plus1[k]);
+        ybar[k] = 0.5*(yy_j[k] + yy_j_plus1[k]);
+    }
+    thermo.setMassFractions_NoNorm(ybar);
+    thermo.setPressure(m_press);
+}
+
+void Flow1D::setNumThreads(size_t nThreads)
+{
+    m_nThreads = nThreads;
+    m_workers.clear();
+}
+
+void Flow1D::forEachPointBlock(size_t j0, size_t j1,
+    const function<void(ThermoPhase&, Kinetics&, Transport&, size_t, size_t)>& func)
+{
+    size_t n = (j1 > j0) ? j1 - j0 : 0;
+    size_t nThreads = m_nThreads ? m_nThreads : hardwareThreads();
+    // Property updates for a few points, for example while evaluating the Jacobian
+    // column by column, are not worth distributing
+    nThreads = std::min(nThreads, n / 8);
+    if (nThreads <= 1) {
+        func(*m_thermo, *m_kin, *m_trans, j0, j1);
+        return;
+    }
+
+    if (m_kin->cacheNumber() != m_workersCacheNum) {
+        // cloned Kinetics objects do not reflect modified reactions or settings
+        m_workers.clear();
+        m_workersCacheNum = m_kin->cacheNumber();
     }
-    m_thermo->setMassFractions_NoNorm(m_ybar.data());
-    m_thermo->setPressure(m_press);
+    if (m_workers.size() < nThreads - 1) {
+        if (hasDelegatedRates(*m_solution)) {
+            throw CanteraError("Flow1D::forEachPointBlock", "Parallel evaluation is "
+                "not supported for mechanisms that include user-defined reaction "
+                "rates.");
+        }
+        bool withKinetics = m_kin->kineticsType() != "none";
+        while (m_workers.size() < nThreads - 1) {
+            m_workers.push_back(m_solution->clone({}, withKinetics, true));
+        }
+    }
+    if (m_kin->kineticsType() != "none") {
+        // rate multipliers are not retained by cloned Kinetics objects
+        for (size_t w = 0; w < nThreads - 1; w++) {
+            auto& kin = *m_workers[w]->kinetics();
+            for (size_t i = 0; i < m_kin->nReactions(); i++) {
+                kin.setMultiplier(i, m_kin->multiplier(i));
+            }
+        }
+    }
+
+    parallelFor(n, nThreads, [&](size_t worker, size_t begin, size_t end) {
+        if (worker == 0) {
+            func(*m_thermo, *m_kin, *m_trans, j0 + begin, j0 + end);
+        } else {
+            auto& sol = *m_workers[worker - 1];
+            func(*sol.thermo(), *sol.kinetics(), *sol.transport(),
+                 j0 + begin, j0 + end);
+        }
+    });
 }
 
 void Flow1D::_finalize(const double* x)
@@ -341,13 +428,117 @@ void Flow1D::eval(size_t jGlobal, double* xGlobal, double* rsdGlobal,
     evalSpecies(x, rsd, diag, rdt, jmin, jmax);
 }
 
+bool Flow1D::evalSourceJacobian(double* x, size_t j, double* jac)
+{
+    if (!m_analyticChemistryJac) {
+        return false;
+    }
+    std::fill(jac, jac + m_nv * m_nv, 0.0);
+    if (j == 0 || j == m_points - 1 || !m_kin->nReactions()) {
+        // boundary residuals do not include source terms
+        return true;
+    }
+
+    setGas(x, j);
+    m_dwdot_dT.resize(m_nsp);
+    m_dwdot_dC.resize(m_nsp);
+    m_dwdot_dX.resize(m_nsp);
+    m_hkWork.resize(m_nsp);
+    m_work.resize(m_nsp);
+    double rho = m_thermo->density();
+    double cp = m_thermo->cp_mass();
+    double wtm = m_thermo->meanMolecularWeight();
+    m_thermo->getPartialMolarEnthalpies(m_hkWork.data());
+
+    // set derivatives of residuals with respect to solution component n based on
+    // derivatives of production rates stored in m_work
+    auto setColumn = [&](size_t n) {
+        double* col = jac + n * m_nv;
+        double dh = 0.0;
+        for (size_t k = 0; k < m_nsp; k++) {
+            col[c_offset_Y + k] = m_wt[k] * m_work[k] / rho;
+            dh += m_hkWork[k] * m_work[k];
+        }
+        if (m_do_energy[j]) {
+            col[c_offset_T] = - dh / (rho * cp);
+        }
+    };
+
+    // derivative with respect to temperature at constant pressure and composition,
+    // where the molar density of an ideal gas changes as dC/dT = -C/T
+    m_kin->getNetProductionRates_ddT(m_dwdot_dT.data());
+    m_kin->getNetProductionRates_ddC(m_dwdot_dC.data());
+    double C = m_thermo->molarDensity();
+    double T = m_thermo->temperature();
+    for (size_t k = 0; k < m_nsp; k++) {
+        m_work[k] = m_dwdot_dT[k] - m_dwdot_dC[k] * C / T;
+    }
+    setColumn(c_offset_T);
+
+    // derivatives with respect to mass fractions are obtained from derivatives with
+    // respect to mole fractions, where dX_m/dY_i = W/W_i * (delta_mi - X_m)
+    Eigen::SparseMatrix<double> dwdot_dX = m_kin->netProductionRates_ddX();
+    m_thermo->getMoleFractions(m_work.data());
+    Eigen::Map<Eigen::VectorXd>(m_dwdot_dX.data(), m_nsp) =
+        dwdot_dX * Eigen::Map<const Eigen::VectorXd>(m_work.data(), m_nsp);
+    for (size_t i = 0; i < m_nsp; i++) {
+        double scale = wtm / m_wt[i];
+        for (size_t k = 0; k < m_nsp; k++) {
+            m_work[k] = - scale * m_dwdot_dX[k];
+        }
+        for (Eigen::SparseMatrix<double>::InnerIterator it(dwdot_dX, i); it; ++it) {
+            m_work[it.row()] += scale * it.value();
+        }
+        setColumn(c_offset_Y + i);
+    }
+    return true;
+}
+
+void Flow1D::addReactionAdjointProducts(const Kinetics& kin, const double* x,
+                                        const double* lambda, double* products)
+{
+    if (&kin != m_kin || !m_kin->nReactions()) {
+        return;
+    }
+    size_t nr = m_kin->nReactions();
+    m_hkWork.resize(m_nsp);
+    m_work.resize(m_nsp);
+    vector<double> ropNet(nr), delta(nr);
+    // Source terms only appear in the residuals of interior points. As rates of
+    // progress are proportional to the rate constants, the derivative of the net
+    // production rate of species k with respect to ln(k_i) is nu_ki * q_i.
+    for (size_t j = 1; j + 1 < m_points; j++) {
+        setGas(x, j);
+        double rho = m_thermo->density();
+        double cp = m_thermo->cp_mass();
+        m_thermo->getPartialMolarEnthalpies(m_hkWork.data());
+        double lambdaT = 0.0;
+        if (m_do_energy[j]) {
+            lambdaT = lambda[index(c_offset_T, j)] / (rho * cp);
+        }
+        // adjoint-weighted derivatives of the residuals with respect to the net
+        // production rates of each species
+        for (size_t k = 0; k < m_nsp; k++) {
+            m_work[k] = m_wt[k] * lambda[index(c_offset_Y + k, j)] / rho
+                        - lambdaT * m_hkWork[k];
+        }
+        m_kin->getReactionDelta(m_work.data(), delta.data());
+        m_kin->getNetRatesOfProgress(ropNet.data());
+        for (size_t i = 0; i < nr; i++) {
+            products[i] += ropNet[i] * delta[i];
+        }
+    }
+}
+
 void Flow1D::updateProperties(size_t jg, double* x, size_t jmin, size_t jmax)
 {
     // properties are computed for grid points from j0 to j1
     size_t j0 = std::max<size_t>(jmin, 1) - 1;
     size_t j1 = std::min(jmax+1,m_points-1);
 
-    updateThermo(x, j0, j1);
+    // production rates are held constant while evaluating the Jacobian if their
+    // derivatives are evaluated analytically
+    updateThermo(x, j0, j1, jg == npos || !m_analyticChemistryJac);
     if (jg == npos || m_force_full_update) {
         // update transport properties only if a Jacobian is not being
         // evaluated, or if specifically requested
@@ -365,55 +556,91 @@ void Flow1D::updateProperties(size_t jg, double* x, size_t jmin, size_t jmax)
     updateDiffFluxes(x, j0, j1);
 }
 
-void Flow1D::updateTransport(double* x, size_t j0, size_t j1)
+void Flow1D::updateThermo(const double* x, size_t j0, size_t j1, bool updateRates)
 {
-     if (m_do_multicomponent) {
-        for (size_t j = j0; j < j1; j++) {
-            setGasAtMidpoint(x,j);
-            double wtm = m_thermo->meanMolecularWeight();
-            double rho = m_thermo->density();
-            m_visc[j] = (m_dovisc ? m_trans->viscosity() : 0.0);
-            m_trans->getMultiDiffCoeffs(m_nsp, &m_multidiff[mindex(0,0,j)]);
-
-            // Use m_diff as storage for the factor outside the summation
-            for (size_t k = 0; k < m_nsp; k++) {
-                m_diff[k+j*m_nsp] = m_wt[k] * rho / (wtm*wtm);
-            }
-
-            m_tcon[j] = m_trans->thermalConductivity();
-            if (m_do_soret) {
-                m_trans->getThermalDiffCoeffs(m_dthermal.ptrColumn(0) + j*m_nsp);
+    SolverProfiler* profiler = m_container ? &m_container->profiler() : nullptr;
+    forEachPointBlock(j0, j1 + 1, [&](ThermoPhase& thermo, Kinetics& kin,
+                                      Transport& trans, size_t begin, size_t end) {
+        // each grid point contributes one call to the thermo and kinetics phases
+        PhaseTimer thermoTimer(profiler, SolverPhase::thermo, false);
+        PhaseTimer kineticsTimer(profiler, SolverPhase::kinetics, false);
+        for (size_t j = begin; j < end; j++) {
+            thermoTimer.start();
+            setGas(thermo, x, j);
+            m_rho[j] = thermo.density();
+            m_wtm[j] = thermo.meanMolecularWeight();
+            m_cp[j] = thermo.cp_mass();
+            thermo.getPartialMolarEnthalpies(&m_hk(0, j));
+            thermoTimer.stop();
+            if (updateRates) {
+                kineticsTimer.start();
+                kin.getNetProductionRates(&m_wdot(0, j));
+                kineticsTimer.stop();
             }
         }
-    } else { // mixture averaged transport
-        for (size_t j = j0; j < j1; j++) {
-            setGasAtMidpoint(x,j);
-            m_visc[j] = (m_dovisc ? m_trans->viscosity() : 0.0);
+    });
+}
 
-            if (m_fluxGradientBasis == ThermoBasis::molar) {
-                m_trans->getMixDiffCoeffs(&m_diff[j*m_nsp]);
-            } else {
-                m_trans->getMixDiffCoeffsMass(&m_diff[j*m_nsp]);
+void Flow1D::updateTransport(double* x, size_t j0, size_t j1)
+{
+    SolverProfiler* profiler = m_container ? &m_container->profiler() : nullptr;
+    forEachPointBlock(j0, j1, [&](ThermoPhase& thermo, Kinetics& kin,
+                                  Transport& trans, size_t begin, size_t end) {
+        // each grid point contributes one call to the transport phase
+        PhaseTimer timer(profiler, SolverPhase::transport, false);
+        vector<double> ybar(m_nsp);
+        if (m_do_multicomponent) {
+            for (size_t j = begin; j < end; j++) {
+                timer.start();
+                setGasAtMidpoint(thermo, x, j, ybar.data());
+                double wtm = thermo.meanMolecularWeight();
+                double rho = thermo.density();
+                m_visc[j] = (m_dovisc ? trans.viscosity() : 0.0);
+                trans.getMultiDiffCoeffs(m_nsp, &m_multidiff[mindex(0,0,j)]);
+
+                // Use m_diff as storage for the factor outside the summation
+                for (size_t k = 0; k < m_nsp; k++) {
+                    m_diff[k+j*m_nsp] = m_wt[k] * rho / (wtm*wtm);
+                }
+
+                m_tcon[j] = trans.thermalConductivity();
+                if (m_do_soret) {
+                    trans.getThermalDiffCoeffs(m_dthermal.ptrColumn(0) + j*m_nsp);
+                }
+                timer.stop();
             }
+        } else { // mixture averaged transport
+            for (size_t j = begin; j < end; j++) {
+                timer.start();
+                setGasAtMidpoint(thermo, x, j, ybar.data());
+                m_visc[j] = (m_dovisc ? trans.viscosity() : 0.0);
+
+                if (m_fluxGradientBasis == ThermoBasis::molar) {
+                    trans.getMixDiffCoeffs(&m_diff[j*m_nsp]);
+                } else {
+                    trans.getMixDiffCoeffsMass(&m_diff[j*m_nsp]);
+                }
 
-            double rho = m_thermo->density();
+                double rho = thermo.density();
 
-            if (m_fluxGradientBasis == ThermoBasis::molar) {
-                double wtm = m_thermo->meanMolecularWeight();
-                for (size_t k=0; k < m_nsp; k++) {
-                    m_diff[k+j*m_nsp] *= m_wt[k] * rho / wtm;
+                if (m_fluxGradientBasis == ThermoBasis::molar) {
+                    double wtm = thermo.meanMolecularWeight();
+                    for (size_t k=0; k < m_nsp; k++) {
+                        m_diff[k+j*m_nsp] *= m_wt[k] * rho / wtm;
+                    }
+                } else {
+                    for (size_t k=0; k < m_nsp; k++) {
+                        m_diff[k+j*m_nsp] *= rho;
+                    }
                 }
-            } else {
-                for (size_t k=0; k < m_nsp; k++) {
-                    m_diff[k+j*m_nsp] *= rho;
+                m_tcon[j] = trans.thermalConductivity();
+                if (m_do_soret) {
+                    trans.getThermalDiffCoeffs(m_dthermal.ptrColumn(0) + j*m_nsp);
                 }
-            }
-            m_tcon[j] = m_trans->thermalConductivity();
-            if (m_do_soret) {
-                m_trans->getThermalDiffCoeffs(m_dthermal.ptrColumn(0) + j*m_nsp);
+                timer.stop();
             }
         }
-    }
+    });
 }
 
 void Flow1D::updateDiffFluxes(const double* x, size_t j0, size_t j1)
@@ -35,6 +35,7 @@ void MultiNewton::step(double* x, double* step, SteadyStateSystem& r, int loglev
 
     auto jac = r.linearSolver();
     try {
+        PhaseTimer timer(&r.profiler(), SolverPhase::linearSolve);
         jac->solve(r.size(), step, step);
     } catch (CanteraError&) {
         if (jac->info() > 0) {
@@ -222,6 +223,7 @@ int MultiNewton::solve(double* x0, double* x1, SteadyStateSystem& r, int logleve
         if (forceNewJac) {
             r.evalJacobian(&m_x[0]);
             try {
+                PhaseTimer timer(&r.profiler(), SolverPhase::factorization);
                 jac->updateTransient(rdt, r.transientMask().data());
             } catch (CanteraError& err) {
                 // Allow solver to continue after failure to factorize the steady-state
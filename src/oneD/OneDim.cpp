@@ -176,6 +176,8 @@ void OneDim::clearStats()
 
 void OneDim::resize()
 {
+    m_savedJacOffset.clear();
+    m_savedJac.clear();
     m_bw = 0;
     m_nvars.clear();
     m_loc.clear();
@@ -241,6 +243,7 @@ Domain1D* OneDim::pointDomain(size_t i)
 
 void OneDim::eval(size_t j, double* x, double* r, double rdt, int count)
 {
+    PhaseTimer timer(&m_profiler, SolverPhase::residual);
     clock_t t0 = clock();
     if (m_interrupt) {
         m_interrupt->eval(m_nevals);
@@ -273,14 +276,48 @@ void OneDim::eval(size_t j, double* x, double* r, double rdt, int count)
 
 void OneDim::evalJacobian(double* x0)
 {
+    PhaseTimer timer(&m_profiler, SolverPhase::jacobian);
     m_jac->reset();
     clock_t t0 = clock();
     m_work1.resize(size());
     m_work2.resize(size());
     eval(npos, x0, m_work1.data(), 0.0, 0);
+    bool reuse = !m_savedJacOffset.empty();
+    if (m_jacobianColoring && !reuse) {
+        evalColoredJacobian(x0);
+        m_jac->updateElapsed(double(clock() - t0) / CLOCKS_PER_SEC);
+        m_jac->incrementEvals();
+        m_jac->setAge(0);
+        return;
+    }
     size_t ipt = 0;
+    size_t iDom = 0;
     for (size_t j = 0; j < points(); j++) {
         size_t nv = nVars(j);
+        while (j > m_dom[iDom]->lastPoint()) {
+            iDom++;
+        }
+        if (reuse && m_savedJacOffset[j] != npos) {
+            // copy columns retained during grid refinement
+            const double* saved = m_savedJac.data() + m_savedJacOffset[j];
+            size_t iStart = (j == 0) ? 0 : loc(j - 1);
+            size_t iEnd = (j + 1 < points()) ? loc(j + 1) + nVars(j + 1) : size();
+            for (size_t n = 0; n < nv; n++) {
+                for (size_t i = iStart; i < iEnd; i++) {
+                    double value = *saved++;
+                    if (value != 0.0 || i == ipt) {
+                        m_jac->setValue(i, ipt, value);
+                    }
+                }
+                ipt++;
+            }
+            continue;
+        }
+        // analytic derivatives of local source terms, if provided by the domain
+        Domain1D* dom = m_dom[iDom].get();
+        m_sourceJac.resize(nv * nv);
+        bool analytic = dom->evalSourceJacobian(x0 + dom->loc(), j - dom->firstPoint(),
+                                                m_sourceJac.data());
         for (size_t n = 0; n < nv; n++) {
             // perturb x(n); preserve sign(x(n))
             double xsave = x0[ipt];
@@ -301,8 +338,11 @@ void OneDim::evalJacobian(double* x0)
                     size_t iloc = loc(i);
                     for (size_t m = 0; m < mv; m++) {
                         double delta = m_work2[m+iloc] - m_work1[m+iloc];
-                        if (std::abs(delta) > m_jacobianThreshold || m+iloc == ipt) {
-                            m_jac->setValue(m + iloc, ipt, delta * rdx);
+                        double source = (analytic && i == j) ? m_sourceJac[m + n*nv] : 0.0;
+                        if (std::abs(delta) > m_jacobianThreshold || m+iloc == ipt
+                            || source != 0.0)
+                        {
+                            m_jac->setValue(m + iloc, ipt, delta * rdx + source);
                         }
                     }
                 }
@@ -311,12 +351,71 @@ void OneDim::evalJacobian(double* x0)
             ipt++;
         }
     }
+    // retained columns are only valid for the first evaluation after refinement
+    m_savedJacOffset.clear();
+    m_savedJac.clear();
 
     m_jac->updateElapsed(double(clock() - t0) / CLOCKS_PER_SEC);
     m_jac->incrementEvals();
     m_jac->setAge(0);
 }
 
+void OneDim::evalColoredJacobian(double* x0)
+{
+    size_t nvMax = *max_element(m_nvars.begin(), m_nvars.end());
+    vector<double> xsave(points());
+    vector<double> rdx(points());
+    // Residuals at point j only depend on the solution at points j-1, j, and j+1, so
+    // perturbations at points that are three points apart affect disjoint rows
+    for (size_t color = 0; color < 3; color++) {
+        for (size_t n = 0; n < nvMax; n++) {
+            bool perturbed = false;
+            for (size_t j = color; j < points(); j += 3) {
+                if (n >= nVars(j)) {
+                    continue;
+                }
+                // perturb x(n) at point j; preserve sign(x(n))
+                size_t ipt = loc(j) + n;
+                xsave[j] = x0[ipt];
+                double dx = fabs(xsave[j]) * m_jacobianRelPerturb + m_jacobianAbsPerturb;
+                if (xsave[j] < 0) {
+                    dx = -dx;
+                }
+                x0[ipt] = xsave[j] + dx;
+                rdx[j] = 1.0 / (x0[ipt] - xsave[j]);
+                perturbed = true;
+            }
+            if (!perturbed) {
+                continue;
+            }
+
+            // calculate perturbed residual at all points
+            eval(npos, x0, m_work2.data(), 0.0, 0);
+
+            // compute columns of Jacobian for all perturbed points
+            for (size_t j = color; j < points(); j += 3) {
+                if (n >= nVars(j)) {
+                    continue;
+                }
+                size_t ipt = loc(j) + n;
+                for (size_t i = j - 1; i != j+2; i++) {
+                    if (i != npos && i < points()) {
+                        size_t mv = nVars(i);
+                        size_t iloc = loc(i);
+                        for (size_t m = 0; m < mv; m++) {
+                            double delta = m_work2[m+iloc] - m_work1[m+iloc];
+                            if (std::abs(delta) > m_jacobianThreshold || m+iloc == ipt) {
+                                m_jac->setValue(m + iloc, ipt, delta * rdx[j]);
+                            }
+                        }
+                    }
+                }
+                x0[ipt] = xsave[j];
+            }
+        }
+    }
+}
+
 void OneDim::initTimeInteg(double dt, double* x)
 {
     SteadyStateSystem::initTimeInteg(dt, x);
@@ -385,10 +385,12 @@ void Sim1D::solve(int loglevel, bool refine_grid)
 
 int Sim1D::refine(int loglevel)
 {
+    PhaseTimer timer(&m_profiler, SolverPhase::refinement);
     int added = 0;
     int discarded = 0;
     vector<double> znew, xnew;
     vector<size_t> dsize;
+    vector<size_t> oldPoint; // global index of each new point in the old grid
 
     m_xlast_ss = *m_state;
     m_grid_last_ss.clear();
@@ -417,6 +419,7 @@ int Sim1D::refine(int loglevel)
             if (r.keepPoint(m)) {
                 // add the current grid point to the new grid
                 znew.push_back(d.z(m));
+                oldPoint.push_back(d.firstPoint() + m);
 
                 // do the same for the solution at this point
                 for (size_t i = 0; i < comp; i++) {
@@ -430,6 +433,7 @@ int Sim1D::refine(int loglevel)
                     // add new point at midpoint
                     double zmid = 0.5*(d.z(m) + d.z(m+1));
                     znew.push_back(zmid);
+                    oldPoint.push_back(npos);
                     added++;
 
                     // for each component, linearly interpolate the solution to this
@@ -449,6 +453,12 @@ int Sim1D::refine(int loglevel)
         dsize.push_back(znew.size() - nstart);
     }
 
+    vector<size_t> savedJacOffset;
+    vector<double> savedJac;
+    if (m_reuseJacAfterRefine) {
+        saveJacobianColumns(oldPoint, savedJacOffset, savedJac);
+    }
+
     // At this point, the new grid znew and the new solution vector xnew have
     // been constructed, but the domains themselves have not yet been modified.
     // Now update each domain with the new grid.
@@ -466,10 +476,57 @@ int Sim1D::refine(int loglevel)
     // Replace the current solution vector with the new one
     *m_state = xnew;
     resize();
+    m_savedJacOffset = std::move(savedJacOffset);
+    m_savedJac = std::move(savedJac);
     finalize();
     return added || -discarded;
 }
 
+void Sim1D::saveJacobianColumns(const vector<size_t>& oldPoint,
+                                vector<size_t>& offsets, vector<double>& values)
+{
+    auto multijac = dynamic_pointer_cast<MultiJac>(m_jac);
+    if (!multijac || !m_jac->nEvals()) {
+        // no Jacobian available for the current grid
+        return;
+    }
+    size_t nOld = points();
+    size_t nNew = oldPoint.size();
+    // The residual at a point is unaffected by refinement if the point is retained
+    // along with its neighbors
+    vector<bool> unchanged(nNew);
+    for (size_t p = 0; p < nNew; p++) {
+        size_t q = oldPoint[p];
+        unchanged[p] = q != npos
+            && (p == 0 ? q == 0 : q > 0 && oldPoint[p - 1] == q - 1)
+            && (p + 1 == nNew ? q + 1 == nOld : oldPoint[p + 1] == q + 1);
+    }
+
+    offsets.assign(nNew, npos);
+    size_t nSaved = 0;
+    for (size_t p = 0; p < nNew; p++) {
+        // columns of point p contain the rows of point p and its neighbors
+        if (!unchanged[p] || (p > 0 && !unchanged[p - 1])
+            || (p + 1 < nNew && !unchanged[p + 1]))
+        {
+            continue;
+        }
+        size_t q = oldPoint[p];
+        size_t iStart = (q == 0) ? 0 : loc(q - 1);
+        size_t iEnd = (q + 1 < nOld) ? loc(q + 1) + nVars(q + 1) : size();
+        offsets[p] = values.size();
+        for (size_t n = 0; n < nVars(q); n++) {
+            for (size_t i = iStart; i < iEnd; i++) {
+                values.push_back(multijac->steadyValue(i, loc(q) + n));
+            }
+        }
+        nSaved++;
+    }
+    if (!nSaved) {
+        offsets.clear();
+    }
+}
+
 void Sim1D::clearDebugFile()
 {
     std::filesystem::remove("debug_sim1d.yaml");
@@ -796,6 +853,16 @@ void Sim1D::solveAdjoint(const double* b, double* lambda)
     Jt.solve(b, lambda);
 }
 
+void Sim1D::getReactionAdjointProducts(const Kinetics& kin, const double* lambda,
+                                       double* products)
+{
+    std::fill(products, products + kin.nReactions(), 0.0);
+    for (auto& D : m_dom) {
+        D->addReactionAdjointProducts(kin, m_state->data() + D->loc(),
+                                      lambda + D->loc(), products);
+    }
+}
+
 void Sim1D::resize()
 {
     OneDim::resize();
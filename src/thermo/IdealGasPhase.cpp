@@ -201,6 +201,12 @@ void IdealGasPhase::getCp_R_ref(double* cprt) const
     copy(_cpr.begin(), _cpr.end(), cprt);
 }
 
+void IdealGasPhase::getReferenceProperties(size_t n, const double* T, double* cp_R,
+                                           double* h_RT, double* s_R) const
+{
+    m_spthermo.updateMultiple(n, T, cp_R, h_RT, s_R);
+}
+
 void IdealGasPhase::getStandardVolumes_ref(double* vol) const
 {
     double tmp = RT() / m_p0;
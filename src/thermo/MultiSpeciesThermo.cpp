@@ -14,6 +14,7 @@
 #include "cantera/base/utilities.h"
 #include "cantera/base/ctexceptions.h"
 #include "cantera/base/global.h"
+#include <numeric>
 
 namespace Cantera
 {
@@ -105,6 +106,44 @@ void MultiSpeciesThermo::update(double t, double* cp_R, double* h_RT, double* s_
     }
 }
 
+void MultiSpeciesThermo::updateMultiple(size_t n, const double* T, double* cp_R,
+                                        double* h_RT, double* s_R) const
+{
+    size_t nSpecies = m_installed.size();
+    if (n == 0 || nSpecies == 0) {
+        return;
+    }
+
+    // Process temperatures in increasing order
+    vector<size_t> order(n);
+    std::iota(order.begin(), order.end(), 0);
+    std::stable_sort(order.begin(), order.end(),
+                     [T](size_t i, size_t j) { return T[i] < T[j]; });
+    vector<double> sortedT(n);
+    for (size_t i = 0; i < n; i++) {
+        sortedT[i] = T[order[i]];
+    }
+
+    vector<double> tpoly, cp(n), h(n), s(n);
+    for (const auto& [type, species] : m_sp) {
+        size_t nPoly = species[0].second->temperaturePolySize();
+        tpoly.resize(n * nPoly);
+        for (size_t i = 0; i < n; i++) {
+            species[0].second->updateTemperaturePoly(sortedT[i], &tpoly[i * nPoly]);
+        }
+        for (const auto& [k, spthermo] : species) {
+            spthermo->updatePropertiesMultiple(n, sortedT.data(), tpoly.data(),
+                                               cp.data(), h.data(), s.data());
+            for (size_t i = 0; i < n; i++) {
+                size_t loc = order[i] * nSpecies + k;
+                cp_R[loc] = cp[i];
+                h_RT[loc] = h[i];
+                s_R[loc] = s[i];
+            }
+        }
+    }
+}
+
 int MultiSpeciesThermo::reportType(size_t index) const
 {
     const SpeciesThermoInterpType* sp = provideSTIT(index);
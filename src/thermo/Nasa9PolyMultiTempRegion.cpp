@@ -142,6 +142,24 @@ void Nasa9PolyMultiTempRegion::updatePropertiesTemp(const double temp,
     m_regionPts[m_currRegion]->updatePropertiesTemp(temp, cp_R, h_RT, s_R);
 }
 
+void Nasa9PolyMultiTempRegion::updatePropertiesMultiple(size_t n, const double* T,
+        const double* tt, double* cp_R, double* h_RT, double* s_R) const
+{
+    // Temperatures are sorted, so each region covers a contiguous range of points
+    size_t start = 0;
+    for (size_t r = 0; r < m_regionPts.size(); r++) {
+        size_t end = n;
+        if (r + 1 < m_regionPts.size()) {
+            end = std::lower_bound(T + start, T + n, m_lowerTempBounds[r + 1]) - T;
+        }
+        const Nasa9Poly1& poly = *m_regionPts[r];
+        for (size_t i = start; i < end; i++) {
+            poly.Nasa9Poly1::updateProperties(tt + 7 * i, cp_R + i, h_RT + i, s_R + i);
+        }
+        start = end;
+    }
+}
+
 size_t Nasa9PolyMultiTempRegion::nCoeffs() const
 {
     return 11*m_regionPts.size() + 1;
@@ -33,6 +33,15 @@ void SpeciesThermoInterpType::updatePropertiesTemp(const double temp,
     throw NotImplementedError("SpeciesThermoInterpType::updatePropertiesTemp");
 }
 
+void SpeciesThermoInterpType::updatePropertiesMultiple(size_t n, const double* T,
+        const double* tt, double* cp_R, double* h_RT, double* s_R) const
+{
+    size_t nPoly = temperaturePolySize();
+    for (size_t i = 0; i < n; i++) {
+        updateProperties(tt + i * nPoly, cp_R + i, h_RT + i, s_R + i);
+    }
+}
+
 size_t SpeciesThermoInterpType::nCoeffs() const
 {
     throw NotImplementedError("SpeciesThermoInterpType::nCoeffs");
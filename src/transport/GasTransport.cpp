@@ -12,6 +12,8 @@
 #include "cantera/thermo/Species.h"
 #include "cantera/base/utilities.h"
 #include "cantera/base/global.h"
+#include <list>
+#include <mutex>
 
 namespace Cantera
 {
@@ -20,6 +22,151 @@ namespace Cantera
 //! except in CK mode, where the degree is 6.
 #define COLL_INT_POLY_DEGREE 8
 
+namespace {
+
+//! Polynomial fits generated by GasTransport::setupCollisionIntegral()
+struct TransportFits
+{
+    vector<vector<double>> visccoeffs, condcoeffs, diffcoeffs;
+    vector<vector<double>> omega22_poly, astar_poly, bstar_poly, cstar_poly;
+    vector<vector<int>> poly, star_poly_uses_actualT;
+    AnyMap fittingErrors;
+};
+
+//! In-process cache of polynomial fits, keyed by the SHA-256 digest of
+//! GasTransport::fitCacheKey(). Entries are ordered from most to least recently
+//! used.
+std::list<pair<string, shared_ptr<const TransportFits>>> fit_cache;
+std::mutex fit_cache_mutex;
+
+//! Maximum number of entries held in #fit_cache
+const size_t fitCacheCapacity = 32;
+
+//! Category used for fits stored in the persistent cache. The suffix is the
+//! version of the storage format.
+const string fitCacheCategory = "transport-fits-v2";
+
+//! Look up fits in the in-process cache, marking them as most recently used
+shared_ptr<const TransportFits> findCachedFits(const string& digest)
+{
+    std::unique_lock<std::mutex> lock(fit_cache_mutex);
+    for (auto iter = fit_cache.begin(); iter != fit_cache.end(); iter++) {
+        if (iter->first == digest) {
+            fit_cache.splice(fit_cache.begin(), fit_cache, iter);
+            return iter->second;
+        }
+    }
+    return nullptr;
+}
+
+//! Add fits to the in-process cache, discarding the least recently used fits
+//! if the cache is full
+void storeCachedFits(const string& digest, shared_ptr<const TransportFits> fits)
+{
+    std::unique_lock<std::mutex> lock(fit_cache_mutex);
+    fit_cache.remove_if([&](const auto& entry) { return entry.first == digest; });
+    fit_cache.emplace_front(digest, fits);
+    if (fit_cache.size() > fitCacheCapacity) {
+        fit_cache.pop_back();
+    }
+}
+
+//! Fitting errors included in the persistent cache
+const vector<string> fitErrorNames = {
+    "viscosity-max-abs-error", "viscosity-max-rel-error",
+    "conductivity-max-abs-error", "conductivity-max-rel-error",
+    "diff-coeff-max-abs-error", "diff-coeff-max-rel-error"
+};
+
+template <class T>
+void packMatrix(vector<double>& buf, const vector<vector<T>>& values)
+{
+    buf.push_back(static_cast<double>(values.size()));
+    for (const auto& row : values) {
+        buf.push_back(static_cast<double>(row.size()));
+        buf.insert(buf.end(), row.begin(), row.end());
+    }
+}
+
+template <class T>
+void unpackMatrix(const double*& ptr, const double* end, vector<vector<T>>& values)
+{
+    auto next = [&]() {
+        if (ptr == end) {
+            throw CanteraError("GasTransport::setupCollisionIntegral",
+                               "Incomplete cache entry for transport fits.");
+        }
+        return *ptr++;
+    };
+    values.resize(static_cast<size_t>(next()));
+    for (auto& row : values) {
+        row.resize(static_cast<size_t>(next()));
+        for (auto& value : row) {
+            value = static_cast<T>(next());
+        }
+    }
+}
+
+//! Serialize fits for storage in the persistent cache
+string packFits(const TransportFits& fits)
+{
+    vector<double> buf;
+    for (auto matrix : {&fits.visccoeffs, &fits.condcoeffs, &fits.diffcoeffs,
+                        &fits.omega22_poly, &fits.astar_poly, &fits.bstar_poly,
+                        &fits.cstar_poly})
+    {
+        packMatrix(buf, *matrix);
+    }
+    packMatrix(buf, fits.poly);
+    packMatrix(buf, fits.star_poly_uses_actualT);
+    for (const auto& name : fitErrorNames) {
+        buf.push_back(fits.fittingErrors.getDouble(name, NAN));
+    }
+    string data;
+    data.reserve(buf.size() * sizeof(double));
+    for (double value : buf) {
+        data += toLittleEndian(value);
+    }
+    return data;
+}
+
+//! Deserialize fits read from the persistent cache
+shared_ptr<TransportFits> unpackFits(const string& data)
+{
+    if (data.size() % sizeof(double)) {
+        throw CanteraError("GasTransport::setupCollisionIntegral",
+                           "Invalid cache entry for transport fits.");
+    }
+    vector<double> buf(data.size() / sizeof(double));
+    for (size_t i = 0; i < buf.size(); i++) {
+        buf[i] = fromLittleEndian<double>(data.data() + i * sizeof(double));
+    }
+    const double* ptr = buf.data();
+    const double* end = ptr + buf.size();
+    auto fits = make_shared<TransportFits>();
+    for (auto matrix : {&fits->visccoeffs, &fits->condcoeffs, &fits->diffcoeffs,
+                        &fits->omega22_poly, &fits->astar_poly, &fits->bstar_poly,
+                        &fits->cstar_poly})
+    {
+        unpackMatrix(ptr, end, *matrix);
+    }
+    unpackMatrix(ptr, end, fits->poly);
+    unpackMatrix(ptr, end, fits->star_poly_uses_actualT);
+    if (end - ptr != static_cast<ptrdiff_t>(fitErrorNames.size())) {
+        throw CanteraError("GasTransport::setupCollisionIntegral",
+                           "Invalid cache entry for transport fits.");
+    }
+    for (const auto& name : fitErrorNames) {
+        if (!std::isnan(*ptr)) {
+            fits->fittingErrors[name] = *ptr;
+        }
+        ptr++;
+    }
+    return fits;
+}
+
+} // end anonymous namespace
+
 GasTransport::GasTransport() :
     m_polytempvec(5)
 {
@@ -360,8 +507,75 @@ void GasTransport::invalidateCache()
     m_bindiff_ok = false;
 }
 
+void GasTransport::clearFitCache()
+{
+    std::unique_lock<std::mutex> lock(fit_cache_mutex);
+    fit_cache.clear();
+}
+
+string GasTransport::fitCacheKey()
+{
+    string key = fmt::format("{}\n{}\n", transportModel(), m_mode);
+    vector<double> data{m_thermo->minTemp(), m_thermo->maxTemp()};
+    for (size_t k = 0; k < m_nsp; k++) {
+        key += m_thermo->speciesName(k) + "\n";
+        data.insert(data.end(), {m_thermo->molecularWeight(k), m_thermo->charge(k),
+            m_crot[k], m_sigma[k], m_eps[k], m_alpha[k], m_zrot[k], m_w_ac[k],
+            m_disp[k], m_quad_polar[k]});
+    }
+    // Collision parameters for each species pair, which derived classes may
+    // modify before the fits are generated
+    for (size_t i = 0; i < m_nsp; i++) {
+        for (size_t j = i; j < m_nsp; j++) {
+            data.insert(data.end(), {m_reducedMass(i,j), m_diam(i,j), m_epsilon(i,j),
+                m_dipole(i,j), m_delta(i,j)});
+        }
+    }
+    // Heat capacities at the temperatures used in fitProperties()
+    const size_t np = 50;
+    double dt = (m_thermo->maxTemp() - m_thermo->minTemp())/(np-1);
+    vector<double> state;
+    m_thermo->saveState(state);
+    vector<double> cp_R(m_nsp);
+    for (size_t n = 0; n < np; n++) {
+        m_thermo->setTemperature(m_thermo->minTemp() + dt*n);
+        m_thermo->getCp_R_ref(cp_R.data());
+        data.insert(data.end(), cp_R.begin(), cp_R.end());
+    }
+    m_thermo->restoreState(state);
+    for (double value : data) {
+        key += toLittleEndian(value);
+    }
+    return key;
+}
+
 void GasTransport::setupCollisionIntegral()
 {
+    string digest = sha256(fitCacheKey());
+    shared_ptr<const TransportFits> fits = findCachedFits(digest);
+    string data;
+    if (!fits && readCacheEntry(fitCacheCategory, digest, data)) {
+        try {
+            fits = unpackFits(data);
+            storeCachedFits(digest, fits);
+        } catch (CanteraError&) {
+            // Treat a corrupt cache entry as a cache miss
+        }
+    }
+    if (fits) {
+        m_visccoeffs = fits->visccoeffs;
+        m_condcoeffs = fits->condcoeffs;
+        m_diffcoeffs = fits->diffcoeffs;
+        m_omega22_poly = fits->omega22_poly;
+        m_astar_poly = fits->astar_poly;
+        m_bstar_poly = fits->bstar_poly;
+        m_cstar_poly = fits->cstar_poly;
+        m_poly = fits->poly;
+        m_star_poly_uses_actualT = fits->star_poly_uses_actualT;
+        m_fittingErrors = fits->fittingErrors;
+        return;
+    }
+
     double tstar_min = 1.e8, tstar_max = 0.0;
     for (size_t i = 0; i < m_nsp; i++) {
         for (size_t j = i; j < m_nsp; j++) {
@@ -384,6 +598,21 @@ void GasTransport::setupCollisionIntegral()
     fitCollisionIntegrals(integrals);
     // make polynomial fits
     fitProperties(integrals);
+
+    // store the fits for reuse by other transport managers
+    auto newFits = make_shared<TransportFits>();
+    newFits->visccoeffs = m_visccoeffs;
+    newFits->condcoeffs = m_condcoeffs;
+    newFits->diffcoeffs = m_diffcoeffs;
+    newFits->omega22_poly = m_omega22_poly;
+    newFits->astar_poly = m_astar_poly;
+    newFits->bstar_poly = m_bstar_poly;
+    newFits->cstar_poly = m_cstar_poly;
+    newFits->poly = m_poly;
+    newFits->star_poly_uses_actualT = m_star_poly_uses_actualT;
+    newFits->fittingErrors = m_fittingErrors;
+    storeCachedFits(digest, newFits);
+    writeCacheEntry(fitCacheCategory, digest, packFits(*newFits));
 }
 
 void GasTransport::getTransportData()
@@ -238,6 +238,20 @@ void IonGasTransport::fitDiffCoeffs(MMCollisionInt& integrals)
                  mxrelerr);
 }
 
+string IonGasTransport::fitCacheKey()
+{
+    string key = GasTransport::fitCacheKey();
+    for (size_t i = 0; i < m_nsp; i++) {
+        for (size_t j = i; j < m_nsp; j++) {
+            key += toLittleEndian(m_gamma(i,j));
+        }
+    }
+    for (double c : m_om11_O2) {
+        key += toLittleEndian(c);
+    }
+    return key;
+}
+
 void IonGasTransport::setupN64()
 {
     m_gamma.resize(m_nsp, m_nsp, 0.0);
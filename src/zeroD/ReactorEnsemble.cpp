@@ -0,0 +1,234 @@
+//! @file ReactorEnsemble.cpp
+
+// This file is part of Cantera. See License.txt in the top-level directory or
+// at https://cantera.org/license.txt for license and copyright information.
+
+#include "cantera/zeroD/ReactorEnsemble.h"
+#include "cantera/zeroD/ReactorNet.h"
+#include "cantera/zeroD/ReactorFactory.h"
+#include "cantera/base/Solution.h"
+#include "cantera/base/parallel.h"
+#include "cantera/thermo/ThermoPhase.h"
+#include "cantera/kinetics/Kinetics.h"
+
+namespace Cantera
+{
+
+ReactorEnsemble::ReactorEnsemble(shared_ptr<Solution> phase, const string& model)
+    : m_sol(phase)
+    , m_model(model)
+{
+    if (!m_sol || !m_sol->thermo()) {
+        throw CanteraError("ReactorEnsemble::ReactorEnsemble",
+            "Ensemble requires a Solution object with a valid thermo model.");
+    }
+}
+
+ReactorEnsemble::~ReactorEnsemble()
+{
+}
+
+void ReactorEnsemble::setTolerances(double rtol, double atol)
+{
+    if (rtol >= 0.0) {
+        m_rtol = rtol;
+    }
+    if (atol >= 0.0) {
+        m_atol = atol;
+    }
+}
+
+void ReactorEnsemble::setMaxSteps(int nmax)
+{
+    if (nmax < 0) {
+        throw CanteraError("ReactorEnsemble::setMaxSteps",
+            "Maximum number of steps must not be negative; got {}.", nmax);
+    }
+    m_maxSteps = nmax;
+}
+
+void ReactorEnsemble::setMaxTimeStep(double maxstep)
+{
+    if (maxstep < 0.0) {
+        throw CanteraError("ReactorEnsemble::setMaxTimeStep",
+            "Maximum time step must not be negative; got {}.", maxstep);
+    }
+    m_maxTimeStep = maxstep;
+}
+
+void ReactorEnsemble::setNumThreads(size_t nThreads)
+{
+    m_nThreads = nThreads;
+}
+
+void ReactorEnsemble::setSampleTimes(span<const double> times)
+{
+    for (size_t j = 0; j < times.size(); j++) {
+        if (times[j] < 0.0 || (j && times[j] <= times[j - 1])) {
+            throw CanteraError("ReactorEnsemble::setSampleTimes",
+                "Sample times need to be non-negative and increasing.");
+        }
+    }
+    m_sampleTimes.assign(times.begin(), times.end());
+}
+
+size_t ReactorEnsemble::sampleWidth() const
+{
+    return 2 + m_sol->thermo()->nSpecies();
+}
+
+void ReactorEnsemble::integrate(double tEnd, span<const double> T,
+                                span<const double> P, span<const double> X)
+{
+    size_t n = T.size();
+    size_t nsp = m_sol->thermo()->nSpecies();
+    if (P.size() != n || X.size() != n * nsp) {
+        throw CanteraError("ReactorEnsemble::integrate",
+            "Inconsistent sizes of initial states: expected {} pressures and {} mole "
+            "fractions for {} temperatures, but got {} and {}.",
+            n, n * nsp, n, P.size(), X.size());
+    }
+    if (tEnd <= 0.0) {
+        throw CanteraError("ReactorEnsemble::integrate",
+            "End time needs to be positive; got {}.", tEnd);
+    }
+    if (!m_sampleTimes.empty() && m_sampleTimes.back() > tEnd) {
+        throw CanteraError("ReactorEnsemble::integrate",
+            "Last sample time ({}) exceeds end time ({}).",
+            m_sampleTimes.back(), tEnd);
+    }
+    size_t nThreads = std::min(m_nThreads ? m_nThreads : hardwareThreads(), n);
+    if (m_nThreads != 1 && hasDelegatedRates(*m_sol)) {
+        throw CanteraError("ReactorEnsemble::integrate", "Parallel integration is "
+            "not supported for mechanisms that include user-defined reaction rates.");
+    }
+
+    size_t nSamples = m_sampleTimes.size();
+    m_ignitionTimes.assign(n, NAN);
+    m_samples.assign(n * nSamples * sampleWidth(), NAN);
+    m_errors.assign(n, "");
+    if (!n) {
+        return;
+    }
+    prepareWorkers(std::max<size_t>(nThreads, 1));
+    parallelFor(n, nThreads, [&](size_t worker, size_t begin, size_t end) {
+        for (size_t i = begin; i < end; i++) {
+            try {
+                integrateMember(m_workers[worker], i, tEnd, T, P, X);
+            } catch (std::exception& err) {
+                m_ignitionTimes[i] = NAN;
+                std::fill_n(m_samples.begin() + i * nSamples * sampleWidth(),
+                            nSamples * sampleWidth(), NAN);
+                m_errors[i] = err.what();
+            }
+        }
+    });
+}
+
+void ReactorEnsemble::prepareWorkers(size_t nWorkers)
+{
+    auto kin = m_sol->kinetics();
+    bool withKinetics = kin && kin->kineticsType() != "none";
+    while (m_workers.size() < nWorkers) {
+        Worker worker;
+        worker.sol = m_sol->clone({}, withKinetics, false);
+        worker.reactor = newReactor(m_model, worker.sol, false,
+                                    fmt::format("member-{}", m_workers.size()));
+        worker.net = make_shared<ReactorNet>(worker.reactor);
+        m_workers.push_back(worker);
+    }
+    if (m_ignitionRise > 0.0) {
+        try {
+            m_workers[0].reactor->componentIndex("temperature");
+        } catch (CanteraError&) {
+            throw CanteraError("ReactorEnsemble::prepareWorkers",
+                "Ignition detection requires a reactor type that uses temperature "
+                "as a state variable, which is not the case for '{}'.", m_model);
+        }
+    }
+    for (auto& worker : m_workers) {
+        if (withKinetics) {
+            // rate multipliers are not retained by cloned Kinetics objects
+            for (size_t i = 0; i < kin->nReactions(); i++) {
+                worker.sol->kinetics()->setMultiplier(i, kin->multiplier(i));
+            }
+        }
+        worker.net->setTolerances(m_rtol, m_atol);
+        worker.net->setMaxTimeStep(m_maxTimeStep);
+        if (m_maxSteps) {
+            worker.net->setMaxSteps(m_maxSteps);
+        }
+    }
+}
+
+void ReactorEnsemble::integrateMember(Worker& worker, size_t i, double tEnd,
+                                      span<const double> T, span<const double> P,
+                                      span<const double> X)
+{
+    auto& thermo = *worker.sol->thermo();
+    auto& reactor = *worker.reactor;
+    auto& net = *worker.net;
+    size_t nsp = thermo.nSpecies();
+    size_t width = sampleWidth();
+    size_t nSamples = m_sampleTimes.size();
+    double* samples = m_samples.data() + i * nSamples * width;
+
+    thermo.setState_TPX(T[i], P[i], X.data() + i * nsp);
+    if (reactor.hasAdvanceLimits()) {
+        // remove limits left over from a previous member
+        vector<double> limits(reactor.neq(), -1.0);
+        reactor.setAdvanceLimits(limits.data());
+    }
+    reactor.setInitialVolume(1.0);
+    net.setInitialTime(0.0);
+    net.reinitialize();
+
+    bool detect = m_ignitionRise > 0.0;
+    double ignitionTemperature = T[i] + m_ignitionRise;
+    size_t next = 0; // index of the next sample
+    while (true) {
+        double tOut = (next < nSamples) ? m_sampleTimes[next] : tEnd;
+        if (detect) {
+            // The advance limit is met once the temperature change since the start of
+            // this advance call reaches the remaining rise; integration stops at the
+            // corresponding root.
+            double Tstart = reactor.temperature();
+            if (Tstart >= ignitionTemperature) {
+                m_ignitionTimes[i] = net.time();
+                detect = false;
+                if (m_stopAtIgnition) {
+                    return;
+                }
+                continue;
+            }
+            reactor.setAdvanceLimit("temperature", ignitionTemperature - Tstart);
+            double t = net.advance(tOut, true);
+            if (t < tOut) {
+                if (reactor.temperature() > Tstart) {
+                    m_ignitionTimes[i] = t;
+                    detect = false;
+                    reactor.setAdvanceLimit("temperature", -1.0);
+                    if (m_stopAtIgnition) {
+                        return;
+                    }
+                }
+                // Continue towards the output time; limits are updated
+                continue;
+            }
+        } else {
+            net.advance(tOut);
+        }
+
+        if (next < nSamples) {
+            double* sample = samples + next * width;
+            sample[0] = thermo.temperature();
+            sample[1] = thermo.pressure();
+            thermo.getMassFractions(sample + 2);
+            next++;
+        } else {
+            break;
+        }
+    }
+}
+
+}
@@ -5,12 +5,15 @@
 
 #include "cantera/zeroD/ReactorNet.h"
 #include "cantera/zeroD/FlowDevice.h"
+#include "cantera/zeroD/flowControllers.h"
 #include "cantera/zeroD/ReactorSurface.h"
 #include "cantera/zeroD/Wall.h"
 #include "cantera/zeroD/Reservoir.h"
 #include "cantera/base/utilities.h"
 #include "cantera/base/Array.h"
 #include "cantera/base/Solution.h"
+#include "cantera/base/parallel.h"
+#include "cantera/kinetics/Kinetics.h"
 #include "cantera/numerics/Integrator.h"
 #include "cantera/zeroD/FlowReactor.h"
 #include "cantera/numerics/SystemJacobianFactory.h"
@@ -249,7 +252,9 @@ void ReactorNet::initialize()
         writelog("Number of equations: {:d}\n", neq());
         writelog("Maximum time step:   {:14.6g}\n", m_maxstep);
     }
-    if (m_integ->preconditionerSide() != PreconditionerSide::NO_PRECONDITION) {
+    if (m_integ->preconditionerSide() != PreconditionerSide::NO_PRECONDITION
+        || m_integ->linearSolverType() == "SPARSE")
+    {
         checkPreconditionerSupported();
     }
     m_needIntegratorInit = false;
@@ -264,7 +269,9 @@ void ReactorNet::reinitialize()
             reactor->updateConnected(true);
         }
         m_integ->reinitialize(m_time, *this);
-        if (m_integ->preconditionerSide() != PreconditionerSide::NO_PRECONDITION) {
+        if (m_integ->preconditionerSide() != PreconditionerSide::NO_PRECONDITION
+            || m_integ->linearSolverType() == "SPARSE")
+        {
             checkPreconditionerSupported();
         }
         m_needIntegratorInit = false;
@@ -521,10 +528,46 @@ Integrator& ReactorNet::integrator() {
     return *m_integ;
 }
 
+void ReactorNet::setNumThreads(size_t nThreads)
+{
+    if (nThreads != 1) {
+        for (auto& R : m_bulkReactors) {
+            if (hasDelegatedRates(*R->phase())) {
+                throw CanteraError("ReactorNet::setNumThreads", "Parallel "
+                    "evaluation is not supported for reactor '{}', which uses "
+                    "user-defined reaction rates.", R->name());
+            }
+        }
+    }
+    m_nThreads = nThreads;
+}
+
+void ReactorNet::evalKineticsParallel()
+{
+    if (m_nThreads == 1 || m_bulkReactors.size() < 2) {
+        return;
+    }
+    parallelFor(m_bulkReactors.size(), m_nThreads,
+        [&](size_t worker, size_t begin, size_t end) {
+            vector<double> wdot;
+            for (size_t i = begin; i < end; i++) {
+                auto& R = m_bulkReactors[i];
+                auto kin = R->phase()->kinetics();
+                if (!R->chemistryEnabled() || !kin || !kin->nReactions()) {
+                    continue;
+                }
+                wdot.resize(kin->nTotalSpecies());
+                kin->getNetProductionRates(wdot.data());
+            }
+        });
+}
+
 void ReactorNet::eval(double t, double* y, double* ydot, double* p)
 {
+    PhaseTimer timer(&m_profiler, SolverPhase::residual);
     m_time = t;
     updateState(y);
+    evalKineticsParallel();
     m_LHS.assign(m_nv, 1);
     m_RHS.assign(m_nv, 0);
     for (auto& R : m_reactors) {
@@ -541,7 +584,9 @@ void ReactorNet::eval(double t, double* y, double* ydot, double* p)
 
 void ReactorNet::evalSteady(double* y, double* residual)
 {
+    PhaseTimer timer(&m_profiler, SolverPhase::residual);
     updateState(y);
+    evalKineticsParallel();
     m_LHS.assign(m_nv, 1);
     m_RHS.assign(m_nv, 0);
     for (auto& R : m_reactors) {
@@ -556,6 +601,7 @@ void ReactorNet::evalSteady(double* y, double* residual)
 
 void ReactorNet::evalDae(double t, double* y, double* ydot, double* p, double* residual)
 {
+    PhaseTimer timer(&m_profiler, SolverPhase::residual);
     m_time = t;
     updateState(y);
     for (auto& R : m_reactors) {
@@ -590,6 +636,7 @@ double ReactorNet::sensitivity(size_t k, size_t p)
 
 void ReactorNet::evalJacobian(double t, double* y, double* ydot, double* p, Array2D* j)
 {
+    PhaseTimer timer(&m_profiler, SolverPhase::jacobian);
     //evaluate the unperturbed ydot
     eval(t, y, ydot, p);
     for (size_t n = 0; n < m_nv; n++) {
@@ -612,6 +659,7 @@ void ReactorNet::evalJacobian(double t, double* y, double* ydot, double* p, Arra
 
 void ReactorNet::updateState(double* y)
 {
+    PhaseTimer timer(&m_profiler, SolverPhase::thermo);
     checkFinite("y", y, m_nv);
     for (auto& R : m_reactors) {
         R->updateState(y + R->offset());
@@ -776,6 +824,7 @@ void ReactorNet::preconditionerSolve(double* rhs, double* output)
         throw CanteraError("ReactorNet::preconditionerSolve",
                            "Must only be called after ReactorNet is initialized.");
     }
+    PhaseTimer timer(&m_profiler, SolverPhase::linearSolve);
     m_integ->preconditionerSolve(m_nv, rhs, output);
 }
 
@@ -790,21 +839,28 @@ void ReactorNet::preconditionerSetup(double t, double* y, double gamma)
     precon->reset();
     // Set gamma value for M =I - gamma*J
     precon->setGamma(gamma);
-    // Make a copy of state to adjust it for preconditioner
-    vector<double> yCopy(m_nv);
-    // Get state of reactor
-    getState(yCopy.data());
-    // transform state based on preconditioner rules
-    precon->stateAdjustment(yCopy);
-    // update network with adjusted state
-    updateState(yCopy.data());
+    // The sparse direct solver needs the Jacobian at the actual state, so the state
+    // is only adjusted when the matrix is used as a preconditioner
+    if (m_integ->preconditionerSide() != PreconditionerSide::NO_PRECONDITION) {
+        // Make a copy of state to adjust it for preconditioner
+        vector<double> yCopy(m_nv);
+        // Get state of reactor
+        getState(yCopy.data());
+        // transform state based on preconditioner rules
+        precon->stateAdjustment(yCopy);
+        // update network with adjusted state
+        updateState(yCopy.data());
+    }
     // Get jacobians and give elements to preconditioners
+    PhaseTimer jacTimer(&m_profiler, SolverPhase::jacobian);
     vector<Eigen::Triplet<double>> trips;
     for (auto& R : m_reactors) {
         R->getJacobianElements(trips);
     }
     precon->setFromTriplets(trips);
+    jacTimer.stop();
     // post reactor setup operations
+    PhaseTimer factorTimer(&m_profiler, SolverPhase::factorization);
     precon->updatePreconditioner();
 }
 
@@ -816,6 +872,7 @@ void ReactorNet::updatePreconditioner(double gamma)
     }
     auto precon = m_integ->preconditioner();
     precon->setGamma(gamma);
+    PhaseTimer timer(&m_profiler, SolverPhase::factorization);
     precon->updatePreconditioner();
 }
 
@@ -824,7 +881,8 @@ void ReactorNet::checkPreconditionerSupported() const {
     for (auto reactor : m_bulkReactors) {
         if (!reactor->preconditionerSupported()) {
             throw CanteraError("ReactorNet::checkPreconditionerSupported",
-                "Preconditioning is only supported for type *MoleReactor,\n"
+                "Preconditioning and sparse direct linear solvers are only "
+                "supported for type *MoleReactor,\n"
                 "Reactor type given: '{}'.",
                 reactor->type());
         }
@@ -852,6 +910,99 @@ SteadyReactorSolver::SteadyReactorSolver(ReactorNet* net, double* x0)
         }
         start += R.neq();
     }
+    initJacobianColoring();
+}
+
+void SteadyReactorSolver::initJacobianColoring()
+{
+    size_t nReactors = m_net->nReactors();
+    map<ReactorBase*, size_t> index;
+    for (size_t i = 0; i < nReactors; i++) {
+        index[&m_net->reactor(static_cast<int>(i))] = i;
+    }
+
+    // Residuals of all reactors connected by a flow device, wall, or surface may
+    // depend on the states of all of these reactors
+    vector<set<size_t>> coupled(nReactors);
+    auto connect = [&](const vector<ReactorBase*>& group) {
+        for (auto R1 : group) {
+            auto i1 = index.find(R1);
+            if (i1 == index.end()) {
+                continue; // reservoirs do not have state variables
+            }
+            for (auto R2 : group) {
+                auto i2 = index.find(R2);
+                if (i2 != index.end()) {
+                    coupled[i1->second].insert(i2->second);
+                }
+            }
+        }
+    };
+    auto connectFlow = [&](FlowDevice& device) {
+        vector<ReactorBase*> group = {&device.in(), &device.out()};
+        auto controller = dynamic_cast<PressureController*>(&device);
+        if (controller && controller->primary()) {
+            // mass flow rate depends on the mass flow rate of the primary device
+            group.push_back(&controller->primary()->in());
+            group.push_back(&controller->primary()->out());
+        }
+        connect(group);
+    };
+    auto connectSurface = [&](ReactorSurface* surf) {
+        vector<ReactorBase*> group = {surf};
+        for (size_t n = 0; n < surf->nAdjacent(); n++) {
+            group.push_back(surf->adjacent(n).get());
+        }
+        connect(group);
+    };
+    for (size_t i = 0; i < nReactors; i++) {
+        auto& R = m_net->reactor(static_cast<int>(i));
+        coupled[i].insert(i);
+        for (size_t n = 0; n < R.nInlets(); n++) {
+            connectFlow(R.inlet(n));
+        }
+        for (size_t n = 0; n < R.nOutlets(); n++) {
+            connectFlow(R.outlet(n));
+        }
+        for (size_t n = 0; n < R.nWalls(); n++) {
+            auto& wall = R.wall(n);
+            connect({&wall.left(), &wall.right()});
+        }
+        for (size_t n = 0; n < R.nSurfs(); n++) {
+            connectSurface(R.surface(n));
+        }
+        if (auto surf = dynamic_cast<ReactorSurface*>(&R)) {
+            connectSurface(surf);
+        }
+    }
+
+    // Greedy coloring: reactors can only be perturbed simultaneously if they do not
+    // affect the residuals of any common reactor
+    m_coupled.clear();
+    m_colors.clear();
+    vector<set<size_t>> affected; // residuals affected by each color
+    for (size_t j = 0; j < nReactors; j++) {
+        m_coupled.emplace_back(coupled[j].begin(), coupled[j].end());
+        size_t color = 0;
+        for (; color < m_colors.size(); color++) {
+            bool conflict = false;
+            for (size_t i : coupled[j]) {
+                if (affected[color].count(i)) {
+                    conflict = true;
+                    break;
+                }
+            }
+            if (!conflict) {
+                break;
+            }
+        }
+        if (color == m_colors.size()) {
+            m_colors.emplace_back();
+            affected.emplace_back();
+        }
+        m_colors[color].push_back(j);
+        affected[color].insert(coupled[j].begin(), coupled[j].end());
+    }
 }
 
 void SteadyReactorSolver::eval(double* x, double* r, double rdt, int count)
@@ -879,27 +1030,58 @@ void SteadyReactorSolver::evalJacobian(double* x0)
     m_work1.resize(size());
     m_work2.resize(size());
     eval(x0, m_work1.data(), 0.0, 0);
-    for (size_t j = 0; j < size(); j++) {
-        // perturb x(n); preserve sign(x(n))
-        double xsave = x0[j];
-        double dx = fabs(xsave) * m_jacobianRelPerturb + m_jacobianAbsPerturb;
-        if (xsave < 0) {
-            dx = -dx;
+    size_t nReactors = m_net->nReactors();
+    vector<double> xsave(nReactors);
+    vector<double> rdx(nReactors);
+    for (const auto& color : m_colors) {
+        size_t nvMax = 0;
+        for (size_t j : color) {
+            nvMax = std::max(nvMax, m_net->reactor(static_cast<int>(j)).neq());
         }
-        x0[j] = xsave + dx;
-        double rdx = 1.0 / (x0[j] - xsave);
+        for (size_t n = 0; n < nvMax; n++) {
+            bool perturbed = false;
+            for (size_t j : color) {
+                auto& R = m_net->reactor(static_cast<int>(j));
+                if (n >= R.neq()) {
+                    continue;
+                }
+                // perturb x(n) of reactor j; preserve sign(x(n))
+                size_t ipt = R.offset() + n;
+                xsave[j] = x0[ipt];
+                double dx = fabs(xsave[j]) * m_jacobianRelPerturb + m_jacobianAbsPerturb;
+                if (xsave[j] < 0) {
+                    dx = -dx;
+                }
+                x0[ipt] = xsave[j] + dx;
+                rdx[j] = 1.0 / (x0[ipt] - xsave[j]);
+                perturbed = true;
+            }
+            if (!perturbed) {
+                continue;
+            }
 
-        // calculate perturbed residual
-        eval(x0, m_work2.data(), 0.0, 0);
+            // calculate perturbed residual
+            eval(x0, m_work2.data(), 0.0, 0);
 
-        // compute nth column of Jacobian
-        for (size_t i = 0; i < size(); i++) {
-            double delta = m_work2[i] - m_work1[i];
-            if (std::abs(delta) > m_jacobianThreshold || i == j) {
-                m_jac->setValue(i, j, delta * rdx);
+            // compute columns of Jacobian for all perturbed reactors
+            for (size_t j : color) {
+                auto& R = m_net->reactor(static_cast<int>(j));
+                if (n >= R.neq()) {
+                    continue;
+                }
+                size_t ipt = R.offset() + n;
+                for (size_t k : m_coupled[j]) {
+                    auto& Rk = m_net->reactor(static_cast<int>(k));
+                    for (size_t i = Rk.offset(); i < Rk.offset() + Rk.neq(); i++) {
+                        double delta = m_work2[i] - m_work1[i];
+                        if (std::abs(delta) > m_jacobianThreshold || i == ipt) {
+                            m_jac->setValue(i, ipt, delta * rdx[j]);
+                        }
+                    }
+                }
+                x0[ipt] = xsave[j];
             }
         }
-        x0[j] = xsave;
     }
     // Restore system to unperturbed state
     m_net->updateState(x0);
@@ -111,6 +111,29 @@ TEST(parseCompString, missing_last_value)
                  CanteraError);
 }
 
+TEST(sha256, test_vectors)
+{
+    EXPECT_EQ(sha256(""),
+        "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855");
+    EXPECT_EQ(sha256("abc"),
+        "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad");
+    // message length requiring an additional block for padding
+    EXPECT_EQ(sha256("abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq"),
+        "248d6a61d20638b8e5c026930c3e6039a33ce45964ff2167f6ecedd419db06c1");
+    EXPECT_EQ(sha256(string(1000000, 'a')),
+        "cdc76e5c9914fb9281a1c7e284d73e67f1809a48a497200e046d39ccc7112cd0");
+}
+
+TEST(littleEndian, round_trip)
+{
+    EXPECT_EQ(toLittleEndian<uint32_t>(0x01020304), string("\x04\x03\x02\x01"));
+    EXPECT_EQ(toLittleEndian(1.0), string("\0\0\0\0\0\0\xf0\x3f", 8));
+    EXPECT_EQ(fromLittleEndian<int64_t>(toLittleEndian<int64_t>(-12345).data()),
+              -12345);
+    EXPECT_EQ(fromLittleEndian<double>(toLittleEndian(-2.5e-300).data()), -2.5e-300);
+    EXPECT_EQ(fromLittleEndian<uint8_t>(toLittleEndian<uint8_t>(200).data()), 200);
+}
+
 }
 
 int main(int argc, char** argv)
@@ -1,6 +1,8 @@
 #include "gtest/gtest.h"
 #include "cantera/base/Interface.h"
 #include "cantera/base/SolutionArray.h"
+#include "cantera/kinetics/Reaction.h"
+#include "cantera/kinetics/Arrhenius.h"
 #include "cantera/transport/Transport.h"
 
 using namespace Cantera;
@@ -30,6 +32,73 @@ TEST(Solution, clone_idealgas)
     EXPECT_GT(kf2[2], kf1[2]);
 }
 
+TEST(Solution, clone_independent_reactions)
+{
+    auto soln = newSolution("h2o2.yaml");
+    size_t nrxn = soln->kinetics()->nReactions();
+    soln->thermo()->setState_TPX(1200, OneAtm, "H2:0.5, O2:0.4, AR:0.1");
+    auto dup = soln->clone();
+    for (size_t i = 0; i < nrxn; i++) {
+        EXPECT_NE(soln->kinetics()->reaction(i).get(),
+                  dup->kinetics()->reaction(i).get());
+        EXPECT_EQ(soln->kinetics()->reaction(i)->equation(),
+                  dup->kinetics()->reaction(i)->equation());
+    }
+    dup->thermo()->setState_TPX(1200, OneAtm, "H2:0.5, O2:0.4, AR:0.1");
+    vector<double> kf0(nrxn);
+    dup->kinetics()->getFwdRateConstants(kf0.data());
+
+    // Modifying a reaction of the original in place does not affect the clone
+    auto orig = soln->kinetics()->reaction(2);
+    auto dupRate = dup->kinetics()->reaction(2)->rate();
+    orig->setRate(make_shared<ArrheniusRate>(3.87, 2.7, 6260.0 * 4184));
+    soln->kinetics()->modifyReaction(2, orig);
+    EXPECT_EQ(dup->kinetics()->reaction(2)->rate().get(), dupRate.get());
+
+    vector<double> kf1(nrxn), kf2(nrxn);
+    soln->kinetics()->getFwdRateConstants(kf1.data());
+    dup->kinetics()->getFwdRateConstants(kf2.data());
+    EXPECT_NEAR(kf1[2], 0.1 * kf2[2], 1e-10 * kf2[2]);
+    for (size_t i = 0; i < nrxn; i++) {
+        EXPECT_DOUBLE_EQ(kf2[i], kf0[i]) << "reaction " << i;
+        if (i != 2) {
+            EXPECT_NEAR(kf1[i], kf2[i], 1e-12 * kf1[i]);
+        }
+    }
+}
+
+TEST(Solution, clone_shared_stoichiometry)
+{
+    auto soln = newSolution("h2o2.yaml");
+    auto kin = soln->kinetics();
+    size_t nrxn = kin->nReactions();
+    soln->thermo()->setState_TPX(1200, OneAtm, "H2:0.5, O2:0.4, AR:0.1");
+    auto dup = soln->clone();
+    auto kinDup = dup->kinetics();
+    EXPECT_EQ(&kin->reactantStoichCoeffs(), &kinDup->reactantStoichCoeffs());
+    EXPECT_EQ(&kin->productStoichCoeffs(), &kinDup->productStoichCoeffs());
+    EXPECT_EQ(&kin->revProductStoichCoeffs(), &kinDup->revProductStoichCoeffs());
+
+    // Adding a reaction to the clone creates its own copy of the data
+    auto rate = make_shared<ArrheniusRate>(1e10, 0.0, 1e8);
+    auto rxn = make_shared<Reaction>(Composition{{"H2", 1}, {"O2", 1}},
+                                     Composition{{"OH", 2}}, rate);
+    kinDup->addReaction(rxn);
+    EXPECT_NE(&kin->reactantStoichCoeffs(), &kinDup->reactantStoichCoeffs());
+    EXPECT_NE(&kin->productStoichCoeffs(), &kinDup->productStoichCoeffs());
+    EXPECT_EQ(kin->reactantStoichCoeffs().cols(), static_cast<long>(nrxn));
+    EXPECT_EQ(kinDup->reactantStoichCoeffs().cols(), static_cast<long>(nrxn + 1));
+
+    dup->thermo()->setState_TPX(1200, OneAtm, "H2:0.5, O2:0.4, AR:0.1");
+    vector<double> rop1(nrxn), rop2(nrxn + 1);
+    kin->getNetRatesOfProgress(rop1.data());
+    kinDup->getNetRatesOfProgress(rop2.data());
+    for (size_t i = 0; i < nrxn; i++) {
+        EXPECT_NEAR(rop1[i], rop2[i], 1e-12 * std::abs(rop1[i]) + 1e-300);
+    }
+    EXPECT_GT(rop2[nrxn], 0.0);
+}
+
 TEST(Solution, clone_surf_complete)
 {
     auto soln1 = newInterface("ptcombust.yaml", "Pt_surf");
@@ -208,6 +277,216 @@ TEST(SolutionArray, normalize)
     }
 }
 
+TEST(SolutionArray, evalProperty)
+{
+    auto gas = newSolution("h2o2.yaml");
+    auto arr = SolutionArray::create(gas, 7);
+    size_t nsp = gas->thermo()->nSpecies();
+    for (int loc = 0; loc < arr->size(); loc++) {
+        arr->setLoc(loc);
+        gas->thermo()->setState_TPX(300. + 200. * loc, OneAtm, "H2:1, O2:0.7, AR:2");
+        arr->updateState(loc);
+    }
+
+    ASSERT_TRUE(SolutionArray::hasProperty("cp_mass"));
+    ASSERT_FALSE(SolutionArray::hasProperty("spam"));
+    ASSERT_THROW(arr->evalProperty("spam"), CanteraError);
+    ASSERT_EQ(arr->propertySize("cp_mass"), 1u);
+    ASSERT_EQ(arr->propertySize("netProductionRates"), nsp);
+    ASSERT_EQ(arr->propertySize("netRatesOfProgress"), gas->kinetics()->nReactions());
+
+    auto cp = arr->evalProperty("cp_mass");
+    auto wdot = arr->evalProperty("netProductionRates");
+    auto visc = arr->evalProperty("viscosity");
+    ASSERT_EQ(cp.size(), 7u);
+    ASSERT_EQ(wdot.size(), 7 * nsp);
+    vector<double> wdotRef(nsp);
+    for (int loc = 0; loc < arr->size(); loc++) {
+        arr->setLoc(loc);
+        EXPECT_DOUBLE_EQ(cp[loc], gas->thermo()->cp_mass());
+        EXPECT_DOUBLE_EQ(visc[loc], gas->transport()->viscosity());
+        gas->kinetics()->getNetProductionRates(wdotRef.data());
+        for (size_t k = 0; k < nsp; k++) {
+            EXPECT_DOUBLE_EQ(wdot[loc * nsp + k], wdotRef[k]);
+        }
+    }
+
+    // sliced arrays only evaluate active entries
+    auto sliced = arr->share({5, 2});
+    auto T = sliced->evalProperty("temperature");
+    ASSERT_EQ(T.size(), 2u);
+    EXPECT_DOUBLE_EQ(T[0], 1300.);
+    EXPECT_DOUBLE_EQ(T[1], 700.);
+}
+
+TEST(SolutionArray, evalPropertyThreads)
+{
+    auto gas = newSolution("h2o2.yaml");
+    auto arr = SolutionArray::create(gas, 9);
+    for (int loc = 0; loc < arr->size(); loc++) {
+        arr->setLoc(loc);
+        gas->thermo()->setState_TPX(300. + 150. * loc, OneAtm, "H2:1, O2:0.7, AR:2");
+        arr->updateState(loc);
+    }
+    gas->kinetics()->setMultiplier(2, 0.5);
+    auto visc = arr->evalProperty("viscosity");
+    auto Dkm = arr->evalProperty("mixDiffCoeffs");
+    auto wdot = arr->evalProperty("netProductionRates");
+    gas->thermo()->setState_TP(500., 2 * OneAtm);
+
+    EXPECT_EQ(arr->numThreads(), 1u);
+    arr->setNumThreads(4);
+    EXPECT_EQ(arr->numThreads(), 4u);
+    auto viscPar = arr->evalProperty("viscosity");
+    auto DkmPar = arr->evalProperty("mixDiffCoeffs");
+    auto wdotPar = arr->evalProperty("netProductionRates");
+    for (size_t i = 0; i < visc.size(); i++) {
+        EXPECT_DOUBLE_EQ(viscPar[i], visc[i]);
+    }
+    for (size_t i = 0; i < Dkm.size(); i++) {
+        EXPECT_NEAR(DkmPar[i], Dkm[i], 1e-12 * Dkm[i]);
+        EXPECT_NEAR(wdotPar[i], wdot[i], 1e-12 * (1 + std::abs(wdot[i])));
+    }
+    // state of associated Solution object is not modified
+    EXPECT_DOUBLE_EQ(gas->thermo()->temperature(), 500.);
+
+    // sliced arrays share worker settings
+    auto sliced = arr->share({7, 1, 4});
+    EXPECT_EQ(sliced->numThreads(), 4u);
+    auto T = sliced->evalProperty("temperature");
+    EXPECT_DOUBLE_EQ(T[0], 1350.);
+    EXPECT_DOUBLE_EQ(T[1], 450.);
+    EXPECT_DOUBLE_EQ(T[2], 900.);
+}
+
+TEST(SolutionArray, setStates)
+{
+    auto gas = newSolution("h2o2.yaml", "", "none");
+    auto arr = SolutionArray::create(gas, 4);
+    size_t nsp = gas->thermo()->nSpecies();
+    vector<double> T{400., 800., 1200., 1600.};
+    vector<double> P(4, 2 * OneAtm);
+    vector<double> X(4 * nsp, 0.);
+    size_t iH2 = gas->thermo()->speciesIndex("H2");
+    size_t iO2 = gas->thermo()->speciesIndex("O2");
+    for (size_t loc = 0; loc < 4; loc++) {
+        X[loc * nsp + iH2] = 2. + loc;
+        X[loc * nsp + iO2] = 1.;
+    }
+    arr->setStates("TPX", T.data(), P.data(), X.data());
+    auto Tout = arr->evalProperty("temperature");
+    auto Xout = arr->evalProperty("moleFractions");
+    auto h = arr->evalProperty("enthalpy_mass");
+    for (size_t loc = 0; loc < 4; loc++) {
+        EXPECT_DOUBLE_EQ(Tout[loc], T[loc]);
+        EXPECT_NEAR(Xout[loc * nsp + iH2], (2. + loc) / (3. + loc), 1e-14);
+    }
+
+    // set enthalpy and pressure while retaining compositions
+    for (auto& hk : h) {
+        hk += 1e5;
+    }
+    arr->setStates("HP", h.data(), P.data());
+    auto hout = arr->evalProperty("enthalpy_mass");
+    Tout = arr->evalProperty("temperature");
+    for (size_t loc = 0; loc < 4; loc++) {
+        EXPECT_NEAR(hout[loc], h[loc], 1e-8 * std::abs(h[loc]));
+        EXPECT_GT(Tout[loc], T[loc]);
+    }
+
+    // skip normalization
+    arr->setStates("TPY", T.data(), P.data(), X.data(), false);
+    auto Y = arr->evalProperty("massFractions");
+    EXPECT_DOUBLE_EQ(Y[nsp + iH2], 3.);
+    arr->setStates("TPX", T.data(), P.data(), X.data(), false);
+    Y = arr->evalProperty("massFractions");
+    Xout = arr->evalProperty("moleFractions");
+    auto Pout = arr->evalProperty("pressure");
+    double sumY = 0.;
+    for (size_t k = 0; k < nsp; k++) {
+        sumY += Y[nsp + k];
+    }
+    EXPECT_NEAR(sumY, 4., 1e-14);
+    EXPECT_NEAR(Xout[nsp + iH2], 0.75, 1e-14);
+    EXPECT_NEAR(Pout[1], P[1], 1e-8 * P[1]);
+
+    // entries added by resizing are zero-initialized; setStates uses the current
+    // state of the phase for entries that have not been assigned a state
+    arr->resize(6);
+    auto Tnew = arr->getComponent("T").asVector<double>();
+    EXPECT_EQ(Tnew[5], 0.);
+    gas->thermo()->setState_TPX(500., OneAtm, "H2:1");
+    arr->updateState(4);
+    gas->thermo()->setState_TPX(500., OneAtm, "O2:1, AR:1");
+    T.resize(6, 600.);
+    P.resize(6, OneAtm);
+    arr->setStates("TP", T.data(), P.data());
+    Xout = arr->evalProperty("moleFractions");
+    EXPECT_NEAR(Xout[5 * nsp + iO2], 0.5, 1e-14);
+    EXPECT_NEAR(Xout[4 * nsp + iH2], 1.0, 1e-14);
+    EXPECT_NEAR(Xout[nsp + iH2], 0.75, 1e-14);
+
+    EXPECT_THROW(arr->setStates("TX", T.data(), P.data(), X.data()), CanteraError);
+    EXPECT_THROW(arr->setStates("TPX", T.data(), P.data()), CanteraError);
+    EXPECT_THROW(arr->setStates("TP", T.data(), P.data(), X.data()), CanteraError);
+}
+
+TEST(SolutionArray, componentData)
+{
+    auto gas = newSolution("h2o2.yaml", "", "none");
+    auto arr = SolutionArray::create(gas, 5);
+    size_t nsp = gas->thermo()->nSpecies();
+    vector<double> T{400., 800., 1200., 1600., 2000.};
+    vector<double> P(5, OneAtm);
+    arr->setStates("TP", T.data(), P.data());
+    AnyValue values;
+    values = vector<double>{1., 2., 3., 4., 5.};
+    arr->addExtra("spam");
+    arr->setComponent("spam", values);
+
+    size_t stride, width;
+    double* data = arr->componentData("T", stride, width);
+    ASSERT_NE(data, nullptr);
+    EXPECT_EQ(stride, gas->thermo()->stateSize());
+    EXPECT_EQ(width, 1u);
+    for (size_t k = 0; k < 5; k++) {
+        EXPECT_DOUBLE_EQ(data[k * stride], T[k]);
+    }
+    EXPECT_EQ(data, arr->componentData("temperature", stride, width));
+    data = arr->componentData("Y", stride, width);
+    ASSERT_NE(data, nullptr);
+    EXPECT_EQ(width, nsp);
+    EXPECT_EQ(arr->componentData("P", stride, width), nullptr);
+
+    // auxiliary components retain their location when values are updated
+    data = arr->componentData("spam", stride, width);
+    ASSERT_NE(data, nullptr);
+    EXPECT_EQ(stride, 1u);
+    values = vector<double>{5., 4., 3., 2., 1.};
+    arr->setComponent("spam", values);
+    EXPECT_EQ(data, arr->componentData("spam", stride, width));
+    EXPECT_DOUBLE_EQ(data[0], 5.);
+
+    // contiguous slices
+    auto sliced = arr->share({2, 3, 4});
+    data = sliced->componentData("T", stride, width);
+    ASSERT_NE(data, nullptr);
+    EXPECT_DOUBLE_EQ(data[0], 1200.);
+    EXPECT_DOUBLE_EQ(data[stride], 1600.);
+    EXPECT_DOUBLE_EQ(sliced->componentData("spam", stride, width)[0], 3.);
+    EXPECT_EQ(arr->share({1, 3})->componentData("T", stride, width), nullptr);
+
+    // storage cannot be resized or replaced while shared
+    auto anchor = arr->sharedData();
+    sliced.reset();
+    EXPECT_THROW(arr->resize(6), CanteraError);
+    values = vector<string>(5, "eggs");
+    EXPECT_THROW(arr->setComponent("spam", values), CanteraError);
+    anchor.reset();
+    arr->resize(6);
+    EXPECT_EQ(arr->size(), 6);
+}
+
 TEST(SolutionArray, meta)
 {
     auto gas = newSolution("h2o2.yaml",  "", "none");
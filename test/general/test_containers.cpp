@@ -1,6 +1,8 @@
 #include "gtest/gtest.h"
 #include "gmock/gmock.h"
 #include "cantera/base/AnyMap.h"
+#include "cantera/base/global.h"
+#include <fstream>
 
 using namespace Cantera;
 
@@ -431,6 +433,108 @@ TEST(AnyMap, dumpYamlString)
         generated["species"].getMapWhere("name", "OH")["thermo"]["data"].asVector<vector<double>>());
 }
 
+TEST(AnyMap, persistentCache)
+{
+    std::filesystem::path cacheDir = "input-cache";
+    std::filesystem::remove_all(cacheDir);
+    string contents =
+        "scalars: {x: 1.5, n: 3, flag: true, name: spam, empty: null}\n"
+        "vectors:\n"
+        "  doubles: [1.0, 2, 3.5]\n"
+        "  ints: [1, 2, 3]\n"
+        "  bools: [true, false]\n"
+        "  strings: [a, b]\n"
+        "  mixed: [1.0, a, true]\n"
+        "  matrix: [[1, 2.5], [3, 4]]\n"
+        "  int-matrix: [[1, 2], [3]]\n"
+        "  string-matrix: [[a, b], [c]]\n"
+        "items:\n"
+        "- {name: A, value: 1 cm}\n"
+        "- name: B\n"
+        "  value: [2, 3]\n";
+    std::ofstream("cache-test.yaml") << contents;
+    std::ofstream("cache-test-copy.yaml") << contents;
+    setCacheDirectory(cacheDir.string());
+    AnyMap::clearCachedFile("cache-test.yaml");
+    AnyMap::clearCachedFile("cache-test-copy.yaml");
+    AnyMap original = AnyMap::fromYamlFile("cache-test.yaml");
+    ASSERT_TRUE(std::filesystem::exists(cacheDir));
+    auto nFiles = [&]() {
+        auto iter = std::filesystem::directory_iterator(cacheDir);
+        return std::distance(begin(iter), end(iter));
+    };
+    EXPECT_EQ(nFiles(), 1);
+
+    // A file with identical contents is loaded from the cache
+    AnyMap cached = AnyMap::fromYamlFile("cache-test-copy.yaml");
+    EXPECT_EQ(nFiles(), 1);
+    EXPECT_TRUE(cached["scalars"]["empty"].empty());
+    auto strip = [](AnyMap& m) {
+        // Remove the file name and null values, which cannot be compared
+        m.erase("__file__");
+        m["scalars"].as<AnyMap>().erase("empty");
+    };
+    strip(original);
+    strip(cached);
+    EXPECT_EQ(cached, original);
+    EXPECT_EQ(cached.toYamlString(), original.toYamlString());
+    EXPECT_EQ(cached["vectors"]["mixed"].asVector<AnyValue>()[1].asString(), "a");
+    EXPECT_DOUBLE_EQ(cached["items"].asVector<AnyMap>()[0].convert("value", "m"),
+                     0.01);
+
+    // Error messages refer to the same locations in the input file
+    auto errorMessage = [](const AnyMap& m) {
+        try {
+            m["items"].asVector<AnyMap>()[1].at("spam");
+        } catch (CanteraError& err) {
+            return string(err.what());
+        }
+        return string();
+    };
+    EXPECT_THAT(errorMessage(cached), testing::HasSubstr("line 13"));
+    EXPECT_THAT(errorMessage(cached), testing::HasSubstr("cache-test-copy.yaml"));
+
+    // Corrupt cache files are replaced
+    auto cacheFile = std::filesystem::directory_iterator(cacheDir)->path();
+    std::filesystem::resize_file(cacheFile, 100);
+    AnyMap::clearCachedFile("cache-test.yaml");
+    AnyMap reloaded = AnyMap::fromYamlFile("cache-test.yaml");
+    strip(reloaded);
+    EXPECT_EQ(reloaded, original);
+    EXPECT_GT(std::filesystem::file_size(cacheFile), 100u);
+
+    setCacheDirectory("");
+    EXPECT_EQ(cacheDirectory(), "");
+    std::filesystem::remove_all(cacheDir);
+    std::filesystem::remove("cache-test.yaml");
+    std::filesystem::remove("cache-test-copy.yaml");
+}
+
+TEST(AnyMap, persistentCacheKeys)
+{
+    std::filesystem::path cacheDir = "entry-cache";
+    std::filesystem::remove_all(cacheDir);
+    setCacheDirectory(cacheDir.string());
+    writeCacheEntry("test", "key-A", "data-A");
+    auto fileA = std::filesystem::directory_iterator(cacheDir)->path();
+    std::filesystem::remove(fileA);
+    writeCacheEntry("test", "key-B", "data-B");
+    auto fileB = std::filesystem::directory_iterator(cacheDir)->path();
+    // entries are identified by a SHA-256 digest
+    EXPECT_EQ(fileB.stem().string().size(), string("test-").size() + 64);
+    string data;
+    ASSERT_TRUE(readCacheEntry("test", "key-B", data));
+    EXPECT_EQ(data, "data-B");
+    EXPECT_FALSE(readCacheEntry("test", "key-A", data));
+
+    // An entry stored under a colliding file name does not match a different key
+    std::filesystem::copy_file(fileB, fileA);
+    EXPECT_FALSE(readCacheEntry("test", "key-A", data));
+
+    setCacheDirectory("");
+    std::filesystem::remove_all(cacheDir);
+}
+
 TEST(AnyMap, YamlFlowStyle)
 {
     AnyMap original;
@@ -5,6 +5,8 @@
 #include "gmock/gmock.h"
 #include "cantera/base/global.h"
 #include "cantera/base/Solution.h"
+#include "cantera/base/parallel.h"
+#include "cantera/base/Profiler.h"
 
 using namespace Cantera;
 using ::testing::HasSubstr;
@@ -30,3 +32,70 @@ TEST(CanteraError, stacktrace) {
     }
     EXPECT_TRUE(raised);
 }
+
+TEST(parallelFor, blocks) {
+    size_t n = 11;
+    vector<size_t> worker(n, npos);
+    parallelFor(n, 3, [&](size_t w, size_t begin, size_t end) {
+        for (size_t k = begin; k < end; k++) {
+            worker[k] = w;
+        }
+    });
+    vector<size_t> expected{0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2};
+    EXPECT_EQ(worker, expected);
+
+    // fewer items than threads
+    vector<int> count(2, 0);
+    parallelFor(2, 8, [&](size_t w, size_t begin, size_t end) {
+        EXPECT_EQ(end, begin + 1);
+        count[w] += 1;
+    });
+    EXPECT_EQ(count, vector<int>({1, 1}));
+    EXPECT_GE(hardwareThreads(), 1u);
+}
+
+TEST(parallelFor, exceptions) {
+    auto func = [](size_t w, size_t, size_t) {
+        if (w == 1) {
+            throw CanteraError("test", "worker failed");
+        }
+    };
+    EXPECT_THROW(parallelFor(10, 4, func), CanteraError);
+}
+
+TEST(Profiler, timers) {
+    Profiler profiler;
+    size_t cat = profiler.addCategory("test");
+    EXPECT_EQ(profiler.addCategory("test"), cat);
+    EXPECT_EQ(profiler.categoryName(cat), "test");
+    EXPECT_THROW(profiler.time("unknown"), CanteraError);
+    {
+        ProfileTimer timer(&profiler, cat);
+    }
+    EXPECT_EQ(profiler.calls("test"), 0u);
+    if (!Profiler::profilingSupported()) {
+        EXPECT_THROW(profiler.setEnabled(true), CanteraError);
+        GTEST_SKIP() << "Cantera was compiled without support for profiling";
+    }
+
+    profiler.setEnabled(true);
+    {
+        ProfileTimer timer(&profiler, cat, false);
+        for (int i = 0; i < 3; i++) {
+            timer.start();
+            timer.stop();
+        }
+    }
+    {
+        ProfileTimer timer(&profiler, cat, true, 0);
+    }
+    {
+        ProfileTimer timer(nullptr, cat);
+    }
+    EXPECT_EQ(profiler.calls("test"), 3u);
+    EXPECT_GT(profiler.time("test"), 0.0);
+    EXPECT_EQ(profiler.stats()["test"]["calls"].asInt(), 3);
+    profiler.clear();
+    EXPECT_EQ(profiler.calls("test"), 0u);
+    EXPECT_THROW(profiler.add(cat + 1, 1.0), IndexError);
+}
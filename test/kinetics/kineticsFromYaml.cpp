@@ -1023,3 +1023,112 @@ TEST_F(ReactionToYaml, BlowersMaselInterface)
     EXPECT_TRUE(std::dynamic_pointer_cast<InterfaceBlowersMaselRate>(duplicate->rate()));
     compareReactions();
 }
+
+TEST(Kinetics, evalBatch)
+{
+    auto gas = newSolution("h2o2.yaml", "", "none");
+    auto& thermo = *gas->thermo();
+    auto kin = gas->kinetics();
+    size_t nsp = thermo.nSpecies();
+    size_t nr = kin->nReactions();
+    vector<double> T{800., 1200., 1600., 2000., 2400.};
+    vector<double> P{OneAtm, 2 * OneAtm, OneAtm, 5 * OneAtm, OneAtm};
+    size_t n = T.size();
+    vector<double> Y(n * nsp);
+    for (size_t i = 0; i < n; i++) {
+        thermo.setMoleFractionsByName(
+            Composition{{"H2", 1.0}, {"O2", 0.7}, {"AR", 2.0}, {"H", 0.01 * i}});
+        thermo.getMassFractions(Y.data() + i * nsp);
+    }
+    thermo.setState_TP(500., 2 * OneAtm);
+
+    vector<double> wdot(n * nsp);
+    kin->evalBatch("netProductionRates", n, T.data(), P.data(), Y.data(), wdot.data());
+    EXPECT_DOUBLE_EQ(thermo.temperature(), 500.);
+    EXPECT_DOUBLE_EQ(thermo.pressure(), 2 * OneAtm);
+    vector<double> ref(nsp);
+    for (size_t i = 0; i < n; i++) {
+        thermo.setState_TPY(T[i], P[i], Y.data() + i * nsp);
+        kin->getNetProductionRates(ref.data());
+        for (size_t k = 0; k < nsp; k++) {
+            EXPECT_NEAR(wdot[i * nsp + k], ref[k], 1e-12 * (1 + std::abs(ref[k])));
+        }
+    }
+
+    // worker objects used for parallel evaluation reflect multipliers and are
+    // replaced when reactions are modified
+    kin->setMultiplier(1, 0.5);
+    vector<double> kf(n * nr), kfPar(n * nr);
+    kin->evalBatch("fwdRateConstants", n, T.data(), P.data(), Y.data(), kf.data());
+    kin->evalBatch("fwdRateConstants", n, T.data(), P.data(), Y.data(),
+                   kfPar.data(), 3);
+    for (size_t i = 0; i < kf.size(); i++) {
+        EXPECT_NEAR(kfPar[i], kf[i], 1e-12 * kf[i]);
+    }
+    auto rxn = kin->reaction(2);
+    auto rate = std::dynamic_pointer_cast<ArrheniusRate>(rxn->rate());
+    ASSERT_TRUE(rate);
+    auto modified = make_shared<Reaction>(rxn->reactants, rxn->products,
+        make_shared<ArrheniusRate>(2 * rate->preExponentialFactor(),
+                                   rate->temperatureExponent(),
+                                   rate->activationEnergy()));
+    kin->modifyReaction(2, modified);
+    kin->evalBatch("fwdRateConstants", n, T.data(), P.data(), Y.data(),
+                   kfPar.data(), 3);
+    for (size_t i = 0; i < n; i++) {
+        EXPECT_NEAR(kfPar[i * nr + 2], 2 * kf[i * nr + 2], 1e-12 * kf[i * nr + 2]);
+        EXPECT_NEAR(kfPar[i * nr + 1], kf[i * nr + 1], 1e-12 * kf[i * nr + 1]);
+    }
+
+    auto unattached = newKinetics("none");
+    EXPECT_THROW(unattached->evalBatch("netProductionRates", 0, nullptr, nullptr,
+                                       nullptr, nullptr), CanteraError);
+}
+
+TEST(Kinetics, rateTabulationPlog)
+{
+    auto ref = newSolution("pdep-test.yaml", "gas");
+    auto gas = newSolution("pdep-test.yaml", "gas");
+    AnyMap settings;
+    settings["T-range"] = vector<double>{300., 2000.};
+    gas->kinetics()->setRateTabulation(settings);
+    // tables are created on first use and are then shared with clones
+    vector<double> wdot(gas->thermo()->nSpecies());
+    gas->kinetics()->getNetProductionRates(wdot.data());
+    auto dup = gas->clone();
+
+    size_t nr = gas->kinetics()->nReactions();
+    vector<double> kf(nr), kfRef(nr), kfDup(nr), kc(nr), kcRef(nr);
+    vector<double> dq(nr), dqRef(nr);
+    // pressures include nodes of P-log rates, intermediate pressures, and
+    // pressures outside the range of some rate expressions
+    for (double P : {0.001 * OneAtm, 0.02 * OneAtm, OneAtm, 3.7 * OneAtm,
+                     100 * OneAtm}) {
+        for (double T : {300., 612.3, 1000., 1873.1}) {
+            for (auto sol : {ref, gas, dup}) {
+                sol->thermo()->setState_TPX(T, P, "R1A:0.3, R1B:0.4, H:0.2, R2:0.1");
+            }
+            ref->kinetics()->getFwdRateConstants(kfRef.data());
+            gas->kinetics()->getFwdRateConstants(kf.data());
+            dup->kinetics()->getFwdRateConstants(kfDup.data());
+            for (size_t i = 0; i < 4; i++) {
+                // P-log reactions
+                EXPECT_NEAR(kf[i], kfRef[i], 2e-4 * kfRef[i]);
+                // parameters of reactions of the clone are subject to round-off
+                // errors from unit conversions, which do not affect shared tables
+                EXPECT_EQ(kfDup[i], kf[i]);
+            }
+
+            // equilibrium constants are tabulated, but Delta G^0 is still
+            // available to methods that need it
+            ref->kinetics()->getEquilibriumConstants(kcRef.data());
+            gas->kinetics()->getEquilibriumConstants(kc.data());
+            ref->kinetics()->getNetRatesOfProgress_ddT(dqRef.data());
+            gas->kinetics()->getNetRatesOfProgress_ddT(dq.data());
+            for (size_t i = 0; i < nr; i++) {
+                EXPECT_NEAR(kc[i], kcRef[i], 1e-12 * kcRef[i]);
+                EXPECT_NEAR(dq[i], dqRef[i], 1e-3 * std::abs(dqRef[i]) + 1e-20);
+            }
+        }
+    }
+}
@@ -219,6 +219,120 @@ TEST_F(PdepTest, ChebyshevEdgeCases)
     EXPECT_NEAR(3.354054351e+07, kf[4], 1e-1);
 }
 
+TEST(RateTabulation, interpolatedRates)
+{
+    auto soln = newSolution("../data/pdep-test.yaml");
+    auto kin = soln->kinetics();
+    auto thermo = soln->thermo();
+    size_t nr = kin->nReactions();
+    vector<double> T = {300.0, 455.5, 873.2, 1403.7, 2000.0};
+    vector<double> P = {1000.0, 3.5e4, 101325, 2.3e6, 1.0e7};
+    vector<double> kf(nr), kr(nr), kf_tab(nr), kr_tab(nr);
+
+    AnyMap settings;
+    settings["T-range"] = vector<double>{300.0, 2000.0};
+    settings["P-range"] = vector<double>{1000.0, 1.0e7};
+    settings["rtol"] = 1e-5;
+
+    vector<vector<double>> kf_ref, kr_ref;
+    string X = "H:1.0, R1A:1.0, R2:1.0, R3:1.0, R4:1.0";
+    for (double Pi : P) {
+        for (double Ti : T) {
+            thermo->setState_TPX(Ti, Pi, X);
+            kin->getFwdRateConstants(kf.data());
+            kin->getRevRateConstants(kr.data());
+            kf_ref.push_back(kf);
+            kr_ref.push_back(kr);
+        }
+    }
+
+    kin->setRateTabulation(settings);
+    size_t n = 0;
+    for (double Pi : P) {
+        for (double Ti : T) {
+            thermo->setState_TPX(Ti, Pi, X);
+            kin->getFwdRateConstants(kf_tab.data());
+            kin->getRevRateConstants(kr_tab.data());
+            for (size_t i = 0; i < nr; i++) {
+                EXPECT_NEAR(kf_tab[i], kf_ref[n][i], 1e-5 * kf_ref[n][i])
+                    << "T = " << Ti << ", P = " << Pi << ", reaction " << i;
+                EXPECT_NEAR(kr_tab[i], kr_ref[n][i], 2e-5 * kr_ref[n][i])
+                    << "T = " << Ti << ", P = " << Pi << ", reaction " << i;
+            }
+            n++;
+        }
+    }
+
+    // Outside of the tabulated range, rate constants are evaluated directly
+    thermo->setState_TP(2500.0, 101325);
+    kin->getFwdRateConstants(kf_tab.data());
+    kin->setRateTabulation(AnyMap());
+    kin->getFwdRateConstants(kf.data());
+    for (size_t i = 0; i < nr; i++) {
+        EXPECT_DOUBLE_EQ(kf_tab[i], kf[i]);
+    }
+}
+
+TEST(RateTabulation, settings)
+{
+    auto soln = newSolution("../data/pdep-test.yaml");
+    auto kin = soln->kinetics();
+    AnyMap settings;
+    kin->getRateTabulation(settings);
+    EXPECT_TRUE(settings.empty());
+
+    settings["T-range"] = vector<double>{500.0, 1500.0};
+    kin->setRateTabulation(settings);
+    AnyMap out;
+    kin->getRateTabulation(out);
+    EXPECT_EQ(out["T-range"].asVector<double>(), (vector<double>{500.0, 1500.0}));
+    EXPECT_FALSE(out.hasKey("P-range"));
+    EXPECT_DOUBLE_EQ(out["rtol"].asDouble(), 1e-4);
+    EXPECT_TRUE(kin->parameters().hasKey("rate-tabulation"));
+
+    settings["T-range"] = vector<double>{1500.0, 500.0};
+    EXPECT_THROW(kin->setRateTabulation(settings), CanteraError);
+    settings["T-range"] = vector<double>{500.0, 1500.0};
+    settings["rtol"] = 0.0;
+    EXPECT_THROW(kin->setRateTabulation(settings), CanteraError);
+}
+
+TEST(KineticsProfiler, rateTypes)
+{
+    auto soln = newSolution("../data/pdep-test.yaml");
+    auto kin = soln->kinetics();
+    auto& profiler = kin->profiler();
+    EXPECT_FALSE(profiler.enabled());
+    EXPECT_EQ(profiler.nCategories(), 5u);
+    EXPECT_EQ(profiler.addCategory("Chebyshev"), profiler.addCategory("Chebyshev"));
+    EXPECT_EQ(profiler.categoryName(KineticsProfiler::thirdBodies), "third-bodies");
+    EXPECT_THROW(profiler.calls("falloff"), CanteraError);
+
+    if (!KineticsProfiler::profilingSupported()) {
+        EXPECT_THROW(profiler.setEnabled(true), CanteraError);
+        GTEST_SKIP() << "Cantera was compiled without support for profiling";
+    }
+    vector<double> wdot(kin->nTotalSpecies());
+    profiler.setEnabled(true);
+    for (double T : {800.0, 1000.0}) {
+        soln->thermo()->setState_TP(T, 2 * OneAtm);
+        kin->getNetProductionRates(wdot.data());
+    }
+    EXPECT_EQ(profiler.calls("pressure-dependent-Arrhenius"), 2u);
+    EXPECT_EQ(profiler.calls("Chebyshev"), 2u);
+    EXPECT_EQ(profiler.calls("equilibrium-constants"), 2u);
+    EXPECT_EQ(profiler.calls("stoichiometry"), 4u);
+    EXPECT_GT(profiler.time("Chebyshev"), 0.0);
+
+    AnyMap stats = profiler.stats();
+    EXPECT_EQ(stats.size(), 5u);
+    EXPECT_EQ(stats["Chebyshev"]["calls"].asInt(), 2);
+
+    profiler.clear();
+    EXPECT_EQ(profiler.calls("Chebyshev"), 0u);
+    EXPECT_EQ(profiler.time("Chebyshev"), 0.0);
+}
+
 } // namespace Cantera
 
 int main(int argc, char** argv)
@@ -6,6 +6,8 @@
 #include "cantera/onedim.h"
 #include "cantera/oneD/DomainFactory.h"
 #include "cantera/oneD/IonFlow.h"
+#include "cantera/oneD/MultiJac.h"
+#include "cantera/kinetics/Arrhenius.h"
 
 using namespace Cantera;
 
@@ -96,6 +98,245 @@ TEST(onedim, freeflame)
     }
 }
 
+// Set up a free flame with a coarse grid and an initial temperature profile
+shared_ptr<Sim1D> coarseFreeFlame(shared_ptr<Flow1D>& flow, size_t nPoints=11)
+{
+    auto sol = newSolution("h2o2.yaml", "ohmech", "mixture-averaged");
+    auto gas = sol->thermo();
+    string X = "H2:0.65, O2:0.5, AR:2";
+    gas->setState_TPX(300, OneAtm, X);
+    double mdot = 0.3 * gas->density();
+    gas->equilibrate("HP");
+    double Tad = gas->temperature();
+
+    flow = newFlow1D("free-flow", sol, "flow");
+    flow->setupUniformGrid(nPoints, 0.02);
+    auto inlet = newBoundary1D("inlet", sol);
+    inlet->setMoleFractions(X);
+    inlet->setMdot(mdot);
+    inlet->setTemperature(300);
+    auto outlet = newBoundary1D("outlet", sol);
+    vector<shared_ptr<Domain1D>> domains { inlet, flow, outlet };
+    auto flame = newSim1D(domains);
+    vector<double> locs{0.0, 0.3, 0.7, 1.0};
+    vector<double> value{300, 300, Tad, Tad};
+    flow->setProfile("T", locs, value);
+    flame->getInitialSoln();
+    flame->setFixedTemperature(0.5 * (300 + Tad));
+    flow->solveEnergyEqn();
+    return flame;
+}
+
+// Compare banded Jacobian to a reference, or store the reference if it is empty
+void checkJacobian(Sim1D& flame, vector<double>& ref, double rtol, double atol)
+{
+    auto jac = std::dynamic_pointer_cast<MultiJac>(flame.linearSolver());
+    ASSERT_TRUE(jac);
+    size_t n = flame.size();
+    size_t bw = flame.bandwidth();
+    bool store = ref.empty();
+    size_t k = 0;
+    for (size_t j = 0; j < n; j++) {
+        for (size_t i = (j > bw) ? j - bw : 0; i < std::min(n, j + bw + 1); i++) {
+            if (store) {
+                ref.push_back(jac->value(i, j));
+            } else {
+                EXPECT_NEAR(jac->value(i, j), ref[k], rtol * std::abs(ref[k]) + atol)
+                    << "Jacobian element (" << i << ", " << j << ")";
+            }
+            k++;
+        }
+    }
+}
+
+TEST(onedim, colored_jacobian)
+{
+    shared_ptr<Flow1D> flow;
+    auto flame = coarseFreeFlame(flow);
+    EXPECT_FALSE(flame->jacobianColoring());
+    flame->evalSSJacobian();
+    vector<double> ref;
+    checkJacobian(*flame, ref, 0.0, 0.0);
+    int nEvals = flame->linearSolver()->nEvals();
+
+    flame->setJacobianColoring(true);
+    EXPECT_TRUE(flame->jacobianColoring());
+    flame->evalSSJacobian();
+    EXPECT_EQ(flame->linearSolver()->nEvals(), nEvals + 1);
+    checkJacobian(*flame, ref, 1e-3, 1e-6);
+}
+
+TEST(onedim, analytic_chemistry_jacobian)
+{
+    shared_ptr<Flow1D> flow;
+    auto flame = coarseFreeFlame(flow);
+    flame->evalSSJacobian();
+    vector<double> ref;
+    checkJacobian(*flame, ref, 0.0, 0.0);
+
+    EXPECT_FALSE(flow->analyticChemistryJacobianEnabled());
+    flow->enableAnalyticChemistryJacobian(true);
+    EXPECT_TRUE(flow->analyticChemistryJacobianEnabled());
+    flame->evalSSJacobian();
+    // absolute tolerance accounts for round-off errors of finite differences for
+    // species with small mass fractions
+    checkJacobian(*flame, ref, 1e-3, 1e-4);
+}
+
+TEST(onedim, reuse_jacobian_after_refine)
+{
+    // flame with a temperature profile that requires refinement in part of the domain
+    auto setup = [](shared_ptr<Flow1D>& flow) {
+        auto flame = coarseFreeFlame(flow, 21);
+        vector<double> locs{0.0, 0.4, 0.6, 1.0};
+        vector<double> T{300, 300, 1800, 1800};
+        flow->setProfile("T", locs, T);
+        flame->setRefineCriteria(1, 10.0, 0.4, 0.4);
+        return flame;
+    };
+
+    // reference Jacobian evaluated on the refined grid
+    shared_ptr<Flow1D> flow;
+    auto flame = setup(flow);
+    ASSERT_GT(flame->refine(), 0);
+    size_t nPoints = flow->nPoints();
+    flame->evalSSJacobian();
+    vector<double> ref;
+    checkJacobian(*flame, ref, 0.0, 0.0);
+
+    flame = setup(flow);
+    EXPECT_FALSE(flame->reuseJacobianAfterRefine());
+    flame->setReuseJacobianAfterRefine(true);
+    EXPECT_TRUE(flame->reuseJacobianAfterRefine());
+    flame->evalSSJacobian();
+    flame->refine();
+    ASSERT_EQ(flow->nPoints(), nPoints);
+    flame->evalSSJacobian();
+    checkJacobian(*flame, ref, 0.0, 0.0);
+}
+
+TEST(onedim, solver_profiler)
+{
+    shared_ptr<Flow1D> flow;
+    auto flame = coarseFreeFlame(flow);
+    auto& profiler = flame->profiler();
+    EXPECT_FALSE(profiler.enabled());
+    flame->eval();
+    EXPECT_EQ(profiler.calls(SolverPhase::residual), 0u);
+
+    if (!SolverProfiler::profilingSupported()) {
+        EXPECT_THROW(profiler.setEnabled(true), CanteraError);
+        GTEST_SKIP() << "Cantera was compiled without support for profiling";
+    }
+    profiler.setEnabled(true);
+    flame->eval();
+    size_t nPoints = flow->nPoints();
+    EXPECT_EQ(profiler.calls(SolverPhase::residual), 1u);
+    EXPECT_EQ(profiler.calls(SolverPhase::thermo), nPoints);
+    EXPECT_EQ(profiler.calls(SolverPhase::kinetics), nPoints);
+    EXPECT_EQ(profiler.calls(SolverPhase::transport), nPoints - 1);
+    EXPECT_GT(profiler.time(SolverPhase::residual), 0.0);
+    EXPECT_GE(profiler.time(SolverPhase::residual), profiler.time(SolverPhase::thermo));
+
+    flame->evalSSJacobian();
+    EXPECT_EQ(profiler.calls(SolverPhase::jacobian), 1u);
+    EXPECT_GT(profiler.calls(SolverPhase::residual), flame->size());
+    flame->refine();
+    EXPECT_EQ(profiler.calls(SolverPhase::refinement), 1u);
+
+    AnyMap stats = profiler.stats();
+    EXPECT_EQ(stats["jacobian"]["calls"].asInt(), 1);
+    EXPECT_TRUE(stats.hasKey("linear_solve"));
+    EXPECT_TRUE(stats.hasKey("time_stepping"));
+    profiler.clear();
+    EXPECT_EQ(profiler.calls(SolverPhase::residual), 0u);
+    EXPECT_EQ(profiler.time(SolverPhase::jacobian), 0.0);
+}
+
+TEST(onedim, reaction_adjoint_products)
+{
+    shared_ptr<Flow1D> flow;
+    auto flame = coarseFreeFlame(flow);
+    auto& kin = flow->kinetics();
+    size_t n = flame->size();
+    vector<double> lambda(n);
+    for (size_t i = 0; i < n; i++) {
+        lambda[i] = std::sin(1.0 + i);
+    }
+    vector<double> products(kin.nReactions());
+    flame->getReactionAdjointProducts(kin, lambda.data(), products.data());
+
+    // compare to central differences of the residual
+    double dp = 1e-5;
+    vector<double> fplus(n), fminus(n);
+    for (size_t i = 0; i < kin.nReactions(); i++) {
+        kin.setMultiplier(i, 1.0 + dp);
+        flame->getResidual(0.0, fplus.data());
+        kin.setMultiplier(i, 1.0 - dp);
+        flame->getResidual(0.0, fminus.data());
+        kin.setMultiplier(i, 1.0);
+        double fd = 0.0;
+        for (size_t m = 0; m < n; m++) {
+            fd += lambda[m] * (fplus[m] - fminus[m]) / (2 * dp);
+        }
+        EXPECT_NEAR(products[i], fd, 1e-6 * std::abs(fd) + 1e-8) << "reaction " << i;
+    }
+}
+
+TEST(onedim, threaded_residual)
+{
+    shared_ptr<Flow1D> flow;
+    auto flame = coarseFreeFlame(flow, 41);
+    size_t n = flame->size();
+    vector<double> ref(n), resid(n);
+    for (string model : {"mixture-averaged", "multicomponent"}) {
+        flow->setTransportModel(model);
+        flow->setNumThreads(1);
+        flame->getResidual(0.0, ref.data());
+        flow->setNumThreads(4);
+        EXPECT_EQ(flow->numThreads(), 4u);
+        flame->getResidual(0.0, resid.data());
+        for (size_t i = 0; i < n; i++) {
+            EXPECT_DOUBLE_EQ(resid[i], ref[i]) << model << " component " << i;
+        }
+    }
+
+    // rate multipliers are synchronized with worker threads
+    flow->kinetics().setMultiplier(0, 2.0);
+    flow->setNumThreads(1);
+    flame->getResidual(0.0, ref.data());
+    flow->setNumThreads(4);
+    flame->getResidual(0.0, resid.data());
+    for (size_t i = 0; i < n; i++) {
+        EXPECT_DOUBLE_EQ(resid[i], ref[i]) << "component " << i;
+    }
+
+    // existing workers are replaced after reactions or settings are modified
+    auto& kin = flow->kinetics();
+    auto orig = kin.reaction(2);
+    auto rate = make_shared<ArrheniusRate>(3.87e2, 2.7, 6260.0 * 4184);
+    kin.modifyReaction(2, make_shared<Reaction>(orig->reactants, orig->products,
+                                                 rate));
+    flame->getResidual(0.0, resid.data());
+    flow->setNumThreads(1);
+    flame->getResidual(0.0, ref.data());
+    for (size_t i = 0; i < n; i++) {
+        EXPECT_DOUBLE_EQ(resid[i], ref[i]) << "modified, component " << i;
+    }
+
+    flow->setNumThreads(4);
+    flame->getResidual(0.0, resid.data());
+    AnyMap settings;
+    settings["T-range"] = vector<double>{200.0, 3000.0};
+    kin.setRateTabulation(settings);
+    flame->getResidual(0.0, resid.data());
+    flow->setNumThreads(1);
+    flame->getResidual(0.0, ref.data());
+    for (size_t i = 0; i < n; i++) {
+        EXPECT_DOUBLE_EQ(resid[i], ref[i]) << "tabulated, component " << i;
+    }
+}
+
 TEST(onedim, flame_types)
 {
     auto sol = newSolution("h2o2.yaml", "ohmech", "mixture-averaged");
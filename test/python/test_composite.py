@@ -1,8 +1,10 @@
+import gc
 import numpy as np
 import pickle
 import pytest
 from pytest import approx
 import re
+import threading
 from ruamel import yaml
 
 import cantera as ct
@@ -308,6 +310,211 @@ class TestSolutionArray:
         spc = ["H2", "O2"]
         assert arr(*spc).Y.shape == (siz, 2)
         assert arr(*spc).net_production_rates.shape == (siz, 2)
+        # selection does not apply to properties indexed by reaction
+        ropnet = arr(*spc).net_rates_of_progress
+        assert ropnet.shape == (siz, gas.n_reactions)
+        assert ropnet[0] == approx(gas.net_rates_of_progress)
+        assert arr(*spc).forward_rate_constants == approx(arr.forward_rate_constants)
+
+    def test_native_properties(self, gas):
+        arr = ct.SolutionArray(gas, (3, 4))
+        arr.TPX = np.linspace(500, 2000, 4), ct.one_atm, "H2:1, O2:1, AR:3"
+        assert arr._has_property("cp_mass")
+        assert not arr._has_property("spam")
+        for native in ct.SolutionArray._native.values():
+            assert ct.SolutionArray._has_property(native)
+        cp = arr.cp_mass
+        wdot = arr.net_production_rates
+        assert cp.shape == (3, 4)
+        assert wdot.shape == (3, 4, gas.n_species)
+        for i, j in np.ndindex(arr.shape):
+            gas.TDY = arr.T[i, j], arr.density[i, j], arr.Y[i, j]
+            assert cp[i, j] == approx(gas.cp_mass)
+            assert wdot[i, j] == approx(gas.net_production_rates)
+        sliced = arr[1:, 2]
+        assert sliced.enthalpy_mass == approx(arr.enthalpy_mass[1:, 2])
+        assert arr("H2", "OH").X[0, 1] == approx(arr.X[0, 1, [0, 4]])
+
+    def test_native_properties_threads(self):
+        gas = ct.Solution("h2o2.yaml")
+        arr = ct.SolutionArray(gas, 8)
+        arr.TPX = np.linspace(500, 2000, 8), ct.one_atm, "H2:1, O2:1, AR:3"
+        visc = arr.viscosity
+        wdot = arr.net_production_rates
+        assert arr.num_threads == 1
+        arr.num_threads = 3
+        assert arr[2:].num_threads == 3
+        assert arr.viscosity == approx(visc)
+        assert arr.net_production_rates == approx(wdot)
+        assert arr[2:].viscosity == approx(visc[2:])
+        with pytest.raises(ValueError, match="non-negative"):
+            arr.num_threads = -1
+
+    def test_native_properties_threads_concurrent(self):
+        gas = ct.Solution("h2o2.yaml")
+        arr = ct.SolutionArray(gas, 40)
+        arr.TPX = np.linspace(500, 2000, 40), ct.one_atm, "H2:1, O2:1, AR:3"
+        visc = arr.viscosity
+        arr.num_threads = 2
+        results = {}
+
+        def evaluate(ix, sliced):
+            # slices share cloned Solution objects used by worker threads
+            results[ix] = [sliced.viscosity for _ in range(20)]
+
+        slices = [slice(0, 20), slice(20, 40)]
+        threads = [threading.Thread(target=evaluate, args=(ix, arr[sl]))
+                   for ix, sl in enumerate(slices)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for ix, sl in enumerate(slices):
+            for values in results[ix]:
+                assert values == approx(visc[sl])
+
+    def test_native_states(self, gas):
+        arr = ct.SolutionArray(gas, (2, 3))
+        T = np.linspace(500, 1500, 3)
+        arr.TPX = T, ct.one_atm, "H2:1, O2:1, AR:3"
+        assert arr.T == approx(np.tile(T, (2, 1)))
+        assert arr.X[1, 2, gas.species_index("AR")] == approx(0.6)
+
+        X = np.zeros((2, 3, gas.n_species))
+        X[..., 0] = np.arange(1, 7).reshape(2, 3)
+        X[..., gas.species_index("O2")] = 1.
+        arr.TPX = 1000, 2 * ct.one_atm, X
+        assert arr.X[1, 1, 0] == approx(5 / 6)
+        assert arr.P == approx(2 * ct.one_atm)
+
+        h = arr.h + 1e5
+        arr.HP = h, None
+        assert arr.h == approx(h)
+        assert arr.P == approx(2 * ct.one_atm)
+
+        arr.basis = "molar"
+        arr.HP = arr.h + 1e5, ct.one_atm
+        assert arr.h == approx(h * arr.mean_molecular_weight + 1e5)
+
+    def test_views(self, gas):
+        arr = ct.SolutionArray(gas, (2, 3), extra={"t": 0.})
+        arr.TPX = np.linspace(500, 1500, 3), ct.one_atm, "H2:1, O2:1, AR:3"
+        arr.t = np.arange(6.).reshape(2, 3)
+
+        T = arr.T
+        Y = arr.Y
+        t = arr.t
+        assert not T.flags.owndata and not T.flags.writeable
+        assert not Y.flags.owndata and not Y.flags.writeable
+        assert not t.flags.owndata and not t.flags.writeable
+        assert T.shape == (2, 3)
+        assert t.shape == (2, 3)
+        assert Y.shape == (2, 3, gas.n_species)
+        assert T == approx(arr._eval_property("temperature").reshape(2, 3))
+        assert Y == approx(arr._eval_property("massFractions").reshape(Y.shape))
+        assert t == approx(np.arange(6.).reshape(2, 3))
+        # properties and explicit views share the underlying data
+        assert np.shares_memory(arr.view("T"), T)
+        assert np.shares_memory(arr.view("t"), t)
+        # other properties are writeable copies
+        assert arr.cp_mass.flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            T[0, 0] = 300
+        with pytest.raises(ValueError, match="read-only"):
+            t[0, 0] = 3.
+
+        # views reflect updates of the underlying data
+        arr.TP = 800, None
+        arr.t = 7.
+        assert T == approx(800)
+        assert t == approx(7.)
+
+        # sliced arrays with contiguous entries use views as well
+        sliced = arr[1]
+        assert not sliced.T.flags.owndata
+        assert sliced.view("Y") == approx(Y[1])
+        assert arr[1, 1:].view("T") == approx(T[1, 1:])
+        # non-contiguous slices and species subsets return copies
+        assert not np.shares_memory(arr[:, 1].t, t)
+        assert not np.shares_memory(arr("H2").Y, Y)
+        with pytest.raises(ValueError, match="non-contiguous"):
+            arr[:, 1].view("t")
+        with pytest.raises(ValueError, match="not available"):
+            arr.view("cp_mass")
+        with pytest.raises(ValueError, match="subset of species"):
+            arr("H2").view("Y")
+
+        # data cannot be resized or replaced while views exist
+        with pytest.raises(ct.CanteraError, match="shared by multiple objects"):
+            arr.shape = (4,)
+        with pytest.raises(ct.CanteraError, match="shared by multiple objects"):
+            arr.t = np.full((2, 3), "spam")
+        del T, Y, t, sliced
+        arr.shape = (4,)
+        assert arr.T.shape == (4,)
+
+    def test_writeable_views(self, gas):
+        arr = ct.SolutionArray(gas, 3, extra={"t": 0.})
+        arr.TPX = 500, ct.one_atm, "H2:1, O2:1, AR:3"
+        rho = arr.density_mass.copy()
+
+        T = arr.view("T", writeable=True)
+        t = arr.view("t", writeable=True)
+        assert T.flags.writeable and t.flags.writeable
+        T[1] = 900.
+        t[:] = [1., 2., 3.]
+        # values written to views are stored in the SolutionArray
+        assert arr.T == approx([500., 900., 500.])
+        assert arr[1].T == approx(900.)
+        assert arr.density_mass == approx(rho)
+        assert arr.t == approx([1., 2., 3.])
+        # pressure follows from the native state (T, density_mass and Y)
+        assert arr.P == approx(np.array([1., 1.8, 1.]) * ct.one_atm)
+        # default views remain read-only
+        with pytest.raises(ValueError, match="read-only"):
+            arr.T[0] = 300
+
+    def test_views_outlive_array(self, gas):
+        arr = ct.SolutionArray(gas, 3, extra={"x": np.array([1., 2., 3.])})
+        arr.TP = np.array([400., 500., 600.]), ct.one_atm
+        x = arr.x
+        T = arr.T
+        # the base of a view references the buffer, which keeps the data alive
+        for view in (T, x):
+            base = view.base
+            while isinstance(base, np.ndarray):
+                base = base.base
+            assert type(base).__name__ == "_SharedBuffer"
+        del arr
+        gc.collect()
+        assert x == approx([1., 2., 3.])
+        assert T == approx([400., 500., 600.])
+
+    def test_restore_data_unnormalized(self, gas):
+        data = {"T": np.array([500., 900.]), "P": np.full(2, ct.one_atm),
+                "X": np.zeros((2, gas.n_species))}
+        data["X"][:, 0] = [0.3, 0.6]
+        data["X"][:, 3] = [0.2, 0.1]
+        arr = ct.SolutionArray(gas)
+        arr.restore_data(data, normalize=False)
+        # mole fractions are reported relative to the sum; the scaling of the
+        # composition is retained by mass fractions
+        assert arr.X[:, 0] == approx([0.6, 0.6 / 0.7])
+        assert arr.Y.sum(axis=1) == approx([0.5, 0.7])
+        assert arr.P == approx(data["P"])
+        arr = ct.SolutionArray(gas)
+        arr.restore_data(data)
+        assert arr.X[:, 0] == approx([0.6, 0.6 / 0.7])
+        assert arr.Y.sum(axis=1) == approx([1., 1.])
+
+        data["Y"] = data.pop("X")
+        arr = ct.SolutionArray(gas)
+        arr.restore_data(data, normalize=False)
+        assert arr.Y[:, 0] == approx([0.3, 0.6])
+        assert arr.P == approx(data["P"])
+        arr = ct.SolutionArray(gas)
+        arr.restore_data(data)
+        assert arr.Y[:, 0] == approx([0.6, 0.6 / 0.7])
 
     def test_interface_wdot(self):
         gas = ct.Solution("ptcombust.yaml", "gas", transport_model=None)
@@ -690,6 +897,136 @@ class TestSolutionArrayIO:
         attr = b.restore(outfile, "group0")
         self.check_arrays(states, b)
 
+    @pytest.mark.skipif("native" not in ct.hdf_support(),
+                        reason="Cantera compiled without HDF support")
+    def test_write_hdf_append(self):
+        outfile = self.test_work_path / "solutionarray_append.h5"
+        outfile.unlink(missing_ok=True)
+
+        states = ct.SolutionArray(self.gas, 7, extra={"t": range(7)})
+        states.TPX = np.linspace(300, 1000, 7), 2e5, "H2:0.5, O2:0.4"
+        block = ct.SolutionArray(self.gas, extra=["t"])
+        for i in range(7):
+            block.append(states[i].state, t=i)
+            if len(block) == 3 or i == 6:
+                # stream blocks to disk and clear buffer
+                block.save(outfile, "group0", append=True, chunk_size=2,
+                           compression=4)
+                block.shape = (0,)
+
+        b = ct.SolutionArray(self.gas)
+        b.restore(outfile, "group0")
+        self.check_arrays(states, b)
+
+        states.save(outfile, "group1")
+        with pytest.raises(ct.CanteraError, match="not resizable"):
+            states.save(outfile, "group1", append=True)
+        other = ct.SolutionArray(self.gas, 2, extra={"spam": "eggs"})
+        with pytest.raises(ct.CanteraError, match="inconsistent"):
+            other.save(outfile, "group0", append=True)
+
+    @pytest.mark.skipif("native" not in ct.hdf_support(),
+                        reason="Cantera compiled without HDF support")
+    def test_write_hdf_append_fixed(self):
+        outfile = self.test_work_path / "solutionarray_append_fixed.h5"
+        outfile.unlink(missing_ok=True)
+
+        states = ct.SolutionArray(self.gas, 7, extra={"t": range(7)})
+        states.TPX = np.linspace(300, 1000, 7), 2e5, "H2:0.5, O2:0.4"
+        states.save(outfile, "group0")
+        more = ct.SolutionArray(self.gas, 3, extra={"t": range(7, 10)})
+        with pytest.raises(ct.CanteraError, match="not resizable"):
+            more.save(outfile, "group0", append=True)
+
+        # failed append leaves neither datasets nor size attribute modified
+        b = ct.SolutionArray(self.gas)
+        b.restore(outfile, "group0")
+        assert b.shape == (7,)
+        self.check_arrays(states, b)
+        assert b.t == approx(states.t)
+
+    def test_write_yaml_append(self):
+        outfile = self.test_work_path / "solutionarray_append.yaml"
+        states = ct.SolutionArray(self.gas, 3)
+        with pytest.raises(NotImplementedError, match="only supported for HDF"):
+            states.save(outfile, "group0", append=True)
+
+    @pytest.mark.skipif("native" not in ct.hdf_support(),
+                        reason="Cantera compiled without HDF support")
+    def test_restore_hdf_partial(self):
+        outfile = self.test_work_path / "solutionarray_partial.h5"
+        outfile.unlink(missing_ok=True)
+
+        states = ct.SolutionArray(self.gas, 7, extra={"t": range(7), "spam": "eggs"})
+        states.TPX = np.linspace(300, 1000, 7), 2e5, "H2:0.5, O2:0.4"
+        states.save(outfile, "group0")
+
+        b = ct.SolutionArray(self.gas)
+        b.restore(outfile, "group0", columns=["t"], rows=slice(2, 5))
+        assert b.shape == (3,)
+        assert list(b.extra) == ["t"]
+        assert b.T == approx(states.T[2:5])
+        assert b.X == approx(states.X[2:5])
+        assert b.t == approx(states.t[2:5])
+
+        b = ct.SolutionArray(self.gas)
+        b.restore(outfile, "group0", rows=slice(4, None), lazy=True)
+        assert b.shape == (3,)
+        assert b.t == approx(states.t[4:])
+        assert (b.spam == "eggs").all()
+
+        with pytest.raises(ct.CanteraError, match="not found"):
+            b.restore(outfile, "group0", columns=["ham"])
+        with pytest.raises(IndexError):
+            b.restore(outfile, "group0", rows=slice(5, 10))
+        with pytest.raises(ValueError, match="contiguous"):
+            b.restore(outfile, "group0", rows=slice(0, 6, 2))
+
+    @pytest.mark.skipif("native" not in ct.hdf_support(),
+                        reason="Cantera compiled without HDF support")
+    def test_restore_hdf_species_columns(self):
+        outfile = self.test_work_path / "solutionarray_species.h5"
+        outfile.unlink(missing_ok=True)
+
+        states = ct.SolutionArray(self.gas, 5, extra={"t": range(5)})
+        states.TPX = np.linspace(300, 1000, 5), 2e5, "H2:0.5, O2:0.4, AR:0.1"
+        states.save(outfile, "group0")
+
+        b = ct.SolutionArray(self.gas)
+        b.restore(outfile, "group0", columns=["O2", "H2"], rows=slice(1, 4))
+        assert b.shape == (3,)
+        assert not b.extra
+        assert b.T == approx(states.T[1:4])
+        assert b.density == approx(states.density[1:4])
+        for k, name in enumerate(self.gas.species_names):
+            if name in ("H2", "O2"):
+                assert b.Y[:, k] == approx(states.Y[1:4, k])
+            else:
+                assert b.Y[:, k] == approx(0.)
+
+    @pytest.mark.skipif("native" not in ct.hdf_support(),
+                        reason="Cantera compiled without HDF support")
+    def test_restore_hdf_lazy_modified(self):
+        outfile = self.test_work_path / "solutionarray_lazy.h5"
+        outfile.unlink(missing_ok=True)
+
+        states = ct.SolutionArray(self.gas, 5, extra={"t": range(5)})
+        states.save(outfile, "group0")
+
+        b = ct.SolutionArray(self.gas)
+        b.restore(outfile, "group0", lazy=True)
+        states.save(outfile, "group1")
+        with pytest.raises(ct.CanteraError, match="was modified"):
+            b.t
+
+    def test_restore_yaml_partial(self):
+        outfile = self.test_work_path / "solutionarray_partial.yaml"
+        states = ct.SolutionArray(self.gas, 3)
+        states.save(outfile, "group0", overwrite=True)
+        b = ct.SolutionArray(self.gas)
+        with pytest.raises(NotImplementedError, match="only supported for HDF"):
+            b.restore(outfile, "group0", rows=slice(1, 2))
+
     @pytest.mark.skipif("native" not in ct.hdf_support(),
                         reason="Cantera compiled without HDF support")
     def test_write_hdf_str_column(self):
@@ -186,6 +186,142 @@ class TestKinetics:
         assert (phase.delta_standard_enthalpy - phase.delta_standard_entropy * phase.T
                 == approx(phase.delta_standard_gibbs))
 
+    @pytest.mark.parametrize("num_threads", [1, 3])
+    def test_evaluate_batch(self, phase, num_threads):
+        T = np.linspace(600, 2400, 7)
+        P = np.linspace(0.5, 5, 7) * ct.one_atm
+        Y = np.tile(phase.Y, (7, 1))
+        Y[:, 0] *= np.linspace(1, 2, 7)
+        phase.set_multiplier(2.0, 3)
+        state = phase.state
+        wdot = phase.evaluate_batch("net_production_rates", T, P, Y,
+                                    num_threads=num_threads)
+        kf = phase.evaluate_batch("forward_rate_constants", T, P, Y,
+                                  num_threads=num_threads)
+        hrr = phase.evaluate_batch("heat_release_rate", T, P, Y)
+        assert wdot.shape == (7, phase.n_species)
+        assert kf.shape == (7, phase.n_reactions)
+        assert hrr.shape == (7,)
+        assert phase.state == approx(state)
+
+        for i in range(7):
+            phase.TPY = T[i], P[i], Y[i]
+            assert wdot[i] == approx(phase.net_production_rates, rel=1e-12)
+            assert kf[i] == approx(phase.forward_rate_constants, rel=1e-12)
+            assert hrr[i] == approx(phase.heat_release_rate, rel=1e-12)
+
+    def test_evaluate_batch_modified(self, phase):
+        T = np.linspace(600, 2400, 7)
+        P = np.full_like(T, ct.one_atm)
+        Y = np.tile(phase.Y, (7, 1))
+        kf = phase.evaluate_batch("forward_rate_constants", T, P, Y, num_threads=3)
+
+        # worker objects retained for parallel evaluation reflect modified reactions
+        rxn = phase.reaction(2)
+        rate = rxn.rate
+        rxn.rate = ct.ArrheniusRate(2 * rate.pre_exponential_factor,
+                                    rate.temperature_exponent, rate.activation_energy)
+        phase.modify_reaction(2, rxn)
+        phase.set_multiplier(0.5, 4)
+        kf2 = phase.evaluate_batch("forward_rate_constants", T, P, Y, num_threads=3)
+        assert kf2[:, 2] == approx(2 * kf[:, 2], rel=1e-12)
+        assert kf2[:, 4] == approx(0.5 * kf[:, 4], rel=1e-12)
+        assert kf2[:, 5] == approx(kf[:, 5], rel=1e-12)
+
+    def test_evaluate_batch_invalid(self, phase):
+        T = [500, 600]
+        with pytest.raises(ValueError, match="Unsupported quantity"):
+            phase.evaluate_batch("viscosity", T, T, np.ones((2, phase.n_species)))
+        with pytest.raises(ValueError, match="Expected 2 pressures"):
+            phase.evaluate_batch("net_production_rates", T, [1e5],
+                                 np.ones((2, phase.n_species)))
+        with pytest.raises(ValueError, match="with 10 species"):
+            phase.evaluate_batch("net_production_rates", T, T, np.ones((2, 5)))
+
+    def test_rate_tabulation(self, phase):
+        assert phase.rate_tabulation == {}
+        T = [500, 731.4, 1002.5, 1877.3, 2500]
+        kf_ref = []
+        kr_ref = []
+        for Ti in T:
+            phase.TP = Ti, None
+            kf_ref.append(phase.forward_rate_constants)
+            kr_ref.append(phase.reverse_rate_constants)
+
+        phase.rate_tabulation = {"T-range": [500, 2500], "rtol": 1e-6}
+        assert phase.rate_tabulation["T-range"] == approx([500, 2500])
+        assert phase.rate_tabulation["rtol"] == approx(1e-6)
+        for i, Ti in enumerate(T):
+            phase.TP = Ti, None
+            assert phase.forward_rate_constants == approx(kf_ref[i], rel=2e-6)
+            assert phase.reverse_rate_constants == approx(kr_ref[i], rel=3e-6)
+
+        # Rate constants outside of the tabulated range are evaluated directly
+        phase.TP = 3000, None
+        kf = phase.forward_rate_constants
+        phase.rate_tabulation = {}
+        assert phase.rate_tabulation == {}
+        assert phase.forward_rate_constants == approx(kf, rel=1e-14)
+
+    def test_rate_tabulation_invalid(self, phase):
+        with pytest.raises(ct.CanteraError, match="Invalid temperature range"):
+            phase.rate_tabulation = {"T-range": [1000, 500]}
+        with pytest.raises(ct.CanteraError, match="Invalid pressure range"):
+            phase.rate_tabulation = {"T-range": [500, 1000], "P-range": [-1, 1e5]}
+
+    def test_rate_tabulation_yaml(self, phase):
+        yaml = """
+        phases:
+        - name: gas
+          thermo: ideal-gas
+          species: [{h2o2.yaml/species: all}]
+          kinetics: gas
+          reactions: [{h2o2.yaml/reactions: declared-species}]
+          rate-tabulation:
+            T-range: [300, 3000]
+            P-range: [0.1 atm, 10 atm]
+            rtol: 1e-5
+        """
+        gas = ct.Solution(yaml=yaml)
+        settings = gas.rate_tabulation
+        assert settings["T-range"] == approx([300, 3000])
+        assert settings["P-range"] == approx([0.1 * ct.one_atm, 10 * ct.one_atm])
+        assert settings["rtol"] == approx(1e-5)
+        assert gas.input_data["rate-tabulation"]["rtol"] == approx(1e-5)
+
+        gas.TPX = phase.TPX
+        assert gas.net_production_rates == approx(phase.net_production_rates,
+                                                  rel=1e-4, abs=1e-12)
+
+    def test_profiler(self, phase):
+        assert not phase.profiling
+        phase.net_production_rates
+        stats = phase.profiler_stats
+        assert set(stats) == {"Arrhenius", "Troe", "equilibrium-constants",
+                              "third-bodies", "stoichiometry"}
+        assert all(s["calls"] == 0 and s["time"] == 0 for s in stats.values())
+
+        phase.profiling = True
+        for T in [900, 1000, 1100]:
+            phase.TP = T, None
+            phase.net_production_rates
+        phase.creation_rates
+        stats = phase.profiler_stats
+        assert stats["Arrhenius"]["calls"] == 4
+        assert stats["Troe"]["calls"] == 4
+        assert stats["equilibrium-constants"]["calls"] == 3
+        assert stats["third-bodies"]["calls"] == 3
+        assert stats["stoichiometry"]["calls"] == 7
+        assert all(s["time"] > 0 for s in stats.values())
+
+        phase.profiling = False
+        phase.TP = 1200, None
+        phase.net_production_rates
+        assert phase.profiler_stats == stats
+
+        phase.clear_profiler_stats()
+        assert all(s["calls"] == 0 for s in phase.profiler_stats.values())
+
 
 class TestKineticsFromReactions:
     """
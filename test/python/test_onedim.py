@@ -184,6 +184,16 @@ def check_component_order(fname: str, group: str):
             components = value[::-1]
 
 
+def make_sweep_flame(phi, T):
+    # factory used by parameter sweep tests; defined at module level for pickling
+    gas = ct.Solution("h2o2.yaml")
+    gas.set_equivalence_ratio(phi, "H2", "O2:1.0, AR:4.0")
+    gas.TP = T, ct.one_atm
+    flame = ct.FreeFlame(gas, width=0.03)
+    flame.set_refine_criteria(ratio=4, slope=0.1, curve=0.2)
+    return flame
+
+
 class TestFreeFlame:
     tol_ss = [1.0e-5, 1.0e-14]  # [rtol atol] for steady-state problem
     tol_ts = [1.0e-4, 1.0e-11]  # [rtol atol] for time stepping
@@ -282,6 +292,65 @@ class TestFreeFlame:
             self.sim.flame.set_values("Uo", zeros)
 
     @pytest.mark.slow_test
+    def test_run_sweep(self):
+        grid = {"phi": [0.6, 0.8, 1.0], "T": [300, 400]}
+        outfile = self.test_work_path / "sweep.yaml"
+        outfile.unlink(missing_ok=True)
+        results = ct.run_sweep(make_sweep_flame, grid, processes=2, output=outfile,
+                               name="sweep", auto=True)
+        assert results.meta["parameters"]["phi"] == [0.6, 0.6, 0.8, 0.8, 1.0, 1.0]
+        assert "failed" not in results.meta
+        assert set(results.case) == set(range(6))
+
+        # compare to flame solved independently
+        flame = make_sweep_flame(0.8, 400)
+        flame.solve(loglevel=0, auto=True)
+        case = results[results.case == 3]
+        # warm-started cases are refined starting from the grid of a neighboring
+        # case, so grids and domain extents differ and results agree to within the
+        # discretization error. After aligning both solutions at the fixed
+        # temperature point, profiles agree within the bound set by the refinement
+        # criteria, which limit the temperature change between adjacent points to
+        # 'slope' times the temperature range.
+        Tfix = flame.fixed_temperature
+        i = np.flatnonzero(case.T < Tfix)[-1]
+        z = case.grid - np.interp(Tfix, case.T[i:i+2], case.grid[i:i+2])
+        z += flame.fixed_temperature_location
+        slope = flame.get_refine_criteria()["slope"]
+        T_range = flame.T.max() - flame.T.min()
+        assert np.interp(flame.grid, z, case.T) == approx(flame.T, abs=slope * T_range)
+        # for slope=0.1 and curve=0.2, the flame speed differs by about 1% from
+        # the solution for slope=0.05 and curve=0.1
+        assert case.velocity[0] == approx(flame.velocity[0], rel=1e-2)
+        assert case.T[-1] == approx(flame.T[-1], rel=1e-3)
+        speeds = [results[results.case == i].velocity[0] for i in range(6)]
+        assert speeds[0] < speeds[2] < speeds[4]
+        assert speeds[0] < speeds[1]
+
+        # sequential sweep without warm start
+        serial = ct.run_sweep(make_sweep_flame, [{"phi": 0.8, "T": 400}],
+                              processes=1, warm_start=False, auto=True)
+        assert serial.velocity[0] == approx(flame.velocity[0], rel=1e-2)
+
+        restored = ct.SolutionArray(results._phase)
+        restored.restore(outfile, "sweep")
+        assert restored.shape == results.shape
+        assert restored.meta["parameters"]["T"] == [300, 400] * 3
+
+    def test_sweep_invalid_guess(self):
+        from cantera.onedim import _flame_data, _flame_guess, _solve_case
+        flame = make_sweep_flame(0.8, 400)
+        flame.set_initial_guess()
+        data = _flame_data(flame)
+        # profile does not reach the fixed temperature of the new case
+        data["T"][:] = 400.
+        with pytest.raises(ValueError, match="Fixed temperature"):
+            _flame_guess(make_sweep_flame(0.8, 400), data)
+        # warm start falls back to the default initial guess
+        result = _solve_case(make_sweep_flame, {"phi": 0.8, "T": 400}, data,
+                             {"loglevel": 0})
+        assert result["T"][-1] > 2000
+
     def test_auto_width(self):
         Tin = 300
         p = ct.one_atm
@@ -559,6 +628,19 @@ class TestFreeFlame:
             fwd = (Suplus-Suminus)/(2*Su0*dk)
             assert fwd == approx(dSdk_adj[m], rel=5e-3, abs=1e-7)
 
+    def test_adjoint_multipliers(self):
+        self.run_mix(phi=0.5, T=300, width=0.1, p=1.0, refine=False)
+        Nvars = sum(D.n_components * D.n_points for D in self.sim.domains)
+        dgdx = np.zeros(Nvars)
+        dgdx[self.sim.inlet.n_components + self.sim.flame.component_index('velocity')] = 1
+
+        def perturb(sim, i, dp):
+            sim.gas.set_multiplier(1+dp, i)
+
+        generic = self.sim.solve_adjoint(perturb, self.gas.n_reactions, dgdx)
+        analytic = self.sim.solve_adjoint_multipliers(self.gas, dgdx)
+        assert analytic == approx(generic, rel=1e-5, abs=1e-8 * max(abs(generic)))
+
     def test_jacobian_options(self):
         reactants = {'H2': 0.65, 'O2': 0.5, 'AR': 2}
         self.create_sim(p=ct.one_atm, Tin=300, reactants=reactants, width=0.03)
@@ -571,6 +653,70 @@ class TestFreeFlame:
         # regression value matching test_mixture_averaged_case1
         assert self.sim.velocity[0] == approx(1.693407, rel=1e-4)
 
+    def test_jacobian_coloring(self):
+        reactants = {'H2': 0.65, 'O2': 0.5, 'AR': 2}
+        self.create_sim(p=ct.one_atm, Tin=300, reactants=reactants, width=0.03)
+        assert not self.sim.jacobian_coloring
+        self.sim.jacobian_coloring = True
+        assert self.sim.jacobian_coloring
+        self.solve_mix(refine=True)
+
+        # regression value matching test_mixture_averaged_case1
+        assert self.sim.velocity[0] == approx(1.693407, rel=1e-4)
+
+    def test_analytic_chemistry_jacobian(self):
+        reactants = {'H2': 0.65, 'O2': 0.5, 'AR': 2}
+        self.create_sim(p=ct.one_atm, Tin=300, reactants=reactants, width=0.03)
+        assert not self.sim.flame.analytic_chemistry_jacobian
+        self.sim.flame.analytic_chemistry_jacobian = True
+        assert self.sim.flame.analytic_chemistry_jacobian
+        self.solve_mix(refine=True)
+
+        # regression value matching test_mixture_averaged_case1
+        assert self.sim.velocity[0] == approx(1.693407, rel=1e-4)
+
+    def test_num_threads(self):
+        reactants = {'H2': 0.65, 'O2': 0.5, 'AR': 2}
+        self.create_sim(p=ct.one_atm, Tin=300, reactants=reactants, width=0.03)
+        assert self.sim.flame.num_threads == 1
+        self.sim.flame.num_threads = 3
+        assert self.sim.flame.num_threads == 3
+        self.sim.jacobian_coloring = True
+        with pytest.raises(ValueError, match="non-negative"):
+            self.sim.flame.num_threads = -1
+        self.solve_mix(refine=True)
+
+        # regression value matching test_mixture_averaged_case1
+        assert self.sim.velocity[0] == approx(1.693407, rel=1e-4)
+
+    def test_reuse_jacobian_after_refine(self):
+        reactants = {'H2': 0.65, 'O2': 0.5, 'AR': 2}
+        self.create_sim(p=ct.one_atm, Tin=300, reactants=reactants, width=0.03)
+        assert not self.sim.reuse_jacobian_after_refine
+        self.sim.reuse_jacobian_after_refine = True
+        assert self.sim.reuse_jacobian_after_refine
+        self.solve_mix(refine=True)
+
+        # regression value matching test_mixture_averaged_case1
+        assert self.sim.velocity[0] == approx(1.693407, rel=1e-4)
+
+    def test_profiler_stats(self):
+        reactants = {'H2': 0.65, 'O2': 0.5, 'AR': 2}
+        self.create_sim(p=ct.one_atm, Tin=300, reactants=reactants, width=0.03)
+        assert not self.sim.profiling
+        self.sim.profiling = True
+        assert self.sim.profiling
+        self.solve_mix(refine=True)
+        stats = self.sim.profiler_stats
+        for phase in ["residual", "jacobian", "factorization", "linear_solve",
+                      "thermo", "kinetics", "transport", "refinement"]:
+            assert stats[phase]["calls"] > 0
+            assert stats[phase]["time"] > 0
+        assert stats["time_stepping"]["calls"] >= 0
+        self.sim.clear_profiler_stats()
+        stats = self.sim.profiler_stats
+        assert stats["residual"] == {"calls": 0, "time": 0.0}
+
     # @utilities.unittest.skip('sometimes slow')
     def test_multicomponent(self):
         reactants = 'H2:1.1, O2:1, AR:5.3'
@@ -1788,6 +1788,77 @@ class TestExtensible(ReactionTests):
         with pytest.raises(ValueError):
             self.eval_rate(R)
 
+    def test_profiler(self):
+        gas = ct.Solution(yaml=self._phase_def)
+        gas.add_reaction(ct.Reaction(equation=self._equation, rate=self._rate_obj))
+        gas.profiling = True
+        for T in [500, 1000]:
+            gas.TP = T, None
+            gas.net_rates_of_progress
+        stats = gas.profiler_stats
+        assert stats["user-rate-1"]["calls"] == 2
+        assert stats["user-rate-1"]["time"] > 0
+
+
+@ct.extension(name="user-rate-batch", data=UserRate1Data)
+class UserRateBatch(UserRate1):
+    batch_parameters = ["A"]
+    batch_calls = 0
+    eval_error = False
+
+    def eval(self, data):
+        raise AssertionError("eval should not be called")
+
+    @classmethod
+    def eval_batch(cls, data, params, out):
+        if cls.eval_error:
+            raise ValueError("Error evaluating batch")
+        cls.batch_calls += 1
+        out[:] = params[:, 0] * data.T**2.7 * np.exp(-3150.15428/data.T)
+
+
+class TestExtensibleBatch:
+    # test evaluation of ExtensibleRate objects using a single batch call
+    _equations = ["H2 + O <=> H + OH", "H + O2 <=> O + OH", "H2O2 + O <=> HO2 + OH"]
+
+    @pytest.fixture
+    def gas(self):
+        gas = ct.Solution(yaml=TestExtensible._phase_def)
+        for i, equation in enumerate(self._equations):
+            rate = UserRateBatch(input_data={"A": 10.0 * (i + 1)})
+            gas.add_reaction(ct.Reaction(equation=equation, rate=rate))
+        return gas
+
+    def expected(self, A, T):
+        return np.array(A) * T**2.7 * np.exp(-3150.15428/T)
+
+    def test_eval_batch(self, gas):
+        assert gas.reaction(0).rate.type == "user-rate-batch"
+        UserRateBatch.batch_calls = 0
+        for T in [800, 1200]:
+            gas.TP = T, None
+            assert gas.forward_rate_constants == approx(
+                self.expected([10.0, 20.0, 30.0], T))
+        assert UserRateBatch.batch_calls == 2
+
+    def test_modify_reaction(self, gas):
+        gas.TP = 900, None
+        gas.forward_rate_constants
+        rate = UserRateBatch(input_data={"A": 5.0})
+        gas.modify_reaction(1, ct.Reaction(equation=self._equations[1], rate=rate))
+        gas.TP = 1000, None
+        assert gas.forward_rate_constants == approx(
+            self.expected([10.0, 5.0, 30.0], 1000))
+
+    def test_eval_batch_error(self, gas):
+        gas.TP = 1100, None
+        UserRateBatch.eval_error = True
+        try:
+            with pytest.raises(ValueError, match="Error evaluating batch"):
+                gas.forward_rate_constants
+        finally:
+            UserRateBatch.eval_error = False
+
 
 @pytest.fixture(scope='function')
 def setup_extensible2_tests(request):
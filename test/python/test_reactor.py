@@ -74,6 +74,20 @@ class TestReactor:
         self.make_reactors()
         assert self.r1.type == self.reactorClass.__name__
 
+    def test_clone_modify_reaction(self):
+        self.make_reactors(n_reactors=1)
+        clone = self.r1.phase
+        kf = clone.forward_rate_constants
+        A = clone.reaction(2).rate.pre_exponential_factor
+
+        # reaction is modified in place and then replaced in the original only
+        rxn = self.gas1.reaction(2)
+        rxn.rate = ct.ArrheniusRate(0.1 * A, 2.7, 2.619184e7)
+        self.gas1.modify_reaction(2, rxn)
+        assert self.gas1.reaction(2).rate.pre_exponential_factor == approx(0.1 * A)
+        assert clone.reaction(2).rate.pre_exponential_factor == approx(A)
+        assert clone.forward_rate_constants == approx(kf)
+
     def test_component_index(self):
         self.make_reactors(n_reactors=1)
         net = ct.ReactorNet([self.r1])
@@ -1446,6 +1460,101 @@ class TestWellStirredReactorIgnition:
         assert self.combustor.phase['H2O'].Y[0] == approx(0.103658, rel=1e-5)
         assert self.combustor.phase['HO2'].Y[0] == approx(8.734515e-06, rel=1e-5)
 
+
+class TestReactorEnsemble:
+    """ Ignition of ensembles of independent reactors """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.gas = ct.Solution("h2o2.yaml", transport_model=None)
+        self.T0 = np.array([1000., 1100., 1200., 1300.])
+        self.X0 = "H2:2, O2:1, AR:7"
+
+    def reference_ignition(self, T0, dT):
+        self.gas.TPX = T0, ct.one_atm, self.X0
+        r = ct.IdealGasConstPressureReactor(self.gas)
+        net = ct.ReactorNet([r])
+        t, T = 0., T0
+        while r.T < T0 + dT:
+            t, T = net.time, r.T
+            net.step()
+        return t + (net.time - t) * (T0 + dT - T) / (r.T - T)
+
+    def test_ignition_times(self):
+        ensemble = ct.ReactorEnsemble(self.gas)
+        assert ensemble.reactor_type == "IdealGasConstPressureReactor"
+        assert ensemble.num_threads == 1
+        with pytest.raises(ValueError, match="non-negative"):
+            ensemble.num_threads = -1
+        ensemble.ignition_rise = 300.
+        tau = ensemble.integrate(self.T0, ct.one_atm, self.X0, 0.1)
+        assert tau.shape == self.T0.shape
+        assert not ensemble.errors
+        assert (np.diff(tau) < 0).all()
+        for T0, t in zip(self.T0, tau):
+            assert t == approx(self.reference_ignition(T0, 300.), rel=1e-3)
+        assert ensemble.ignition_times == approx(tau)
+
+    def test_samples(self):
+        ensemble = ct.ReactorEnsemble(self.gas, num_threads=2)
+        tau = ensemble.integrate(self.T0, ct.one_atm, self.X0, 0.1)
+        times = [1e-6, 1e-2, 0.1]
+        ensemble.stop_at_ignition = False
+        tau2 = ensemble.integrate(self.T0, ct.one_atm, self.X0, 0.1,
+                                  sample_times=times)
+        assert tau2 == approx(tau, rel=1e-6)
+        assert ensemble.sample_times == approx(times)
+        samples = ensemble.samples
+        assert samples.shape == (len(self.T0), len(times), self.gas.n_species + 2)
+        assert samples[:, 0, 0] == approx(self.T0, rel=1e-3)
+        assert (samples[:, -1, 0] > self.T0 + 400).all()
+        assert samples[:, :, 1] == approx(ct.one_atm)
+        assert samples[:, :, 2:].sum(axis=2) == approx(1.)
+
+        # samples after ignition are not available when stopping at ignition
+        ensemble.stop_at_ignition = True
+        ensemble.integrate(self.T0, ct.one_atm, self.X0, 0.1, sample_times=times)
+        assert not np.isnan(ensemble.samples[:, 0]).any()
+        assert np.isnan(ensemble.samples[:, -1]).all()
+
+    def test_initial_states(self):
+        ensemble = ct.ReactorEnsemble(self.gas)
+        self.gas.TPX = 500, 2 * ct.one_atm, "H2:1, O2:1"
+        X = np.zeros((2, self.gas.n_species))
+        X[:, self.gas.species_index("H2")] = [2., 1.]
+        X[:, self.gas.species_index("O2")] = 1.
+        X[:, self.gas.species_index("AR")] = [7., 8.]
+        tau = ensemble.integrate(1100., [ct.one_atm, 5 * ct.one_atm], X, 0.1)
+        assert tau.shape == (2,)
+        assert not np.isnan(tau).any()
+        # state of the template Solution is not modified
+        assert self.gas.T == approx(500)
+        assert self.gas.P == approx(2 * ct.one_atm)
+
+        with pytest.raises(ValueError, match="shape"):
+            ensemble.integrate(1100., ct.one_atm, X[:, :3], 0.1)
+        with pytest.raises(ct.CanteraError, match="exceeds end time"):
+            ensemble.integrate(1100., ct.one_atm, X, 0.1, sample_times=[0.2])
+
+    def test_failed_members(self):
+        ensemble = ct.ReactorEnsemble(self.gas)
+        tau = ensemble.integrate([1100., -100.], ct.one_atm, self.X0, 0.1)
+        assert not np.isnan(tau[0])
+        assert np.isnan(tau[1])
+        assert list(ensemble.errors) == [1]
+        assert "temperature" in ensemble.errors[1].lower()
+
+    def test_reactor_type(self):
+        ensemble = ct.ReactorEnsemble(self.gas, "ConstPressureReactor")
+        with pytest.raises(ct.CanteraError, match="temperature as a state"):
+            ensemble.integrate(self.T0, ct.one_atm, self.X0, 0.1)
+        ensemble.ignition_rise = 0.
+        tau = ensemble.integrate(self.T0, ct.one_atm, self.X0, 0.1,
+                                 sample_times=[0.1])
+        assert np.isnan(tau).all()
+        assert (ensemble.samples[:, 0, 0] > self.T0 + 400).all()
+
+
 class TestConstPressureReactor:
     """
     The constant pressure reactor should give essentially the same results as
@@ -1663,6 +1772,54 @@ class TestIdealGasMoleReactor(TestMoleReactor):
             assert r1.phase.P == approx(r2.phase.P, rel=1e-5)
 
 
+    def test_sparse_direct_integration(self):
+        gas1 = ct.Solution("h2o2.yaml", transport_model=None)
+        gas1.TPX = 1000, ct.one_atm, "H2:2, O2:1, AR:4"
+        r1 = ct.IdealGasMoleReactor(gas1)
+        net1 = ct.ReactorNet([r1])
+        gas2 = ct.Solution("h2o2.yaml", transport_model=None)
+        gas2.TPX = 1000, ct.one_atm, "H2:2, O2:1, AR:4"
+        r2 = ct.IdealGasMoleReactor(gas2)
+        net2 = ct.ReactorNet([r2])
+        net2.preconditioner = ct.EigenSparseDirectJacobian()
+        assert net2.linear_solver_type == "SPARSE"
+        net1.atol = net2.atol = 1e-15
+        net1.rtol = net2.rtol = 1e-8
+        for t in np.arange(0.02, 0.1, 0.02):
+            net1.advance(t)
+            net2.advance(t)
+            assert r1.phase.X == approx(r2.phase.X, rel=1e-4, abs=1e-9)
+            assert r1.T == approx(r2.T, rel=1e-6)
+        assert net2.solver_stats["lin_solve_setups"] > 0
+
+    def test_profiler_stats(self):
+        gas = ct.Solution("h2o2.yaml", transport_model=None)
+        gas.TPX = 1000, ct.one_atm, "H2:2, O2:1, AR:4"
+        net = ct.ReactorNet([ct.IdealGasMoleReactor(gas)])
+        net.preconditioner = ct.AdaptivePreconditioner()
+        assert not net.profiling
+        net.profiling = True
+        assert net.profiling
+        net.advance(0.05)
+        stats = net.profiler_stats
+        assert stats["residual"]["calls"] > 0
+        assert stats["thermo"]["calls"] >= stats["residual"]["calls"]
+        assert stats["jacobian"]["calls"] > 0
+        assert stats["factorization"]["calls"] >= stats["jacobian"]["calls"]
+        assert stats["linear_solve"]["calls"] == net.solver_stats["prec_solves"]
+        assert stats["residual"]["time"] > 0
+        assert stats["refinement"]["calls"] == 0
+        net.clear_profiler_stats()
+        assert net.profiler_stats["residual"]["calls"] == 0
+
+    def test_sparse_direct_unsupported(self):
+        gas = ct.Solution("h2o2.yaml", transport_model=None)
+        net = ct.ReactorNet([ct.IdealGasReactor(gas)])
+        net.linear_solver_type = "SPARSE"
+        with pytest.raises(ct.CanteraError, match="only supported for type"):
+            net.initialize()
+
+
 class TestReactorJacobians:
 
     def test_multi_surface_simple(self):
@@ -3559,6 +3716,32 @@ class TestSteadySolver:
         assert r1.phase.T == approx(2429.27092)
         assert r2.phase.T == approx(2538.63069)
 
+    def test_multiple_reactors_threads(self):
+        gas = ct.Solution("h2o2.yaml", transport_model=None)
+        gas.set_equivalence_ratio(1.2, "H2:1.0", "O2:1.0, N2:3.76")
+        gas.TP = 500, 20 * ct.one_atm
+
+        upstream = ct.Reservoir(gas)
+        gas.equilibrate("HP")
+        downstream = ct.Reservoir(gas)
+        V0 = 1e-3
+        r1 = ct.IdealGasReactor(gas, volume=V0)
+        r2 = ct.MoleReactor(gas, volume=2*V0)
+        inlet = ct.MassFlowController(upstream, r1, mdot=120)
+        ct.PressureController(r1, r2, primary=inlet)
+        ct.PressureController(r2, downstream, primary=inlet)
+        net = ct.ReactorNet([r1, r2])
+        assert net.num_threads == 1
+        with pytest.raises(ValueError, match="non-negative"):
+            net.num_threads = -1
+        net.num_threads = 2
+        assert net.num_threads == 2
+        net.solve_steady()
+
+        # results are identical to the serial evaluation in test_multiple_reactors
+        assert r1.phase.T == approx(2429.27092)
+        assert r2.phase.T == approx(2538.63069)
+
     @pytest.mark.parametrize("reactor_class",
         [ct.ConstPressureReactor, ct.IdealGasConstPressureReactor,
          ct.ConstPressureMoleReactor, ct.IdealGasConstPressureMoleReactor])
@@ -1114,6 +1114,23 @@ class TestThermo:
         assert np.dot(g.standard_gibbs_RT, g.X) - Smix_R == approx(
                g.gibbs_mole / (R*g.T))
 
+    def test_reference_state_properties(self):
+        g = self.gas
+        state = g.state
+        T = np.array([1500.0, 300.0, 1000.0, 2800.0, 999.0, 700.0])
+        cp, h, s = g.reference_state_properties(T)
+        assert cp.shape == h.shape == s.shape == (len(T), g.n_species)
+        assert g.state == approx(state)
+        for i, Ti in enumerate(T):
+            g.TP = Ti, g.reference_pressure
+            assert cp[i] == approx(g.standard_cp_R, rel=1e-14)
+            assert h[i] == approx(g.standard_enthalpies_RT, rel=1e-14)
+            assert s[i] == approx(g.standard_entropies_R, rel=1e-14)
+
+        cp_O2 = g["O2"].reference_state_properties(T)[0]
+        assert cp_O2.shape == (len(T), 1)
+        assert cp_O2[:, 0] == approx(cp[:, g.species_index("O2")])
+
 
 @pytest.fixture(scope='function')
 def setup_interface_tests(request):
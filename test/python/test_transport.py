@@ -285,6 +285,28 @@ class TestTransport:
         phase.set_collision_integral_polynomial(kO2, kO2, *coll_polys_O2, actualT=False)
         assert get_cond("O2") == cond1_O2  # back to original
 
+    def test_fit_cache(self, tmp_path):
+        species = ct.Species.list_from_file("h2o2.yaml")
+        # Use transport data not used by other tests to avoid reusing fits from
+        # the in-process cache
+        species[0].transport.well_depth *= 1.0123
+        try:
+            ct.set_cache_directory(tmp_path)
+            gas1 = ct.Solution(thermo="ideal-gas", species=species,
+                               transport_model="mixture-averaged")
+        finally:
+            ct.set_cache_directory(None)
+        assert any(f.name.startswith("transport-fits") for f in tmp_path.iterdir())
+
+        # Fits are reused, but modifying them does not affect other objects
+        poly = gas1.get_binary_diff_coeffs_polynomial(0, 2)
+        gas1.set_binary_diff_coeffs_polynomial(0, 2, 2 * poly)
+        gas2 = ct.Solution(thermo="ideal-gas", species=species,
+                           transport_model="mixture-averaged")
+        assert gas2.get_binary_diff_coeffs_polynomial(0, 2) == approx(poly)
+        assert gas2.get_viscosity_polynomial(0) == approx(
+            gas1.get_viscosity_polynomial(0))
+
 
 class TestIonTransport:
 
@@ -358,6 +358,32 @@ class TestListDataFiles:
         assert str(Path("example_data/oxygen-plasma-itikawa.yaml")) in data_files
 
 
+class TestInputCache:
+
+    def test_cache(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        contents = (Path(__file__).parents[2] / "data" / "h2o2.yaml").read_text()
+        (tmp_path / "mech1.yaml").write_text(contents)
+        (tmp_path / "mech2.yaml").write_text(contents)
+        try:
+            ct.set_cache_directory(cache_dir)
+            assert ct.get_cache_directory() == str(cache_dir)
+            gas1 = ct.Solution(tmp_path / "mech1.yaml")
+            cache_files = set(cache_dir.iterdir())
+            assert cache_files
+            # A file with identical contents is loaded from the cache
+            gas2 = ct.Solution(tmp_path / "mech2.yaml")
+            assert set(cache_dir.iterdir()) == cache_files
+        finally:
+            ct.set_cache_directory(None)
+        assert ct.get_cache_directory() is None
+        assert gas2.species_names == gas1.species_names
+        assert gas2.input_header == gas1.input_header
+        gas1.TPX = gas2.TPX = 1200, ct.one_atm, "H2:2, O2:1, AR:5"
+        assert gas2.net_rates_of_progress == approx(gas1.net_rates_of_progress)
+        assert gas2.mix_diff_coeffs == approx(gas1.mix_diff_coeffs)
+
+
 def test_namespace_cleanliness():
     for name in dir(ct):
         if name.startswith('_'):
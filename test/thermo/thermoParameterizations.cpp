@@ -7,6 +7,7 @@
 #include "cantera/thermo/NasaPoly2.h"
 #include "cantera/thermo/ShomatePoly.h"
 #include "cantera/thermo/PDSS_HKFT.h"
+#include "cantera/thermo/ThermoFactory.h"
 #include "cantera/base/stringUtils.h"
 #include "cantera/base/Solution.h"
 #include "thermo_data.h"
@@ -117,6 +118,53 @@ TEST_F(SpeciesThermoInterpTypeTest, install_shomate)
     EXPECT_DOUBLE_EQ(p2.cp_mass(), p.cp_mass());
 }
 
+void checkReferenceProperties(ThermoPhase& thermo, const vector<double>& T)
+{
+    size_t nsp = thermo.nSpecies();
+    size_t n = T.size();
+    vector<double> cp(n * nsp), h(n * nsp), s(n * nsp);
+    thermo.getReferenceProperties(n, T.data(), cp.data(), h.data(), s.data());
+    vector<double> cp_ref(nsp), h_ref(nsp), s_ref(nsp);
+    for (size_t i = 0; i < n; i++) {
+        thermo.setState_TP(T[i], OneAtm);
+        thermo.getCp_R_ref(cp_ref.data());
+        thermo.getEnthalpy_RT_ref(h_ref.data());
+        thermo.getEntropy_R_ref(s_ref.data());
+        for (size_t k = 0; k < nsp; k++) {
+            EXPECT_DOUBLE_EQ(cp[i * nsp + k], cp_ref[k]) << i << ", " << k;
+            EXPECT_DOUBLE_EQ(h[i * nsp + k], h_ref[k]) << i << ", " << k;
+            EXPECT_DOUBLE_EQ(s[i * nsp + k], s_ref[k]) << i << ", " << k;
+        }
+    }
+}
+
+TEST_F(SpeciesThermoInterpTypeTest, referencePropertiesMultiple)
+{
+    auto sO2 = make_shared<Species>("O2", parseCompString("O:2"));
+    auto sH2 = make_shared<Species>("H2", parseCompString("H:2"));
+    auto sCO = make_shared<Species>("CO", parseCompString("C:1 O:1"));
+    auto sCO2 = make_shared<Species>("CO2", parseCompString("C:1 O:2"));
+    auto sH2O = make_shared<Species>("H2O", parseCompString("H:2 O:1"));
+    sO2->thermo = make_shared<NasaPoly2>(200, 3500, 101325, o2_nasa_coeffs);
+    sH2->thermo = make_shared<ConstCpPoly>(200, 5000, 101325, c_h2);
+    sCO->thermo = make_shared<ShomatePoly2>(200, 6000, 101325, co_shomate_coeffs);
+    sCO2->thermo = make_shared<ShomatePoly2>(200, 6000, 101325, co2_shomate_coeffs);
+    sH2O->thermo = make_shared<NasaPoly2>(200, 3500, 101325, h2o_nasa_coeffs);
+    p.addSpecies(sO2);
+    p.addSpecies(sH2);
+    p.addSpecies(sCO);
+    p.addSpecies(sCO2);
+    p.addSpecies(sH2O);
+    p.initThermo();
+    // unsorted temperatures, including the midpoints of the parameterizations
+    checkReferenceProperties(p, {1500.0, 300.0, 1000.0, 999.9, 1200.0, 1000.1,
+                                 2500.0, 700.0, 1200.0});
+
+    auto nasa9 = newThermo("../data/gasNASA9.yaml");
+    checkReferenceProperties(*nasa9, {300.0, 3000.0, 999.9, 1000.0, 2000.0, 1000.1,
+                                      250.0, 500.0, 499.9, 1800.0});
+}
+
 TEST(Shomate, modifyOneHf298)
 {
     ShomatePoly2 S(200, 6000, 101325, co2_shomate_coeffs);
@@ -168,6 +168,81 @@ TEST_F(TransportFromScratch, thermalConductivityMulti)
     }
 }
 
+TEST_F(TransportFromScratch, fitCache)
+{
+    GasTransport::clearFitCache();
+    test->setState_TPX(1234, 2e5, "H2:0.5, O2:0.3, H2O:0.2");
+    vector<double> state0, state1;
+    test->saveState(state0);
+    MixTransport tr1;
+    tr1.init(test);
+    // Generating the cache key leaves the state of the phase unchanged
+    test->saveState(state1);
+    EXPECT_EQ(state0, state1);
+    vector<double> c1(5), c2(5);
+    tr1.getViscosityPolynomial(0, c1.data());
+
+    // Modifying fits does not affect fits reused by other transport managers
+    vector<double> modified = c1;
+    modified[0] *= 2;
+    tr1.setViscosityPolynomial(0, modified.data());
+    MixTransport tr2;
+    tr2.init(test);
+    tr2.getViscosityPolynomial(0, c2.data());
+    EXPECT_EQ(c1, c2);
+    EXPECT_EQ(tr1.fittingErrors(), tr2.fittingErrors());
+
+    // Different transport data results in new fits
+    tH2->well_depth *= 1.1;
+    MixTransport tr3;
+    tr3.init(test);
+    tr3.getViscosityPolynomial(0, c2.data());
+    EXPECT_NE(c1, c2);
+}
+
+TEST_F(TransportFromScratch, persistentFitCache)
+{
+    std::filesystem::path cacheDir = "transport-cache";
+    std::filesystem::remove_all(cacheDir);
+    setCacheDirectory(cacheDir.string());
+    GasTransport::clearFitCache();
+    MultiTransport tr1;
+    tr1.init(test);
+    EXPECT_EQ(std::distance(std::filesystem::directory_iterator(cacheDir),
+                            std::filesystem::directory_iterator()), 1);
+
+    // Load fits from the persistent cache
+    GasTransport::clearFitCache();
+    MultiTransport tr2;
+    tr2.init(test);
+    setCacheDirectory("");
+    std::filesystem::remove_all(cacheDir);
+
+    size_t K = test->nSpecies();
+    vector<double> c1(9), c2(9), d1(9), d2(9), e1(9), e2(9);
+    for (size_t i = 0; i < K; i++) {
+        tr1.getViscosityPolynomial(i, c1.data());
+        tr2.getViscosityPolynomial(i, c2.data());
+        EXPECT_EQ(c1, c2);
+        tr1.getConductivityPolynomial(i, c1.data());
+        tr2.getConductivityPolynomial(i, c2.data());
+        EXPECT_EQ(c1, c2);
+        for (size_t j = i; j < K; j++) {
+            tr1.getBinDiffusivityPolynomial(i, j, c1.data());
+            tr2.getBinDiffusivityPolynomial(i, j, c2.data());
+            EXPECT_EQ(c1, c2);
+            tr1.getCollisionIntegralPolynomial(i, j, c1.data(), d1.data(), e1.data());
+            tr2.getCollisionIntegralPolynomial(i, j, c2.data(), d2.data(), e2.data());
+            EXPECT_EQ(c1, c2);
+            EXPECT_EQ(d1, d2);
+            EXPECT_EQ(e1, e2);
+        }
+    }
+    EXPECT_EQ(tr1.fittingErrors(), tr2.fittingErrors());
+    test->setState_TPX(800, 5e5, "H2:0.5, O2:0.3, H2O:0.2");
+    EXPECT_DOUBLE_EQ(tr1.thermalConductivity(), tr2.thermalConductivity());
+}
+
 int main(int argc, char** argv)
 {
     printf("Running main() from transportFromScratch.cpp\n");
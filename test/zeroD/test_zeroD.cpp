@@ -191,6 +191,80 @@ TEST(zerodim, test_individual_reactor_initialization)
     }
 }
 
+TEST(zerodim, reactor_ensemble)
+{
+    auto sol = newSolution("h2o2.yaml", "ohmech", "none");
+    size_t nsp = sol->thermo()->nSpecies();
+    vector<double> T = {1000.0, 1100.0, 1200.0};
+    vector<double> P(T.size(), OneAtm);
+    vector<double> X0(nsp, 0.0);
+    X0[sol->thermo()->speciesIndex("H2")] = 2.0;
+    X0[sol->thermo()->speciesIndex("O2")] = 1.0;
+    X0[sol->thermo()->speciesIndex("AR")] = 7.0;
+    vector<double> X;
+    for (size_t i = 0; i < T.size(); i++) {
+        X.insert(X.end(), X0.begin(), X0.end());
+    }
+
+    ReactorEnsemble ensemble(sol);
+    ensemble.setIgnitionRise(200.0);
+    ensemble.integrate(0.01, T, P, X);
+    ASSERT_EQ(ensemble.size(), T.size());
+
+    // reference ignition times obtained by marching a single reactor network
+    for (size_t i = 0; i < T.size(); i++) {
+        EXPECT_EQ(ensemble.errors()[i], "");
+        sol->thermo()->setState_TPX(T[i], P[i], X0.data());
+        auto reactor = newReactor("IdealGasConstPressureReactor", sol, true);
+        ReactorNet net(reactor);
+        double tPrev = 0.0;
+        double Tprev = T[i];
+        while (reactor->temperature() < T[i] + 200.0) {
+            tPrev = net.time();
+            Tprev = reactor->temperature();
+            net.step();
+        }
+        double tIgn = tPrev + (net.time() - tPrev) *
+            (T[i] + 200.0 - Tprev) / (reactor->temperature() - Tprev);
+        EXPECT_NEAR(ensemble.ignitionTimes()[i], tIgn, 1e-3 * tIgn);
+        if (i) {
+            EXPECT_LT(ensemble.ignitionTimes()[i], ensemble.ignitionTimes()[i - 1]);
+        }
+    }
+
+    // parallel integration with sampling and invalid members
+    vector<double> times = {1e-5, 1e-3, 0.01};
+    ensemble.setSampleTimes(times);
+    ensemble.setStopAtIgnition(false);
+    ensemble.setNumThreads(2);
+    vector<double> ignitionTimes = ensemble.ignitionTimes();
+    T.push_back(-100.0);
+    P.push_back(OneAtm);
+    X.insert(X.end(), X0.begin(), X0.end());
+    ensemble.integrate(0.01, T, P, X);
+    size_t width = ensemble.sampleWidth();
+    ASSERT_EQ(width, nsp + 2);
+    ASSERT_EQ(ensemble.samples().size(), T.size() * times.size() * width);
+    for (size_t i = 0; i < 3; i++) {
+        EXPECT_NEAR(ensemble.ignitionTimes()[i], ignitionTimes[i],
+                    1e-6 * ignitionTimes[i]);
+        const double* samples = ensemble.samples().data() + i * times.size() * width;
+        EXPECT_LT(samples[0], T[i] + 200.0);
+        EXPECT_GT(samples[2 * width], T[i] + 200.0);
+        EXPECT_NEAR(samples[2 * width + 1], OneAtm, 1e-6 * OneAtm);
+    }
+    EXPECT_TRUE(std::isnan(ensemble.ignitionTimes()[3]));
+    EXPECT_TRUE(std::isnan(ensemble.samples().back()));
+    EXPECT_NE(ensemble.errors()[3], "");
+
+    // invalid input
+    EXPECT_THROW(ensemble.integrate(0.01, T, P, X0), CanteraError);
+    EXPECT_THROW(ensemble.integrate(1e-3, T, P, X), CanteraError);
+    EXPECT_THROW(ensemble.setSampleTimes(vector<double>{1e-3, 1e-4}), CanteraError);
+    ReactorEnsemble ensemble2(sol, "ConstPressureReactor");
+    EXPECT_THROW(ensemble2.integrate(0.01, T, P, X), CanteraError);
+}
+
 TEST(zerodim, plasma_reactor_energy)
 {
     auto sol = newSolution("air-plasma.yaml", "air-plasma-Phelps", "none");
@@ -327,6 +401,131 @@ TEST(AdaptivePreconditionerTests, test_precon_solver_stats)
     EXPECT_GE(stats["nonlinear_conv_fails"].asInt(), 0);
 }
 
+TEST(ReactorNet, sparse_direct_linear_solver)
+{
+    auto sol1 = newSolution("h2o2.yaml", "", "none");
+    sol1->thermo()->setState_TPX(1000.0, OneAtm, "H2:2.0, O2:1.0, AR:4.0");
+    auto sol2 = newSolution("h2o2.yaml", "", "none");
+    sol2->thermo()->setState_TPX(1000.0, OneAtm, "H2:2.0, O2:1.0, AR:4.0");
+    auto reactor1 = newReactor4("IdealGasMoleReactor", sol1, false);
+    auto reactor2 = newReactor4("IdealGasMoleReactor", sol2, false);
+    ReactorNet dense(reactor1);
+    ReactorNet sparse(reactor2);
+    sparse.setLinearSolverType("SPARSE");
+    dense.setTolerances(1e-8, 1e-14);
+    sparse.setTolerances(1e-8, 1e-14);
+    for (double t = 0.02; t < 0.1; t += 0.02) {
+        dense.advance(t);
+        sparse.advance(t);
+        EXPECT_NEAR(reactor1->temperature(), reactor2->temperature(), 1e-3);
+    }
+    EXPECT_EQ(sparse.linearSolverType(), "SPARSE");
+    AnyMap stats = sparse.solverStats();
+    EXPECT_GT(stats["lin_solve_setups"].asInt(), 0);
+
+    // Sparse Jacobians are not available for mass-based reactors
+    auto sol3 = newSolution("h2o2.yaml", "", "none");
+    auto reactor3 = newReactor4("IdealGasReactor", sol3, false);
+    ReactorNet unsupported(reactor3);
+    unsupported.setLinearSolverType("SPARSE");
+    EXPECT_THROW(unsupported.initialize(), CanteraError);
+}
+
+TEST(ReactorNet, steady_jacobian_coloring)
+{
+    auto gas = newSolution("h2o2.yaml", "", "none");
+    gas->thermo()->setState_TPX(1000.0, 2 * OneAtm, "H2:2.0, O2:1.0, AR:4.0");
+    auto upstream = newReservoir(gas, true);
+    vector<shared_ptr<ReactorBase>> reactors;
+    for (size_t i = 0; i < 4; i++) {
+        gas->thermo()->setState_TP(1100.0 + 50 * i, 2 * OneAtm);
+        reactors.push_back(newReactor4("IdealGasConstPressureReactor", gas, true));
+    }
+    auto downstream = newReservoir(gas, true);
+    vector<shared_ptr<FlowDevice>> mfcs;
+    mfcs.push_back(newFlowDevice("MassFlowController", upstream, reactors[0]));
+    for (size_t i = 0; i < 3; i++) {
+        mfcs.push_back(newFlowDevice("MassFlowController", reactors[i],
+                                     reactors[i+1]));
+    }
+    mfcs.push_back(newFlowDevice("MassFlowController", reactors[3], downstream));
+    for (auto& mfc : mfcs) {
+        mfc->setMassFlowRate(0.1);
+    }
+    auto wall = std::dynamic_pointer_cast<Wall>(
+        newWall("Wall", reactors[0], reactors[1]));
+    wall->setHeatTransferCoeff(100.0);
+    ReactorNet net(reactors);
+    auto jac = net.steadyJacobian();
+
+    // Compare with Jacobian evaluated by perturbing one state variable at a time
+    size_t nv = net.neq();
+    vector<double> y(nv), r0(nv), r1(nv);
+    net.getState(y.data());
+    net.evalSteady(y.data(), r0.data());
+    for (size_t j = 0; j < nv; j++) {
+        double ysave = y[j];
+        double dy = fabs(ysave) * 1e-5 + 1000 * net.atol();
+        y[j] = (ysave < 0) ? ysave - dy : ysave + dy;
+        double rdy = 1.0 / (y[j] - ysave);
+        net.evalSteady(y.data(), r1.data());
+        for (size_t i = 0; i < nv; i++) {
+            double expected = (r1[i] - r0[i]) * rdy;
+            EXPECT_NEAR(jac.coeff(i, j), expected, 1e-12 * fabs(expected))
+                << "i = " << i << ", j = " << j;
+        }
+        y[j] = ysave;
+    }
+
+    // Reactors which are not directly connected do not affect each other
+    size_t i2 = reactors[2]->offset();
+    size_t i0 = reactors[0]->offset();
+    for (size_t m = 0; m < reactors[2]->neq(); m++) {
+        for (size_t n = 0; n < reactors[0]->neq(); n++) {
+            EXPECT_EQ(jac.coeff(i2 + m, i0 + n), 0.0);
+        }
+    }
+}
+
+TEST(ReactorNet, parallel_eval)
+{
+    auto makeNetwork = [](vector<shared_ptr<ReactorBase>>& reactors,
+                          vector<shared_ptr<FlowDevice>>& devices) {
+        auto gas = newSolution("h2o2.yaml", "", "none");
+        gas->thermo()->setState_TPX(1200.0, OneAtm, "H2:2.0, O2:1.0, AR:4.0");
+        auto upstream = newReservoir(gas, true);
+        for (size_t i = 0; i < 5; i++) {
+            gas->thermo()->setState_TP(1200.0 + 40 * i, (1.0 - 0.05 * i) * OneAtm);
+            reactors.push_back(newReactor4("IdealGasReactor", gas, true));
+        }
+        devices.push_back(
+            newFlowDevice("MassFlowController", upstream, reactors[0]));
+        devices.back()->setMassFlowRate(0.05);
+        for (size_t i = 0; i < 4; i++) {
+            devices.push_back(newFlowDevice("Valve", reactors[i], reactors[i+1]));
+            devices.back()->setDeviceCoefficient(1e-5);
+        }
+        return make_shared<ReactorNet>(reactors);
+    };
+    vector<shared_ptr<ReactorBase>> reactors1, reactors2;
+    vector<shared_ptr<FlowDevice>> devices1, devices2;
+    auto serial = makeNetwork(reactors1, devices1);
+    auto parallel = makeNetwork(reactors2, devices2);
+    EXPECT_EQ(parallel->numThreads(), 1u);
+    parallel->setNumThreads(3);
+    EXPECT_EQ(parallel->numThreads(), 3u);
+
+    size_t nv = serial->neq();
+    ASSERT_EQ(parallel->neq(), nv);
+    vector<double> y(nv), ydot1(nv), ydot2(nv);
+    serial->getState(y.data());
+    serial->eval(0.0, y.data(), ydot1.data(), nullptr);
+    parallel->eval(0.0, y.data(), ydot2.data(), nullptr);
+    for (size_t i = 0; i < nv; i++) {
+        EXPECT_EQ(ydot1[i], ydot2[i]) << "i = " << i;
+    }
+}
+
 int main(int argc, char** argv)
 {
     printf("Running main() from test_zeroD.cpp\n");